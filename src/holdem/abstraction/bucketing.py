@@ -183,7 +183,46 @@ class HandBucketing:
         features_2d = prepare_for_sklearn(features[np.newaxis, :])
         bucket = self.models[street].predict(features_2d)[0]
         return int(bucket)
-    
+
+    def get_buckets(self, hands: List[List[Card]], board: List[Card], street: Street,
+                    pot: float = 100.0, stack: float = 200.0, is_in_position: bool = True) -> np.ndarray:
+        """Get bucket indices for many hands on the same board.
+
+        Same buckets as get_bucket, with one k-means prediction for all hands.
+
+        Returns:
+            Array of bucket indices, one per hand
+        """
+        if not hands:
+            return np.zeros(0, dtype=np.int32)
+        if street == Street.PREFLOP and self.use_lossless_preflop:
+            from holdem.abstraction.preflop_lossless import get_bucket_169
+            return np.array([get_bucket_169(hand) for hand in hands], dtype=np.int32)
+        if not self.fitted:
+            raise RuntimeError("Buckets not built yet. Call build() first.")
+        if street not in self.models:
+            raise ValueError(f"No model for street {street}")
+
+        if street == Street.PREFLOP:
+            features = [extract_preflop_features(hand, equity_samples=self.preflop_equity_samples) for hand in hands]
+        else:
+            features = [
+                extract_postflop_features(
+                    hole_cards=hand,
+                    board=board,
+                    street=street,
+                    pot=pot,
+                    stack=stack,
+                    is_in_position=is_in_position,
+                    num_opponents=1,
+                    equity_samples=100,
+                    future_equity_samples=50
+                )
+                for hand in hands
+            ]
+        features_2d = prepare_for_sklearn(np.stack(features))
+        return self.models[street].predict(features_2d).astype(np.int32)
+
     def save(self, path: Path):
         """Save bucketing models."""
         if not self.fitted and not self.use_lossless_preflop:
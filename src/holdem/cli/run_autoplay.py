@@ -10,6 +10,7 @@ from holdem.vision.detect_table import TableDetector
 from holdem.vision.cards import CardRecognizer
 from holdem.vision.ocr import OCREngine
 from holdem.vision.chat_enabled_parser import ChatEnabledStateParser
+from holdem.vision.parse_state import StateParser
 from holdem.vision.vision_metrics import VisionMetrics, VisionMetricsConfig
 from holdem.abstraction.bucketing import HandBucketing
 from holdem.mccfr.policy_store import PolicyStore
@@ -18,6 +19,7 @@ from holdem.rt_resolver.leaf_evaluator import LeafEvaluator
 from holdem.control.executor import ActionExecutor
 from holdem.control.safety import SafetyChecker
 from holdem.utils.logging import setup_logger
+from holdem.utils.metrics_registry import get_metrics_registry, start_metrics_server, stop_metrics_server
 
 logger = setup_logger("run_autoplay")
 
@@ -187,6 +189,51 @@ def _run_chat_ocr_focus_mode(args, profile, ocr_engine, screen_capture, table_de
             logger.info(f"[CHAT OCR FOCUS] Closed log file")
 
 
+class _TableChangeWatch:
+    """should_stop predicate for anytime solves: true once the table moved on from the decision state.
+    
+    Re-parses the table at most every check_interval_s (a parse is much
+    slower than a solver iteration); the table moved on when the street, the
+    pot or the amount to call changed, or the hero is no longer in the hand
+    (e.g. timed out). state_parser should be a vision-only StateParser of its
+    own: the main loop's chat-enabled parser would run chat OCR and consume
+    the events fused during the solve.
+    """
+    
+    def __init__(self, decision_state, capture, table_detector, state_parser, check_interval_s: float = 0.25):
+        self.decision_state = decision_state
+        self.capture = capture
+        self.table_detector = table_detector
+        self.state_parser = state_parser
+        self.check_interval_s = check_interval_s
+        self.changed = False
+        # The first check is due one interval into the solve
+        self._last_check = time.time()
+    
+    def __call__(self) -> bool:
+        if self.changed:
+            return True
+        if time.time() - self._last_check < self.check_interval_s:
+            return False
+        self._last_check = time.time()
+        screenshot = self.capture()
+        if screenshot is None:
+            return False
+        state = self.state_parser.parse(self.table_detector.detect(screenshot))
+        if state is None:
+            return False
+        before = self.decision_state
+        self.changed = (
+            state.street != before.street
+            or abs(state.pot - before.pot) > 1e-6
+            or abs(state.to_call - before.to_call) > 1e-6
+            or not state.hero_active
+        )
+        if self.changed:
+            logger.info("[REAL-TIME SEARCH] Table state changed during search")
+        return self.changed
+
+
 def _report_vision_metrics(vision_metrics, args, logger, header, do_export):
     """Helper function to generate and report vision metrics.
     
@@ -229,6 +276,13 @@ def main():
                        help="Minimum iterations for search")
     parser.add_argument("--num-workers", type=int, default=1,
                        help="Number of parallel workers for real-time solving (1 = single process, 0 = use all CPU cores)")
+    parser.add_argument("--speculative", action="store_true",
+                       help="Pre-solve likely next decisions in the background while opponents act")
+    parser.add_argument("--anytime", action="store_true",
+                       help="Solve in the background and act at the earliest of convergence, "
+                            "the time budget or a table state change")
+    parser.add_argument("--anytime-tol", type=float, default=0.01,
+                       help="Act once the strategy moves less than this between snapshots (with --anytime)")
     parser.add_argument("--confirm-every-action", action="store_true",
                        help="Confirm each action (disables auto-play mouse control)")
     parser.add_argument("--i-understand-the-tos", action="store_true",
@@ -255,6 +309,10 @@ def main():
                        help="File to save metrics report (optional, default: console only)")
     parser.add_argument("--metrics-format", type=str, choices=["text", "json"], default="text",
                        help="Metrics report format (text or json, default: text)")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                       help="Serve all metrics in Prometheus format on http://127.0.0.1:PORT/metrics")
+    parser.add_argument("--metrics-textfile", type=Path, default=None,
+                       help="Write all metrics in Prometheus format to this file at each report")
     parser.add_argument("--hero-position", type=int, default=None,
                        help="Fixed hero position (0-5 for 6-max). Overrides config value. If not provided, uses config or auto-detection.")
     parser.add_argument("--enable-detailed-vision-logs", action="store_true",
@@ -289,6 +347,11 @@ def main():
     else:
         logger.info("Vision metrics tracking disabled")
     
+    if args.metrics_port is not None:
+        start_metrics_server(args.metrics_port)
+    if args.metrics_textfile:
+        args.metrics_textfile.parent.mkdir(parents=True, exist_ok=True)
+    
     # Create vision timing profiler if enabled
     vision_profiler = None
     if args.enable_detailed_vision_logs:
@@ -442,6 +505,18 @@ def main():
         hero_position=args.hero_position
     )
     
+    # Anytime table watch: vision-only parser with its own caches, so checks during a
+    # solve neither run chat OCR nor advance the main parser's event tracking
+    watch_parser = None
+    if args.anytime:
+        watch_parser = StateParser(
+            profile=profile,
+            card_recognizer=card_recognizer,
+            ocr_engine=ocr_engine,
+            perf_config=perf_config,
+            hero_position=state_parser.hero_pos
+        )
+    
     # Create leaf evaluator based on arguments
     if args.no_cfv_net:
         # Use blueprint/rollouts mode
@@ -486,7 +561,10 @@ def main():
     search_config = SearchConfig(
         time_budget_ms=args.time_budget_ms,
         min_iterations=args.min_iters,
-        num_workers=args.num_workers
+        num_workers=args.num_workers,
+        speculative_presolve=args.speculative,
+        anytime_solve=args.anytime,
+        anytime_convergence_tol=args.anytime_tol
     )
     search_controller = SearchController(search_config, bucketing, policy, leaf_evaluator)
     
@@ -500,6 +578,10 @@ def main():
     
     logger.info("Auto-play mode started")
     logger.info(f"Real-time search: time_budget={args.time_budget_ms}ms, min_iters={args.min_iters}, workers={args.num_workers}")
+    if args.speculative:
+        logger.info("Speculative pre-solve enabled: next decisions solved while opponents act")
+    if args.anytime:
+        logger.info(f"Anytime search enabled: act on convergence (tol {args.anytime_tol}), budget or table change")
     
     # Log performance config
     if perf_config.enable_light_parse:
@@ -513,6 +595,16 @@ def main():
     # Track frame index for light parse
     frame_index = 0
     
+    def capture():
+        if profile.screen_region:
+            x, y, w, h = profile.screen_region
+            return screen_capture.capture_region(x, y, w, h)
+        return screen_capture.capture_window(
+            profile.window_title,
+            owner_name=profile.owner_name,
+            screen_region=profile.screen_region
+        )
+    
     try:
         # Track action history for belief updates
         # Resets on street changes to maintain accurate belief state
@@ -524,15 +616,7 @@ def main():
             frame_index += 1
             
             # Capture and parse state
-            if profile.screen_region:
-                x, y, w, h = profile.screen_region
-                screenshot = screen_capture.capture_region(x, y, w, h)
-            else:
-                screenshot = screen_capture.capture_window(
-                    profile.window_title,
-                    owner_name=profile.owner_name,
-                    screen_region=profile.screen_region
-                )
+            screenshot = capture()
             
             if screenshot is None:
                 time.sleep(1.0)
@@ -597,22 +681,36 @@ def main():
                         logger.info("[REAL-TIME SEARCH] Computing optimal action...")
                         start_time = time.time()
                         
-                        # Get action from search controller
+                        # Get action from search controller (anytime: stops early if the table moves on)
+                        table_watch = None
+                        if args.anytime:
+                            # Check at least once within the budget
+                            table_watch = _TableChangeWatch(
+                                state, capture, table_detector, watch_parser,
+                                check_interval_s=min(0.25, args.time_budget_ms / 2000.0)
+                            )
                         suggested_action = search_controller.get_action(
                             state=state,
                             our_cards=hero_cards,
-                            history=action_history
+                            history=action_history,
+                            should_stop=table_watch
                         )
                         
                         elapsed_ms = (time.time() - start_time) * 1000
                         logger.info(f"[REAL-TIME SEARCH] Action decided: {suggested_action.name} (in {elapsed_ms:.1f}ms)")
                         
+                        if table_watch is not None and table_watch.changed:
+                            logger.info("[AUTO-PLAY] Decision is stale, re-reading the table")
+                            continue
+                        
                         # Execute the action
                         success = executor.execute(suggested_action, state)
                         if success:
                             logger.info(f"[AUTO-PLAY] Executed action: {suggested_action.name}")
                             # Track this action in history
                             action_history.append(suggested_action.name)
+                            # Opponents act next: pre-solve our likely next decisions meanwhile
+                            search_controller.presolve(state, hero_cards, action_history, hero_action=suggested_action)
                         else:
                             logger.warning(f"[AUTO-PLAY] Failed to execute action: {suggested_action.name}")
                         
@@ -635,6 +733,8 @@ def main():
                         do_export=False
                     )
                     last_metrics_report = current_time
+                    if args.metrics_textfile:
+                        get_metrics_registry().write_textfile(str(args.metrics_textfile))
             
             time.sleep(2.0)
             
@@ -652,6 +752,26 @@ def main():
             do_export=True
         )
     
+    # Report decision latency and stop the resolver worker pool
+    latency = search_controller.latency_stats()
+    if latency.get('count'):
+        logger.info(f"Decision latency: p50 {latency['p50_ms']:.1f}ms, p99 {latency['p99_ms']:.1f}ms "
+                    f"({latency['count']} decisions)")
+    speculative = search_controller.speculative_stats()
+    if speculative:
+        logger.info(f"Speculative pre-solve: hit rate {speculative['hit_rate']:.1%} "
+                    f"({speculative['hits']}/{speculative['hits'] + speculative['misses']}), "
+                    f"{speculative['latency_saved_ms_per_decision']:.1f}ms saved per decision")
+    solution_cache = search_controller.solution_cache_stats()
+    if solution_cache:
+        logger.info(f"Subgame solution cache: hit rate {solution_cache['hit_rate']:.1%}, "
+                    f"{solution_cache['avg_iterations_saved']:.1f} iterations saved per hit, "
+                    f"{solution_cache['memory_mb']:.1f}MB")
+    if args.metrics_textfile:
+        get_metrics_registry().write_textfile(str(args.metrics_textfile))
+    stop_metrics_server()
+    search_controller.close()
+    
     # Close vision profiler if enabled
     if vision_profiler:
         vision_profiler.close()
@@ -640,6 +640,13 @@ def main():
             do_export=True
         )
     
+    # Report decision latency and stop the resolver worker pool
+    latency = search_controller.latency_stats()
+    if latency.get('count'):
+        logger.info(f"Decision latency: p50 {latency['p50_ms']:.1f}ms, p99 {latency['p99_ms']:.1f}ms "
+                    f"({latency['count']} decisions)")
+    search_controller.close()
+    
     # Close vision profiler if enabled
     if vision_profiler:
         vision_profiler.close()
@@ -69,6 +69,18 @@ def create_mccfr_config(args, yaml_config: dict = None) -> MCCFRConfig:
     if args.batch_size is not None:
         config_dict['batch_size'] = args.batch_size
     
+    if getattr(args, 'mp_start_method', None) is not None:
+        config_dict['mp_start_method'] = args.mp_start_method
+    
+    if getattr(args, 'adaptive_batch', False):
+        config_dict['adaptive_batch_enabled'] = True
+    
+    if getattr(args, 'cpu_affinity', False):
+        config_dict['cpu_affinity'] = True
+    
+    if getattr(args, 'worker_blas_threads', None) is not None:
+        config_dict['worker_blas_threads'] = args.worker_blas_threads
+    
     # Multi-player configuration
     if args.num_players is not None:
         config_dict['num_players'] = args.num_players
@@ -130,6 +142,16 @@ def main():
                        help="Number of parallel worker processes (1 = single process, 0 = use all CPU cores)")
     parser.add_argument("--batch-size", type=int,
                        help="Number of iterations per worker batch (only for parallel training)")
+    parser.add_argument("--mp-start-method", choices=["spawn", "fork", "forkserver"],
+                       help="Worker start method for parallel training (fork/forkserver: Linux only; "
+                            "fork shares the loaded buckets copy-on-write)")
+    parser.add_argument("--adaptive-batch", action="store_true",
+                       help="Auto-tune the batch size and per-worker shares to hold merge/IPC overhead "
+                            "near adaptive_batch_target_overhead (--batch-size is the starting size)")
+    parser.add_argument("--cpu-affinity", action="store_true",
+                       help="Pin workers/instances to disjoint CPU sets spread across NUMA nodes (Linux only)")
+    parser.add_argument("--worker-blas-threads", type=int,
+                       help="Cap BLAS/OpenMP threads per worker process (e.g. 1 to avoid oversubscription)")
     
     # Multi-instance parallel training
     parser.add_argument("--num-instances", type=int,
@@ -0,0 +1,148 @@
+"""Adaptive batch sizing for the parallel MCCFR solver."""
+
+from typing import Dict, List, Optional
+from holdem.types import MCCFRConfig
+from holdem.utils.logging import get_logger
+
+logger = get_logger("mccfr.adaptive_batch")
+
+# Largest relative change of the batch size between two consecutive batches
+MAX_RESIZE_FACTOR = 2.0
+
+
+class AdaptiveBatchSizer:
+    """Tunes the parallel batch size and per-worker shares from measured timings.
+
+    Each batch costs worker compute (sampling iterations, proportional to the
+    batch size) plus a mostly fixed overhead (task dispatch, regret snapshots
+    and deltas, result pickling/IPC and the merge in the main process). The
+    sizer tracks both with exponential moving averages and resizes the batch
+    so that overhead / (overhead + compute) approaches the target ratio:
+    smaller batches when overhead is negligible (fresher regrets, finer
+    epsilon/discount schedule), larger ones when merging dominates.
+
+    Per-worker shares follow each worker's measured throughput, so faster
+    cores receive more iterations and all workers finish at about the same
+    time.
+    """
+
+    def __init__(self, config: MCCFRConfig, num_workers: int):
+        """Initialize adaptive batch sizer.
+
+        Args:
+            config: MCCFR configuration (batch_size is the starting size)
+            num_workers: Number of worker processes
+        """
+        self.num_workers = num_workers
+        self.target_overhead = config.adaptive_batch_target_overhead
+        self.smoothing = config.adaptive_batch_smoothing
+        self.min_size = max(num_workers, config.adaptive_batch_min_size or num_workers)
+        self.max_size = config.adaptive_batch_max_size
+        # Batches never span more than one discount interval, so discounting stays on schedule
+        if config.regret_discount_alpha < 1.0 or config.strategy_discount_beta < 1.0:
+            self.max_size = min(self.max_size, config.discount_interval)
+        self.max_size = max(self.max_size, self.min_size)
+
+        if not 0.0 < self.target_overhead < 1.0:
+            raise ValueError(f"adaptive_batch_target_overhead must be in (0, 1), got {self.target_overhead}")
+
+        self.batch_size = min(max(config.batch_size, self.min_size), self.max_size)
+
+        # Smoothed measurements
+        self._overhead_seconds: Optional[float] = None  # Per-batch overhead
+        self._overhead_ratio: Optional[float] = None
+        self._worker_ips: List[Optional[float]] = [None] * num_workers  # Iterations per compute second
+
+        logger.info(f"Adaptive batch sizing enabled: start {self.batch_size}, "
+                    f"range [{self.min_size}, {self.max_size}], "
+                    f"target overhead {self.target_overhead:.0%}")
+
+    def _smooth(self, previous: Optional[float], value: float) -> float:
+        if previous is None:
+            return value
+        return (1.0 - self.smoothing) * previous + self.smoothing * value
+
+    def get_shares(self, batch_size: Optional[int] = None) -> List[int]:
+        """Split a batch among workers in proportion to their throughput.
+
+        Workers without measurements yet get the mean throughput of the others
+        (an even split on the first batch).
+
+        Args:
+            batch_size: Iterations to split (default: the current batch size)
+
+        Returns:
+            Iterations per worker, summing to batch_size
+        """
+        if batch_size is None:
+            batch_size = self.batch_size
+        measured = [ips for ips in self._worker_ips if ips is not None]
+        default_ips = sum(measured) / len(measured) if measured else 1.0
+        weights = [ips if ips is not None else default_ips for ips in self._worker_ips]
+        total_weight = sum(weights)
+
+        # Largest remainder rounding keeps the total exact
+        exact = [batch_size * w / total_weight for w in weights]
+        shares = [int(x) for x in exact]
+        leftover = batch_size - sum(shares)
+        by_remainder = sorted(range(self.num_workers), key=lambda i: exact[i] - shares[i], reverse=True)
+        for worker_id in by_remainder[:leftover]:
+            shares[worker_id] += 1
+        return shares
+
+    def record_batch(self, wall_seconds: float, worker_stats: Dict[int, Dict[str, float]]):
+        """Record one completed batch and resize the next one.
+
+        Args:
+            wall_seconds: Main-process time from dispatch to the end of the merge
+            worker_stats: {worker_id: {'num_iterations': n, 'compute_seconds': s}}
+        """
+        compute_seconds = 0.0
+        for worker_id, stats in worker_stats.items():
+            if stats['num_iterations'] > 0 and stats['compute_seconds'] > 0:
+                ips = stats['num_iterations'] / stats['compute_seconds']
+                self._worker_ips[worker_id] = self._smooth(self._worker_ips[worker_id], ips)
+            compute_seconds = max(compute_seconds, stats['compute_seconds'])
+
+        if wall_seconds <= 0 or compute_seconds <= 0:
+            return
+
+        # Compute runs in parallel: the slowest worker is the batch's critical path
+        overhead_seconds = max(0.0, wall_seconds - compute_seconds)
+        self._overhead_seconds = self._smooth(self._overhead_seconds, overhead_seconds)
+        self._overhead_ratio = self._smooth(self._overhead_ratio, overhead_seconds / wall_seconds)
+
+        measured = [ips for ips in self._worker_ips if ips is not None]
+        if not measured:
+            return
+
+        # With throughput-proportional shares, compute time = batch_size / total throughput;
+        # solve overhead / (overhead + compute) = target for the batch size
+        total_ips = sum(measured) * self.num_workers / len(measured)
+        target_compute = self._overhead_seconds * (1.0 - self.target_overhead) / self.target_overhead
+        desired = target_compute * total_ips
+
+        low = self.batch_size / MAX_RESIZE_FACTOR
+        high = self.batch_size * MAX_RESIZE_FACTOR
+        new_size = int(round(min(max(desired, low), high)))
+        new_size = min(max(new_size, self.min_size), self.max_size)
+
+        if new_size != self.batch_size:
+            logger.debug(f"Adaptive batch size {self.batch_size} -> {new_size} "
+                         f"(overhead ratio {self._overhead_ratio:.1%}, "
+                         f"overhead {1000 * self._overhead_seconds:.1f}ms/batch)")
+            self.batch_size = new_size
+
+    def get_metrics(self) -> Dict[str, float]:
+        """Get current batch sizing metrics for logging.
+
+        Returns:
+            Dictionary of metric names to values
+        """
+        metrics = {'batch/size': float(self.batch_size)}
+        if self._overhead_ratio is not None:
+            metrics['batch/overhead_ratio'] = self._overhead_ratio
+            metrics['batch/overhead_ms'] = 1000.0 * self._overhead_seconds
+        for worker_id, share in enumerate(self.get_shares()):
+            metrics[f'batch/share_worker_{worker_id}'] = float(share)
+        return metrics
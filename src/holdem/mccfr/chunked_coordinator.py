@@ -228,6 +228,8 @@ class ChunkedTrainingCoordinator:
             chunk_elapsed_seconds = time.time() - chunk_start_time
             solver._cumulative_elapsed_seconds += chunk_elapsed_seconds
             
+            solver._training_metrics.close()
+            
             # Flush TensorBoard if enabled
             if solver.writer:
                 logger.info("Flushing TensorBoard logs...")
@@ -354,6 +356,7 @@ class ChunkedTrainingCoordinator:
                     
                     if self.config.dcfr_reset_negative_regrets:
                         solver.sampler.regret_tracker.reset_regrets()
+                        solver._training_metrics.on_regrets_reset()
                     
                     logger.debug(f"DCFR discount at iteration {solver.iteration}: α={alpha:.4f}, β={beta:.4f}")
                     
@@ -381,14 +384,9 @@ class ChunkedTrainingCoordinator:
                 
                 solver.writer.add_scalar('Training/Epsilon', solver._current_epsilon, solver.iteration)
                 
-                # Log policy entropy per street
-                entropy_metrics = solver._calculate_policy_entropy_metrics()
-                for metric_name, value in entropy_metrics.items():
-                    solver.writer.add_scalar(metric_name, value, solver.iteration)
-                
-                # Log normalized regret per street
-                regret_metrics = solver._calculate_regret_norm_metrics()
-                for metric_name, value in regret_metrics.items():
+                # Log policy entropy and normalized regret per street
+                training_metrics = solver._calculate_training_metrics()
+                for metric_name, value in training_metrics.items():
                     solver.writer.add_scalar(metric_name, value, solver.iteration)
             
             # Console logging
@@ -8,6 +8,7 @@ from holdem.abstraction.bucketing import HandBucketing
 from holdem.abstraction.state_encode import StateEncoder
 from holdem.mccfr.regrets import RegretTracker
 from holdem.utils.rng import get_rng
+from holdem.utils.timers import PhaseProfiler
 from holdem.utils.logging import get_logger
 
 logger = get_logger("mccfr.outcome_sampling")
@@ -48,6 +49,13 @@ class OutcomeSampler:
         self.min_unpruned_ratio = min_unpruned_ratio  # e.g., 0.05 = 5%
         self.total_iterations = 0
         self.pruned_iterations = 0
+        
+        # Optional callback notified with each infoset before its regrets/strategy are updated
+        # (installed by TrainingMetricsAggregator for incremental metrics)
+        self.infoset_observer = None
+        
+        # Per-phase timers (disabled by default; solvers share theirs when profiling is on)
+        self.profiler = PhaseProfiler(enabled=False)
     
     def set_epsilon(self, epsilon: float):
         """Update exploration epsilon.
@@ -83,7 +91,8 @@ class OutcomeSampler:
         self.total_iterations += 1
         
         # Sample hands for all players
-        hands = self._deal_hands()
+        with self.profiler.phase('deal'):
+            hands = self._deal_hands()
         
         # Run MCCFR recursion for each player
         utility_sum = 0.0
@@ -143,14 +152,15 @@ class OutcomeSampler:
         
         # Create infoset with versioned encoding
         # Convert action history to abbreviated format (e.g., ["check_call", "bet_0.75p"] -> "C-B75")
-        action_sequence = self.encoder.encode_action_history(history)
-        infoset, _ = self.encoder.encode_infoset(
-            hands[current_player],
-            board,
-            street,
-            action_sequence,
-            use_versioning=True  # Use new versioned format (v2)
-        )
+        with self.profiler.phase('encode'):
+            action_sequence = self.encoder.encode_action_history(history)
+            infoset, _ = self.encoder.encode_infoset(
+                hands[current_player],
+                board,
+                street,
+                action_sequence,
+                use_versioning=True  # Use new versioned format (v2)
+            )
         
         # Dynamic pruning with Pluribus parity rules:
         # 1. Never prune on river
@@ -180,7 +190,8 @@ class OutcomeSampler:
                 return 0.0
         
         # Get current strategy
-        strategy = self.regret_tracker.get_strategy(infoset, actions)
+        with self.profiler.phase('strategy'):
+            strategy = self.regret_tracker.get_strategy(infoset, actions)
         
         # Linear weighting: use iteration number as weight
         weight = float(iteration) if self.use_linear_weighting else 1.0
@@ -204,21 +215,25 @@ class OutcomeSampler:
                 player, reach_prob, sample_player, iteration
             )
             
-            # Update regrets with linear weighting
-            action_utilities = {sampled_action: utility}
-            for action in actions:
-                if action != sampled_action:
-                    action_utilities[action] = 0.0  # Not sampled
-            
-            expected_utility = utility  # Since we only sampled one action
-            
-            for action in actions:
-                regret = action_utilities.get(action, 0.0) - expected_utility
-                self.regret_tracker.update_regret(infoset, action, regret, weight)
-            
-            # Add to strategy sum with linear weighting
-            strategy_weight = weight * reach_prob
-            self.regret_tracker.add_strategy(infoset, strategy, strategy_weight)
+            with self.profiler.phase('regret_update'):
+                if self.infoset_observer is not None:
+                    self.infoset_observer(infoset)
+                
+                # Update regrets with linear weighting
+                action_utilities = {sampled_action: utility}
+                for action in actions:
+                    if action != sampled_action:
+                        action_utilities[action] = 0.0  # Not sampled
+                
+                expected_utility = utility  # Since we only sampled one action
+                
+                for action in actions:
+                    regret = action_utilities.get(action, 0.0) - expected_utility
+                    self.regret_tracker.update_regret(infoset, action, regret, weight)
+                
+                # Add to strategy sum with linear weighting
+                strategy_weight = weight * reach_prob
+                self.regret_tracker.add_strategy(infoset, strategy, strategy_weight)
             
             return utility
         
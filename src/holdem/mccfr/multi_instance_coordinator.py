@@ -20,6 +20,10 @@ from holdem.types import MCCFRConfig
 from holdem.abstraction.bucketing import HandBucketing
 from holdem.mccfr.solver import MCCFRSolver
 from holdem.utils.logging import get_logger, setup_logger
+from holdem.utils.affinity import (
+    affinity_supported, plan_cpu_sets, pin_current_process, limit_blas_threads,
+    blas_thread_env, CpuUtilizationMonitor
+)
 
 logger = get_logger("mccfr.multi_instance")
 
@@ -73,7 +77,9 @@ def _run_solver_instance(
     use_time_budget: bool,
     start_iter: int = 0,
     end_iter: int = None,
-    resume_checkpoint: Path = None
+    resume_checkpoint: Path = None,
+    cpu_set: Optional[List[int]] = None,
+    blas_threads: Optional[int] = None
 ):
     """Run a single solver instance in a separate process.
     
@@ -92,10 +98,16 @@ def _run_solver_instance(
         start_iter: Starting iteration (inclusive) - only used in iteration mode
         end_iter: Ending iteration (exclusive) - only used in iteration mode
         resume_checkpoint: Path to checkpoint file to resume from (optional)
+        cpu_set: CPUs to pin this instance to (optional, Linux only)
+        blas_threads: Cap on BLAS/OpenMP threads in this instance (optional)
     """
     # Setup instance-specific logger
     instance_logger = setup_logger(f"instance_{instance_id}", log_file=logdir / f"instance_{instance_id}.log")
     
+    limit_blas_threads(blas_threads)
+    if pin_current_process(cpu_set):
+        instance_logger.info(f"Instance {instance_id} pinned to CPUs {cpu_set}")
+    
     try:
         if use_time_budget:
             instance_logger.info(f"Instance {instance_id} starting: time budget {config.time_budget_seconds:.0f}s")
@@ -389,6 +401,7 @@ class MultiInstanceCoordinator:
         self._processes: List[mp.Process] = []
         self._progress_files: List[Path] = []
         self._interrupted = False
+        self._cpu_monitor: Optional[CpuUtilizationMonitor] = None
     
     def _calculate_iteration_ranges(self) -> List[Tuple[int, int]]:
         """Calculate iteration ranges for each instance.
@@ -525,73 +538,99 @@ class MultiInstanceCoordinator:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
         
+        # Plan CPU placement (one CPU set per instance, coordinator on its own CPU when available)
+        instance_cpu_sets = [None] * self.num_instances
+        monitored_cpus = None
+        if self.config.cpu_affinity:
+            if affinity_supported():
+                coordinator_cpus, instance_cpu_sets = plan_cpu_sets(
+                    self.num_instances,
+                    reserve_main=True,
+                    spread_numa=self.config.numa_spread
+                )
+                pin_current_process(coordinator_cpus)
+                monitored_cpus = sorted(set(coordinator_cpus).union(*instance_cpu_sets))
+                logger.info(f"Coordinator pinned to CPUs {coordinator_cpus}")
+            else:
+                logger.warning("cpu_affinity requested but not supported on this platform, ignoring")
+        self._cpu_monitor = CpuUtilizationMonitor(cpus=monitored_cpus)
+        
         # Launch instances
         mp_context = mp.get_context('spawn')
-        
-        if self.use_time_budget:
-            # Time-budget mode: all instances run for the same time budget
-            for i in range(self.num_instances):
-                progress_file = progress_dir / f"instance_{i}_progress.json"
-                self._progress_files.append(progress_file)
+        # Spawned instances import numpy before any instance code runs, so the BLAS cap goes in their env
+        with blas_thread_env(self.config.worker_blas_threads):
+            if self.use_time_budget:
+                # Time-budget mode: all instances run for the same time budget
+                for i in range(self.num_instances):
+                    progress_file = progress_dir / f"instance_{i}_progress.json"
+                    self._progress_files.append(progress_file)
                 
-                # Get resume checkpoint if available
-                resume_checkpoint = resume_checkpoints[i] if resume_checkpoints and i < len(resume_checkpoints) else None
+                    # Get resume checkpoint if available
+                    resume_checkpoint = resume_checkpoints[i] if resume_checkpoints and i < len(resume_checkpoints) else None
                 
-                # Create process
-                p = mp_context.Process(
-                    target=_run_solver_instance,
-                    args=(
-                        i,
-                        self.config,
-                        self.bucketing,
-                        self.num_players,
-                        logdir,
-                        use_tensorboard,
-                        progress_file,
-                        True,  # use_time_budget
-                    ),
-                    kwargs={'resume_checkpoint': resume_checkpoint}
-                )
-                p.start()
-                self._processes.append(p)
+                    # Create process
+                    p = mp_context.Process(
+                        target=_run_solver_instance,
+                        args=(
+                            i,
+                            self.config,
+                            self.bucketing,
+                            self.num_players,
+                            logdir,
+                            use_tensorboard,
+                            progress_file,
+                            True,  # use_time_budget
+                        ),
+                        kwargs={
+                            'resume_checkpoint': resume_checkpoint,
+                            'cpu_set': instance_cpu_sets[i],
+                            'blas_threads': self.config.worker_blas_threads
+                        }
+                    )
+                    p.start()
+                    self._processes.append(p)
                 
-                if resume_checkpoint:
-                    logger.info(f"Launched instance {i} (PID: {p.pid}) - resuming from checkpoint")
-                else:
-                    logger.info(f"Launched instance {i} (PID: {p.pid}) - time budget: {self.config.time_budget_seconds:.0f}s")
-        else:
-            # Iteration-based mode: distribute iterations among instances
-            for i, (start_iter, end_iter) in enumerate(self.iteration_ranges):
-                progress_file = progress_dir / f"instance_{i}_progress.json"
-                self._progress_files.append(progress_file)
+                    if resume_checkpoint:
+                        logger.info(f"Launched instance {i} (PID: {p.pid}) - resuming from checkpoint")
+                    else:
+                        logger.info(f"Launched instance {i} (PID: {p.pid}) - time budget: {self.config.time_budget_seconds:.0f}s")
+            else:
+                # Iteration-based mode: distribute iterations among instances
+                for i, (start_iter, end_iter) in enumerate(self.iteration_ranges):
+                    progress_file = progress_dir / f"instance_{i}_progress.json"
+                    self._progress_files.append(progress_file)
                 
-                # Get resume checkpoint if available
-                resume_checkpoint = resume_checkpoints[i] if resume_checkpoints and i < len(resume_checkpoints) else None
+                    # Get resume checkpoint if available
+                    resume_checkpoint = resume_checkpoints[i] if resume_checkpoints and i < len(resume_checkpoints) else None
                 
-                # Create process
-                p = mp_context.Process(
-                    target=_run_solver_instance,
-                    args=(
-                        i,
-                        self.config,
-                        self.bucketing,
-                        self.num_players,
-                        logdir,
-                        use_tensorboard,
-                        progress_file,
-                        False,  # use_time_budget
-                        start_iter,
-                        end_iter
-                    ),
-                    kwargs={'resume_checkpoint': resume_checkpoint}
-                )
-                p.start()
-                self._processes.append(p)
+                    # Create process
+                    p = mp_context.Process(
+                        target=_run_solver_instance,
+                        args=(
+                            i,
+                            self.config,
+                            self.bucketing,
+                            self.num_players,
+                            logdir,
+                            use_tensorboard,
+                            progress_file,
+                            False,  # use_time_budget
+                            start_iter,
+                            end_iter
+                        ),
+                        kwargs={
+                            'resume_checkpoint': resume_checkpoint,
+                            'cpu_set': instance_cpu_sets[i],
+                            'blas_threads': self.config.worker_blas_threads
+                        }
+                    )
+                    p.start()
+                    self._processes.append(p)
                 
-                if resume_checkpoint:
-                    logger.info(f"Launched instance {i} (PID: {p.pid}) - resuming from checkpoint")
-                else:
-                    logger.info(f"Launched instance {i} (PID: {p.pid}) - iterations {start_iter} to {end_iter-1}")
+                    if resume_checkpoint:
+                        logger.info(f"Launched instance {i} (PID: {p.pid}) - resuming from checkpoint")
+                    else:
+                        logger.info(f"Launched instance {i} (PID: {p.pid}) - iterations {start_iter} to {end_iter-1}")
         
         # Monitor progress
         self._monitor_progress(progress_dir)
@@ -701,6 +740,11 @@ class MultiInstanceCoordinator:
                     f"(iter {p.get('current_iter', 0)}/{p.get('end_iter', 0)})"
                 )
         
+        if self._cpu_monitor is not None and self._cpu_monitor.available:
+            utilization = self._cpu_monitor.sample()
+            if utilization:
+                logger.info(f"Per-core CPU utilization: {CpuUtilizationMonitor.format(utilization)}")
+        
         logger.info(f"=" * 60)
     
     def _terminate_all(self):
@@ -1,5 +1,6 @@
 """Parallel MCCFR solver using multiprocessing."""
 
+import gc
 import multiprocessing as mp
 import platform
 import queue
@@ -13,7 +14,11 @@ from holdem.mccfr.mccfr_os import OutcomeSampler
 from holdem.mccfr.policy_store import PolicyStore
 from holdem.mccfr.regrets import RegretTracker
 from holdem.utils.logging import get_logger
-from holdem.utils.timers import Timer
+from holdem.utils.timers import Timer, PhaseProfiler
+from holdem.utils.affinity import (
+    affinity_supported, available_cpus, plan_cpu_sets, pin_current_process,
+    limit_blas_threads, blas_thread_env, CpuUtilizationMonitor
+)
 
 logger = get_logger("mccfr.parallel_solver")
 
@@ -58,6 +63,11 @@ else:
 RESULT_PUT_TIMEOUT_SECONDS = 60  # Timeout for putting results in queue (60s - handles large payloads)
 ERROR_PUT_TIMEOUT_SECONDS = 5  # Timeout for putting error results (5s - shorter since errors are small)
 
+# Worker start methods (config.mp_start_method); fork/forkserver are only enabled on Linux
+# (fork is unsafe with macOS system frameworks, forkserver is unavailable on Windows)
+SUPPORTED_START_METHODS = ("spawn", "fork", "forkserver")
+WORKER_READY_TIMEOUT_SECONDS = WORKER_TIMEOUT_MIN_SECONDS  # Max wait for all workers to finish startup
+
 # Worker monitoring configuration
 WORKER_STATUS_CHECK_INTERVAL = 10  # Check worker status every N results collected
 
@@ -74,6 +84,65 @@ except ImportError:
     logger.warning("TensorBoard not available. Install tensorboard for training visualization: pip install tensorboard")
 
 
+def _resolve_start_method(requested: str) -> str:
+    """Validate the requested multiprocessing start method for this platform.
+    
+    Args:
+        requested: "spawn", "fork" or "forkserver"
+        
+    Returns:
+        The start method to use ("spawn" when fork/forkserver is requested off Linux)
+    """
+    if requested not in SUPPORTED_START_METHODS:
+        raise ValueError(
+            f"Invalid mp_start_method: {requested}. Must be one of {', '.join(SUPPORTED_START_METHODS)}"
+        )
+    if requested != "spawn" and platform.system() != "Linux":
+        logger.warning(f"mp_start_method='{requested}' is only supported on Linux, falling back to 'spawn'")
+        return "spawn"
+    return requested
+
+
+def _crossed_interval(previous_iteration: int, iteration: int, interval: int) -> bool:
+    """Whether a multiple of interval lies in (previous_iteration, iteration].
+    
+    Batches advance the iteration counter by batch_size, which need not divide
+    the logging/discount/checkpoint intervals (and varies with adaptive sizing).
+    """
+    if not interval or interval <= 0:
+        return False
+    return iteration // interval > previous_iteration // interval
+
+
+def _process_memory_mb() -> Dict[str, float]:
+    """Memory usage of the current process in MB.
+    
+    On Linux, reads /proc/self/smaps_rollup, which separates pages shared
+    copy-on-write with the parent from private ones. Elsewhere only the
+    peak RSS is available.
+    
+    Returns:
+        Dictionary with rss_mb and, on Linux, pss_mb and private_mb
+    """
+    try:
+        fields = {}
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in ('Rss', 'Pss', 'Private_Clean', 'Private_Dirty'):
+                    fields[key] = int(value.split()[0]) / 1024  # kB -> MB
+        return {
+            'rss_mb': fields['Rss'],
+            'pss_mb': fields['Pss'],
+            'private_mb': fields['Private_Clean'] + fields['Private_Dirty'],
+        }
+    except (OSError, KeyError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and in KB elsewhere
+        return {'rss_mb': peak / (1024 * 1024) if _is_macos() else peak / 1024}
+
+
 def _diagnostic_test_worker(queue: mp.Queue):
     """Simple worker function for diagnostic multiprocessing test.
     
@@ -95,7 +164,10 @@ def persistent_worker_process(
     pruning_threshold: float,
     pruning_probability: float,
     task_queue: mp.Queue,
-    result_queue: mp.Queue
+    result_queue: mp.Queue,
+    enable_profiling: bool = False,
+    cpu_set: Optional[List[int]] = None,
+    blas_threads: Optional[int] = None
 ):
     """Persistent worker process that processes multiple batches.
     
@@ -113,12 +185,22 @@ def persistent_worker_process(
         pruning_probability: Pruning probability
         task_queue: Queue to receive tasks from main process
         result_queue: Queue to send results to main process
+        enable_profiling: Time sampler/delta phases and return them with each result
+        cpu_set: CPUs to pin this worker to (None = no pinning)
+        blas_threads: Cap on BLAS/OpenMP threads in this worker (None = library default)
     """
     worker_logger = get_logger(f"mccfr.worker_{worker_id}")
     sampler = None
+    profiler = PhaseProfiler(enabled=enable_profiling)
     
     try:
+        limit_blas_threads(blas_threads)
+        if pin_current_process(cpu_set):
+            worker_logger.debug(f"Worker {worker_id} pinned to CPUs {cpu_set}")
+        
         worker_logger.info(f"Worker {worker_id} started and ready for tasks")
+        # Startup handshake: lets the main process measure pool start time and per-worker memory
+        result_queue.put({'worker_id': worker_id, 'ready': True, 'memory': _process_memory_mb()})
         
         while True:
             # Wait for task from main process
@@ -149,55 +231,61 @@ def persistent_worker_process(
                     pruning_threshold=pruning_threshold,
                     pruning_probability=pruning_probability
                 )
+                sampler.profiler = profiler
                 worker_logger.debug(f"Worker {worker_id} sampler initialized with epsilon={epsilon:.3f}")
             
             # Snapshot state before running batch to compute deltas
             # This allows us to send only incremental updates, not the entire accumulated state
-            regrets_before = {}
-            strategy_sum_before = {}
-            
-            for infoset in sampler.regret_tracker.regrets:
-                regrets_before[infoset] = dict(sampler.regret_tracker.regrets[infoset])
-            
-            for infoset in sampler.regret_tracker.strategy_sum:
-                strategy_sum_before[infoset] = dict(sampler.regret_tracker.strategy_sum[infoset])
+            with profiler.phase('delta'):
+                regrets_before = {}
+                strategy_sum_before = {}
+                
+                for infoset in sampler.regret_tracker.regrets:
+                    regrets_before[infoset] = dict(sampler.regret_tracker.regrets[infoset])
+                
+                for infoset in sampler.regret_tracker.strategy_sum:
+                    strategy_sum_before[infoset] = dict(sampler.regret_tracker.strategy_sum[infoset])
             
-            # Run iterations
+            # Run iterations (compute time feeds the main process's adaptive batch sizing)
             utilities = []
+            compute_start = time.perf_counter()
             
             for i in range(num_iterations):
                 iteration = iteration_start + i
                 utility = sampler.sample_iteration(iteration)
                 utilities.append(utility)
             
+            compute_seconds = time.perf_counter() - compute_start
+            
             # Compute deltas: only send the incremental changes made during this batch
             # This prevents the data transfer size from growing unboundedly as training progresses
-            regret_updates = {}  # Track regret deltas: {infoset: {action: delta_regret}}
-            strategy_updates = {}  # Track strategy deltas: {infoset: {action: delta_weight}}
-            
-            # Calculate regret deltas
-            for infoset in sampler.regret_tracker.regrets:
-                regret_delta = {}
-                for action, new_value in sampler.regret_tracker.regrets[infoset].items():
-                    old_value = regrets_before.get(infoset, {}).get(action, 0.0)
-                    delta = new_value - old_value
-                    if delta != 0.0:  # Only include non-zero deltas
-                        regret_delta[action] = delta
+            with profiler.phase('delta'):
+                regret_updates = {}  # Track regret deltas: {infoset: {action: delta_regret}}
+                strategy_updates = {}  # Track strategy deltas: {infoset: {action: delta_weight}}
                 
-                if regret_delta:  # Only include infosets with changes
-                    regret_updates[infoset] = regret_delta
-            
-            # Calculate strategy deltas
-            for infoset in sampler.regret_tracker.strategy_sum:
-                strategy_delta = {}
-                for action, new_value in sampler.regret_tracker.strategy_sum[infoset].items():
-                    old_value = strategy_sum_before.get(infoset, {}).get(action, 0.0)
-                    delta = new_value - old_value
-                    if delta != 0.0:  # Only include non-zero deltas
-                        strategy_delta[action] = delta
+                # Calculate regret deltas
+                for infoset in sampler.regret_tracker.regrets:
+                    regret_delta = {}
+                    for action, new_value in sampler.regret_tracker.regrets[infoset].items():
+                        old_value = regrets_before.get(infoset, {}).get(action, 0.0)
+                        delta = new_value - old_value
+                        if delta != 0.0:  # Only include non-zero deltas
+                            regret_delta[action] = delta
+                    
+                    if regret_delta:  # Only include infosets with changes
+                        regret_updates[infoset] = regret_delta
                 
-                if strategy_delta:  # Only include infosets with changes
-                    strategy_updates[infoset] = strategy_delta
+                # Calculate strategy deltas
+                for infoset in sampler.regret_tracker.strategy_sum:
+                    strategy_delta = {}
+                    for action, new_value in sampler.regret_tracker.strategy_sum[infoset].items():
+                        old_value = strategy_sum_before.get(infoset, {}).get(action, 0.0)
+                        delta = new_value - old_value
+                        if delta != 0.0:  # Only include non-zero deltas
+                            strategy_delta[action] = delta
+                    
+                    if strategy_delta:  # Only include infosets with changes
+                        strategy_updates[infoset] = strategy_delta
             
             worker_logger.debug(f"Worker {worker_id} completed batch: {len(utilities)} iterations, "
                               f"{len(regret_updates)} infosets with regret changes, "
@@ -210,9 +298,13 @@ def persistent_worker_process(
                 'utilities': utilities,
                 'regret_updates': regret_updates,
                 'strategy_updates': strategy_updates,
+                'num_iterations': num_iterations,
+                'compute_seconds': compute_seconds,
+                'phase_times': profiler.snapshot(),
                 'success': True,
                 'error': None
             }
+            profiler.reset()
             
             # Use a timeout to avoid indefinite blocking on large results
             # The main process should be actively consuming results, but this provides a safeguard
@@ -280,9 +372,13 @@ class ParallelMCCFRSolver:
         # Use config.num_players if num_players not explicitly provided
         self.num_players = num_players if num_players is not None else config.num_players
         
-        # Create multiprocessing context with 'spawn' for cross-platform compatibility
+        # Create multiprocessing context ('spawn' by default for cross-platform compatibility)
         # Use get_context() instead of set_start_method() to avoid conflicts
-        self.mp_context = mp.get_context('spawn')
+        self.start_method = _resolve_start_method(config.mp_start_method)
+        self.mp_context = mp.get_context(self.start_method)
+        if self.start_method == "forkserver":
+            # Import the solver stack once in the fork server instead of once per worker
+            self.mp_context.set_forkserver_preload(['holdem.mccfr.parallel_solver'])
         
         # Determine number of workers
         if self.config.num_workers == 0:
@@ -327,11 +423,29 @@ class ParallelMCCFRSolver:
             self._adaptive_scheduler = AdaptiveEpsilonScheduler(config)
             logger.info("Adaptive epsilon scheduling enabled")
         
-        # Worker pool management
+        # Initialize adaptive batch sizer if enabled
+        self._batch_sizer = None
+        if config.adaptive_batch_enabled:
+            from holdem.mccfr.adaptive_batch import AdaptiveBatchSizer
+            self._batch_sizer = AdaptiveBatchSizer(config, self.num_workers)
+        
+        # Worker pool management (one task queue per worker so batch shares can differ per worker)
         self._workers: List[mp.Process] = []
-        self._task_queue: Optional[mp.Queue] = None
+        self._task_queues: List[mp.Queue] = []
         self._result_queue: Optional[mp.Queue] = None
         self._workers_started = False
+        
+        # Worker pool startup statistics (start method, start time, per-worker memory)
+        self.pool_stats: Dict = {}
+        
+        # CPU placement (config.cpu_affinity) and per-core utilization reporting
+        self._main_cpus: Optional[List[int]] = None
+        self._worker_cpu_sets: List[Optional[List[int]]] = [None] * self.num_workers
+        self._saved_affinity: Optional[List[int]] = None
+        self._cpu_monitor: Optional[CpuUtilizationMonitor] = None
+        
+        # Per-phase timers (main process phases plus worker phases merged under "worker/")
+        self.profiler = PhaseProfiler(enabled=config.enable_phase_profiling)
     
     def _merge_worker_results(self, results: List[Dict]):
         """Merge regret and strategy updates from workers.
@@ -378,35 +492,143 @@ class ParallelMCCFRSolver:
             logger.warning("Worker pool already started")
             return
         
-        logger.info(f"Starting worker pool with {self.num_workers} persistent worker(s)...")
+        logger.info(f"Starting worker pool with {self.num_workers} persistent worker(s) "
+                    f"(start method: '{self.start_method}')...")
+        pool_start_time = time.perf_counter()
         
         # Create task and result queues
-        self._task_queue = self.mp_context.Queue()
+        self._task_queues = [self.mp_context.Queue() for _ in range(self.num_workers)]
         self._result_queue = self.mp_context.Queue()
         
-        # Start worker processes
+        # With fork, workers receive the bucketing (KMeans models, tables) by inheriting the
+        # parent's memory instead of unpickling a copy. Freezing the GC moves existing objects
+        # out of the collected generations so the children's collector never writes to (and
+        # un-shares) their pages.
+        if self.start_method == "fork":
+            gc.collect()
+            gc.freeze()
+        
+        self._plan_cpu_placement()
+        
+        # Start worker processes (spawned workers inherit the BLAS thread cap through the environment)
         self._workers = []
-        for worker_id in range(self.num_workers):
-            p = self.mp_context.Process(
-                target=persistent_worker_process,
-                args=(
-                    worker_id,
-                    self.bucketing,
-                    self.num_players,
-                    self.config.use_linear_weighting,
-                    self.config.enable_pruning,
-                    self.config.pruning_threshold,
-                    self.config.pruning_probability,
-                    self._task_queue,
-                    self._result_queue
+        with blas_thread_env(self.config.worker_blas_threads):
+            for worker_id in range(self.num_workers):
+                self._start_worker(worker_id)
+        
+        if self.start_method == "fork":
+            gc.unfreeze()
+        
+        # Keep merge/IPC work in the main process off the workers' cores
+        if self._main_cpus is not None:
+            self._saved_affinity = available_cpus()
+            pin_current_process(self._main_cpus)
+            logger.info(f"Main process pinned to CPUs {self._main_cpus}")
+        
+        self._workers_started = True
+        worker_memory = self._wait_for_workers_ready()
+        self.pool_stats = {
+            'start_method': self.start_method,
+            'num_workers': self.num_workers,
+            'start_seconds': time.perf_counter() - pool_start_time,
+            'worker_memory': worker_memory,
+        }
+        for key in ('rss_mb', 'pss_mb', 'private_mb'):
+            values = [memory[key] for memory in worker_memory if key in memory]
+            if values:
+                self.pool_stats[f'worker_avg_{key}'] = sum(values) / len(values)
+        
+        memory_summary = ", ".join(
+            f"{key[len('worker_avg_'):-len('_mb')]}={self.pool_stats[key]:.1f} MB"
+            for key in ('worker_avg_rss_mb', 'worker_avg_pss_mb', 'worker_avg_private_mb')
+            if key in self.pool_stats
+        )
+        logger.info(f"Worker pool started successfully with {self.num_workers} worker(s) "
+                    f"in {self.pool_stats['start_seconds']:.2f}s (per-worker memory: {memory_summary})")
+    
+    def _start_worker(self, worker_id: int):
+        """Start one persistent worker process."""
+        p = self.mp_context.Process(
+            target=persistent_worker_process,
+            args=(
+                worker_id,
+                self.bucketing,
+                self.num_players,
+                self.config.use_linear_weighting,
+                self.config.enable_pruning,
+                self.config.pruning_threshold,
+                self.config.pruning_probability,
+                self._task_queues[worker_id],
+                self._result_queue,
+                self.config.enable_phase_profiling,
+                self._worker_cpu_sets[worker_id],
+                self.config.worker_blas_threads
+            )
+        )
+        p.start()
+        self._workers.append(p)
+        logger.debug(f"Started persistent worker {worker_id} with PID {p.pid}")
+    
+    def _plan_cpu_placement(self):
+        """Assign CPU sets to the main process and workers (config.cpu_affinity)."""
+        monitored_cpus = None
+        if self.config.cpu_affinity:
+            if affinity_supported():
+                self._main_cpus, worker_cpu_sets = plan_cpu_sets(
+                    self.num_workers,
+                    reserve_main=True,
+                    spread_numa=self.config.numa_spread
                 )
+                self._worker_cpu_sets = worker_cpu_sets
+                monitored_cpus = sorted(set(self._main_cpus).union(*worker_cpu_sets))
+                for worker_id, cpus in enumerate(worker_cpu_sets):
+                    logger.info(f"Worker {worker_id} will be pinned to CPUs {cpus}")
+            else:
+                logger.warning("cpu_affinity requested but not supported on this platform, ignoring")
+        self._cpu_monitor = CpuUtilizationMonitor(cpus=monitored_cpus)
+    
+    def _log_cpu_utilization(self):
+        """Log per-core utilization since the previous call (Linux only)."""
+        if self._cpu_monitor is None or not self._cpu_monitor.available:
+            return
+        utilization = self._cpu_monitor.sample()
+        if not utilization:
+            return
+        logger.info(f"Per-core CPU utilization: {CpuUtilizationMonitor.format(utilization)}")
+        if self.writer:
+            self.writer.add_scalar(
+                'Performance/CPUUtilizationMean', sum(utilization.values()) / len(utilization), self.iteration
             )
-            p.start()
-            self._workers.append(p)
-            logger.debug(f"Started persistent worker {worker_id} with PID {p.pid}")
+            self.writer.add_scalar('Performance/CPUUtilizationMin', min(utilization.values()), self.iteration)
+    
+    def _wait_for_workers_ready(self) -> List[Dict[str, float]]:
+        """Wait for the startup handshake of every worker.
         
-        self._workers_started = True
-        logger.info(f"Worker pool started successfully with {self.num_workers} worker(s)")
+        Returns:
+            Memory usage reported by each worker, ordered by worker ID
+            
+        Raises:
+            RuntimeError: If a worker fails during startup or does not report in time
+        """
+        memory_by_worker = {}
+        deadline = time.time() + WORKER_READY_TIMEOUT_SECONDS
+        while len(memory_by_worker) < self.num_workers:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                self._stop_worker_pool()
+                raise RuntimeError(
+                    f"Only {len(memory_by_worker)}/{self.num_workers} workers started "
+                    f"within {WORKER_READY_TIMEOUT_SECONDS}s"
+                )
+            try:
+                message = self._result_queue.get(timeout=min(remaining, QUEUE_GET_TIMEOUT_MAX))
+            except queue.Empty:
+                continue
+            if not message.get('ready', False):
+                self._stop_worker_pool()
+                raise RuntimeError(f"Worker {message['worker_id']} failed during startup:\n{message.get('error')}")
+            memory_by_worker[message['worker_id']] = message['memory']
+        return [memory_by_worker[worker_id] for worker_id in sorted(memory_by_worker)]
     
     def _stop_worker_pool(self):
         """Stop persistent worker processes gracefully."""
@@ -416,8 +638,8 @@ class ParallelMCCFRSolver:
         logger.info("Stopping worker pool...")
         
         # Send shutdown signal to all workers
-        for _ in range(self.num_workers):
-            self._task_queue.put({'shutdown': True})
+        for task_queue in self._task_queues:
+            task_queue.put({'shutdown': True})
         
         # Wait for workers to finish gracefully
         for worker_id, p in enumerate(self._workers):
@@ -433,6 +655,10 @@ class ParallelMCCFRSolver:
         
         self._workers = []
         self._workers_started = False
+        
+        if self._saved_affinity is not None:
+            pin_current_process(self._saved_affinity)
+            self._saved_affinity = None
         logger.info("Worker pool stopped")
     
     def train(self, logdir: Path = None, use_tensorboard: bool = True):
@@ -442,9 +668,9 @@ class ParallelMCCFRSolver:
             logdir: Directory for logs and checkpoints
             use_tensorboard: Enable TensorBoard logging (requires tensorboard package)
         """
-        # Using 'spawn' context for cross-platform compatibility (Mac/Linux)
-        # This was initialized in __init__ to avoid conflicts with already-used context
-        logger.info(f"Using multiprocessing context: 'spawn' for cross-platform compatibility")
+        # Context was initialized in __init__ ('spawn' unless fork/forkserver was requested on Linux)
+        # to avoid conflicts with an already-used context
+        logger.info(f"Using multiprocessing context: '{self.start_method}'")
         
         # Verify multiprocessing is working by running a simple test
         logger.info("Running multiprocessing diagnostic test...")
@@ -499,7 +725,8 @@ class ParallelMCCFRSolver:
             logger.info(f"Starting parallel MCCFR training for {self.config.num_iterations} iterations")
         
         logger.info(f"Using {self.num_workers} worker process(es)")
-        logger.info(f"Batch size: {self.config.batch_size} iterations (merge period between workers)")
+        logger.info(f"Batch size: {self.config.batch_size} iterations (merge period between workers)"
+                    f"{', adaptive' if self._batch_sizer is not None else ''}")
         
         # Initialize TensorBoard writer if requested and available
         if logdir and use_tensorboard and TENSORBOARD_AVAILABLE:
@@ -518,6 +745,7 @@ class ParallelMCCFRSolver:
         last_logged_iteration = 0  # Track iterations at last log for accurate rate calculation
         timer = Timer()
         timer.start()
+        profile_start_iteration = self.iteration
         
         # Track metrics for moving averages
         utility_history = []
@@ -541,48 +769,58 @@ class ParallelMCCFRSolver:
                     break
                 
                 # Run batch of iterations in parallel
-                batch_size = self.config.batch_size
-                
-                # Distribute work evenly across workers, ensuring all iterations are executed
-                # Use floor division to get base iterations per worker
-                base_iterations_per_worker = batch_size // self.num_workers
-                # Calculate remainder to distribute among first workers
-                remainder = batch_size % self.num_workers
-                
-                # Warn if batch size is too small for the number of workers
-                if base_iterations_per_worker == 0:
-                    logger.warning(f"Batch size ({batch_size}) is smaller than number of workers ({self.num_workers}). "
-                                 f"Consider increasing --batch-size to at least {self.num_workers} for better performance.")
+                batch_start_time = time.perf_counter()
+                if self._batch_sizer is not None:
+                    batch_size = self._batch_sizer.batch_size
+                    if not use_time_budget:
+                        # Do not overshoot num_iterations with a resized batch
+                        batch_size = min(batch_size, self.config.num_iterations - self.iteration)
+                    worker_shares = self._batch_sizer.get_shares(batch_size)
+                else:
+                    batch_size = self.config.batch_size
+                    
+                    # Distribute work evenly across workers, ensuring all iterations are executed
+                    # Use floor division to get base iterations per worker
+                    base_iterations_per_worker = batch_size // self.num_workers
+                    # Calculate remainder to distribute among first workers
+                    remainder = batch_size % self.num_workers
+                    
+                    # Warn if batch size is too small for the number of workers
+                    if base_iterations_per_worker == 0:
+                        logger.warning(f"Batch size ({batch_size}) is smaller than number of workers ({self.num_workers}). "
+                                     f"Consider increasing --batch-size to at least {self.num_workers} for better performance.")
+                    
+                    # First 'remainder' workers get one extra iteration
+                    worker_shares = [
+                        base_iterations_per_worker + (1 if worker_id < remainder else 0)
+                        for worker_id in range(self.num_workers)
+                    ]
                 
-                logger.debug(f"Dispatching batch to workers: {self.num_workers} workers, "
-                           f"{base_iterations_per_worker} base iterations each, "
-                           f"{remainder} workers get +1 iteration")
+                logger.debug(f"Dispatching batch of {batch_size} iterations to workers: shares {worker_shares}")
                 
-                # Send tasks to workers via task queue
+                # Send tasks to workers via their task queues
                 # Distribute iterations ensuring total equals batch_size
                 current_iteration = self.iteration
-                for worker_id in range(self.num_workers):
-                    # First 'remainder' workers get one extra iteration
-                    iterations_for_this_worker = base_iterations_per_worker + (1 if worker_id < remainder else 0)
-                    
-                    # Skip workers with no work (only happens if batch_size < num_workers)
-                    if iterations_for_this_worker == 0:
-                        continue
-                    
-                    task = {
-                        'epsilon': self._current_epsilon,
-                        'iteration_start': current_iteration,
-                        'num_iterations': iterations_for_this_worker
-                    }
-                    self._task_queue.put(task)
-                    logger.debug(f"Dispatched task to worker {worker_id}: iterations {current_iteration} "
-                               f"to {current_iteration + iterations_for_this_worker - 1} "
-                               f"({iterations_for_this_worker} iterations)")
-                    
-                    current_iteration += iterations_for_this_worker
+                with self.profiler.phase('dispatch'):
+                    for worker_id, iterations_for_this_worker in enumerate(worker_shares):
+                        # Skip workers with no work (only happens if batch_size < num_workers)
+                        if iterations_for_this_worker == 0:
+                            continue
+                        
+                        task = {
+                            'epsilon': self._current_epsilon,
+                            'iteration_start': current_iteration,
+                            'num_iterations': iterations_for_this_worker
+                        }
+                        self._task_queues[worker_id].put(task)
+                        logger.debug(f"Dispatched task to worker {worker_id}: iterations {current_iteration} "
+                                   f"to {current_iteration + iterations_for_this_worker - 1} "
+                                   f"({iterations_for_this_worker} iterations)")
+                        
+                        current_iteration += iterations_for_this_worker
                 
                 # Calculate expected number of active workers (for result collection)
-                active_workers = min(self.num_workers, batch_size)
+                active_workers = sum(1 for share in worker_shares if share > 0)
                 
                 # Collect results from workers with adaptive backoff
                 # Adaptive backoff reduces context switching and GIL contention on macOS/Apple Silicon
@@ -590,13 +828,14 @@ class ParallelMCCFRSolver:
                 # when results arrive. This prevents the progressive CPU collapse seen with multiple workers.
                 results = []
                 # Calculate timeout based on maximum iterations per worker
-                max_iterations_per_worker = base_iterations_per_worker + (1 if remainder > 0 else 0)
+                max_iterations_per_worker = max(worker_shares)
                 timeout_seconds = max(WORKER_TIMEOUT_MIN_SECONDS, max_iterations_per_worker * WORKER_TIMEOUT_MULTIPLIER)
                 start_wait_time = time.time()
                 
                 # Adaptive timeout for queue polling
                 current_timeout = QUEUE_GET_TIMEOUT_SECONDS
                 consecutive_empty_polls = 0
+                wait_start_time = time.perf_counter()
                 
                 while len(results) < active_workers:
                     # Check if timeout exceeded
@@ -667,6 +906,9 @@ class ParallelMCCFRSolver:
                             if not p.is_alive() and p.exitcode is not None and p.exitcode != 0:
                                 logger.error(f"Worker process {p.pid} died with exit code {p.exitcode}")
                 
+                if self.profiler.enabled:
+                    self.profiler.add('wait', time.perf_counter() - wait_start_time)
+                
                 # Check for worker errors
                 failed_workers = []
                 for result in results:
@@ -689,9 +931,26 @@ class ParallelMCCFRSolver:
                     raise RuntimeError(f"Workers {failed_workers} failed during execution")
                 
                 # Merge worker results
-                self._merge_worker_results(results)
+                with self.profiler.phase('merge'):
+                    self._merge_worker_results(results)
+                if self.profiler.enabled:
+                    for result in results:
+                        self.profiler.merge(result.get('phase_times', {}), prefix='worker/')
+                
+                if self._batch_sizer is not None:
+                    self._batch_sizer.record_batch(
+                        time.perf_counter() - batch_start_time,
+                        {
+                            result['worker_id']: {
+                                'num_iterations': result.get('num_iterations', 0),
+                                'compute_seconds': result.get('compute_seconds', 0.0)
+                            }
+                            for result in results
+                        }
+                    )
                 
                 # Update iteration count
+                previous_iteration = self.iteration
                 self.iteration += batch_size
                 
                 # Collect utilities for logging
@@ -707,12 +966,13 @@ class ParallelMCCFRSolver:
                 self._update_epsilon_schedule()
                 
                 # Linear MCCFR discount at regular intervals
-                if (self.iteration % self.config.discount_interval == 0 and 
+                if (_crossed_interval(previous_iteration, self.iteration, self.config.discount_interval) and 
                     (self.config.regret_discount_alpha < 1.0 or self.config.strategy_discount_beta < 1.0)):
-                    self.regret_tracker.discount(
-                        regret_factor=self.config.regret_discount_alpha,
-                        strategy_factor=self.config.strategy_discount_beta
-                    )
+                    with self.profiler.phase('discount'):
+                        self.regret_tracker.discount(
+                            regret_factor=self.config.regret_discount_alpha,
+                            strategy_factor=self.config.strategy_discount_beta
+                        )
                 
                 # Snapshot saving (time-based)
                 if logdir and use_time_budget:
@@ -723,7 +983,7 @@ class ParallelMCCFRSolver:
                         last_snapshot_time = current_time
                 
                 # TensorBoard logging
-                if self.writer and self.iteration % self.config.tensorboard_log_interval == 0:
+                if self.writer and _crossed_interval(previous_iteration, self.iteration, self.config.tensorboard_log_interval):
                     if utility_history:
                         recent_utility = sum(utility_history[-100:]) / min(100, len(utility_history))
                         self.writer.add_scalar('Training/Utility', recent_utility, self.iteration)
@@ -744,10 +1004,25 @@ class ParallelMCCFRSolver:
                         adaptive_metrics = self._adaptive_scheduler.get_metrics()
                         for metric_name, value in adaptive_metrics.items():
                             self.writer.add_scalar(metric_name, value, self.iteration)
+                    
+                    # Log adaptive batch sizes and measured merge/IPC overhead
+                    if self._batch_sizer is not None:
+                        for metric_name, value in self._batch_sizer.get_metrics().items():
+                            self.writer.add_scalar(metric_name, value, self.iteration)
+                    
+                    # Log per-phase timing breakdown
+                    if self.profiler.enabled:
+                        report = self.profiler.report(
+                            iterations=self.iteration - profile_start_iteration,
+                            wall_seconds=time.time() - start_time
+                        )
+                        for phase, stats in report['phases'].items():
+                            self.writer.add_scalar(f'Profile/{phase}_us_per_iter', stats['us_per_iteration'], self.iteration)
+                            self.writer.add_scalar(f'Profile/{phase}_fraction', stats['fraction'], self.iteration)
                 
                 # Console logging
                 time_since_log = current_time - last_log_time
-                should_log = (self.iteration % 10000 == 0) or (use_time_budget and time_since_log >= 60)
+                should_log = _crossed_interval(previous_iteration, self.iteration, 10000) or (use_time_budget and time_since_log >= 60)
                 
                 if should_log:
                     elapsed = timer.stop()
@@ -789,6 +1064,8 @@ class ParallelMCCFRSolver:
                     # Log performance metrics to TensorBoard
                     if self.writer:
                         self.writer.add_scalar('Performance/IterationsPerSecond', iter_per_sec, self.iteration)
+                    
+                    self._log_cpu_utilization()
                 
                 # Checkpointing (iteration-based or time-based)
                 if logdir:
@@ -798,10 +1075,11 @@ class ParallelMCCFRSolver:
                         # Checkpoint every hour in time-budget mode
                         should_checkpoint = time_since_checkpoint >= 3600
                     else:
-                        should_checkpoint = self.iteration % self.config.checkpoint_interval == 0
+                        should_checkpoint = _crossed_interval(previous_iteration, self.iteration, self.config.checkpoint_interval)
                     
                     if should_checkpoint:
-                        self._save_checkpoint(logdir, self.iteration, current_time - start_time)
+                        with self.profiler.phase('checkpoint'):
+                            self._save_checkpoint(logdir, self.iteration, current_time - start_time)
                         last_checkpoint_time = current_time
         
         finally:
@@ -810,6 +1088,13 @@ class ParallelMCCFRSolver:
         
         logger.info("Training complete")
         
+        # Per-phase profile report (worker/* phases are summed over all workers)
+        if self.profiler.enabled:
+            report = self.get_profile_report(self.iteration - profile_start_iteration, time.time() - start_time)
+            MCCFRSolver._log_profile_summary(report)
+            if logdir:
+                MCCFRSolver.save_profile_report(logdir, report)
+        
         # Close TensorBoard writer
         if self.writer:
             self.writer.close()
@@ -819,6 +1104,20 @@ class ParallelMCCFRSolver:
         if logdir:
             self.save_policy(logdir)
     
+    def get_profile_report(self, iterations: int, wall_seconds: float) -> Dict:
+        """Get the per-phase timing breakdown accumulated so far.
+        
+        Main-process phases (dispatch, wait, merge, discount, checkpoint) are
+        wall-clock; worker/* phases are summed over workers, so their fractions
+        can exceed 1.0 with several workers.
+        """
+        report = self.profiler.report(iterations=iterations, wall_seconds=wall_seconds)
+        report['solver'] = type(self).__name__
+        report['num_workers'] = self.num_workers
+        # Workers only send non-zero regret deltas, so count visited infosets by strategy sums
+        report['num_infosets'] = len(self.regret_tracker.strategy_sum)
+        return report
+    
     def _update_epsilon_schedule(self):
         """Update epsilon based on schedule if configured."""
         if self.config.epsilon_schedule is None:
@@ -1,5 +1,6 @@
 """Main MCCFR solver."""
 
+import json
 import time
 from pathlib import Path
 from typing import Optional, Dict
@@ -10,8 +11,9 @@ from holdem.mccfr.mccfr_os import OutcomeSampler
 from holdem.mccfr.policy_store import PolicyStore
 from holdem.mccfr.regrets import RegretTracker
 from holdem.mccfr.compact_storage import CompactRegretStorage
+from holdem.mccfr.training_metrics import TrainingMetricsAggregator, extract_position_from_infoset
 from holdem.utils.logging import get_logger
-from holdem.utils.timers import Timer
+from holdem.utils.timers import Timer, PhaseProfiler
 
 logger = get_logger("mccfr.solver")
 
@@ -113,6 +115,19 @@ class MCCFRSolver:
         # Store history as list of (iteration, regret_norms_by_street)
         self._regret_history = []
         self._regret_history_window = 10000  # Keep last 10k iterations
+        
+        # Incremental entropy/regret-norm metrics (avoids a full infoset scan per log interval)
+        self._training_metrics = TrainingMetricsAggregator(
+            regret_tracker,
+            mode=config.training_metrics_mode,
+            sample_size=config.training_metrics_sample_size,
+            background=config.training_metrics_background
+        )
+        self.sampler.infoset_observer = self._training_metrics.observe
+        
+        # Per-phase timers shared with the sampler (no-op unless enable_phase_profiling)
+        self.profiler = PhaseProfiler(enabled=config.enable_phase_profiling)
+        self.sampler.profiler = self.profiler
     
     def train(self, logdir: Path = None, use_tensorboard: bool = True):
         """Run MCCFR training.
@@ -147,6 +162,7 @@ class MCCFRSolver:
         last_log_iteration = 0  # Track iteration number at last log
         timer = Timer()
         timer.start()
+        profile_start_iteration = self.iteration
         
         # Track metrics for moving averages
         utility_history = []
@@ -175,39 +191,41 @@ class MCCFRSolver:
             
             # Linear MCCFR discount at regular intervals
             if self.iteration % self.config.discount_interval == 0:
-                # Calculate discount factors based on mode
-                if self.config.discount_mode == "dcfr":
-                    # DCFR/CFR+ adaptive discounting
-                    t = float(self.iteration)
-                    d = float(self.config.discount_interval)
+                with self.profiler.phase('discount'):
+                    # Calculate discount factors based on mode
+                    if self.config.discount_mode == "dcfr":
+                        # DCFR/CFR+ adaptive discounting
+                        t = float(self.iteration)
+                        d = float(self.config.discount_interval)
                     
-                    # α = (t + d) / (t + 2d) for regrets
-                    alpha = (t + d) / (t + 2 * d)
+                        # α = (t + d) / (t + 2d) for regrets
+                        alpha = (t + d) / (t + 2 * d)
                     
-                    # β = t / (t + d) for strategy
-                    beta = t / (t + d) if t > 0 else 0.0
+                        # β = t / (t + d) for strategy
+                        beta = t / (t + d) if t > 0 else 0.0
                     
-                    # Apply discounting
-                    self.sampler.regret_tracker.discount(
-                        regret_factor=alpha,
-                        strategy_factor=beta
-                    )
+                        # Apply discounting
+                        self.sampler.regret_tracker.discount(
+                            regret_factor=alpha,
+                            strategy_factor=beta
+                        )
                     
-                    # CFR+: Reset negative regrets to 0
-                    if self.config.dcfr_reset_negative_regrets:
-                        self.sampler.regret_tracker.reset_regrets()
+                        # CFR+: Reset negative regrets to 0
+                        if self.config.dcfr_reset_negative_regrets:
+                            self.sampler.regret_tracker.reset_regrets()
+                            self._training_metrics.on_regrets_reset()
                     
-                    logger.debug(f"DCFR discount at iteration {self.iteration}: α={alpha:.4f}, β={beta:.4f}")
+                        logger.debug(f"DCFR discount at iteration {self.iteration}: α={alpha:.4f}, β={beta:.4f}")
                     
-                elif self.config.discount_mode == "static":
-                    # Static discount factors
-                    if (self.config.regret_discount_alpha < 1.0 or 
-                        self.config.strategy_discount_beta < 1.0):
-                        self.sampler.regret_tracker.discount(
-                            regret_factor=self.config.regret_discount_alpha,
-                            strategy_factor=self.config.strategy_discount_beta
-                        )
-                # else: discount_mode == "none", no discounting
+                    elif self.config.discount_mode == "static":
+                        # Static discount factors
+                        if (self.config.regret_discount_alpha < 1.0 or 
+                            self.config.strategy_discount_beta < 1.0):
+                            self.sampler.regret_tracker.discount(
+                                regret_factor=self.config.regret_discount_alpha,
+                                strategy_factor=self.config.strategy_discount_beta
+                            )
+                    # else: discount_mode == "none", no discounting
             
             # Snapshot saving (time-based)
             if logdir and use_time_budget:
@@ -228,15 +246,17 @@ class MCCFRSolver:
                 # Log exploration epsilon
                 self.writer.add_scalar('Training/Epsilon', self._current_epsilon, self.iteration)
                 
-                # Log policy entropy per street
-                entropy_metrics = self._calculate_policy_entropy_metrics()
-                for metric_name, value in entropy_metrics.items():
+                # Log policy entropy and normalized regret per street
+                with self.profiler.phase('metrics'):
+                    training_metrics = self._calculate_training_metrics()
+                for metric_name, value in training_metrics.items():
                     self.writer.add_scalar(metric_name, value, self.iteration)
                 
-                # Log normalized regret per street
-                regret_metrics = self._calculate_regret_norm_metrics()
-                for metric_name, value in regret_metrics.items():
-                    self.writer.add_scalar(metric_name, value, self.iteration)
+                # Log per-phase timing breakdown
+                if self.profiler.enabled:
+                    self._log_phase_profile(
+                        self.iteration - profile_start_iteration, current_time - start_time
+                    )
                 
                 # Log adaptive epsilon metrics if enabled
                 if self._adaptive_scheduler is not None:
@@ -298,11 +318,22 @@ class MCCFRSolver:
                     should_checkpoint = self.iteration % self.config.checkpoint_interval == 0
                 
                 if should_checkpoint:
-                    self.save_checkpoint(logdir, self.iteration, current_time - start_time)
+                    with self.profiler.phase('checkpoint'):
+                        self.save_checkpoint(logdir, self.iteration, current_time - start_time)
                     last_checkpoint_time = current_time
         
         logger.info("Training complete")
         
+        self._training_metrics.close()
+        
+        # Per-phase profile report (iteration counter overshoots by one when the loop exits)
+        if self.profiler.enabled:
+            profiled_iterations = max(0, self.iteration - 1 - profile_start_iteration)
+            report = self.get_profile_report(profiled_iterations, time.time() - start_time)
+            self._log_profile_summary(report)
+            if logdir:
+                self.save_profile_report(logdir, report)
+        
         # Close TensorBoard writer
         if self.writer:
             self.writer.close()
@@ -312,6 +343,47 @@ class MCCFRSolver:
         if logdir:
             self.save_policy(logdir)
     
+    def get_profile_report(self, iterations: int, wall_seconds: float) -> Dict:
+        """Get the per-phase timing breakdown accumulated so far.
+        
+        Args:
+            iterations: Number of iterations covered by the profile
+            wall_seconds: Wall-clock training time covered by the profile
+            
+        Returns:
+            JSON-serializable report (see PhaseProfiler.report)
+        """
+        report = self.profiler.report(iterations=iterations, wall_seconds=wall_seconds)
+        report['solver'] = type(self).__name__
+        report['num_infosets'] = len(self.sampler.regret_tracker.regrets)
+        return report
+    
+    @staticmethod
+    def save_profile_report(logdir: Path, report: Dict):
+        """Write a per-phase profile report to logdir/profile_report.json."""
+        logdir.mkdir(parents=True, exist_ok=True)
+        report_path = logdir / "profile_report.json"
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Saved phase profile report to {report_path}")
+    
+    def _log_phase_profile(self, iterations: int, wall_seconds: float):
+        """Log per-phase cost (µs/iteration and fraction of wall time) to TensorBoard."""
+        report = self.profiler.report(iterations=iterations, wall_seconds=wall_seconds)
+        for phase, stats in report['phases'].items():
+            self.writer.add_scalar(f'Profile/{phase}_us_per_iter', stats['us_per_iteration'], self.iteration)
+            self.writer.add_scalar(f'Profile/{phase}_fraction', stats['fraction'], self.iteration)
+    
+    @staticmethod
+    def _log_profile_summary(report: Dict):
+        """Log a one-line-per-phase summary of a profile report."""
+        logger.info(f"Phase profile ({report['iterations']} iterations, {report['wall_seconds']:.1f}s):")
+        for phase, stats in sorted(report['phases'].items(), key=lambda kv: -kv[1]['total_seconds']):
+            logger.info(
+                f"  {phase:<24} {stats['total_seconds']:9.3f}s  "
+                f"{stats['us_per_iteration']:10.1f} µs/iter  {100 * stats['fraction']:5.1f}%"
+            )
+    
     def _extract_street_from_infoset(self, infoset: str) -> str:
         """Extract street name from infoset encoding.
         
@@ -716,6 +788,7 @@ class MCCFRSolver:
                 try:
                     regret_state = load_pickle(regret_state_path)
                     self.sampler.regret_tracker.set_state(regret_state)
+                    self._training_metrics.rebuild()
                     logger.info("✓ Warm-start: Full regret tracker state restored")
                     logger.info(f"  - Restored {len(self.sampler.regret_tracker.regrets)} infosets with regrets")
                     logger.info(f"  - Restored {len(self.sampler.regret_tracker.strategy_sum)} infosets with strategy")
@@ -867,21 +940,25 @@ class MCCFRSolver:
         Returns:
             'IP' for in position, 'OOP' for out of position, or None
         """
-        try:
-            # Parse infoset to get action history
-            parts = infoset.split('|')
-            if len(parts) >= 2:
-                history = parts[1] if len(parts) > 1 else ''
-                if history:
-                    last_action = history[-1]
-                    # Simple heuristic
-                    if last_action in ['c', 'k']:  # call or check
-                        return 'IP'
-                    elif last_action in ['b', 'r']:  # bet or raise
-                        return 'OOP'
-        except (IndexError, ValueError):
-            pass
-        return None
+        return extract_position_from_infoset(infoset)
+    
+    def _calculate_training_metrics(self) -> Dict[str, float]:
+        """Calculate policy entropy and regret norm metrics for TensorBoard.
+        
+        Uses the incremental aggregator (``training_metrics_mode``) instead of
+        scanning every infoset; see _calculate_policy_entropy_metrics and
+        _calculate_regret_norm_metrics for the full-scan reference versions.
+        
+        Returns:
+            Dictionary of metric names to values
+        """
+        entropy_metrics, avg_norms = self._training_metrics.compute()
+        
+        metrics = dict(entropy_metrics)
+        for street, avg_norm in avg_norms.items():
+            metrics[f'avg_regret_norm/{street}'] = avg_norm
+        metrics.update(self._update_regret_slope_metrics(avg_norms))
+        return metrics
     
     def _calculate_regret_norm_metrics(self) -> Dict[str, float]:
         """Calculate normalized regret metrics per street with L2 slope validation.
@@ -920,6 +997,22 @@ class MCCFRSolver:
                 metrics[f'avg_regret_norm/{street}'] = avg_norm
                 current_norms[street] = avg_norm
         
+        metrics.update(self._update_regret_slope_metrics(current_norms))
+        return metrics
+    
+    def _update_regret_slope_metrics(self, current_norms: Dict[str, float]) -> Dict[str, float]:
+        """Record average regret norms in history and compute L2 regret slopes.
+        
+        Args:
+            current_norms: Average regret L2 norm per street at the current iteration
+            
+        Returns:
+            Dictionary of regret_slope/* and regret_slope_ok/* metrics
+        """
+        import numpy as np
+        
+        metrics = {}
+        
         # Store current regret norms in history
         if current_norms:
             self._regret_history.append((self.iteration, current_norms))
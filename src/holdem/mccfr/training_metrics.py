@@ -0,0 +1,441 @@
+"""Incremental aggregation of training metrics (policy entropy, regret norms).
+
+The TensorBoard metrics logged by MCCFRSolver every ``tensorboard_log_interval``
+iterations used to be computed with a full scan over every infoset, which
+becomes a visible throughput sawtooth as the table grows. This module keeps
+those metrics up to date without rescanning the whole table:
+
+- ``exact`` mode: per-infoset entropy and regret norm are cached in flat
+  numpy arrays and recomputed only for infosets touched since the last log
+  (plus infosets whose regrets were changed by a CFR+ negative-regret reset).
+  Aggregation per street/position is a vectorized reduction over the arrays.
+- ``sampled`` mode: a fixed-size reservoir sample of infosets (Algorithm R over
+  the stream of newly discovered infosets) gives unbiased estimates of the
+  per-street means with constant memory and constant cost per log.
+
+Row values are read directly from the regret tracker without going through
+its lazy-discount API, so the reduction can optionally run on a background
+thread from a snapshot taken on the training thread.
+"""
+
+import math
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from holdem.abstraction.state_encode import parse_infoset_key
+from holdem.utils.logging import get_logger
+from holdem.utils.rng import RNG
+
+logger = get_logger("mccfr.training_metrics")
+
+STREET_NAMES = ('preflop', 'flop', 'turn', 'river')
+POSITION_NAMES = ('IP', 'OOP')
+
+METRICS_MODES = ('exact', 'sampled')
+
+_STREET_INDEX = {name: idx for idx, name in enumerate(STREET_NAMES)}
+_NO_POSITION = -1
+
+
+def extract_street_index(infoset: str) -> int:
+    """Return the street index (0=preflop .. 3=river) encoded in an infoset key."""
+    try:
+        street_name, _, _ = parse_infoset_key(infoset)
+        return _STREET_INDEX.get(street_name.lower(), 0)
+    except (ValueError, IndexError):
+        return 0
+
+
+def extract_position_from_infoset(infoset: str) -> Optional[str]:
+    """Extract position (IP/OOP) from infoset.
+
+    Simplified heuristic: if history ends with 'c' (call), player is IP,
+    if ends with 'b' or 'r' (bet/raise), player is OOP.
+
+    Args:
+        infoset: Information set identifier
+
+    Returns:
+        'IP' for in position, 'OOP' for out of position, or None
+    """
+    try:
+        parts = infoset.split('|')
+        if len(parts) >= 2:
+            history = parts[1]
+            if history:
+                last_action = history[-1]
+                if last_action in ['c', 'k']:  # call or check
+                    return 'IP'
+                elif last_action in ['b', 'r']:  # bet or raise
+                    return 'OOP'
+    except (IndexError, ValueError):
+        pass
+    return None
+
+
+def _row_values(row) -> np.ndarray:
+    """Get the raw values of a tracker row as a float64 array.
+
+    Supports both RegretTracker rows (dict action -> value) and
+    CompactRegretStorage rows (tuple of (action_indices, values)).
+    """
+    if isinstance(row, tuple):
+        return np.asarray(row[1], dtype=np.float64)
+    return np.fromiter(row.values(), dtype=np.float64, count=len(row))
+
+
+def _entropy(strategy_values: np.ndarray) -> float:
+    """Shannon entropy (bits) of the average strategy given cumulative strategy sums.
+
+    Matches RegretTracker.get_average_strategy: a non-positive total yields the
+    uniform strategy over the recorded actions.
+    """
+    n = strategy_values.size
+    if n == 0:
+        return 0.0
+    total = strategy_values.sum()
+    if total <= 0:
+        return math.log2(n)
+    probs = strategy_values / total
+    probs = probs[probs > 0]
+    return float(-np.sum(probs * np.log2(probs)))
+
+
+def _row_snapshot(tracker, infoset: str) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """Copy the current (discount-corrected) regret and strategy values of an infoset.
+
+    Regrets are scaled by the pending lazy discount so the returned norm matches
+    what the tracker would report after applying it. Strategy sums are returned
+    raw since entropy is invariant to uniform scaling.
+    """
+    regrets = None
+    regret_row = tracker.regrets.get(infoset)
+    if regret_row is not None:
+        regrets = _row_values(regret_row)
+    if regrets is not None and regrets.size:
+        applied = tracker._regret_discount_applied.get(infoset, 1.0)
+        if applied and applied != tracker._cumulative_regret_discount:
+            regrets = regrets * (tracker._cumulative_regret_discount / applied)
+    else:
+        regrets = None
+
+    strategy = None
+    strategy_row = tracker.strategy_sum.get(infoset)
+    if strategy_row is not None:
+        strategy = _row_values(strategy_row)
+        if not strategy.size:
+            strategy = None
+
+    return regrets, strategy
+
+
+class TrainingMetricsAggregator:
+    """Maintains per-street policy entropy and regret norm metrics incrementally.
+
+    The sampler reports every infoset it updates through :meth:`observe`
+    (installed as ``OutcomeSampler.infoset_observer``). The solver calls
+    :meth:`on_regrets_reset` after ``reset_regrets()`` and :meth:`compute`
+    at each TensorBoard log interval.
+    """
+
+    def __init__(
+        self,
+        regret_tracker,
+        mode: str = "exact",
+        sample_size: int = 4096,
+        background: bool = False,
+        seed: Optional[int] = None
+    ):
+        """Initialize aggregator.
+
+        Args:
+            regret_tracker: RegretTracker or CompactRegretStorage being trained
+            mode: "exact" (incremental per-infoset cache) or "sampled" (reservoir estimate)
+            sample_size: Reservoir size for sampled mode
+            background: Run the reduction on a background thread; compute() then
+                        returns the most recently completed result
+            seed: Optional seed for the reservoir RNG
+        """
+        if mode not in METRICS_MODES:
+            raise ValueError(f"Invalid training_metrics_mode: {mode}. Must be one of {METRICS_MODES}")
+        if sample_size <= 0:
+            raise ValueError(f"training_metrics_sample_size must be positive, got {sample_size}")
+
+        self.regret_tracker = regret_tracker
+        self.mode = mode
+        self.sample_size = sample_size
+        self.background = background
+        # Private RNG so reservoir draws never perturb the training RNG stream
+        self._rng = RNG(seed)
+
+        if mode == "exact":
+            self.observe = self._observe_exact
+            # Infosets updated since the last refresh
+            self._touched: Set[str] = set()
+            # Infosets refreshed because they were touched since the last regret reset;
+            # only these can still hold negative regrets that a reset would zero out
+            self._touched_since_reset: Set[str] = set()
+            # Infosets whose regret norm is stale because of a reset
+            self._reset_dirty: Set[str] = set()
+
+            self._slots: Dict[str, int] = {}
+            capacity = 1024
+            self._street = np.zeros(capacity, dtype=np.int8)
+            self._position = np.full(capacity, _NO_POSITION, dtype=np.int8)
+            self._entropy = np.zeros(capacity, dtype=np.float64)
+            self._has_entropy = np.zeros(capacity, dtype=bool)
+            self._norm = np.zeros(capacity, dtype=np.float64)
+            self._norm_discount = np.ones(capacity, dtype=np.float64)
+            self._has_norm = np.zeros(capacity, dtype=bool)
+        else:
+            self.observe = self._observe_sampled
+            # Reservoir of infoset keys and number of infosets seen so far
+            self._reservoir: List[str] = []
+            self._seen = 0
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Future] = None
+        self._last_result: Tuple[Dict[str, float], Dict[str, float]] = ({}, {})
+        if background:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="training-metrics")
+
+    # ------------------------------------------------------------------
+    # Observation hooks (called from the sampler hot path)
+    # ------------------------------------------------------------------
+
+    def _observe_exact(self, infoset: str):
+        self._touched.add(infoset)
+
+    def _observe_sampled(self, infoset: str):
+        # Only newly discovered infosets enter the reservoir stream
+        if infoset in self.regret_tracker.strategy_sum or infoset in self.regret_tracker.regrets:
+            return
+        if self._seen < self.sample_size:
+            self._reservoir.append(infoset)
+        else:
+            j = int(self._rng.randint(0, self._seen + 1))
+            if j < self.sample_size:
+                self._reservoir[j] = infoset
+        self._seen += 1
+
+    def on_regrets_reset(self):
+        """Notify that negative regrets were reset to zero (CFR+)."""
+        if self.mode != "exact":
+            return
+        self._reset_dirty |= self._touched_since_reset
+        self._touched_since_reset = set()
+
+    def rebuild(self):
+        """Re-seed the aggregator from the full tracker (e.g. after a checkpoint load)."""
+        if self.mode == "exact":
+            self._touched.update(self.regret_tracker.regrets.keys())
+            self._touched.update(self.regret_tracker.strategy_sum.keys())
+        else:
+            self._reservoir = []
+            self._seen = 0
+            keys = set(self.regret_tracker.regrets.keys())
+            keys.update(self.regret_tracker.strategy_sum.keys())
+            for infoset in keys:
+                if self._seen < self.sample_size:
+                    self._reservoir.append(infoset)
+                else:
+                    j = int(self._rng.randint(0, self._seen + 1))
+                    if j < self.sample_size:
+                        self._reservoir[j] = infoset
+                self._seen += 1
+
+    # ------------------------------------------------------------------
+    # Metric computation
+    # ------------------------------------------------------------------
+
+    def compute(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Compute current metrics.
+
+        Returns:
+            Tuple of (entropy_metrics, avg_regret_norm_by_street). Entropy metric names
+            match MCCFRSolver._calculate_policy_entropy_metrics; regret norms are keyed
+            by street name.
+        """
+        snapshot = self._snapshot()
+
+        if self._executor is None:
+            self._last_result = self._reduce(snapshot)
+            return self._last_result
+
+        # Background mode: publish the last completed reduction, schedule the next one
+        if self._pending is not None and self._pending.done():
+            try:
+                self._last_result = self._pending.result()
+            except Exception as e:
+                logger.warning(f"Background training metrics computation failed: {e}")
+            self._pending = None
+        if self._pending is None:
+            self._pending = self._executor.submit(self._reduce, snapshot)
+        return self._last_result
+
+    def close(self):
+        """Shut down the background thread, if any."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._pending = None
+
+    def _snapshot(self):
+        """Capture everything the reduction needs on the training thread."""
+        if self.mode == "exact":
+            self._refresh()
+            n = len(self._slots)
+            arrays = (
+                self._street[:n], self._position[:n],
+                self._entropy[:n], self._has_entropy[:n],
+                self._norm[:n], self._norm_discount[:n], self._has_norm[:n]
+            )
+            if self._executor is not None:
+                arrays = tuple(a.copy() for a in arrays)
+            return arrays + (self.regret_tracker._cumulative_regret_discount,)
+
+        rows = []
+        for infoset in self._reservoir:
+            regrets, strategy = _row_snapshot(self.regret_tracker, infoset)
+            rows.append((infoset, regrets, strategy))
+        return rows
+
+    def _reduce(self, snapshot) -> Tuple[Dict[str, float], Dict[str, float]]:
+        if self.mode == "exact":
+            return self._reduce_exact(snapshot)
+        return self._reduce_sampled(snapshot)
+
+    def _ensure_capacity(self, size: int):
+        capacity = self._street.shape[0]
+        if size <= capacity:
+            return
+        new_capacity = max(size, capacity * 2)
+
+        def grow(arr, fill):
+            new = np.full(new_capacity, fill, dtype=arr.dtype)
+            new[:capacity] = arr
+            return new
+
+        self._street = grow(self._street, 0)
+        self._position = grow(self._position, _NO_POSITION)
+        self._entropy = grow(self._entropy, 0.0)
+        self._has_entropy = grow(self._has_entropy, False)
+        self._norm = grow(self._norm, 0.0)
+        self._norm_discount = grow(self._norm_discount, 1.0)
+        self._has_norm = grow(self._has_norm, False)
+
+    def _slot_for(self, infoset: str) -> int:
+        slot = self._slots.get(infoset)
+        if slot is None:
+            slot = len(self._slots)
+            self._ensure_capacity(slot + 1)
+            self._slots[infoset] = slot
+            self._street[slot] = extract_street_index(infoset)
+            position = extract_position_from_infoset(infoset)
+            self._position[slot] = _NO_POSITION if position is None else POSITION_NAMES.index(position)
+        return slot
+
+    def _refresh(self):
+        """Recompute cached values for infosets touched or reset since the last refresh."""
+        tracker = self.regret_tracker
+        cumulative = tracker._cumulative_regret_discount
+
+        touched = self._touched
+        self._touched = set()
+        self._touched_since_reset |= touched
+
+        for infoset in touched:
+            regrets, strategy = _row_snapshot(tracker, infoset)
+            slot = self._slot_for(infoset)
+            self._set_norm(slot, regrets, cumulative)
+            if strategy is not None:
+                self._entropy[slot] = _entropy(strategy)
+                self._has_entropy[slot] = True
+
+        reset_dirty = self._reset_dirty - touched
+        self._reset_dirty = set()
+        for infoset in reset_dirty:
+            slot = self._slots.get(infoset)
+            if slot is None:
+                continue
+            regrets, _ = _row_snapshot(tracker, infoset)
+            self._set_norm(slot, regrets, cumulative)
+
+    def _set_norm(self, slot: int, regrets: Optional[np.ndarray], cumulative: float):
+        if regrets is None:
+            return
+        self._norm[slot] = float(np.linalg.norm(regrets))
+        self._norm_discount[slot] = cumulative
+        self._has_norm[slot] = True
+
+    @staticmethod
+    def _reduce_exact(snapshot) -> Tuple[Dict[str, float], Dict[str, float]]:
+        street, position, entropy, has_entropy, norm, norm_discount, has_norm, cumulative = snapshot
+
+        entropy_metrics: Dict[str, float] = {}
+        for idx, name in enumerate(STREET_NAMES):
+            values = entropy[has_entropy & (street == idx)]
+            if values.size:
+                entropy_metrics[f'policy_entropy/{name}'] = float(values.mean())
+                entropy_metrics[f'policy_entropy_max/{name}'] = float(values.max())
+        for idx, name in enumerate(POSITION_NAMES):
+            values = entropy[has_entropy & (position == idx)]
+            if values.size:
+                entropy_metrics[f'policy_entropy/{name}'] = float(values.mean())
+
+        # Bring cached norms up to the current lazy discount level
+        scaled = norm * (cumulative / norm_discount) if norm.size else norm
+        avg_norms: Dict[str, float] = {}
+        for idx, name in enumerate(STREET_NAMES):
+            values = scaled[has_norm & (street == idx)]
+            if values.size:
+                avg_norms[name] = float(values.mean())
+
+        return entropy_metrics, avg_norms
+
+    @staticmethod
+    def _reduce_sampled(rows) -> Tuple[Dict[str, float], Dict[str, float]]:
+        entropy_by_street: Dict[str, List[float]] = {name: [] for name in STREET_NAMES}
+        entropy_by_position: Dict[str, List[float]] = {name: [] for name in POSITION_NAMES}
+        norms_by_street: Dict[str, List[float]] = {name: [] for name in STREET_NAMES}
+
+        for infoset, regrets, strategy in rows:
+            street = STREET_NAMES[extract_street_index(infoset)]
+            if strategy is not None:
+                value = _entropy(strategy)
+                entropy_by_street[street].append(value)
+                position = extract_position_from_infoset(infoset)
+                if position:
+                    entropy_by_position[position].append(value)
+            if regrets is not None:
+                norms_by_street[street].append(float(np.linalg.norm(regrets)))
+
+        entropy_metrics: Dict[str, float] = {}
+        for street, values in entropy_by_street.items():
+            if values:
+                entropy_metrics[f'policy_entropy/{street}'] = sum(values) / len(values)
+                entropy_metrics[f'policy_entropy_max/{street}'] = max(values)
+        for position, values in entropy_by_position.items():
+            if values:
+                entropy_metrics[f'policy_entropy/{position}'] = sum(values) / len(values)
+
+        avg_norms = {
+            street: sum(values) / len(values)
+            for street, values in norms_by_street.items() if values
+        }
+        return entropy_metrics, avg_norms
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get aggregator bookkeeping statistics."""
+        if self.mode == "exact":
+            return {
+                'tracked_infosets': len(self._slots),
+                'pending_touched': len(self._touched),
+                'pending_reset': len(self._reset_dirty),
+            }
+        return {
+            'reservoir_size': len(self._reservoir),
+            'infosets_seen': self._seen,
+        }
@@ -0,0 +1,186 @@
+"""Anytime, interruptible subgame solves.
+
+start_anytime_solve() runs a solve in a background thread and returns a
+SolveHandle at once (SubgameResolver.solve_anytime and
+DepthLimitedCFR.solve_anytime wrap it). While it runs, the solver publishes its current
+average strategy every few iterations; each snapshot carries the iteration
+count and a convergence estimate, the total variation distance between the
+strategy and the previous snapshot's (it shrinks as the average settles).
+
+The caller waits with result(), which returns at the earliest of the solve
+finishing, the strategy converging below a tolerance, a deadline, or a
+should_stop() predicate firing (e.g. the table state changed), and can stop
+the solve with cancel(); solvers check for cancellation between iterations.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from holdem.abstraction.actions import AbstractAction
+from holdem.utils.logging import get_logger
+
+logger = get_logger("realtime.anytime")
+
+# How often result() re-checks should_stop while waiting
+POLL_INTERVAL_S = 0.005
+
+
+@dataclass
+class SolveSnapshot:
+    """Latest strategy published by a running solve."""
+    strategy: Dict[AbstractAction, float]
+    iterations: int
+    convergence: float  # Total variation distance to the previous snapshot (inf for the first)
+    elapsed_ms: float
+
+
+def strategy_change(strategy: Dict[AbstractAction, float], previous: Dict[AbstractAction, float]) -> float:
+    """Total variation distance between two action distributions."""
+    actions = set(strategy) | set(previous)
+    return 0.5 * sum(abs(strategy.get(a, 0.0) - previous.get(a, 0.0)) for a in actions)
+
+
+class SolveHandle:
+    """Handle on a solve running in the background."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._cancel_event = threading.Event()
+        self._snapshot: Optional[SolveSnapshot] = None
+        self._result: Optional[Dict[AbstractAction, float]] = None
+        self._error: Optional[BaseException] = None
+        self._done = False
+        self._start = time.perf_counter()
+        self._thread: Optional[threading.Thread] = None
+
+    # Solver side
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def publish(self, strategy: Dict[AbstractAction, float], iterations: int):
+        """Publish the solve's current average strategy."""
+        with self._condition:
+            previous = self._snapshot
+            convergence = strategy_change(strategy, previous.strategy) if previous is not None else float('inf')
+            self._snapshot = SolveSnapshot(
+                strategy=dict(strategy),
+                iterations=iterations,
+                convergence=convergence,
+                elapsed_ms=(time.perf_counter() - self._start) * 1000
+            )
+            self._condition.notify_all()
+
+    def _finish(self, strategy: Optional[Dict[AbstractAction, float]], error: Optional[BaseException] = None):
+        with self._condition:
+            self._result = strategy
+            self._error = error
+            self._done = True
+            self._condition.notify_all()
+
+    # Caller side
+
+    def cancel(self):
+        """Ask the solve to stop after its current iteration (does not wait)."""
+        self._cancel_event.set()
+
+    def done(self) -> bool:
+        return self._done
+
+    def snapshot(self) -> Optional[SolveSnapshot]:
+        """Latest published snapshot (None before the first)."""
+        with self._condition:
+            return self._snapshot
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[Dict[AbstractAction, float]]:
+        """Wait for the solve to finish and return its strategy (None on timeout).
+
+        Raises:
+            The solve's exception, if it failed
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._done, timeout)
+            if self._error is not None:
+                raise self._error
+            return self._result
+
+    def result(
+        self,
+        deadline: Optional[float] = None,
+        tolerance: Optional[float] = None,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> Optional[Dict[AbstractAction, float]]:
+        """Best strategy available at the earliest of completion, convergence, deadline or should_stop.
+
+        The solve keeps running unless it finished; cancel() it if its result
+        is no longer needed.
+
+        Args:
+            deadline: time.perf_counter() value to return by (None = no deadline)
+            tolerance: Return once a snapshot moved the strategy less than this
+                (None = only on completion / deadline / should_stop)
+            should_stop: Polled while waiting; return as soon as it is true
+
+        Returns:
+            The final strategy if the solve finished, else the latest snapshot's
+            (None if nothing was published yet)
+
+        Raises:
+            The solve's exception, if it failed
+        """
+        def ready() -> bool:
+            if self._done:
+                return True
+            return tolerance is not None and self._snapshot is not None and self._snapshot.convergence <= tolerance
+
+        while True:
+            with self._condition:
+                timeout = POLL_INTERVAL_S if should_stop is not None else None
+                if deadline is not None:
+                    remaining = max(deadline - time.perf_counter(), 0.0)
+                    timeout = remaining if timeout is None else min(timeout, remaining)
+                self._condition.wait_for(ready, timeout)
+                if ready() or (deadline is not None and time.perf_counter() >= deadline):
+                    break
+            # Outside the lock: should_stop may be slow (e.g. a screen parse) and must not block publish()
+            if should_stop is not None and should_stop():
+                break
+
+        with self._condition:
+            if self._done:
+                if self._error is not None:
+                    raise self._error
+                return self._result
+            return dict(self._snapshot.strategy) if self._snapshot is not None else None
+
+
+def start_anytime_solve(
+    solve: Callable[[SolveHandle], Dict[AbstractAction, float]],
+    name: str = "anytime-solve"
+) -> SolveHandle:
+    """Run solve(handle) in a daemon thread.
+
+    Args:
+        solve: Solve function; publishes through the handle and checks handle.cancelled
+        name: Thread name
+
+    Returns:
+        Handle on the running solve
+    """
+    handle = SolveHandle()
+
+    def run():
+        try:
+            strategy = solve(handle)
+        except BaseException as e:  # Re-raised to the caller by result() / wait()
+            logger.warning(f"Anytime solve failed: {e}")
+            handle._finish(None, e)
+        else:
+            handle._finish(strategy)
+
+    handle._thread = threading.Thread(target=run, name=name, daemon=True)
+    handle._thread.start()
+    return handle
@@ -1,48 +1,187 @@
-"""Belief state tracking for opponent ranges."""
+"""Belief state tracking for opponent ranges.
+
+Each opponent's range is a dense float32 vector over the 1326 two-card
+combos (indexing of holdem.utils.card_removal). Combos holding a dead card
+(board, hero cards) are masked out. An observed action is a Bayesian update
+P(hand | action) ∝ P(action | hand) * P(hand) applied to every combo at once:
+combos are mapped to buckets with one batch lookup per street and board,
+and the blueprint is queried once per bucket.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from typing import List, Dict
-from holdem.types import Card
+
+from holdem.types import Card, Street
+from holdem.abstraction.actions import AbstractAction
+from holdem.abstraction.state_encode import create_infoset_key
+from holdem.utils.card_removal import COMBO_CARDS, NUM_COMBOS, card_index, combo_cards, combos_avoiding
+from holdem.utils.deck import RANKS, SUITS
 from holdem.utils.logging import get_logger
 
 logger = get_logger("realtime.belief")
 
+# (street, board, is_in_position)
+BucketTableKey = Tuple[str, str, bool]
+
+
+def _combo_string(combo: int) -> str:
+    return "".join(RANKS[c // 4] + SUITS[c % 4] for c in COMBO_CARDS[combo])
+
 
 class BeliefState:
     """Tracks opponent hand range distributions."""
-    
-    def __init__(self, num_opponents: int = 1):
+
+    def __init__(self, num_opponents: int = 1, bucketing=None, blueprint=None, bucket_table_cache_size: int = 8):
+        """Create uniform ranges.
+
+        Args:
+            num_opponents: Number of tracked opponents
+            bucketing: HandBucketing for the per-board combo -> bucket lookup
+            blueprint: PolicyStore giving P(action | bucket); without it (or
+                without bucketing) updates leave the ranges unchanged
+            bucket_table_cache_size: Boards whose bucket tables are kept
+        """
         self.num_opponents = num_opponents
-        # Simplified: store probability for each opponent hand
-        # In full implementation, would track all possible hands
-        self.ranges: List[Dict[str, float]] = [{} for _ in range(num_opponents)]
-    
-    def initialize_uniform(self):
-        """Initialize with uniform distribution over all hands."""
-        # Simplified: would enumerate all 1326 hand combinations
+        self.bucketing = bucketing
+        self.blueprint = blueprint
+        self.ranges = np.zeros((num_opponents, NUM_COMBOS), dtype=np.float32)
+        self.live = np.ones(NUM_COMBOS, dtype=bool)  # Combos holding no dead card
+        self._cdf: List[Optional[np.ndarray]] = [None] * num_opponents
+        self._bucket_tables: "OrderedDict[BucketTableKey, np.ndarray]" = OrderedDict()
+        self._bucket_table_cache_size = bucket_table_cache_size
+        self.initialize_uniform()
+
+    def initialize_uniform(self, dead_cards: Optional[Sequence[Card]] = None):
+        """Initialize with uniform distribution over all hands (new hand).
+
+        Args:
+            dead_cards: Cards no opponent can hold (e.g. hero hole cards)
+        """
+        self.live = combos_avoiding([card_index(c) for c in dead_cards or []])
+        self.ranges[:] = self.live / self.live.sum()
+        self._cdf = [None] * self.num_opponents
         logger.debug("Initialized uniform belief")
-        pass
-    
-    def update(self, action: str, player: int):
-        """Update belief based on opponent action."""
-        # Bayesian update: P(hand | action) ∝ P(action | hand) * P(hand)
-        # Simplified implementation
-        logger.debug(f"Updated belief for player {player} after action {action}")
-        pass
-    
+
+    def remove_dead_cards(self, cards: Sequence[Card]):
+        """Zero out combos holding any of the cards (e.g. newly dealt board cards)."""
+        mask = combos_avoiding([card_index(c) for c in cards])
+        if np.all(mask | ~self.live):
+            return
+        self.live &= mask
+        self.ranges *= mask
+        for player in range(self.num_opponents):
+            self._normalize(player)
+
+    def _normalize(self, player: int):
+        total = self.ranges[player].sum()
+        if total > 0:
+            self.ranges[player] /= total
+        else:
+            self.ranges[player] = self.live / self.live.sum()
+        self._cdf[player] = None
+
+    def bucket_table(
+        self,
+        board: Sequence[Card],
+        street: Street,
+        pot: float = 100.0,
+        stack: float = 200.0,
+        is_in_position: bool = True
+    ) -> np.ndarray:
+        """Bucket of every combo on a board (-1 for combos colliding with it).
+
+        Computed with one batch bucket lookup and cached per street, board and
+        position. pot and stack only enter the buckets through the SPR feature:
+        the table built at the street's first lookup is reused for the rest of
+        the street, since rebuilding it costs a feature extraction per combo.
+        """
+        key = (street.name, "".join(str(c) for c in board), is_in_position)
+        table = self._bucket_tables.get(key)
+        if table is not None:
+            self._bucket_tables.move_to_end(key)
+            return table
+
+        valid = np.flatnonzero(combos_avoiding([card_index(c) for c in board]))
+        hands = [combo_cards(combo) for combo in valid]
+        table = np.full(NUM_COMBOS, -1, dtype=np.int32)
+        table[valid] = self.bucketing.get_buckets(hands, list(board), street, pot, stack, is_in_position)
+
+        self._bucket_tables[key] = table
+        while len(self._bucket_tables) > self._bucket_table_cache_size:
+            self._bucket_tables.popitem(last=False)
+        return table
+
+    def update(
+        self,
+        action: Union[str, AbstractAction],
+        player: int,
+        street: Optional[Street] = None,
+        board: Optional[Sequence[Card]] = None,
+        action_sequence: str = "",
+        pot: float = 100.0,
+        stack: float = 200.0,
+        is_in_position: bool = True
+    ):
+        """Update belief based on opponent action.
+
+        Args:
+            action: Observed action (AbstractAction or its value)
+            player: Opponent index
+            street: Street the action was taken on
+            board: Board when the action was taken
+            action_sequence: Encoded action history before the action
+                (as in the blueprint infosets)
+            pot, stack, is_in_position: Bucketing context of the acting player
+        """
+        if self.bucketing is None or self.blueprint is None or street is None:
+            logger.debug(f"Updated belief for player {player} after action {action} (no blueprint)")
+            return
+        try:
+            action = AbstractAction(action) if isinstance(action, str) else action
+        except ValueError:
+            logger.debug(f"Ignoring unknown action {action} for belief update")
+            return
+
+        board = list(board or [])
+        self.remove_dead_cards(board)
+        table = self.bucket_table(board, street, pot, stack, is_in_position)
+
+        # P(action | bucket) once per bucket, then gathered for all combos
+        buckets = np.unique(table[table >= 0])
+        probs = np.zeros(int(buckets.max()) + 1 if len(buckets) else 1, dtype=np.float32)
+        for bucket in buckets:
+            infoset, _ = create_infoset_key(street, int(bucket), action_sequence)
+            probs[bucket] = self.blueprint.get_strategy(infoset).get(action, 0.0)
+        likelihood = np.where(table >= 0, probs[np.maximum(table, 0)], 0.0).astype(np.float32)
+
+        posterior = self.ranges[player] * likelihood
+        if posterior.sum() <= 0:
+            logger.warning(f"Action {action.value} has zero probability under player {player}'s range; "
+                           f"keeping the prior")
+            return
+        self.ranges[player] = posterior
+        self._normalize(player)
+        logger.debug(f"Updated belief for player {player} after action {action.value}")
+
+    def range_vector(self, player: int) -> np.ndarray:
+        """Player's dense range over the 1326 combos (read-only view)."""
+        view = self.ranges[player].view()
+        view.flags.writeable = False
+        return view
+
     def get_range(self, player: int) -> Dict[str, float]:
-        """Get current range for a player."""
-        if player < len(self.ranges):
-            return self.ranges[player]
-        return {}
-    
+        """Get current range for a player (hand string, e.g. "AhKs" -> probability)."""
+        if player >= self.num_opponents:
+            return {}
+        weights = self.ranges[player]
+        return {_combo_string(combo): float(weights[combo]) for combo in np.flatnonzero(weights)}
+
     def sample_hand(self, player: int, rng) -> List[Card]:
-        """Sample a hand from player's range."""
-        # Simplified: return random hand
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
-        suits = ['h', 'd', 'c', 's']
-        
-        deck = [Card(rank, suit) for rank in ranks for suit in suits]
-        rng.shuffle(deck)
-        
-        return deck[:2]
+        """Sample a hand from player's range (one uniform draw against cumulative weights)."""
+        cdf = self._cdf[player]
+        if cdf is None:
+            cdf = self._cdf[player] = np.cumsum(self.ranges[player], dtype=np.float64)
+        combo = int(np.searchsorted(cdf, rng.random() * cdf[-1], side='right'))
+        return combo_cards(min(combo, NUM_COMBOS - 1))
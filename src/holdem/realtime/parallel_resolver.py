@@ -2,21 +2,186 @@
 
 import numpy as np
 import multiprocessing as mp
+import queue
 import time
+from collections import deque
+from types import SimpleNamespace
 from typing import Dict, List, Optional, TYPE_CHECKING
 from holdem.types import SearchConfig, Card, Street
 from holdem.abstraction.actions import AbstractAction
 from holdem.mccfr.policy_store import PolicyStore
 from holdem.mccfr.regrets import RegretTracker
+from holdem.realtime.anytime import SolveHandle, start_anytime_solve
 from holdem.realtime.subgame import SubgameTree
-from holdem.utils.rng import get_rng
+from holdem.realtime.range_solver import RangeVsRangeCFR, build_subgame_solver
+from holdem.utils.rng import get_rng, RNG
 from holdem.utils.logging import get_logger
+from holdem.utils.affinity import (
+    affinity_supported, available_cpus, plan_cpu_sets, pin_current_process, limit_blas_threads, blas_thread_env
+)
 
 if TYPE_CHECKING:
     from holdem.rt_resolver.leaf_evaluator import LeafEvaluator
 
 logger = get_logger("realtime.parallel_resolver")
 
+# Persistent pool workers stream their current average strategy at most this often,
+# so a usable answer exists even if the deadline hits mid-solve
+PARTIAL_RESULT_INTERVAL_SECONDS = 0.01
+POOL_READY_TIMEOUT_SECONDS = 120.0
+# Number of recent decisions kept for latency percentiles
+LATENCY_WINDOW = 1000
+
+
+def _warm_start_regrets(
+    regret_tracker: RegretTracker,
+    infoset: str,
+    actions: List[AbstractAction],
+    blueprint_strategy: Dict[AbstractAction, float]
+):
+    """Initialize regrets from the blueprint strategy."""
+    total_prob = sum(blueprint_strategy.values())
+    if total_prob > 0:
+        for action in actions:
+            prob = blueprint_strategy.get(action, 0.0)
+            initial_regret = prob * 10.0  # Warm-start strength
+            regret_tracker.update_regret(infoset, action, initial_regret, weight=1.0)
+
+
+def _cfr_step(
+    regret_tracker: RegretTracker,
+    infoset: str,
+    actions: List[AbstractAction],
+    blueprint_strategy: Dict[AbstractAction, float],
+    kl_weight: float,
+    rng
+):
+    """Run one KL-regularized CFR iteration at the root infoset.
+    
+    PLACEHOLDER: Simplified utility calculation.
+    TODO: Implement proper subgame traversal:
+    - Recursive game tree traversal from current state
+    - Sample opponent actions and board outcomes
+    - Calculate exact utilities at terminal nodes
+    - Backpropagate counterfactual values
+    """
+    current_strategy = regret_tracker.get_strategy(infoset, actions)
+    
+    # Sample action
+    action_probs = [current_strategy.get(a, 0.0) for a in actions]
+    if sum(action_probs) == 0:
+        action_probs = [1.0 / len(actions)] * len(actions)
+    else:
+        action_probs = np.array(action_probs)
+        action_probs /= action_probs.sum()
+    
+    sampled_action = rng.choice(actions, p=action_probs)
+    
+    utility = rng.uniform(-1.0, 1.0)
+    
+    # Add KL divergence penalty to regularize toward blueprint
+    kl_penalty = 0.0
+    for action in current_strategy:
+        p_val = current_strategy.get(action, 1e-10)
+        q_val = blueprint_strategy.get(action, 1e-10)
+        if p_val > 0:
+            kl_penalty += p_val * np.log(p_val / q_val)
+    
+    utility -= kl_weight * kl_penalty
+    
+    # Update regrets
+    for action in actions:
+        regret = 0.0
+        if action == sampled_action:
+            regret = utility
+        regret_tracker.update_regret(infoset, action, regret)
+    
+    # Add to strategy sum
+    regret_tracker.add_strategy(infoset, current_strategy, 1.0)
+
+
+def _range_solver_spec(subgame: SubgameTree, config: SearchConfig) -> Optional[Dict]:
+    """Picklable inputs of the range solver, or None to use the root-only CFR step.
+    
+    Pool tasks carry this instead of the SubgameTree and SearchConfig: only the
+    table numbers, board, hero cards and range solver settings.
+    """
+    state = getattr(subgame, 'state', None)
+    if not config.use_range_solver or state is None:
+        return None
+    return {
+        'board': list(state.board),
+        'pot': state.pot,
+        'to_call': state.to_call,
+        'effective_stack': state.effective_stack,
+        'our_cards': list(subgame.our_cards or []),
+        'max_raises': config.range_solver_max_raises,
+        'leaf_runouts': config.range_solver_leaf_runouts,
+        'blueprint_clip_min': config.blueprint_clip_min,
+    }
+
+
+def _range_solver_from_spec(
+    spec: Optional[Dict],
+    actions: List[AbstractAction],
+    blueprint_strategy: Dict[AbstractAction, float],
+    kl_weight: float,
+    rng
+) -> Optional[RangeVsRangeCFR]:
+    """Blueprint-warm-started range solver from a _range_solver_spec(), or None."""
+    if spec is None:
+        return None
+    subgame = SimpleNamespace(
+        state=SimpleNamespace(
+            board=spec['board'],
+            pot=spec['pot'],
+            to_call=spec['to_call'],
+            effective_stack=spec['effective_stack']
+        ),
+        our_cards=spec['our_cards']
+    )
+    settings = SimpleNamespace(
+        range_solver_max_raises=spec['max_raises'],
+        range_solver_leaf_runouts=spec['leaf_runouts']
+    )
+    solver = build_subgame_solver(subgame, actions, settings, rng.rng)
+    if solver is not None:
+        solver.set_blueprint(blueprint_strategy, kl_weight, spec['blueprint_clip_min'])
+    return solver
+
+
+def _make_range_solver(
+    subgame: SubgameTree,
+    actions: List[AbstractAction],
+    blueprint_strategy: Dict[AbstractAction, float],
+    kl_weight: float,
+    config: SearchConfig,
+    rng
+) -> Optional[RangeVsRangeCFR]:
+    """Blueprint-warm-started range solver, or None to use the root-only CFR step."""
+    return _range_solver_from_spec(
+        _range_solver_spec(subgame, config), actions, blueprint_strategy, kl_weight, rng
+    )
+
+
+def _range_strategy(
+    solver: RangeVsRangeCFR,
+    our_cards: List[Card],
+    actions: List[AbstractAction]
+) -> Dict[AbstractAction, float]:
+    """Hero's average root strategy over the full action list (0 for pruned actions)."""
+    hero_strategy = solver.root_strategy(our_cards)
+    return {action: hero_strategy.get(action, 0.0) for action in actions}
+
+
+def _merge_worker_results(results: Dict[int, Dict], actions: List[AbstractAction]) -> Dict[AbstractAction, float]:
+    """Average of the workers' strategies, weighted by their completed iterations."""
+    total_iterations = sum(r['iterations'] for r in results.values())
+    return {
+        action: sum(r['strategy'].get(action, 0.0) * r['iterations'] for r in results.values()) / total_iterations
+        for action in actions
+    }
+
 
 def worker_cfr_iteration(
     worker_id: int,
@@ -25,16 +190,18 @@ def worker_cfr_iteration(
     blueprint_strategy: Dict[AbstractAction, float],
     kl_weight: float,
     num_iterations: int,
-    result_queue: mp.Queue
+    result_queue: mp.Queue,
+    cpu_set: Optional[List[int]] = None,
+    blas_threads: Optional[int] = None,
+    config: Optional[SearchConfig] = None
 ):
     """Worker process that runs CFR iterations with warm-start from blueprint.
     
     Each worker starts with regrets initialized from the blueprint strategy,
     then runs independent CFR iterations. This improves convergence speed
-    and solution quality.
-    
-    LIMITATION: Uses simplified utility calculation (placeholder).
-    Production implementation should perform complete subgame traversal.
+    and solution quality. Subgames with a table state and hero cards are
+    solved range-vs-range (each worker samples its own leaf runouts);
+    others use the simplified root-only utility (placeholder).
     
     Args:
         worker_id: ID of this worker
@@ -44,62 +211,30 @@ def worker_cfr_iteration(
         kl_weight: KL divergence weight
         num_iterations: Number of iterations to run
         result_queue: Queue to put results
+        cpu_set: CPUs to pin this worker to (optional, Linux only)
+        blas_threads: Cap on BLAS/OpenMP threads in this worker (optional)
+        config: Search config (range solver settings; default SearchConfig())
     """
-    regret_tracker = RegretTracker()
-    rng = get_rng()
+    limit_blas_threads(blas_threads)
+    pin_current_process(cpu_set)
     
-    # Warm-start regrets from blueprint
+    rng = get_rng()
     actions = subgame.get_actions(infoset)
-    total_prob = sum(blueprint_strategy.values())
-    if total_prob > 0:
-        for action in actions:
-            prob = blueprint_strategy.get(action, 0.0)
-            initial_regret = prob * 10.0  # Warm-start strength
-            regret_tracker.update_regret(infoset, action, initial_regret, weight=1.0)
+    range_solver = _make_range_solver(
+        subgame, actions, blueprint_strategy, kl_weight, config or SearchConfig(), rng
+    )
     
-    for _ in range(num_iterations):
-        current_strategy = regret_tracker.get_strategy(infoset, actions)
-        
-        # Sample action
-        action_probs = [current_strategy.get(a, 0.0) for a in actions]
-        if sum(action_probs) == 0:
-            action_probs = [1.0 / len(actions)] * len(actions)
-        else:
-            action_probs = np.array(action_probs)
-            action_probs /= action_probs.sum()
-        
-        sampled_action = rng.choice(actions, p=action_probs)
-        
-        # PLACEHOLDER: Simplified utility calculation
-        # TODO: Implement proper subgame traversal:
-        # - Recursive game tree traversal from current state
-        # - Sample opponent actions and board outcomes
-        # - Calculate exact utilities at terminal nodes
-        # - Backpropagate counterfactual values
-        utility = rng.uniform(-1.0, 1.0)
-        
-        # Add KL divergence penalty to regularize toward blueprint
-        kl_penalty = 0.0
-        for action in current_strategy:
-            p_val = current_strategy.get(action, 1e-10)
-            q_val = blueprint_strategy.get(action, 1e-10)
-            if p_val > 0:
-                kl_penalty += p_val * np.log(p_val / q_val)
-        
-        utility -= kl_weight * kl_penalty
-        
-        # Update regrets
-        for action in actions:
-            regret = 0.0
-            if action == sampled_action:
-                regret = utility
-            regret_tracker.update_regret(infoset, action, regret)
-        
-        # Add to strategy sum
-        regret_tracker.add_strategy(infoset, current_strategy, 1.0)
-    
-    # Get final strategy
-    final_strategy = regret_tracker.get_average_strategy(infoset, actions)
+    if range_solver is not None:
+        for _ in range(num_iterations):
+            range_solver.iterate()
+        final_strategy = _range_strategy(range_solver, subgame.our_cards, actions)
+    else:
+        # Warm-start regrets from blueprint
+        regret_tracker = RegretTracker()
+        _warm_start_regrets(regret_tracker, infoset, actions, blueprint_strategy)
+        for _ in range(num_iterations):
+            _cfr_step(regret_tracker, infoset, actions, blueprint_strategy, kl_weight, rng)
+        final_strategy = regret_tracker.get_average_strategy(infoset, actions)
     
     # Put result in queue
     result = {
@@ -109,6 +244,88 @@ def worker_cfr_iteration(
     result_queue.put(result)
 
 
+def persistent_resolver_worker(
+    worker_id: int,
+    blueprint: PolicyStore,
+    task_queue: mp.Queue,
+    result_queue: mp.Queue,
+    cpu_set: Optional[List[int]] = None,
+    blas_threads: Optional[int] = None
+):
+    """Long-lived resolver worker that solves many decisions.
+    
+    The blueprint is loaded once at pool start. Each task is a small message
+    (solve_id, range solver spec, infoset, actions, iteration quota, deadline); the worker looks
+    up the blueprint strategy itself and streams its current average strategy
+    back every PARTIAL_RESULT_INTERVAL_SECONDS, then a final result when the
+    quota is done or the deadline (wall clock, shared with the main process)
+    passes. A None task shuts the worker down.
+    
+    Args:
+        worker_id: ID of this worker
+        blueprint: Blueprint policy (warm-start and KL regularization)
+        task_queue: Queue of solve tasks for this worker
+        result_queue: Queue for partial/final results
+        cpu_set: CPUs to pin this worker to (optional, Linux only)
+        blas_threads: Cap on BLAS/OpenMP threads in this worker (optional)
+    """
+    limit_blas_threads(blas_threads)
+    pin_current_process(cpu_set)
+    
+    # Independent stream per worker (forked workers would otherwise share the parent's RNG state)
+    rng = RNG()
+    result_queue.put({'worker_id': worker_id, 'ready': True})
+    
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        
+        infoset = task['infoset']
+        actions = task['actions']
+        spec = task['range_solver']
+        blueprint_strategy = blueprint.get_strategy(infoset)
+        range_solver = _range_solver_from_spec(spec, actions, blueprint_strategy, task['kl_weight'], rng)
+        regret_tracker = RegretTracker()
+        if range_solver is None:
+            _warm_start_regrets(regret_tracker, infoset, actions, blueprint_strategy)
+        
+        def current_strategy() -> Dict[AbstractAction, float]:
+            if range_solver is not None:
+                return _range_strategy(range_solver, spec['our_cards'], actions)
+            return regret_tracker.get_average_strategy(infoset, actions)
+        
+        iterations = 0
+        last_report = time.time()
+        while iterations < task['num_iterations']:
+            if range_solver is not None:
+                range_solver.iterate()
+            else:
+                _cfr_step(regret_tracker, infoset, actions, blueprint_strategy, task['kl_weight'], rng)
+            iterations += 1
+            
+            now = time.time()
+            if now >= task['deadline']:
+                break
+            if now - last_report >= PARTIAL_RESULT_INTERVAL_SECONDS:
+                result_queue.put({
+                    'worker_id': worker_id,
+                    'solve_id': task['solve_id'],
+                    'strategy': current_strategy(),
+                    'iterations': iterations,
+                    'final': False
+                })
+                last_report = now
+        
+        result_queue.put({
+            'worker_id': worker_id,
+            'solve_id': task['solve_id'],
+            'strategy': current_strategy(),
+            'iterations': iterations,
+            'final': True
+        })
+
+
 class ParallelSubgameResolver:
     """Resolves subgames with KL regularization using parallel workers."""
     
@@ -132,13 +349,123 @@ class ParallelSubgameResolver:
         else:
             self.num_workers = max(1, self.config.num_workers)
         
+        # Pin workers to disjoint CPU sets, leaving one CPU to the caller (the realtime loop),
+        # which is pinned to it while workers run (pool started or spawned solve)
+        self.worker_cpu_sets: List[Optional[List[int]]] = [None] * self.num_workers
+        self.main_cpus: Optional[List[int]] = None
+        self._saved_affinity: Optional[List[int]] = None
+        if self.config.cpu_affinity:
+            if affinity_supported():
+                self.main_cpus, self.worker_cpu_sets = plan_cpu_sets(self.num_workers, reserve_main=True)
+            else:
+                logger.warning("cpu_affinity requested but not supported on this platform, ignoring")
+        
+        # Persistent worker pool (start_pool); solve() spawns workers per call when not started
+        self._pool_workers: List[mp.Process] = []
+        self._pool_task_queues: List[mp.Queue] = []
+        self._pool_result_queue: Optional[mp.Queue] = None
+        self._solve_id = 0
+        
+        # Recent decision latencies (ms) for p50/p99 reporting
+        self._latencies_ms = deque(maxlen=LATENCY_WINDOW)
+        
         logger.debug(f"Initialized parallel resolver with {self.num_workers} worker(s)")
     
+    @property
+    def pool_running(self) -> bool:
+        return bool(self._pool_workers)
+    
+    def _pin_main(self):
+        """Keep the calling process off the workers' cores (restored by _unpin_main)."""
+        if self.main_cpus is None or self._saved_affinity is not None:
+            return
+        saved = available_cpus()
+        if pin_current_process(self.main_cpus):
+            self._saved_affinity = saved
+            logger.debug(f"Main process pinned to CPUs {self.main_cpus}")
+    
+    def _unpin_main(self):
+        """Restore the calling process affinity saved by _pin_main."""
+        if self._saved_affinity is not None:
+            pin_current_process(self._saved_affinity)
+            self._saved_affinity = None
+    
+    def start_pool(self):
+        """Start the persistent worker pool (blueprint sent to each worker once)."""
+        if self.pool_running or self.num_workers == 1:
+            return
+        
+        start_time = time.perf_counter()
+        self._pool_result_queue = self.mp_context.Queue()
+        self._pool_task_queues = [self.mp_context.Queue() for _ in range(self.num_workers)]
+        with blas_thread_env(self.config.worker_blas_threads):
+            for worker_id in range(self.num_workers):
+                p = self.mp_context.Process(
+                    target=persistent_resolver_worker,
+                    args=(
+                        worker_id,
+                        self.blueprint,
+                        self._pool_task_queues[worker_id],
+                        self._pool_result_queue,
+                        self.worker_cpu_sets[worker_id],
+                        self.config.worker_blas_threads
+                    ),
+                    daemon=True
+                )
+                p.start()
+                self._pool_workers.append(p)
+        self._pin_main()
+        
+        # Wait for the ready handshake so the first decision does not pay for interpreter startup
+        ready = 0
+        deadline = time.time() + POOL_READY_TIMEOUT_SECONDS
+        while ready < self.num_workers:
+            try:
+                result = self._pool_result_queue.get(timeout=max(0.0, deadline - time.time()))
+            except queue.Empty:
+                self.shutdown_pool()
+                raise RuntimeError(f"Resolver pool: only {ready}/{self.num_workers} workers became ready")
+            if result.get('ready'):
+                ready += 1
+        
+        logger.info(f"Started resolver pool with {self.num_workers} persistent worker(s) "
+                    f"in {time.perf_counter() - start_time:.2f}s")
+    
+    def shutdown_pool(self):
+        """Stop the persistent worker pool."""
+        if not self.pool_running:
+            return
+        for task_queue in self._pool_task_queues:
+            task_queue.put(None)
+        for p in self._pool_workers:
+            p.join(timeout=2.0)
+            if p.is_alive():
+                p.terminate()
+                p.join(timeout=1.0)
+        self._pool_workers = []
+        self._pool_task_queues = []
+        self._pool_result_queue = None
+        self._unpin_main()
+        logger.info("Resolver pool stopped")
+    
+    def latency_stats(self) -> Dict[str, float]:
+        """Decision latency percentiles (ms) over recent solves."""
+        if not self._latencies_ms:
+            return {'count': 0}
+        latencies = np.array(self._latencies_ms)
+        return {
+            'count': len(latencies),
+            'p50_ms': float(np.percentile(latencies, 50)),
+            'p99_ms': float(np.percentile(latencies, 99)),
+            'mean_ms': float(latencies.mean()),
+        }
+    
     def solve(
         self,
         subgame: SubgameTree,
         infoset: str,
-        time_budget_ms: int = None
+        time_budget_ms: int = None,
+        progress: Optional[SolveHandle] = None
     ) -> Dict[AbstractAction, float]:
         """Solve subgame using parallel workers and return strategy.
         
@@ -157,21 +484,60 @@ class ParallelSubgameResolver:
             subgame: Subgame tree
             infoset: Information set
             time_budget_ms: Time budget in milliseconds
+            progress: Handle to publish the current strategy to (every
+                anytime_publish_interval iterations sequentially, on each
+                partial result with the pool); the solve stops early when it
+                is cancelled (see solve_anytime). Workers started for this
+                decision only report once, at the end
             
         Returns:
             Strategy dictionary mapping actions to probabilities
         """
-        # Using 'spawn' context initialized in __init__
-        
         if time_budget_ms is None:
             time_budget_ms = self.config.time_budget_ms
         
+        start_time = time.time()
+        
         # Get blueprint strategy for regularization and warm-start
         blueprint_strategy = self.blueprint.get_strategy(infoset)
         
         # If only one worker, fall back to sequential
         if self.num_workers == 1:
-            return self._solve_sequential(subgame, infoset, blueprint_strategy, time_budget_ms)
+            strategy = self._solve_sequential(subgame, infoset, blueprint_strategy, time_budget_ms, progress)
+        elif self.pool_running:
+            strategy = self._solve_with_pool(subgame, infoset, blueprint_strategy, time_budget_ms, progress)
+        else:
+            self._pin_main()
+            try:
+                strategy = self._solve_spawn(subgame, infoset, blueprint_strategy, time_budget_ms)
+            finally:
+                self._unpin_main()
+        
+        self._latencies_ms.append((time.time() - start_time) * 1000)
+        return strategy
+    
+    def solve_anytime(self, subgame: SubgameTree, infoset: str, **solve_kwargs) -> SolveHandle:
+        """Start solve() in a background thread and return a handle on it (see SubgameResolver.solve_anytime).
+        
+        Args:
+            subgame: Subgame tree to solve
+            infoset: Information set to solve for
+            **solve_kwargs: Other solve() arguments
+        """
+        return start_anytime_solve(
+            lambda handle: self.solve(subgame, infoset, progress=handle, **solve_kwargs),
+            name="parallel-subgame-solve"
+        )
+    
+    def _solve_spawn(
+        self,
+        subgame: SubgameTree,
+        infoset: str,
+        blueprint_strategy: Dict[AbstractAction, float],
+        time_budget_ms: int
+    ) -> Dict[AbstractAction, float]:
+        """Solve with worker processes started for this decision only."""
+        # Using 'spawn' context initialized in __init__
         
         # Calculate iterations per worker
         total_iterations = self.config.min_iterations
@@ -185,21 +551,26 @@ class ParallelSubgameResolver:
         
         # Start workers
         workers = []
-        for worker_id in range(self.num_workers):
-            p = self.mp_context.Process(
-                target=worker_cfr_iteration,
-                args=(
-                    worker_id,
-                    subgame,
-                    infoset,
-                    blueprint_strategy,
-                    self.config.kl_divergence_weight,
-                    iterations_per_worker,
-                    result_queue
+        blas_threads = self.config.worker_blas_threads
+        with blas_thread_env(blas_threads):
+            for worker_id in range(self.num_workers):
+                p = self.mp_context.Process(
+                    target=worker_cfr_iteration,
+                    args=(
+                        worker_id,
+                        subgame,
+                        infoset,
+                        blueprint_strategy,
+                        self.config.kl_divergence_weight,
+                        iterations_per_worker,
+                        result_queue,
+                        self.worker_cpu_sets[worker_id],
+                        blas_threads,
+                        self.config
+                    )
                 )
-            )
-            p.start()
-            workers.append(p)
+                p.start()
+                workers.append(p)
         
         # Wait for all workers to complete or timeout
         timeout = time_budget_ms / 1000.0
@@ -242,12 +613,92 @@ class ParallelSubgameResolver:
         
         return merged_strategy
     
+    def _solve_with_pool(
+        self,
+        subgame: SubgameTree,
+        infoset: str,
+        blueprint_strategy: Dict[AbstractAction, float],
+        time_budget_ms: int,
+        progress: Optional[SolveHandle] = None
+    ) -> Dict[AbstractAction, float]:
+        """Solve with the persistent pool, keeping each worker's latest (anytime) result.
+        
+        Returns at the deadline with whatever partial strategies have arrived,
+        or earlier once every worker has sent its final result or progress is
+        cancelled. Workers of a cancelled solve stop at its deadline; their
+        late results are discarded by the next solve.
+        """
+        start_time = time.time()
+        deadline = start_time + time_budget_ms / 1000.0
+        self._solve_id += 1
+        solve_id = self._solve_id
+        
+        actions = subgame.get_actions(infoset)
+        iterations_per_worker = max(1, self.config.min_iterations // self.num_workers)
+        range_solver_spec = _range_solver_spec(subgame, self.config)
+        for task_queue in self._pool_task_queues:
+            task_queue.put({
+                'solve_id': solve_id,
+                'range_solver': range_solver_spec,
+                'infoset': infoset,
+                'actions': actions,
+                'num_iterations': iterations_per_worker,
+                'kl_weight': self.config.kl_divergence_weight,
+                'deadline': deadline
+            })
+        
+        # Latest result per worker; results of earlier (timed-out) solves are discarded
+        latest: Dict[int, Dict] = {}
+        finished = set()
+        if progress is not None:
+            # What a solve without any worker result falls back to
+            progress.publish(blueprint_strategy, 0)
+        while len(finished) < self.num_workers:
+            if progress is not None and progress.cancelled:
+                break
+            remaining = deadline - time.time()
+            # Anytime solves wake up between partial results to notice cancellation
+            timeout = remaining if progress is None else min(remaining, PARTIAL_RESULT_INTERVAL_SECONDS)
+            try:
+                if timeout > 0:
+                    result = self._pool_result_queue.get(timeout=timeout)
+                else:
+                    result = self._pool_result_queue.get_nowait()
+            except queue.Empty:
+                if time.time() >= deadline:
+                    break
+                continue
+            if result.get('solve_id') != solve_id:
+                continue
+            latest[result['worker_id']] = result
+            if result['final']:
+                finished.add(result['worker_id'])
+            if progress is not None:
+                progress.publish(
+                    _merge_worker_results(latest, actions), sum(r['iterations'] for r in latest.values())
+                )
+        
+        if not latest:
+            logger.warning("Parallel solving timed out, falling back to blueprint")
+            return blueprint_strategy
+        
+        # Average worker strategies weighted by completed iterations
+        total_iterations = sum(r['iterations'] for r in latest.values())
+        merged_strategy = _merge_worker_results(latest, actions)
+        
+        elapsed_ms = (time.time() - start_time) * 1000
+        logger.debug(f"Resolved subgame with pool: {len(finished)}/{self.num_workers} workers finished, "
+                     f"{total_iterations} iterations in {elapsed_ms:.1f}ms")
+        
+        return merged_strategy
+    
     def _solve_sequential(
         self,
         subgame: SubgameTree,
         infoset: str,
         blueprint_strategy: Dict[AbstractAction, float],
-        time_budget_ms: int
+        time_budget_ms: int,
+        progress: Optional[SolveHandle] = None
     ) -> Dict[AbstractAction, float]:
         """Sequential solving (fallback for single worker) with warm-start.
         
@@ -256,15 +707,44 @@ class ParallelSubgameResolver:
             infoset: Information set
             blueprint_strategy: Blueprint strategy for regularization and warm-start
             time_budget_ms: Time budget in milliseconds
+            progress: Anytime handle to publish to and check for cancellation
             
         Returns:
             Strategy dictionary
         """
-        regret_tracker = RegretTracker()
         rng = get_rng()
+        actions = subgame.get_actions(infoset)
+        
+        # Budget covers the betting tree build too
+        start_time = time.time()
+        range_solver = _make_range_solver(
+            subgame, actions, blueprint_strategy, self.config.kl_divergence_weight, self.config, rng
+        )
+        publish_interval = max(1, self.config.anytime_publish_interval)
+        if range_solver is not None:
+            if progress is not None:
+                # The warm-started strategy is available before the first iteration
+                warm = range_solver.root_strategy(subgame.our_cards, average=False)
+                progress.publish({action: warm.get(action, 0.0) for action in actions}, 0)
+            iterations = 0
+            while iterations < self.config.min_iterations:
+                range_solver.iterate()
+                iterations += 1
+                # The budget is binding once an iteration has run (as in SubgameResolver.solve)
+                elapsed_ms = (time.time() - start_time) * 1000
+                if elapsed_ms > time_budget_ms:
+                    break
+                if progress is not None:
+                    if progress.cancelled:
+                        break
+                    if iterations % publish_interval == 0:
+                        progress.publish(_range_strategy(range_solver, subgame.our_cards, actions), iterations)
+            logger.debug(f"Resolved subgame range-vs-range in {iterations} iterations ({elapsed_ms:.1f}ms)")
+            return _range_strategy(range_solver, subgame.our_cards, actions)
+        
+        regret_tracker = RegretTracker()
         
         # Warm-start regrets from blueprint
-        actions = subgame.get_actions(infoset)
         total_prob = sum(blueprint_strategy.values())
         if total_prob > 0:
             for action in actions:
@@ -274,6 +754,8 @@ class ParallelSubgameResolver:
         
         start_time = time.time()
         iterations = 0
+        if progress is not None:
+            progress.publish(regret_tracker.get_strategy(infoset, actions), 0)
         
         while iterations < self.config.min_iterations:
             current_strategy = regret_tracker.get_strategy(infoset, actions)
@@ -313,6 +795,11 @@ class ParallelSubgameResolver:
             regret_tracker.add_strategy(infoset, current_strategy, 1.0)
             
             iterations += 1
+            if progress is not None:
+                if progress.cancelled:
+                    break
+                if iterations % publish_interval == 0:
+                    progress.publish(regret_tracker.get_average_strategy(infoset, actions), iterations)
             
             # Check time budget
             elapsed_ms = (time.time() - start_time) * 1000
@@ -0,0 +1,643 @@
+"""Range-vs-range vectorized CFR for depth-limited subgames.
+
+Both players' ranges are numpy vectors over the 1326 hole-card combos (only
+combos that do not collide with the board are kept). Each iteration walks
+the public betting tree of the current street once: a forward pass pushes
+both players' reach vectors down the tree, all terminal values are computed
+in one batch (a single matrix product for showdowns and depth-limit leaves,
+per-card sums for folds), and a backward pass accumulates counterfactual
+values and updates CFR+ regrets for every hand at once.
+
+Showdowns use a pairwise outcome matrix built once per solve from per-board
+strength ranks; combos that share a card never meet (card removal). When the
+board is incomplete, the depth-limit leaf at the end of the street is valued
+as a showdown averaged over sampled runouts.
+"""
+
+import itertools
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import eval7
+import numpy as np
+
+from holdem.types import Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.utils.card_removal import (
+    COMBO_CARDS, NUM_CARDS, NUM_COMBOS, card_index, card_onehot, combo_index, combo_indices,
+    combos_avoiding, compatible_matrix, compatible_reach
+)
+from holdem.utils.deck import RANKS, SUITS
+from holdem.utils.logging import get_logger
+
+logger = get_logger("realtime.range_solver")
+
+# Initial root regret per unit of blueprint probability (pot-normalized values)
+WARM_START_STRENGTH = 1.0
+
+# Betting-tree node kinds
+ACTION, FOLD, SHOWDOWN = 0, 1, 2
+
+_EVAL7_CARDS = [eval7.Card(rank + suit) for rank in RANKS for suit in SUITS]
+
+
+def canonical_suit_map(board: Sequence[int]) -> np.ndarray:
+    """Suit relabeling that maps the board to its canonical (suit-isomorphic) form.
+
+    Boards that differ only by a permutation of suits get the same canonical
+    board; the returned array maps each suit index to its canonical suit.
+    """
+    board = np.asarray(board, dtype=np.int64)
+    best, best_key = None, None
+    for perm in itertools.permutations(range(len(SUITS))):
+        perm = np.array(perm)
+        key = tuple(sorted((board // 4) * 4 + perm[board % 4]))
+        if best_key is None or key < best_key:
+            best, best_key = perm, key
+    return best
+
+
+def bet_fraction(action: AbstractAction) -> Optional[float]:
+    """Pot fraction of a bet action ("bet_0.5p" -> 0.5), None for non-bets."""
+    if action.value.startswith("bet_") and action.value.endswith("p"):
+        return float(action.value[len("bet_"):-1])
+    return None
+
+
+class _Node:
+    __slots__ = ('kind', 'player', 'actions', 'children', 'contrib', 'folder')
+
+    def __init__(self, kind: int, player: int, contrib: Tuple[float, float], folder: int = -1):
+        self.kind = kind
+        self.player = player
+        self.actions: List[AbstractAction] = []
+        self.children: List[int] = []
+        self.contrib = contrib
+        self.folder = folder
+
+
+def build_betting_tree(
+    actions: Sequence[AbstractAction],
+    to_call: float,
+    stack: float,
+    pot: float,
+    max_raises: int = 2
+) -> List[_Node]:
+    """Build the public betting tree for the rest of the current street.
+
+    Player 0 (hero) acts at the root facing to_call. Contributions are
+    counted from the start of the subgame; pot is the money already in the
+    middle apart from the outstanding bet. The street ends with a fold, a
+    call or check-check (SHOWDOWN nodes: a real showdown on the river, a
+    depth-limit leaf otherwise).
+
+    Args:
+        actions: Action menu (FOLD / CHECK_CALL / bet fractions / ALL_IN)
+        to_call: Amount hero must call at the root
+        stack: Maximum total contribution per player in the subgame
+        pot: Pot before the outstanding bet
+        max_raises: Bets/raises allowed in the street (keeps the tree small)
+
+    Returns:
+        Nodes in preorder (index 0 is the root)
+    """
+    nodes: List[_Node] = []
+
+    def add(node: _Node) -> int:
+        nodes.append(node)
+        return len(nodes) - 1
+
+    def expand(player: int, contrib: Tuple[float, float], raises: int, acted: bool) -> int:
+        node_id = add(_Node(ACTION, player, contrib))
+        node = nodes[node_id]
+        other = 1 - player
+        facing = contrib[other] - contrib[player]
+        seen_amounts = set()
+
+        for action in actions:
+            new_contrib = list(contrib)
+            if action == AbstractAction.FOLD:
+                if facing <= 0:
+                    continue
+                child = add(_Node(FOLD, -1, contrib, folder=player))
+            elif action == AbstractAction.CHECK_CALL:
+                new_contrib[player] = contrib[other]
+                new_contrib = tuple(new_contrib)
+                if facing > 0 or acted:
+                    # Call, or check behind: the street is over
+                    child = add(_Node(SHOWDOWN, -1, new_contrib))
+                else:
+                    child = expand(other, new_contrib, raises, True)
+            else:
+                if raises >= max_raises or contrib[other] >= stack:
+                    continue
+                fraction = bet_fraction(action)
+                pot_after_call = pot + 2 * contrib[other]
+                if action == AbstractAction.ALL_IN or fraction is None:
+                    target = stack
+                else:
+                    target = min(stack, contrib[other] + fraction * pot_after_call)
+                if target <= contrib[other] or round(target, 6) in seen_amounts:
+                    continue
+                seen_amounts.add(round(target, 6))
+                new_contrib[player] = target
+                child = expand(other, tuple(new_contrib), raises + 1, True)
+            node.actions.append(action)
+            node.children.append(child)
+        return node_id
+
+    expand(0, (0.0, to_call), 0, False)
+    return nodes
+
+
+def showdown_matrix(
+    combos: np.ndarray,
+    board: Sequence[int],
+    num_runouts: int = 8,
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """Pairwise showdown outcomes between valid combos.
+
+    M[i, j] = P(i beats j) - P(j beats i), averaged over runouts that both
+    hands can coexist with, and 0 when the hands share a card. With a full
+    board this is the exact river showdown; otherwise runouts completing the
+    board are sampled.
+
+    Args:
+        combos: Combo indices (none colliding with the board)
+        board: Board card indices (0-5 cards)
+        num_runouts: Runouts sampled when the board is incomplete
+        rng: numpy Generator for runout sampling
+
+    Returns:
+        Antisymmetric (len(combos), len(combos)) float matrix
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    cards = COMBO_CARDS[combos]
+
+    missing = 5 - len(board)
+    if missing == 0:
+        runouts = [()]
+    else:
+        deck = np.array([c for c in range(NUM_CARDS) if c not in set(board)])
+        runouts = [tuple(rng.choice(deck, size=missing, replace=False)) for _ in range(num_runouts)]
+
+    hands = [[_EVAL7_CARDS[a], _EVAL7_CARDS[b]] for a, b in cards.tolist()]
+    wins = np.zeros((len(combos), len(combos)), dtype=np.int16)
+    valid_runouts = np.zeros((len(runouts), len(combos)), dtype=np.float32)
+    for r, runout in enumerate(runouts):
+        full_board = [_EVAL7_CARDS[c] for c in list(board) + list(runout)]
+        valid = combos_avoiding(runout)[combos] if runout else np.ones(len(combos), dtype=bool)
+        valid_runouts[r] = valid
+        strength = np.array([eval7.evaluate(full_board + hand) for hand in hands], dtype=np.float32)
+        # Hands blocked by the runout get NaN strength, which compares false both ways
+        strength[~valid] = np.nan
+        wins += strength[:, None] > strength[None, :]
+    outcome = (wins - wins.T).astype(np.float32)
+
+    # Number of runouts each pair can coexist with
+    weight = valid_runouts.T @ valid_runouts
+    matrix = np.divide(outcome, weight, out=np.zeros_like(outcome), where=weight > 0)
+    matrix[~compatible_matrix(combos)] = 0.0
+    return matrix
+
+
+class RangeVsRangeCFR:
+    """Vectorized CFR+ over both players' ranges on a depth-limited betting tree.
+
+    Values are pot-normalized and centered: the winner gains half the
+    starting pot plus the loser's contribution, so the game is zero-sum and
+    exploitability is measured in fractions of the pot.
+    """
+
+    def __init__(
+        self,
+        board: Sequence[Card],
+        actions: Sequence[AbstractAction],
+        pot: float,
+        to_call: float = 0.0,
+        stack: Optional[float] = None,
+        hero_range: Optional[np.ndarray] = None,
+        opponent_range: Optional[np.ndarray] = None,
+        max_raises: int = 2,
+        num_runouts: int = 8,
+        rng: Optional[np.random.Generator] = None
+    ):
+        """Build the betting tree and precompute showdown outcomes.
+
+        Args:
+            board: Public cards
+            actions: Action menu used at every decision node
+            pot: Pot including the outstanding bet (to_call)
+            to_call: Amount hero must call at the root
+            stack: Effective stack behind (default: 10 pots)
+            hero_range: Hero weights over 1326 combos (default: uniform)
+            opponent_range: Opponent weights over 1326 combos (default: uniform)
+            max_raises: Bets/raises allowed in the street
+            num_runouts: Runouts sampled for depth-limit leaves before the river
+            rng: numpy Generator for runout sampling
+        """
+        scale = pot if pot > 0 else 1.0
+        self.scale = scale
+        self.pot = max(pot - to_call, 0.0) / scale
+        to_call = to_call / scale
+        stack = (stack / scale) if stack else 10.0
+        stack = max(stack, to_call)
+        self.to_call = to_call
+        self.stack = stack
+
+        self.board = [card_index(c) for c in board]
+        self.combos = np.flatnonzero(combos_avoiding(self.board))
+        self._position = {int(c): i for i, c in enumerate(self.combos)}
+        cards = COMBO_CARDS[self.combos]
+        n = len(self.combos)
+
+        # Canonical (suit-isomorphic) board and each combo's position in the canonical combo order
+        suit_map = canonical_suit_map(self.board)
+        relabel = np.arange(NUM_CARDS) // 4 * 4 + suit_map[np.arange(NUM_CARDS) % 4]
+        canonical_board = sorted(relabel[self.board].tolist())
+        self.canonical_board = "".join(RANKS[c // 4] + SUITS[c % 4] for c in canonical_board)
+        canonical_combos = np.flatnonzero(combos_avoiding(canonical_board))
+        mapped = combo_indices(relabel[cards[:, 0]], relabel[cards[:, 1]])
+        self._canonical_positions = np.searchsorted(canonical_combos, mapped)
+
+        # Combo -> card incidence for card-removal sums
+        self._card_onehot = card_onehot(self.combos, dtype=float)
+
+        self.ranges = [self._restrict(hero_range), self._restrict(opponent_range)]
+
+        self.nodes = build_betting_tree(actions, to_call, stack, self.pot, max_raises)
+        self._showdown = showdown_matrix(self.combos, self.board, num_runouts, rng)
+        self._fold_ids = [i for i, node in enumerate(self.nodes) if node.kind == FOLD]
+        self._showdown_ids = [i for i, node in enumerate(self.nodes) if node.kind == SHOWDOWN]
+        self._action_ids = [i for i, node in enumerate(self.nodes) if node.kind == ACTION]
+
+        self.regrets = {i: np.zeros((len(self.nodes[i].actions), n)) for i in self._action_ids}
+        self.strategy_sum = {i: np.zeros((len(self.nodes[i].actions), n)) for i in self._action_ids}
+        self.iterations = 0
+
+        # Root regularization toward the blueprint (set by set_blueprint)
+        self._root_prior: Optional[np.ndarray] = None
+        self._kl_weight = 0.0
+
+    def _restrict(self, weights: Optional[np.ndarray]) -> np.ndarray:
+        """Restrict 1326-combo weights to board-valid combos and normalize."""
+        if weights is None:
+            restricted = np.ones(len(self.combos))
+        else:
+            restricted = np.asarray(weights, dtype=float)[self.combos]
+        total = restricted.sum()
+        return restricted / total if total > 0 else np.full(len(self.combos), 1.0 / len(self.combos))
+
+    @property
+    def root_actions(self) -> List[AbstractAction]:
+        return list(self.nodes[0].actions)
+
+    def compatible_mass(self, reach: np.ndarray) -> np.ndarray:
+        """Reach of hands sharing no card with each combo (card removal), for one or more reach columns."""
+        return compatible_reach(reach, self._card_onehot)
+
+    def set_blueprint(self, blueprint_strategy: Dict[AbstractAction, float], kl_weight: float,
+                      clip_min: float = 1e-6, warm_start: Optional[Dict[AbstractAction, float]] = None):
+        """Warm-start root regrets and regularize hero's root strategy toward the blueprint.
+
+        Args:
+            blueprint_strategy: Blueprint root strategy (KL target, default warm start)
+            kl_weight: KL regularization weight
+            clip_min: Minimum blueprint probability before the KL term
+            warm_start: Root strategy to warm-start from instead of the blueprint
+                (e.g. a pre-solved strategy for a similar spot)
+        """
+        actions = self.root_actions
+        prior = np.array([max(blueprint_strategy.get(a, 0.0), clip_min) for a in actions])
+        self._root_prior = prior / prior.sum()
+        self._kl_weight = kl_weight
+
+        warm_start = warm_start if warm_start is not None else blueprint_strategy
+        if sum(warm_start.get(a, 0.0) for a in actions) > 0:
+            mass = self.compatible_mass(self.ranges[1])
+            for k, action in enumerate(actions):
+                self.regrets[0][k] += warm_start.get(action, 0.0) * WARM_START_STRENGTH * mass
+
+    def _current_strategy(self, node_id: int) -> np.ndarray:
+        """Regret matching+ strategy at a node (actions x hands)."""
+        positive = self.regrets[node_id]
+        total = positive.sum(axis=0)
+        uniform = 1.0 / positive.shape[0]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(total > 0, positive / total, uniform)
+
+    def _average_strategy(self, node_id: int) -> np.ndarray:
+        strategy_sum = self.strategy_sum[node_id]
+        total = strategy_sum.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(total > 0, strategy_sum / total, 1.0 / strategy_sum.shape[0])
+
+    def _terminal_values(self, reach: Dict[int, List[np.ndarray]], players: Sequence[int]) -> Dict[int, List]:
+        """Counterfactual values at all terminals for the given players, in one batch.
+
+        Args:
+            reach: {node_id: [reach_player0, reach_player1]}
+            players: Players whose values are needed
+
+        Returns:
+            {node_id: [values_player0 or None, values_player1 or None]}
+        """
+        values = {i: [None, None] for i in self._fold_ids + self._showdown_ids}
+
+        # Showdowns / depth-limit leaves: one matrix product for every (terminal, player)
+        columns, keys = [], []
+        for node_id in self._showdown_ids:
+            for p in players:
+                columns.append(reach[node_id][1 - p])
+                keys.append((node_id, p))
+        if columns:
+            results = self._showdown @ np.stack(columns, axis=1).astype(np.float32)
+            for k, (node_id, p) in enumerate(keys):
+                node = self.nodes[node_id]
+                # Both players index the same combo space, so M @ opponent_reach is each hand's net equity
+                values[node_id][p] = (self.pot / 2 + node.contrib[1 - p]) * results[:, k]
+
+        # Folds: winner takes half the pot plus the folder's contribution
+        columns, keys = [], []
+        for node_id in self._fold_ids:
+            for p in players:
+                columns.append(reach[node_id][1 - p])
+                keys.append((node_id, p))
+        if columns:
+            masses = self.compatible_mass(np.stack(columns, axis=1))
+            for k, (node_id, p) in enumerate(keys):
+                node = self.nodes[node_id]
+                stake = self.pot / 2 + node.contrib[node.folder]
+                values[node_id][p] = (-stake if node.folder == p else stake) * masses[:, k]
+        return values
+
+    def iterate(self, deadline: Optional[float] = None) -> Optional[float]:
+        """Run one simultaneous CFR+ iteration for both players.
+
+        Regret and average-strategy updates are committed only once the whole
+        iteration is done, so it can be abandoned part-way without leaving the
+        solver in a mixed state.
+
+        Args:
+            deadline: time.perf_counter() value; the iteration is abandoned if
+                it is passed between stages or nodes (optional)
+
+        Returns:
+            Hero's root KL(current strategy || blueprint), range-averaged, or
+            None if the deadline preempted the iteration (state unchanged)
+        """
+        def expired() -> bool:
+            return deadline is not None and time.perf_counter() >= deadline
+
+        iteration = self.iterations + 1
+        strategies = {i: self._current_strategy(i) for i in self._action_ids}
+
+        # Forward pass: reach vectors at every node
+        reach = {0: [self.ranges[0], self.ranges[1]]}
+        for node_id in self._action_ids:
+            node = self.nodes[node_id]
+            node_reach = reach[node_id]
+            for k, child in enumerate(node.children):
+                child_reach = list(node_reach)
+                child_reach[node.player] = node_reach[node.player] * strategies[node_id][k]
+                reach[child] = child_reach
+
+        if expired():
+            return None
+        values = self._terminal_values(reach, (0, 1))
+
+        # Backward pass: counterfactual values, regrets and average strategy
+        kl = 0.0
+        regrets, strategy_sums = {}, {}
+        for node_id in reversed(self._action_ids):
+            if expired():
+                return None
+            node = self.nodes[node_id]
+            p = node.player
+            strategy = strategies[node_id]
+            child_values = [values[child] for child in node.children]
+            action_values = np.stack([v[p] for v in child_values])
+
+            if node_id == 0 and self._root_prior is not None and self._kl_weight > 0:
+                # KL-to-blueprint penalty, in the units of the hands' counterfactual values
+                log_ratio = np.log(np.maximum(strategy, 1e-12) / self._root_prior[:, None])
+                mass = self.compatible_mass(self.ranges[1])
+                action_values = action_values - self._kl_weight * mass * log_ratio
+                kl = float(self.ranges[0] @ (strategy * log_ratio).sum(axis=0))
+
+            node_value = (strategy * action_values).sum(axis=0)
+            other_value = sum(v[1 - p] for v in child_values)
+            node_values = [None, None]
+            node_values[p] = node_value
+            node_values[1 - p] = other_value
+            values[node_id] = node_values
+
+            regrets[node_id] = np.maximum(self.regrets[node_id] + action_values - node_value, 0.0)
+            # Linear averaging (weight t), as in CFR+
+            strategy_sums[node_id] = iteration * reach[node_id][p] * strategy
+
+        self.iterations = iteration
+        self.regrets.update(regrets)
+        for node_id, increment in strategy_sums.items():
+            self.strategy_sum[node_id] += increment
+        return kl
+
+    def root_strategy(self, hero_cards: Sequence[Card], average: bool = True) -> Dict[AbstractAction, float]:
+        """Hero's root strategy for a specific hand."""
+        position = self._position.get(combo_index(hero_cards))
+        if position is None:
+            raise ValueError(f"Hero cards {[str(c) for c in hero_cards]} collide with the board")
+        strategy = self._average_strategy(0) if average else self._current_strategy(0)
+        return {action: float(strategy[k, position]) for k, action in enumerate(self.root_actions)}
+
+    def _best_response_value(self, responder: int) -> float:
+        """Value of the best response of one player against the other's average strategy."""
+        strategies = {i: self._average_strategy(i) for i in self._action_ids}
+        reach = {0: [self.ranges[0], self.ranges[1]]}
+        for node_id in self._action_ids:
+            node = self.nodes[node_id]
+            for k, child in enumerate(node.children):
+                child_reach = list(reach[node_id])
+                if node.player != responder:
+                    child_reach[node.player] = reach[node_id][node.player] * strategies[node_id][k]
+                reach[child] = child_reach
+
+        values = {i: v[responder] for i, v in self._terminal_values(reach, (responder,)).items()}
+        for node_id in reversed(self._action_ids):
+            node = self.nodes[node_id]
+            child_values = np.stack([values[child] for child in node.children])
+            values[node_id] = child_values.max(axis=0) if node.player == responder else child_values.sum(axis=0)
+
+        # Normalize by the probability that the two ranges are card-compatible
+        compatible = float(self.ranges[0] @ self.compatible_mass(self.ranges[1]))
+        return float(self.ranges[responder] @ values[0]) / compatible
+
+    def tree_signature(self) -> Tuple:
+        """Shape of the betting tree (node kinds, actors and action menus)."""
+        return tuple((node.kind, node.player, tuple(a.value for a in node.actions)) for node in self.nodes)
+
+    def export_state(self) -> Dict:
+        """Regrets and strategy sums of all decision nodes, in canonical combo order (float32)."""
+        def canonical(array: np.ndarray) -> np.ndarray:
+            out = np.empty(array.shape, dtype=np.float32)
+            out[:, self._canonical_positions] = array
+            return out
+
+        return {
+            'signature': self.tree_signature(),
+            'iterations': self.iterations,
+            'regrets': {i: canonical(self.regrets[i]) for i in self._action_ids},
+            'strategy_sum': {i: canonical(self.strategy_sum[i]) for i in self._action_ids},
+        }
+
+    def load_state(self, state: Dict) -> bool:
+        """Continue from an exported state of an equivalent subgame.
+
+        Returns:
+            False (and leaves the solver unchanged) if the betting trees differ
+        """
+        if state['signature'] != self.tree_signature():
+            return False
+        positions = self._canonical_positions
+        self.regrets = {i: state['regrets'][i][:, positions].astype(float) for i in self._action_ids}
+        self.strategy_sum = {i: state['strategy_sum'][i][:, positions].astype(float) for i in self._action_ids}
+        self.iterations = state['iterations']
+        return True
+
+    def exploitability(self) -> float:
+        """Exploitability of the average strategy profile in fractions of the pot."""
+        return (self._best_response_value(0) + self._best_response_value(1)) / 2
+
+    def reached_hero_node(self, hero_action: AbstractAction, pot: float, to_call: float,
+                          tolerance: float = 0.15) -> Optional[int]:
+        """Hero decision node reached after hero_action at the root and one opponent action.
+
+        The opponent action is identified by the pot and amount to call (in
+        chips) the hero now faces; None if no node matches within tolerance.
+        """
+        root = self.nodes[0]
+        if hero_action not in root.actions:
+            return None
+        opponent_node = self.nodes[root.children[root.actions.index(hero_action)]]
+        if opponent_node.kind != ACTION:
+            return None
+
+        best, best_distance = None, None
+        for child in opponent_node.children:
+            node = self.nodes[child]
+            if node.kind != ACTION:
+                continue
+            node_pot = (self.pot + node.contrib[0] + node.contrib[1]) * self.scale
+            node_to_call = (node.contrib[1] - node.contrib[0]) * self.scale
+            pot_diff = abs(pot - node_pot) / max(node_pot, 1e-9)
+            call_diff = abs(to_call / max(pot, 1e-9) - node_to_call / max(node_pot, 1e-9))
+            if pot_diff > tolerance or call_diff > tolerance:
+                continue
+            if best_distance is None or pot_diff + call_diff < best_distance:
+                best, best_distance = child, pot_diff + call_diff
+        return best
+
+    def _reach_at(self, node_id: int) -> List[np.ndarray]:
+        """Both players' range reach at a node under the average strategies."""
+        parents = {}
+        for parent in self._action_ids:
+            for k, child in enumerate(self.nodes[parent].children):
+                parents[child] = (parent, k)
+        reach = [self.ranges[0].copy(), self.ranges[1].copy()]
+        while node_id in parents:
+            node_id, k = parents[node_id]
+            player = self.nodes[node_id].player
+            reach[player] *= self._average_strategy(node_id)[k]
+        return reach
+
+    def reached_ranges(self, node_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Hero and opponent 1326-combo ranges at a node, updated by the actions leading to it."""
+        ranges = []
+        for reach in self._reach_at(node_id):
+            full = np.zeros(NUM_COMBOS)
+            full[self.combos] = reach
+            ranges.append(full)
+        return ranges[0], ranges[1]
+
+    def carry_over(self, previous: "RangeVsRangeCFR", node_id: int) -> int:
+        """Continue from the subtree of a previous solve rooted at the node now reached.
+
+        Nodes are matched by action sequence from the root; regrets and
+        strategy sums are rescaled to this solver's pot and normalized
+        ranges (both players' combos line up as the board is the same).
+
+        Returns:
+            Number of decision nodes carried over (0 if the boards differ)
+        """
+        if previous.board != self.board or previous.nodes[node_id].player != 0:
+            return 0
+        masses = [float(reach.sum()) for reach in previous._reach_at(node_id)]
+        if min(masses) <= 0:
+            return 0
+        ratio = previous.scale / self.scale
+
+        carried = 0
+        stack = [(0, node_id)]
+        while stack:
+            new_id, old_id = stack.pop()
+            new_node, old_node = self.nodes[new_id], previous.nodes[old_id]
+            if new_node.kind != ACTION or old_node.kind != ACTION or new_node.player != old_node.player:
+                continue
+            p = new_node.player
+            for k, action in enumerate(new_node.actions):
+                if action not in old_node.actions:
+                    continue
+                old_k = old_node.actions.index(action)
+                self.regrets[new_id][k] = previous.regrets[old_id][old_k] * ratio / masses[1 - p]
+                self.strategy_sum[new_id][k] = previous.strategy_sum[old_id][old_k] / masses[p]
+                stack.append((new_node.children[k], old_node.children[old_k]))
+            carried += 1
+        self.iterations = previous.iterations
+        return carried
+
+
+def build_subgame_solver(
+    subgame,
+    actions: Sequence[AbstractAction],
+    config,
+    rng: Optional[np.random.Generator] = None,
+    hero_range: Optional[np.ndarray] = None,
+    opponent_range: Optional[np.ndarray] = None
+) -> Optional[RangeVsRangeCFR]:
+    """Range solver for a SubgameTree, or None if the subgame lacks a usable state.
+
+    Needs the subgame's table state (pot, board, to_call) and hero cards that
+    do not collide with the board; other subgames keep the sampled solver.
+
+    Args:
+        subgame: Subgame with .state and .our_cards
+        actions: Action menu at the root
+        config: SearchConfig (range_solver_* fields)
+        rng: numpy Generator for runout sampling
+        hero_range: Hero weights over 1326 combos (default: uniform)
+        opponent_range: Opponent weights over 1326 combos (default: uniform)
+    """
+    state = getattr(subgame, 'state', None)
+    our_cards = getattr(subgame, 'our_cards', None)
+    if state is None or not our_cards or len(our_cards) != 2 or len(state.board) > 5:
+        return None
+
+    board = [card_index(c) for c in state.board]
+    hero = [card_index(c) for c in our_cards]
+    if len(set(board + hero)) != len(board) + 2:
+        return None
+
+    stack = state.effective_stack if state.effective_stack > 0 else None
+    return RangeVsRangeCFR(
+        board=state.board,
+        actions=actions,
+        pot=state.pot,
+        to_call=state.to_call,
+        stack=stack,
+        hero_range=hero_range,
+        opponent_range=opponent_range,
+        max_raises=config.range_solver_max_raises,
+        num_runouts=config.range_solver_leaf_runouts,
+        rng=rng
+    )
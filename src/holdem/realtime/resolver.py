@@ -1,21 +1,53 @@
 """Subgame resolver with KL regularization."""
 
 import numpy as np
-from typing import Dict, List, Optional, TYPE_CHECKING
+import multiprocessing as mp
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import replace
+from typing import Dict, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
 from holdem.types import SearchConfig, Card, Street, TableState
 from holdem.abstraction.actions import AbstractAction
 from holdem.mccfr.policy_store import PolicyStore
 from holdem.mccfr.regrets import RegretTracker
+from holdem.realtime.anytime import SolveHandle, start_anytime_solve
 from holdem.realtime.subgame import SubgameTree
+from holdem.realtime.range_solver import RangeVsRangeCFR, build_subgame_solver
 from holdem.utils.rng import get_rng
 from holdem.utils.logging import get_logger
 from holdem.utils.deck import sample_public_cards
+from holdem.utils.affinity import limit_blas_threads
+from holdem.utils.quantile_sketch import QuantileSketch
 
 if TYPE_CHECKING:
     from holdem.rt_resolver.leaf_evaluator import LeafEvaluator
 
 logger = get_logger("realtime.resolver")
 
+# Resolver of a sampling pool worker process (set by _init_sampling_worker)
+_worker_resolver: Optional['SubgameResolver'] = None
+
+
+def _init_sampling_worker(config: SearchConfig, blueprint: PolicyStore):
+    """Pool initializer: one in-process resolver per worker, blueprint received once."""
+    global _worker_resolver
+    limit_blas_threads(config.worker_blas_threads)
+    _worker_resolver = SubgameResolver(replace(config, sampling_num_workers=1, solution_cache_path=None), blueprint)
+
+
+def _solve_sampled_board(
+    subgame: SubgameTree,
+    infoset: str,
+    time_budget_ms: Optional[int],
+    street: Street,
+    is_oop: bool,
+    deadline: Optional[float]
+) -> Optional[Dict[AbstractAction, float]]:
+    """Solve one sampled board in a pool worker (None if the deadline passed while it was queued)."""
+    if deadline is not None and time.time() >= deadline:
+        return None
+    return _worker_resolver.solve(subgame, infoset, time_budget_ms, street, is_oop)
+
 
 class SubgameResolver:
     """Resolves subgames with KL regularization toward blueprint."""
@@ -31,13 +63,27 @@ class SubgameResolver:
         self.leaf_evaluator = leaf_evaluator
         self.regret_tracker = RegretTracker()
         self.rng = get_rng()
+        self.last_solve_stats: Dict[str, float] = {}
+        self.last_range_solver: Optional[RangeVsRangeCFR] = None  # Kept for within-hand carry-over
+        self.last_sampling_stats: Dict[str, float] = {}
+        
+        # Worker processes for sampled-board solves (sampling_num_workers > 1, see start_pool)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        
+        # Range solver solutions keyed by public state, reused across hands
+        self.solution_cache = None
+        if config.use_range_solver and config.solution_cache_enabled:
+            from holdem.realtime.solution_cache import SubgameSolutionCache
+            self.solution_cache = SubgameSolutionCache(
+                max_entries=config.solution_cache_max_entries,
+                max_mb=config.solution_cache_max_mb,
+                path=config.solution_cache_path
+            )
         
-        # KL divergence statistics tracking
+        # KL divergence statistics tracking (constant-memory sketches of every iteration's KL)
         self.kl_history = {
-            'preflop': {'IP': [], 'OOP': []},
-            'flop': {'IP': [], 'OOP': []},
-            'turn': {'IP': [], 'OOP': []},
-            'river': {'IP': [], 'OOP': []}
+            street: {'IP': QuantileSketch(), 'OOP': QuantileSketch()}
+            for street in ('preflop', 'flop', 'turn', 'river')
         }
     
     def get_leaf_strategy(
@@ -91,7 +137,12 @@ class SubgameResolver:
         
         return biased_strategy
     
-    def warm_start_from_blueprint(self, infoset: str, actions: List[AbstractAction]):
+    def warm_start_from_blueprint(
+        self,
+        infoset: str,
+        actions: List[AbstractAction],
+        strategy: Optional[Dict[AbstractAction, float]] = None
+    ):
         """Warm-start regrets from blueprint strategy.
         
         This initializes the regret tracker with values that bias the search
@@ -100,8 +151,9 @@ class SubgameResolver:
         Args:
             infoset: Information set to warm-start
             actions: Available actions at this infoset
+            strategy: Strategy to warm-start from instead of the blueprint (optional)
         """
-        blueprint_strategy = self.blueprint.get_strategy(infoset)
+        blueprint_strategy = strategy if strategy is not None else self.blueprint.get_strategy(infoset)
         
         # Initialize regrets to favor blueprint actions
         # Higher blueprint probability -> higher initial regret
@@ -191,6 +243,12 @@ class SubgameResolver:
         to reduce variance. The subgame is solved on K sampled boards and
         the resulting strategies are averaged.
         
+        With sampling_num_workers > 1 the boards are solved concurrently by a
+        persistent worker pool. All boards share the decision's deadline:
+        strategies are merged as they finish, boards that miss the deadline
+        are dropped, and sampling stops early once a new board moves the
+        average by less than sampling_early_stop_tol.
+        
         Args:
             subgame: Subgame tree to solve
             infoset: Information set to solve for
@@ -204,6 +262,8 @@ class SubgameResolver:
         """
         import time as time_module
         start_time = time_module.time()
+        if time_budget_ms is None:
+            time_budget_ms = self.config.time_budget_ms
         
         # Get effective number of samples from config
         num_samples = self.config.get_effective_num_samples()
@@ -269,40 +329,50 @@ class SubgameResolver:
         sampling_time_ms = (time_module.time() - sampling_start) * 1000
         logger.debug(f"Board sampling completed in {sampling_time_ms:.2f}ms")
         
-        # Divide time budget across samples
-        time_per_sample = time_budget_ms // num_samples if time_budget_ms else None
+        # All boards share one deadline; boards solved side by side share the budget
+        workers = max(1, min(self.config.sampling_num_workers, num_samples))
+        time_per_sample = time_budget_ms * workers // num_samples if time_budget_ms else None
+        deadline = start_time + time_budget_ms / 1000.0 if time_budget_ms else None
+        subgames = [self._create_subgame_with_board(subgame, board) for board in sampled_boards]
         
-        # Solve on each sampled board and collect strategies
+        # Merge strategies as boards finish; stop once the average has stabilized
         strategies = []
         variances = []
-        
-        for i, board in enumerate(sampled_boards):
-            # Create subgame with sampled board
-            sampled_subgame = self._create_subgame_with_board(subgame, board)
-            
-            # Solve on this board sample
-            strategy = self.solve(
-                sampled_subgame, 
-                infoset, 
-                time_per_sample, 
-                street, 
-                is_oop
-            )
+        averaged_strategy: Dict[AbstractAction, float] = {}
+        stopped_early = False
+        board_solves = self._iter_board_solves(subgames, infoset, time_per_sample, street, is_oop, deadline)
+        for strategy in board_solves:
+            previous = averaged_strategy
             strategies.append(strategy)
+            averaged_strategy = self._average_strategies(strategies)
             
             # Track variance in strategies for logging
-            if strategies:
-                avg_so_far = self._average_strategies(strategies)
-                variance = self._strategy_variance(strategy, avg_so_far)
-                variances.append(variance)
+            variances.append(self._strategy_variance(strategy, averaged_strategy))
+            
+            if (self.config.sampling_early_stop_tol > 0
+                    and len(strategies) >= max(2, self.config.sampling_min_boards)
+                    and self._strategy_variance(averaged_strategy, previous) < self.config.sampling_early_stop_tol):
+                stopped_early = True
+                break
+        board_solves.close()
         
-        # Average strategies across all samples
-        averaged_strategy = self._average_strategies(strategies)
+        if not strategies:
+            logger.warning("No sampled board finished before the deadline, solving the current board")
+            return self.solve(subgame, infoset, time_budget_ms, street, is_oop)
         
         # Calculate total time spent
+        num_solved = len(strategies)
         total_time_ms = (time_module.time() - start_time) * 1000
         solve_time_ms = total_time_ms - sampling_time_ms
-        avg_solve_time_per_sample = solve_time_ms / num_samples if num_samples > 0 else 0
+        avg_solve_time_per_sample = solve_time_ms / num_solved
+        self.last_sampling_stats = {
+            'boards_sampled': num_samples,
+            'boards_solved': num_solved,
+            'boards_dropped': 0 if stopped_early else num_samples - num_solved,
+            'stopped_early': stopped_early,
+            'workers': workers,
+            'elapsed_ms': total_time_ms,
+        }
         
         # Log comprehensive sampling statistics
         if variances:
@@ -310,19 +380,91 @@ class SubgameResolver:
             max_variance = np.max(variances)
             min_variance = np.min(variances)
             logger.info(
-                f"Public card sampling complete: {num_samples} boards sampled | "
+                f"Public card sampling complete: {num_samples} boards sampled, {num_solved} solved "
+                f"({workers} worker(s){', stopped early' if stopped_early else ''}) | "
                 f"total_time={total_time_ms:.1f}ms (sampling={sampling_time_ms:.1f}ms, "
                 f"solving={solve_time_ms:.1f}ms, avg_per_sample={avg_solve_time_per_sample:.1f}ms) | "
                 f"variance: avg={avg_variance:.4f}, min={min_variance:.4f}, max={max_variance:.4f}"
             )
-        else:
-            logger.info(
-                f"Public card sampling complete: {num_samples} boards sampled | "
-                f"total_time={total_time_ms:.1f}ms"
-            )
         
         return averaged_strategy
     
+    def _iter_board_solves(
+        self,
+        subgames: List[SubgameTree],
+        infoset: str,
+        time_per_sample: Optional[int],
+        street: Street,
+        is_oop: bool,
+        deadline: Optional[float]
+    ) -> Iterator[Dict[AbstractAction, float]]:
+        """Yield strategies of the sampled boards as they finish.
+        
+        Boards not finished by the deadline are dropped (queued ones are
+        cancelled when the generator is closed), but the first board is always
+        waited for so there is something to return.
+        """
+        if self.config.sampling_num_workers <= 1:
+            for i, board_subgame in enumerate(subgames):
+                if i > 0 and deadline is not None and time.time() >= deadline:
+                    return
+                yield self.solve(board_subgame, infoset, time_per_sample, street, is_oop)
+            return
+        
+        self.start_pool()
+        pending: Set[Future] = {
+            self._pool.submit(_solve_sampled_board, board_subgame, infoset, time_per_sample, street, is_oop, deadline)
+            for board_subgame in subgames
+        }
+        finished = 0
+        try:
+            while pending:
+                timeout = max(0.0, deadline - time.time()) if deadline is not None and finished else None
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    return  # Deadline passed
+                for future in done:
+                    try:
+                        strategy = future.result()
+                    except Exception as e:
+                        logger.warning(f"Sampled board solve failed: {e}")
+                        continue
+                    if strategy is not None:
+                        finished += 1
+                        yield strategy
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    @property
+    def pool_running(self) -> bool:
+        return self._pool is not None
+    
+    def start_pool(self):
+        """Start the persistent worker pool for sampled-board solves (blueprint sent to each worker once)."""
+        if self.pool_running or self.config.sampling_num_workers <= 1:
+            return
+        
+        start_time = time.perf_counter()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.config.sampling_num_workers,
+            mp_context=mp.get_context('spawn'),
+            initializer=_init_sampling_worker,
+            initargs=(self.config, self.blueprint)
+        )
+        # Workers start on demand: submit one no-op each so the first decision does not pay for startup
+        wait([self._pool.submit(time.time) for _ in range(self.config.sampling_num_workers)])
+        logger.info(f"Started board sampling pool with {self.config.sampling_num_workers} worker(s) "
+                    f"in {time.perf_counter() - start_time:.2f}s")
+    
+    def shutdown_pool(self):
+        """Stop the board sampling worker pool."""
+        if not self.pool_running:
+            return
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._pool = None
+        logger.info("Board sampling pool stopped")
+    
     def _create_subgame_with_board(self, original_subgame: SubgameTree, board: List[Card]) -> SubgameTree:
         """Create a new subgame with a different board.
         
@@ -402,7 +544,11 @@ class SubgameResolver:
         infoset: str,
         time_budget_ms: int = None,
         street: Street = None,
-        is_oop: bool = False
+        is_oop: bool = False,
+        warm_start_strategy: Optional[Dict[AbstractAction, float]] = None,
+        min_iterations: Optional[int] = None,
+        carry_over: Optional[Tuple[RangeVsRangeCFR, int]] = None,
+        progress: Optional[SolveHandle] = None
     ) -> Dict[AbstractAction, float]:
         """Solve subgame and return strategy.
         
@@ -415,12 +561,24 @@ class SubgameResolver:
             time_budget_ms: Time budget in milliseconds (overrides config)
             street: Current game street (for KL weight calculation)
             is_oop: Whether player is out of position (for KL weight calculation)
+            warm_start_strategy: Root strategy to warm-start from instead of the
+                blueprint, e.g. a pre-solved strategy being refined (optional)
+            min_iterations: Iterations to run (overrides config)
+            carry_over: (previous range solver, node reached in it) from an
+                earlier decision on the same street of the hand; the solve is
+                re-rooted there, with ranges narrowed by the actions taken and
+                the previous regrets retained (optional)
+            progress: Handle to publish the average strategy to every
+                anytime_publish_interval iterations; the solve stops early
+                when it is cancelled (see solve_anytime)
             
         Returns:
             Strategy (probability distribution over actions)
         """
         if time_budget_ms is None:
             time_budget_ms = self.config.time_budget_ms
+        if min_iterations is None:
+            min_iterations = self.config.min_iterations
         
         # Determine street from subgame if not provided
         if street is None:
@@ -432,48 +590,144 @@ class SubgameResolver:
         # Get actions for this infoset
         actions = subgame.get_actions(infoset)
         
-        # Warm-start from blueprint strategy
-        self.warm_start_from_blueprint(infoset, actions)
-        
         # Get blueprint strategy for regularization
         blueprint_strategy = self.blueprint.get_strategy(infoset)
         
-        # Run MCCFR with time budget
-        import time
         start_time = time.time()
+        # Hard wall-clock guard: preempts the solve mid-iteration (range solver) at budget x factor
+        hard_deadline = None
+        if self.config.hard_time_limit_factor > 0:
+            hard_deadline = time.perf_counter() + time_budget_ms * self.config.hard_time_limit_factor / 1000.0
+        
+        # Range-vs-range solver when the subgame has a table state and hero cards
+        range_solver = None
+        ranges = carry_over[0].reached_ranges(carry_over[1]) if carry_over is not None else (None, None)
+        if self.config.use_range_solver:
+            range_solver = build_subgame_solver(subgame, actions, self.config, self.rng.rng, *ranges)
+        
+        # Warm-start from blueprint strategy, or continue from the previous decision's solve
+        carried = 0
+        if range_solver is not None:
+            if carry_over is not None:
+                carried = range_solver.carry_over(*carry_over)
+            range_solver.set_blueprint(
+                blueprint_strategy, kl_weight, self.config.blueprint_clip_min,
+                warm_start={} if carried else warm_start_strategy
+            )
+        else:
+            self.warm_start_from_blueprint(infoset, actions, strategy=warm_start_strategy)
+        
+        # Continue from a cached solution of the same public state; it may already be converged
+        # (cached solutions assume full ranges, so not for a re-rooted solve)
+        cache_key, cache_hit = None, False
+        if range_solver is not None and self.solution_cache is not None and carry_over is None:
+            from holdem.realtime.solution_cache import public_state_key
+            cache_key = public_state_key(range_solver, infoset)
+            cached = self.solution_cache.get(cache_key)
+            cache_hit = cached is not None and range_solver.load_state(cached)
+        
+        def current_strategy(average: bool = True) -> Dict[AbstractAction, float]:
+            if range_solver is not None:
+                hero_strategy = range_solver.root_strategy(subgame.our_cards, average=average)
+                return {action: hero_strategy.get(action, 0.0) for action in actions}
+            if average:
+                return self.regret_tracker.get_average_strategy(infoset, actions)
+            return self.regret_tracker.get_strategy(infoset, actions)
+        
+        # Anytime solve: the warm start is available before the first iteration
+        publish_interval = max(1, self.config.anytime_publish_interval)
+        if progress is not None:
+            progress.publish(current_strategy(average=False), 0)
+        
+        # Run CFR with time budget
         iterations = 0
         kl_values = []  # Track KL values for statistics
-        
-        while iterations < self.config.min_iterations:
-            kl_div = self._cfr_iteration(subgame, infoset, blueprint_strategy, kl_weight)
+        elapsed_ms = 0.0
+        last_exploitability = None
+        preempted = False
+        cancelled = False
+        
+        while iterations < min_iterations:
+            if progress is not None and progress.cancelled:
+                cancelled = True
+                break
+            if cache_hit and iterations % max(1, self.config.solution_cache_check_interval) == 0:
+                # Converged: exploitable by less than the target, or no longer improving (KL-regularized plateau)
+                exploitability = range_solver.exploitability()
+                if exploitability <= self.config.solution_cache_target_exploitability or (
+                    last_exploitability is not None
+                    and last_exploitability - exploitability < self.config.solution_cache_min_improvement
+                ):
+                    break
+                last_exploitability = exploitability
+            if range_solver is not None:
+                kl_div = range_solver.iterate(deadline=hard_deadline)
+            elif hard_deadline is None or time.perf_counter() < hard_deadline:
+                kl_div = self._cfr_iteration(subgame, infoset, blueprint_strategy, kl_weight)
+            else:
+                kl_div = None
+            if kl_div is None:
+                preempted = True
+                logger.warning(f"Solve preempted by the hard time limit after {iterations} iterations")
+                break
             kl_values.append(kl_div)
             iterations += 1
+            if progress is not None and iterations % publish_interval == 0:
+                progress.publish(current_strategy(), iterations)
             
-            # Check time budget
+            # Check time budget. Binding for the range solver (an iteration costs ~10ms, so
+            # min_iterations would overrun it many times) and for adaptive budgets (sized to
+            # reach min_iterations); the cheap sampled solver always completes min_iterations
             elapsed_ms = (time.time() - start_time) * 1000
-            if elapsed_ms > time_budget_ms and iterations >= self.config.min_iterations:
+            if elapsed_ms > time_budget_ms and (
+                range_solver is not None or iterations >= min_iterations or self.config.adaptive_time_budget
+            ):
                 break
         
-        # Get solution strategy
-        strategy = self.regret_tracker.get_average_strategy(infoset, actions)
+        # Get solution strategy (the warm-started current strategy if no iteration completed)
+        if range_solver is not None:
+            strategy = current_strategy(average=range_solver.iterations > 0)
+        else:
+            strategy = current_strategy()
+        
+        if cache_key is not None:
+            if cache_hit and not (preempted or cancelled):
+                self.solution_cache.record_iterations_saved(min_iterations - iterations)
+            self.solution_cache.put(cache_key, range_solver.export_state())
+        
+        elapsed_ms = (time.time() - start_time) * 1000
+        self.last_solve_stats = {
+            'solver': 'range' if range_solver is not None else 'sampled',
+            'iterations': iterations,
+            'elapsed_ms': elapsed_ms,
+            'iterations_per_second': iterations / max(elapsed_ms / 1000.0, 1e-9),
+            'cache_hit': cache_hit,
+            'carried_nodes': carried,
+            'budget_ms': float(time_budget_ms),
+            'preempted': preempted,
+            'cancelled': cancelled,
+            'final_kl': float(kl_values[-1]) if kl_values else None,
+        }
+        self.last_range_solver = range_solver
         
         # Track and log KL divergence statistics
         if self.config.track_kl_stats and kl_values:
-            # Store KL values for later analysis
+            # Calculate statistics, and store them for later analysis
             street_name = street.name.lower()
             position = 'OOP' if is_oop else 'IP'
-            self.kl_history[street_name][position].extend(kl_values)
+            kl_sketch = QuantileSketch()
+            kl_sketch.extend(kl_values)
+            self.kl_history[street_name][position].merge(kl_sketch)
             
-            # Calculate statistics
-            kl_array = np.array(kl_values)
-            avg_kl = np.mean(kl_array)
-            p50_kl = np.percentile(kl_array, 50)
-            p90_kl = np.percentile(kl_array, 90)
-            p99_kl = np.percentile(kl_array, 99)
-            pct_high_kl = np.mean(kl_array > self.config.kl_high_threshold) * 100
+            avg_kl = kl_sketch.mean
+            p50_kl = kl_sketch.quantile(0.50)
+            p90_kl = kl_sketch.quantile(0.90)
+            p99_kl = kl_sketch.quantile(0.99)
+            pct_high_kl = kl_sketch.fraction_above(self.config.kl_high_threshold) * 100
             
             logger.info(
-                f"Resolved subgame in {iterations} iterations ({elapsed_ms:.1f}ms) | "
+                f"Resolved subgame in {iterations} iterations ({elapsed_ms:.1f}ms, "
+                f"{self.last_solve_stats['iterations_per_second']:.0f} it/s, {self.last_solve_stats['solver']}) | "
                 f"Street: {street_name} | Position: {position} | "
                 f"KL weight: {kl_weight:.2f} | "
                 f"KL stats - avg: {avg_kl:.4f}, p50: {p50_kl:.4f}, p90: {p90_kl:.4f}, p99: {p99_kl:.4f} | "
@@ -485,6 +739,35 @@ class SubgameResolver:
         
         return strategy
     
+    def solve_anytime(self, subgame: SubgameTree, infoset: str, **solve_kwargs) -> SolveHandle:
+        """Start solve() in a background thread and return a handle on it.
+        
+        The handle publishes the current average strategy, iteration count and
+        a convergence estimate while the solve runs; act on handle.result() and
+        cancel() the solve when the decision no longer needs it. The resolver
+        must not start another solve until this one is done (handle.wait()).
+        
+        Args:
+            subgame: Subgame tree to solve
+            infoset: Information set to solve for
+            **solve_kwargs: Other solve() arguments
+        """
+        return start_anytime_solve(
+            lambda handle: self.solve(subgame, infoset, progress=handle, **solve_kwargs),
+            name="subgame-solve"
+        )
+    
+    def save_solution_cache(self):
+        """Persist the subgame solution cache if a path is configured."""
+        if self.solution_cache is not None and self.solution_cache.path is not None:
+            self.solution_cache.save()
+    
+    def solution_cache_stats(self) -> Dict[str, float]:
+        """Solution cache hit rate, iterations saved and memory use (empty if disabled)."""
+        if self.solution_cache is not None:
+            return self.solution_cache.stats()
+        return {}
+    
     def _cfr_iteration(
         self,
         subgame: SubgameTree,
@@ -593,18 +876,17 @@ class SubgameResolver:
         
         for street, positions in self.kl_history.items():
             stats[street] = {}
-            for position, kl_values in positions.items():
-                if not kl_values:
+            for position, sketch in positions.items():
+                if not sketch.count:
                     continue
                 
-                kl_array = np.array(kl_values)
                 stats[street][position] = {
-                    'avg': float(np.mean(kl_array)),
-                    'p50': float(np.percentile(kl_array, 50)),
-                    'p90': float(np.percentile(kl_array, 90)),
-                    'p99': float(np.percentile(kl_array, 99)),
-                    'pct_high': float(np.mean(kl_array > self.config.kl_high_threshold) * 100),
-                    'count': len(kl_values)
+                    'avg': sketch.mean,
+                    'p50': sketch.quantile(0.50),
+                    'p90': sketch.quantile(0.90),
+                    'p99': sketch.quantile(0.99),
+                    'pct_high': sketch.fraction_above(self.config.kl_high_threshold) * 100,
+                    'count': sketch.count
                 }
         
         return stats
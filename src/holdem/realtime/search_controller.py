@@ -1,7 +1,7 @@
 """Search controller for real-time decision making."""
 
 import time
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Callable, Dict, Optional, Tuple, TYPE_CHECKING
 from holdem.types import TableState, Card, Street, SearchConfig
 from holdem.abstraction.actions import AbstractAction
 from holdem.abstraction.state_encode import StateEncoder
@@ -10,13 +10,27 @@ from holdem.mccfr.policy_store import PolicyStore
 from holdem.realtime.belief import BeliefState
 from holdem.realtime.subgame import SubgameBuilder
 from holdem.realtime.resolver import SubgameResolver
+from holdem.realtime.range_solver import RangeVsRangeCFR
+from holdem.realtime.time_budget import TimeBudgetPolicy
+from holdem.utils.card_removal import combo_index
 from holdem.utils.logging import get_logger
+from holdem.utils.metrics_registry import get_metrics_registry
 
 if TYPE_CHECKING:
     from holdem.rt_resolver.leaf_evaluator import LeafEvaluator
 
 logger = get_logger("realtime.search_controller")
 
+# (street, board, hero cards, action history)
+DecisionKey = Tuple[str, str, str, Tuple[str, ...]]
+
+_DECISION_TIME_MS = get_metrics_registry().histogram(
+    "holdem_decision_time_ms", "Real-time decision latency (ms)", ["street"]
+)
+_DECISIONS = get_metrics_registry().counter(
+    "holdem_decisions", "Real-time decisions by outcome (solved / blueprint fallback)", ["street", "outcome"]
+)
+
 
 class SearchController:
     """Orchestrates real-time search and decision making."""
@@ -33,7 +47,9 @@ class SearchController:
         self.blueprint = blueprint
         self.leaf_evaluator = leaf_evaluator
         self.encoder = StateEncoder(bucketing)
-        self.belief = BeliefState()
+        self.belief = BeliefState(bucketing=bucketing, blueprint=blueprint)
+        # Hero cards of the hand the belief state was initialized for
+        self._hand_cards: Optional[Tuple[str, ...]] = None
         self.subgame_builder = SubgameBuilder(depth_limit=config.depth_limit)
         
         # Choose resolver based on num_workers
@@ -41,18 +57,118 @@ class SearchController:
             from holdem.realtime.parallel_resolver import ParallelSubgameResolver
             self.resolver = ParallelSubgameResolver(config, blueprint, leaf_evaluator)
             logger.info(f"Using parallel resolver with {config.num_workers} worker(s)")
+            if config.persistent_worker_pool:
+                # Pay process startup once instead of on every decision
+                self.resolver.start_pool()
         else:
             self.resolver = SubgameResolver(config, blueprint, leaf_evaluator)
+            if config.persistent_worker_pool:
+                # Sampled-board solves fan out to workers (no-op unless sampling_num_workers > 1)
+                self.resolver.start_pool()
+        
+        # Background pre-solving of the next hero decisions while opponents act
+        self.speculative = None
+        if config.speculative_presolve:
+            from holdem.realtime.speculative import SpeculativeSolver
+            self.speculative = SpeculativeSolver(
+                config, blueprint, self.encoder, self.subgame_builder,
+                solution_cache=getattr(self.resolver, 'solution_cache', None)
+            )
+        
+        # Per-decision budgets from street, pot, subgame size and the session time bank
+        self.time_budget = TimeBudgetPolicy(config) if config.adaptive_time_budget else None
+        
+        # Previous decision of the hand: (key, hero action, range solver) for carry-over
+        self._last_decision: Optional[Tuple[DecisionKey, AbstractAction, RangeVsRangeCFR]] = None
+        
+        # Export the stats dicts at scrape time (latest controller wins)
+        registry = get_metrics_registry()
+        registry.register_collector("holdem_search_latency", self.latency_stats)
+        registry.register_collector("holdem_search_speculative", self.speculative_stats)
+        registry.register_collector("holdem_search_solution_cache", self.solution_cache_stats)
+        registry.register_collector("holdem_search_time_budget", self.time_budget_stats)
+        if leaf_evaluator is not None:
+            registry.register_collector("holdem_leaf_cache", leaf_evaluator.get_cache_stats)
+            registry.register_collector("holdem_cfv_net", leaf_evaluator.get_cfv_net_stats)
+    
+    def close(self):
+        """Release resolver resources (persistent worker pool, speculative pre-solver, solution cache)."""
+        if self.speculative is not None:
+            self.speculative.cancel()
+            self.speculative.wait()
+        if hasattr(self.resolver, 'save_solution_cache'):
+            self.resolver.save_solution_cache()
+        if hasattr(self.resolver, 'shutdown_pool'):
+            self.resolver.shutdown_pool()
+    
+    def presolve(
+        self,
+        state: TableState,
+        our_cards: list,
+        history: list,
+        hero_action: Optional[AbstractAction] = None
+    ):
+        """Pre-solve the hero's likely next decisions while opponents act (no-op unless enabled).
+        
+        Args:
+            state: Public state (before hero_action, if given)
+            our_cards: Hero hole cards
+            history: Action history for the next get_action call
+            hero_action: Action the hero just took, if the opponents now respond to it
+        """
+        if self.speculative is not None:
+            self.speculative.presolve(state, our_cards, history, hero_action)
+    
+    def speculative_stats(self) -> Dict[str, float]:
+        """Speculative hit rate and latency saved (empty if disabled)."""
+        if self.speculative is not None:
+            return self.speculative.stats()
+        return {}
+    
+    def solution_cache_stats(self) -> Dict[str, float]:
+        """Subgame solution cache hit rate, iterations saved and memory use (empty if disabled)."""
+        if hasattr(self.resolver, 'solution_cache_stats'):
+            return self.resolver.solution_cache_stats()
+        return {}
+    
+    def latency_stats(self) -> Dict[str, float]:
+        """Decision latency percentiles of the parallel resolver (empty if not parallel)."""
+        if hasattr(self.resolver, 'latency_stats'):
+            return self.resolver.latency_stats()
+        return {}
+    
+    def time_budget_stats(self) -> Dict[str, float]:
+        """Budget vs time used and time bank of the adaptive budget policy (empty if disabled)."""
+        if self.time_budget is not None:
+            return self.time_budget.stats()
+        return {}
     
     def get_action(
         self,
         state: TableState,
         our_cards: list,
-        history: list
+        history: list,
+        should_stop: Optional[Callable[[], bool]] = None
     ) -> AbstractAction:
-        """Get action for current state."""
+        """Get action for current state.
+        
+        Args:
+            state: Current table state
+            our_cards: Hero hole cards
+            history: Action history of the hand
+            should_stop: With anytime_solve, polled during the solve; the best
+                strategy so far is used as soon as it returns true (e.g. the
+                table state changed)
+        """
         start_time = time.time()
         
+        # Hero's turn: the background pre-solve for this decision is over
+        if self.speculative is not None:
+            self.speculative.cancel()
+        
+        if self._hand_key(our_cards) != self._hand_cards:
+            self.start_hand(our_cards)
+        
         # Encode current infoset with versioned format
         # Convert action history to abbreviated format
         action_sequence = self.encoder.encode_action_history(history)
@@ -69,12 +185,42 @@ class SearchController:
             # Build subgame
             subgame = self.subgame_builder.build_subgame(state, our_cards, history)
             
-            # Solve subgame
-            strategy = self.resolver.solve(
-                subgame,
-                infoset,
-                time_budget_ms=self.config.time_budget_ms
-            )
+            # Continue the previous decision's solve if this street's betting led here;
+            # otherwise refine a pre-solved spot if one matches, otherwise solve cold
+            strategy = None
+            carry_over = self._find_carry_over(state, our_cards, history)
+            if self.speculative is not None and carry_over is None:
+                strategy = self.speculative.solve_from_cache(state, our_cards, history, subgame, infoset)
+            solver = None
+            if strategy is None:
+                solve_kwargs = {'carry_over': carry_over} if carry_over is not None else {}
+                timing = None
+                time_budget_ms = self.config.time_budget_ms
+                if self.time_budget is not None:
+                    stack = state.effective_stack if state.effective_stack > 0 else state.pot * 2.0
+                    timing = self.time_budget.allocate(
+                        state.street, state.pot, stack, len(subgame.get_actions(infoset))
+                    )
+                    time_budget_ms = timing.budget_ms
+                if self.config.anytime_solve:
+                    strategy = self._solve_anytime(subgame, infoset, time_budget_ms, should_stop, solve_kwargs)
+                else:
+                    strategy = self.resolver.solve(
+                        subgame,
+                        infoset,
+                        time_budget_ms=time_budget_ms,
+                        **solve_kwargs
+                    )
+                solver = getattr(self.resolver, 'last_range_solver', None)
+                if timing is not None:
+                    # Exploitability costs a full tree pass: only measured when decisions are logged
+                    exploitability = None
+                    if solver is not None and self.config.time_budget_log_path:
+                        exploitability = solver.exploitability()
+                    self.time_budget.record(
+                        timing, (time.time() - start_time) * 1000,
+                        getattr(self.resolver, 'last_solve_stats', None), exploitability
+                    )
             
             # Sample action
             from holdem.utils.rng import get_rng
@@ -84,13 +230,21 @@ class SearchController:
             
             action = rng.choice(actions, p=probs)
             
+            self._last_decision = None
+            if solver is not None and self.config.carry_over_solution:
+                self._last_decision = (self._decision_key(state, our_cards, history), action, solver)
+            
             elapsed_ms = (time.time() - start_time) * 1000
             logger.info(f"Real-time search completed in {elapsed_ms:.1f}ms")
+            _DECISION_TIME_MS.labels(street=state.street.name.lower()).observe(elapsed_ms)
+            _DECISIONS.labels(street=state.street.name.lower(), outcome="solved").inc()
             
             return action
             
         except Exception as e:
             logger.warning(f"Real-time search failed: {e}, falling back to blueprint")
+            self._last_decision = None
+            _DECISIONS.labels(street=state.street.name.lower(), outcome="fallback").inc()
             
             # Fallback to blueprint
             if self.config.fallback_to_blueprint:
@@ -98,12 +252,128 @@ class SearchController:
             else:
                 raise
     
+    def _solve_anytime(
+        self,
+        subgame,
+        infoset: str,
+        time_budget_ms: float,
+        should_stop: Optional[Callable[[], bool]],
+        solve_kwargs: Dict
+    ) -> Dict[AbstractAction, float]:
+        """Solve in the background and stop at the earliest of convergence, the budget or should_stop."""
+        deadline = time.perf_counter() + time_budget_ms / 1000.0
+        handle = self.resolver.solve_anytime(subgame, infoset, time_budget_ms=time_budget_ms, **solve_kwargs)
+        handle.result(
+            deadline=deadline,
+            tolerance=self.config.anytime_convergence_tol or None,
+            should_stop=should_stop
+        )
+        # Stopping takes at most one iteration; the final average is at least as recent as the snapshot
+        handle.cancel()
+        strategy = handle.wait()
+        snapshot = handle.snapshot()
+        if snapshot is not None:
+            logger.debug(f"Anytime solve stopped after {snapshot.iterations}+ iterations "
+                         f"(convergence {snapshot.convergence:.4f})")
+        return strategy
+    
+    @staticmethod
+    def _decision_key(state: TableState, our_cards: list, history: list) -> DecisionKey:
+        return (
+            state.street.name,
+            "".join(str(c) for c in state.board),
+            "".join(sorted(str(c) for c in our_cards)),
+            tuple(history)
+        )
+    
+    def _find_carry_over(
+        self,
+        state: TableState,
+        our_cards: list,
+        history: list
+    ) -> Optional[Tuple[RangeVsRangeCFR, int]]:
+        """Previous solve and the node reached in it, if this decision follows it on the same street.
+        
+        The hero's action is the one sampled at the previous decision; the
+        opponent's reply is identified from the pot and amount to call.
+        """
+        if self._last_decision is None or not self.config.carry_over_solution:
+            return None
+        (street, board, cards, previous_history), hero_action, solver = self._last_decision
+        key = self._decision_key(state, our_cards, history)
+        if key[:3] != (street, board, cards) or len(history) <= len(previous_history) \
+                or key[3][:len(previous_history)] != previous_history:
+            return None
+        
+        node_id = solver.reached_hero_node(
+            hero_action, state.pot, state.to_call, self.config.carry_over_match_tolerance
+        )
+        if node_id is None:
+            return None
+        hero_range, opponent_range = solver.reached_ranges(node_id)
+        if hero_range[combo_index(our_cards)] <= 0 or opponent_range.sum() <= 0:
+            return None
+        logger.debug(f"Carrying over the previous solve ({solver.iterations} iterations) from node {node_id}")
+        return solver, node_id
+    
     def _get_blueprint_action(self, infoset: str) -> AbstractAction:
         """Get action from blueprint policy."""
         from holdem.utils.rng import get_rng
         rng = get_rng()
         return self.blueprint.sample_action(infoset, rng)
     
-    def update_belief(self, action: AbstractAction, player: int):
-        """Update belief state based on opponent action."""
-        self.belief.update(action.value, player)
+    @staticmethod
+    def _hand_key(our_cards: list) -> Tuple[str, ...]:
+        return tuple(sorted(str(c) for c in our_cards))
+    
+    def start_hand(self, our_cards: list, num_opponents: Optional[int] = None):
+        """Reset per-hand state: uniform opponent ranges without the hero's cards.
+        
+        get_action() calls this when the hero cards change; call it earlier to
+        track opponent actions taken before the hero's first decision.
+        
+        Args:
+            our_cards: Hero hole cards
+            num_opponents: Opponents to track (default: unchanged)
+        """
+        if num_opponents is not None and num_opponents != self.belief.num_opponents:
+            self.belief = BeliefState(
+                num_opponents=max(1, num_opponents), bucketing=self.bucketing, blueprint=self.blueprint
+            )
+        self.belief.initialize_uniform(dead_cards=our_cards)
+        self._hand_cards = self._hand_key(our_cards)
+        self._last_decision = None
+    
+    def update_belief(
+        self,
+        action: AbstractAction,
+        player: int,
+        state: Optional[TableState] = None,
+        history: Optional[list] = None
+    ):
+        """Update belief state based on opponent action.
+
+        The first update of a street buckets every live combo (a feature
+        extraction each, seconds on the flop), and the resolvers do not read
+        the tracked ranges: not called from the live decision loop.
+
+        Args:
+            action: Observed opponent action
+            player: Opponent index
+            state: Public state when the action was taken (without it the
+                blueprint likelihoods are unknown and the range is unchanged)
+            history: Action history before the action
+        """
+        if state is None:
+            self.belief.update(action, player)
+            return
+        self.belief.update(
+            action,
+            player,
+            street=state.street,
+            board=state.board,
+            action_sequence=self.encoder.encode_action_history(history or []),
+            pot=state.pot,
+            stack=state.effective_stack if state.effective_stack > 0 else state.pot * 2.0,
+            is_in_position=not state.is_in_position  # The opponent's position, not the hero's
+        )
@@ -0,0 +1,140 @@
+"""Public-state keyed cache of subgame solutions.
+
+Range-vs-range solutions do not depend on the hero's hand, so a subgame
+solved once can warm-start any later solve of the same public situation:
+canonical (suit-isomorphic) board, abstract action line, and bucketed
+to-call and stack-to-pot ratios. Entries hold the regrets and strategy sums
+of the subgame's decision nodes (float32, canonical combo order), evicted
+least-recently-used by count and memory, and can be persisted to disk
+across sessions.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from holdem.abstraction.state_encode import parse_infoset_key
+from holdem.realtime.range_solver import RangeVsRangeCFR
+from holdem.utils.serialization import save_pickle, load_pickle
+from holdem.utils.logging import get_logger
+
+logger = get_logger("realtime.solution_cache")
+
+# To-call / pot ratio bucket width
+TO_CALL_BUCKET = 0.05
+# Stack-to-pot ratio bucket edges
+SPR_BUCKETS = [0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 20.0]
+
+
+def public_state_key(solver: RangeVsRangeCFR, infoset: str) -> str:
+    """Canonical public-state key of a subgame.
+
+    The action line comes from the infoset (its hand bucket is dropped);
+    infosets in another format are used whole.
+    """
+    try:
+        street, _, action_line = parse_infoset_key(infoset)
+        line = f"{street}:{action_line}"
+    except ValueError:
+        line = infoset
+    to_call_bucket = int(round(solver.to_call / TO_CALL_BUCKET))
+    spr_bucket = int(np.digitize(solver.stack / max(solver.pot + 2 * solver.to_call, 1e-9), SPR_BUCKETS))
+    # Stable across processes (str hashes are salted), so persisted keys stay valid
+    tree = hashlib.sha1(repr(solver.tree_signature()).encode()).hexdigest()[:8]
+    return f"{solver.canonical_board}|{line}|c{to_call_bucket}|s{spr_bucket}|t{tree}"
+
+
+def _entry_bytes(entry: Dict) -> int:
+    return sum(a.nbytes for a in entry['regrets'].values()) + sum(a.nbytes for a in entry['strategy_sum'].values())
+
+
+class SubgameSolutionCache:
+    """LRU cache of exported RangeVsRangeCFR states, bounded by entries and memory.
+
+    Thread-safe, so resolvers solving in background threads can share it.
+    """
+
+    def __init__(self, max_entries: int = 256, max_mb: float = 256.0, path: Optional[Union[str, Path]] = None):
+        """Create the cache, loading it from path if the file exists.
+
+        Args:
+            max_entries: Maximum number of cached subgames
+            max_mb: Maximum memory of cached arrays (MB)
+            path: File for persistence across sessions (optional)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.path = Path(path) if path else None
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.iterations_saved = 0
+
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached state for key (marks it recently used), counting hits and misses."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: Dict):
+        """Store (or replace) the state for key, evicting least recently used entries."""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.memory_bytes -= _entry_bytes(old)
+            self._entries[key] = entry
+            self.memory_bytes += _entry_bytes(entry)
+            while self._entries and (len(self._entries) > self.max_entries or self.memory_bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self.memory_bytes -= _entry_bytes(evicted)
+
+    def record_iterations_saved(self, iterations: int):
+        """Count iterations a warm-started solve did not need to run."""
+        with self._lock:
+            self.iterations_saved += max(0, iterations)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit rate, average iterations saved per hit and memory use."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'avg_iterations_saved': self.iterations_saved / self.hits if self.hits else 0.0,
+            'memory_mb': self.memory_bytes / (1024 * 1024),
+        }
+
+    def save(self, path: Optional[Union[str, Path]] = None):
+        """Persist the cache (most recently used last)."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError("No path given for the solution cache")
+        with self._lock:
+            entries = list(self._entries.items())
+        save_pickle(entries, path)
+        logger.info(f"Saved {len(entries)} cached subgame solutions to {path}")
+
+    def load(self, path: Union[str, Path]):
+        """Load persisted entries (added as most recently used)."""
+        for key, entry in load_pickle(Path(path)):
+            self.put(key, entry)
+        logger.info(f"Loaded {len(self._entries)} cached subgame solutions from {path}")
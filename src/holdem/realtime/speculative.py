@@ -0,0 +1,323 @@
+"""Speculative pre-solving of the hero's next decisions while opponents act.
+
+After the hero acts, the opponents' turns are idle time for the solver. A
+background thread takes the current public state, branches on the most
+probable opponent actions according to the blueprint, and solves the hero
+decision each branch leads to. Results are kept in a cache keyed by the
+public state; when the hero's turn arrives, a matching result warm-starts a
+short refinement solve instead of a cold solve.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Tuple
+
+from holdem.types import SearchConfig, TableState, Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.abstraction.state_encode import StateEncoder
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.realtime.anytime import SolveHandle
+from holdem.realtime.range_solver import bet_fraction
+from holdem.realtime.resolver import SubgameResolver
+from holdem.realtime.solution_cache import SubgameSolutionCache
+from holdem.realtime.subgame import SubgameBuilder, SubgameTree
+from holdem.utils.deck import get_remaining_cards
+from holdem.utils.rng import get_rng
+from holdem.utils.logging import get_logger
+
+logger = get_logger("realtime.speculative")
+
+# (street, board, hero cards, action history)
+SpotKey = Tuple[str, str, str, Tuple[str, ...]]
+
+
+@dataclass
+class PresolvedSpot:
+    """A pre-solved hero decision."""
+    pot: float
+    to_call: float
+    strategy: Dict[AbstractAction, float]
+    solve_ms: float
+    branch_prob: float
+
+
+def spot_key(state: TableState, our_cards: List[Card], history: List[str]) -> SpotKey:
+    """Cache key of a hero decision: everything but the bet amounts, which are matched with a tolerance."""
+    return (
+        state.street.name,
+        "".join(str(c) for c in state.board),
+        "".join(sorted(str(c) for c in our_cards)),
+        tuple(history)
+    )
+
+
+class SpeculativeSolver:
+    """Pre-solves the hero's likely next decisions in a background thread."""
+
+    def __init__(
+        self,
+        config: SearchConfig,
+        blueprint: PolicyStore,
+        encoder: StateEncoder,
+        subgame_builder: SubgameBuilder,
+        solution_cache: Optional[SubgameSolutionCache] = None
+    ):
+        """Create the pre-solver.
+
+        Args:
+            solution_cache: Subgame solution cache to share with the main
+                resolver (optional; otherwise the resolvers here share their own)
+        """
+        self.config = config
+        self.blueprint = blueprint
+        self.encoder = encoder
+        self.subgame_builder = subgame_builder
+
+        # Separate resolvers: background solves and refinement on the hero's turn can overlap
+        self._resolver = SubgameResolver(config, blueprint)
+        self._refine_resolver = SubgameResolver(config, blueprint)
+        if solution_cache is None:
+            solution_cache = self._resolver.solution_cache
+        self._resolver.solution_cache = solution_cache
+        self._refine_resolver.solution_cache = solution_cache
+
+        self._cache: "OrderedDict[SpotKey, List[PresolvedSpot]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        # Handle of the spot being solved, so cancel() can interrupt it
+        self._current_solve: Optional[SolveHandle] = None
+
+        # Hit rate and latency saved
+        self.hits = 0
+        self.misses = 0
+        self.presolved = 0
+        self.latency_saved_ms = 0.0
+
+    def presolve(
+        self,
+        state: TableState,
+        our_cards: List[Card],
+        history: List[str],
+        hero_action: Optional[AbstractAction] = None
+    ):
+        """Start pre-solving the hero's next decisions in the background.
+
+        Args:
+            state: Public state (before hero_action, if given)
+            our_cards: Hero hole cards
+            history: Action history as passed to SearchController.get_action
+                at the next decision (including hero_action)
+            hero_action: Action the hero just took, if the opponents now respond to it
+        """
+        # The previous run must be done with self._resolver before a new one uses it
+        self.cancel()
+        self.wait()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(state, list(our_cards), list(history), hero_action, self._stop_event),
+            name="speculative-presolve",
+            daemon=True
+        )
+        self._thread.start()
+
+    def cancel(self):
+        """Stop background pre-solving, interrupting the current spot's solve (does not wait)."""
+        self._stop_event.set()
+        handle = self._current_solve
+        if handle is not None:
+            handle.cancel()
+
+    def wait(self, timeout: Optional[float] = None):
+        """Wait for the background pre-solve to finish."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(
+        self,
+        state: TableState,
+        our_cards: List[Card],
+        history: List[str],
+        hero_action: Optional[AbstractAction],
+        stop_event: threading.Event
+    ):
+        try:
+            spots = self.predict_spots(state, our_cards, history, hero_action)
+            action_sequence = self.encoder.encode_action_history(history)
+            infoset = self.encoder.encode_infoset(
+                our_cards, state.board, state.street, action_sequence, use_versioning=True
+            )[0]
+            for branch_prob, spot_state in spots:
+                if stop_event.is_set():
+                    break
+                subgame = self.subgame_builder.build_subgame(spot_state, our_cards, history)
+                handle = SolveHandle()
+                self._current_solve = handle
+                if stop_event.is_set():
+                    break
+                start = time.time()
+                strategy = self._resolver.solve(subgame, infoset, progress=handle)
+                solve_ms = (time.time() - start) * 1000
+                if handle.cancelled:
+                    break  # Interrupted: partial strategy
+                self._store(spot_key(spot_state, our_cards, history), PresolvedSpot(
+                    pot=spot_state.pot,
+                    to_call=spot_state.to_call,
+                    strategy=strategy,
+                    solve_ms=solve_ms,
+                    branch_prob=branch_prob
+                ))
+                logger.debug(f"Pre-solved spot pot={spot_state.pot:.2f} to_call={spot_state.to_call:.2f} "
+                             f"(p={branch_prob:.2f}) in {solve_ms:.1f}ms")
+        except Exception as e:
+            logger.warning(f"Speculative pre-solve failed: {e}")
+        finally:
+            self._current_solve = None
+
+    def predict_spots(
+        self,
+        state: TableState,
+        our_cards: List[Card],
+        history: List[str],
+        hero_action: Optional[AbstractAction] = None
+    ) -> List[Tuple[float, TableState]]:
+        """Hero decision states after the most probable opponent actions.
+
+        Returns:
+            (opponent action probability, hero state) pairs, most probable first
+        """
+        pot, facing, hero_acted = state.pot, 0.0, hero_action is not None
+        if hero_action is not None:
+            if hero_action == AbstractAction.FOLD:
+                return []
+            if hero_action == AbstractAction.CHECK_CALL:
+                if state.to_call > 0:
+                    return []  # A call closes the betting round
+            else:
+                pot_after_call = pot + state.to_call
+                facing = self._bet_amount(hero_action, pot_after_call, state.effective_stack - state.to_call)
+                pot = pot_after_call + facing
+
+        spots = []
+        probs = self._opponent_action_probs(state, our_cards, history)
+        for action, prob in sorted(probs.items(), key=lambda item: -item[1]):
+            if len(spots) >= self.config.speculative_branches or prob < self.config.speculative_min_prob:
+                break
+            if action == AbstractAction.FOLD:
+                continue
+            if action == AbstractAction.CHECK_CALL:
+                if facing > 0 or hero_acted:
+                    continue  # Call or check behind ends the round: no hero decision this street
+                spots.append((prob, replace(state, pot=pot, to_call=0.0)))
+            else:
+                raise_amount = self._bet_amount(action, pot + facing, state.effective_stack - facing)
+                spots.append((prob, replace(
+                    state,
+                    pot=pot + facing + raise_amount,
+                    to_call=raise_amount,
+                    current_bet=facing + raise_amount
+                )))
+        return spots
+
+    @staticmethod
+    def _bet_amount(action: AbstractAction, pot_after_call: float, stack_behind: float) -> float:
+        """Bet/raise size on top of a call."""
+        fraction = bet_fraction(action)
+        if action == AbstractAction.ALL_IN or fraction is None:
+            return stack_behind if stack_behind > 0 else pot_after_call
+        amount = fraction * pot_after_call
+        return min(amount, stack_behind) if stack_behind > 0 else amount
+
+    def _opponent_action_probs(
+        self,
+        state: TableState,
+        our_cards: List[Card],
+        history: List[str]
+    ) -> Dict[AbstractAction, float]:
+        """Blueprint action probabilities averaged over sampled opponent hands."""
+        deck = get_remaining_cards(list(state.board) + list(our_cards))
+        rng = get_rng()
+        action_sequence = self.encoder.encode_action_history(history)
+
+        totals: Dict[AbstractAction, float] = {}
+        samples = max(1, self.config.speculative_opponent_samples)
+        for _ in range(samples):
+            hand = [deck[i] for i in rng.rng.choice(len(deck), size=2, replace=False)]
+            infoset = self.encoder.encode_infoset(
+                hand, state.board, state.street, action_sequence, use_versioning=True
+            )[0]
+            for action, prob in self.blueprint.get_strategy(infoset).items():
+                totals[action] = totals.get(action, 0.0) + prob / samples
+        return totals
+
+    def _store(self, key: SpotKey, spot: PresolvedSpot):
+        with self._lock:
+            self._cache.setdefault(key, []).append(spot)
+            self._cache.move_to_end(key)
+            while sum(len(spots) for spots in self._cache.values()) > self.config.speculative_cache_size:
+                self._cache.popitem(last=False)
+            self.presolved += 1
+
+    def lookup(self, state: TableState, our_cards: List[Card], history: List[str]) -> Optional[PresolvedSpot]:
+        """Closest pre-solved spot within the match tolerance, if any."""
+        tolerance = self.config.speculative_match_tolerance
+        with self._lock:
+            candidates = list(self._cache.get(spot_key(state, our_cards, history), []))
+
+        best, best_distance = None, None
+        for spot in candidates:
+            pot_diff = abs(state.pot - spot.pot) / max(spot.pot, 1e-9)
+            call_diff = abs(state.to_call / max(state.pot, 1e-9) - spot.to_call / max(spot.pot, 1e-9))
+            if pot_diff > tolerance or call_diff > tolerance:
+                continue
+            if best_distance is None or pot_diff + call_diff < best_distance:
+                best, best_distance = spot, pot_diff + call_diff
+        return best
+
+    def solve_from_cache(
+        self,
+        state: TableState,
+        our_cards: List[Card],
+        history: List[str],
+        subgame: SubgameTree,
+        infoset: str
+    ) -> Optional[Dict[AbstractAction, float]]:
+        """Refine a matching pre-solved spot, or return None on a miss.
+
+        The refinement warm-starts from the pre-solved strategy and runs
+        speculative_refine_fraction of the usual iterations. Latency saved is
+        the pre-solve time minus the refinement time.
+        """
+        spot = self.lookup(state, our_cards, history)
+        if spot is None:
+            self.misses += 1
+            return None
+
+        start = time.time()
+        strategy = self._refine_resolver.solve(
+            subgame,
+            infoset,
+            warm_start_strategy=spot.strategy,
+            min_iterations=max(1, int(self.config.min_iterations * self.config.speculative_refine_fraction))
+        )
+        refine_ms = (time.time() - start) * 1000
+
+        self.hits += 1
+        self.latency_saved_ms += max(0.0, spot.solve_ms - refine_ms)
+        logger.debug(f"Speculative hit: refined in {refine_ms:.1f}ms (pre-solve took {spot.solve_ms:.1f}ms)")
+        return strategy
+
+    def stats(self) -> Dict[str, float]:
+        """Hit rate and latency saved per decision."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'presolved': self.presolved,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'latency_saved_ms_total': self.latency_saved_ms,
+            'latency_saved_ms_per_decision': self.latency_saved_ms / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,159 @@
+"""Per-decision time budgets for real-time search.
+
+A decision's fair share of time starts from SearchConfig.time_budget_ms,
+scaled by street (time_budget_street_factors) and by how committed the
+stacks are (pot / (pot + effective stack)), so a big river pot gets more
+time than a small preflop spot. The iteration rate observed on earlier
+decisions of the same street and subgame size (number of root actions)
+then gives the time needed to reach min_iterations: a decision that needs
+less than its share finishes early and the unused time goes to a session
+time bank, one that needs more may draw part of the bank. Budgets are
+clamped to [time_budget_min_ms, time_budget_max_ms].
+
+Every decision is recorded (budget, time used, iterations, convergence) in
+memory and, if time_budget_log_path is set, appended to a JSONL file so the
+policy can be tuned offline.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from holdem.types import SearchConfig, Street
+from holdem.utils.logging import get_logger
+
+logger = get_logger("realtime.time_budget")
+
+# Decisions kept in memory for stats
+RECORD_WINDOW = 1000
+# Weight of the latest solve in the iteration-rate average
+RATE_SMOOTHING = 0.3
+# Headroom over the time min_iterations are expected to take
+RATE_MARGIN = 1.1
+
+
+@dataclass
+class DecisionTiming:
+    """Budget and outcome of one decision's search."""
+    street: str
+    pot: float
+    stack: float
+    num_actions: int
+    target_ms: float  # Fair share before rate / bank adjustments
+    budget_ms: float
+    used_ms: float = 0.0
+    iterations: int = 0
+    iterations_per_second: float = 0.0
+    preempted: bool = False
+    final_kl: Optional[float] = None
+    exploitability: Optional[float] = None
+    bank_ms: float = 0.0  # Bank after this decision
+    timestamp: float = 0.0
+
+
+class TimeBudgetPolicy:
+    """Allocates per-decision search budgets and keeps the session time bank."""
+
+    def __init__(self, config: SearchConfig):
+        self.config = config
+        self.bank_ms = float(config.time_bank_ms)
+        self._rates: Dict[Tuple[str, int], float] = {}  # (street, root actions) -> iterations/s
+        self.records = deque(maxlen=RECORD_WINDOW)
+        self._lock = threading.Lock()
+
+    def allocate(self, street: Street, pot: float, stack: float, num_actions: int) -> DecisionTiming:
+        """Budget for a decision.
+
+        Args:
+            street: Current street
+            pot: Pot size
+            stack: Effective stack behind
+            num_actions: Root actions of the subgame (its size)
+
+        Returns:
+            DecisionTiming with target_ms and budget_ms set (pass it to record())
+        """
+        config = self.config
+        street_name = street.name.lower()
+        commitment = pot / (pot + stack) if pot + stack > 0 else 0.0
+        target = (config.time_budget_ms * config.time_budget_street_factors.get(street_name, 1.0)
+                  * (1.0 + config.time_budget_pot_weight * commitment))
+
+        budget = target
+        rate = self._rates.get((street_name, num_actions))
+        if rate:
+            needed = config.min_iterations / rate * 1000.0 * RATE_MARGIN
+            draw = self.bank_ms * config.time_bank_max_draw if config.time_bank_ms > 0 else 0.0
+            budget = min(needed, target + draw)
+        budget = float(np.clip(budget, config.time_budget_min_ms, config.time_budget_max_ms))
+
+        logger.debug(f"Time budget {street_name}: {budget:.1f}ms (share {target:.1f}ms, "
+                     f"rate {rate or 0:.0f} it/s, bank {self.bank_ms:.0f}ms)")
+        return DecisionTiming(street=street_name, pot=pot, stack=stack, num_actions=num_actions,
+                              target_ms=target, budget_ms=budget)
+
+    def record(self, timing: DecisionTiming, used_ms: float, solve_stats: Optional[Dict] = None,
+               exploitability: Optional[float] = None) -> DecisionTiming:
+        """Record a finished decision: update the rate estimate and the time bank.
+
+        Args:
+            timing: Allocation returned by allocate()
+            used_ms: Wall-clock time the decision took
+            solve_stats: Resolver last_solve_stats (iterations, it/s, preempted, final_kl)
+            exploitability: Convergence of the solve, if measured
+
+        Returns:
+            The completed record
+        """
+        stats = solve_stats or {}
+        timing.used_ms = used_ms
+        timing.iterations = int(stats.get('iterations', 0))
+        timing.iterations_per_second = float(stats.get('iterations_per_second', 0.0))
+        timing.preempted = bool(stats.get('preempted', False))
+        timing.final_kl = stats.get('final_kl')
+        timing.exploitability = exploitability
+        timing.timestamp = time.time()
+
+        with self._lock:
+            if timing.iterations > 0 and timing.iterations_per_second > 0:
+                key = (timing.street, timing.num_actions)
+                previous = self._rates.get(key)
+                self._rates[key] = timing.iterations_per_second if previous is None else (
+                    RATE_SMOOTHING * timing.iterations_per_second + (1 - RATE_SMOOTHING) * previous
+                )
+            if self.config.time_bank_ms > 0:
+                # Unused share is saved, time over the share is drawn
+                self.bank_ms = float(np.clip(self.bank_ms + timing.target_ms - used_ms, 0.0, self.config.time_bank_ms))
+            timing.bank_ms = self.bank_ms
+            self.records.append(timing)
+
+        if self.config.time_budget_log_path:
+            try:
+                with open(self.config.time_budget_log_path, 'a') as f:
+                    f.write(json.dumps(asdict(timing)) + "\n")
+            except OSError as e:
+                logger.warning(f"Could not write time budget record: {e}")
+        return timing
+
+    def stats(self) -> Dict[str, float]:
+        """Budget vs time used over recent decisions."""
+        with self._lock:
+            records = list(self.records)
+        if not records:
+            return {'decisions': 0, 'bank_ms': self.bank_ms}
+        budgets = np.array([r.budget_ms for r in records])
+        used = np.array([r.used_ms for r in records])
+        return {
+            'decisions': len(records),
+            'mean_budget_ms': float(budgets.mean()),
+            'mean_used_ms': float(used.mean()),
+            'p99_used_ms': float(np.percentile(used, 99)),
+            'overrun_rate': float(np.mean(used > budgets)),
+            'preempted_rate': float(np.mean([r.preempted for r in records])),
+            'bank_ms': self.bank_ms,
+        }
@@ -5,18 +5,24 @@ Used for real-time subgame resolution during play.
 """
 
 import time
-from typing import Dict, Optional
+from collections import deque
+from typing import Dict, List, Optional
+import numpy as np
 from holdem.types import Card, Street
 from holdem.abstraction.actions import AbstractAction
 from holdem.mccfr.policy_store import PolicyStore
 from holdem.mccfr.regrets import RegretTracker
-from holdem.rt_resolver.subgame_builder import SubgameBuilder, SubgameState
+from holdem.realtime.anytime import SolveHandle, start_anytime_solve
+from holdem.rt_resolver.subgame_builder import NOT_TERMINAL, BettingTree, SubgameBuilder, SubgameState
 from holdem.rt_resolver.leaf_evaluator import LeafEvaluator
 from holdem.utils.rng import get_rng
 from holdem.utils.logging import get_logger
 
 logger = get_logger("rt_resolver.depth_limited_cfr")
 
+# Recent solves kept for latency percentiles
+LATENCY_WINDOW = 1000
+
 
 class DepthLimitedCFR:
     """CFR solver with depth and time limits for real-time play.
@@ -25,7 +31,8 @@ class DepthLimitedCFR:
     - Small iteration budget (400-1200 iterations)
     - Hard time limit (e.g., 80ms per decision)
     - Depth-limited subgame construction
-    - Leaf evaluation via blueprint CFV or rollouts
+    - Leaf evaluation via blueprint CFV or rollouts, all leaves of the
+      subgame evaluated once per solve in a single batch
     - KL regularization toward blueprint
     """
     
@@ -38,7 +45,8 @@ class DepthLimitedCFR:
         max_iterations: int = 1200,
         time_limit_ms: int = 80,
         kl_weight: float = 0.5,
-        fallback_to_blueprint: bool = True
+        fallback_to_blueprint: bool = True,
+        publish_interval: int = 10
     ):
         """Initialize depth-limited CFR solver.
         
@@ -51,6 +59,7 @@ class DepthLimitedCFR:
             time_limit_ms: Time limit in milliseconds
             kl_weight: KL divergence weight toward blueprint
             fallback_to_blueprint: If True, fallback to blueprint when time expires before min_iterations
+            publish_interval: Iterations between strategy snapshots of anytime solves
         """
         self.blueprint = blueprint
         self.subgame_builder = subgame_builder
@@ -60,6 +69,7 @@ class DepthLimitedCFR:
         self.time_limit_ms = time_limit_ms
         self.kl_weight = kl_weight
         self.fallback_to_blueprint = fallback_to_blueprint
+        self.publish_interval = max(1, publish_interval)
         
         self.regret_tracker = RegretTracker()
         self.rng = get_rng()
@@ -70,6 +80,9 @@ class DepthLimitedCFR:
         self.ev_delta_vs_blueprint = 0.0
         self.total_solves = 0
         self.failsafe_fallbacks = 0  # Count of fallbacks to blueprint
+        self.last_leaf_count = 0
+        self.last_leaf_eval_ms = 0.0
+        self._latencies_ms = deque(maxlen=LATENCY_WINDOW)
         
         logger.info(
             f"DepthLimitedCFR initialized: "
@@ -83,17 +96,24 @@ class DepthLimitedCFR:
         root_state: SubgameState,
         hero_hand: list,
         villain_range: Dict[str, float],
-        hero_position: int
+        hero_position: int,
+        progress: Optional[SolveHandle] = None
     ) -> Dict[AbstractAction, float]:
         """Solve subgame and return strategy.
         
         If time expires before min_iterations, falls back to blueprint (safe fallback).
+        A cancelled anytime solve returns its current strategy instead: the
+        caller chose to stop it.
         
         Args:
-            root_state: Root state of subgame
+            root_state: Root state of subgame; its effective_stack caps bets and
+                sizes all-ins (unknown: two pots)
             hero_hand: Hero's hole cards
             villain_range: Villain's hand range
             hero_position: Hero's position (0, 1, ...)
+            progress: Handle to publish the average strategy to every
+                publish_interval iterations; the solve stops early when it is
+                cancelled (see solve_anytime)
             
         Returns:
             Strategy (probability distribution over actions)
@@ -102,20 +122,31 @@ class DepthLimitedCFR:
         self.total_solves += 1
         used_fallback = False
         
-        # Get actions for infoset
-        actions = self.subgame_builder.get_actions(
-            root_state,
-            stack=100.0,  # Placeholder
-            in_position=True
-        )
+        # Betting tree of the subgame (cached per street / stack-to-pot bucket), root actions first
+        stack = root_state.effective_stack if root_state.effective_stack > 0 else root_state.pot * 2.0
+        tree = self.subgame_builder.build_tree(root_state, stack=stack, in_position=True)
+        actions = tree.actions(0)
         infoset = self._make_infoset(root_state, hero_hand)
         
         # Warm-start from blueprint
-        self._warm_start(root_state, hero_hand)
+        self._warm_start(root_state, hero_hand, actions)
+        
+        # Evaluate every leaf of the subgame once, in one batch; iterations back these values up
+        leaf_values = self._evaluate_leaves(tree, root_state, hero_hand, villain_range, hero_position)
+        infosets = self._tree_infosets(tree, root_state, hero_hand)
+        
+        # Anytime solve: the warm start is available before the first iteration
+        if progress is not None:
+            progress.publish(self.regret_tracker.get_strategy(infoset, actions), 0)
         
         # Run CFR iterations with time budget
         iteration = 0
+        cancelled = False
         while iteration < self.max_iterations:
+            if progress is not None and progress.cancelled:
+                cancelled = True
+                break
+            
             # Check time limit before iteration
             elapsed_ms = (time.time() - start_time) * 1000
             
@@ -136,6 +167,7 @@ class DepthLimitedCFR:
                         blueprint_strategy = {a: 1.0 / len(actions) for a in actions}
                     
                     self.last_solve_time_ms = elapsed_ms
+                    self._latencies_ms.append(elapsed_ms)
                     self.last_iterations = iteration
                     self.ev_delta_vs_blueprint = 0.0  # No EV delta since we're using blueprint
                     
@@ -144,10 +176,10 @@ class DepthLimitedCFR:
                     # No fallback, continue with what we have
                     break
             
-            self._cfr_iteration(
-                root_state, hero_hand, villain_range, hero_position, iteration
-            )
+            self._cfr_iteration(tree, root_state, infosets, leaf_values, iteration)
             iteration += 1
+            if progress is not None and iteration % self.publish_interval == 0:
+                progress.publish(self.regret_tracker.get_average_strategy(infoset, actions), iteration)
             
             # Check time limit (after minimum iterations)
             if iteration >= self.min_iterations:
@@ -155,11 +187,15 @@ class DepthLimitedCFR:
                 if elapsed_ms >= self.time_limit_ms:
                     break
         
-        # Compute final strategy from regrets
-        strategy = self.regret_tracker.get_average_strategy(infoset, actions)
+        # Compute final strategy from regrets (the warm start if cancelled before any iteration)
+        if iteration > 0:
+            strategy = self.regret_tracker.get_average_strategy(infoset, actions)
+        else:
+            strategy = self.regret_tracker.get_strategy(infoset, actions)
         
         # Update metrics
         self.last_solve_time_ms = (time.time() - start_time) * 1000
+        self._latencies_ms.append(self.last_solve_time_ms)
         self.last_iterations = iteration
         
         # Calculate EV delta vs blueprint
@@ -171,17 +207,35 @@ class DepthLimitedCFR:
         logger.info(
             f"Solved subgame: {iteration} iterations in {self.last_solve_time_ms:.1f}ms, "
             f"EV delta vs blueprint: {self.ev_delta_vs_blueprint:+.2f} BBs, "
-            f"fallback_used={used_fallback}"
+            f"fallback_used={used_fallback}, cancelled={cancelled}"
         )
         
         return strategy
     
-    def _warm_start(self, state: SubgameState, hero_hand: list):
+    def solve_anytime(
+        self,
+        root_state: SubgameState,
+        hero_hand: list,
+        villain_range: Dict[str, float],
+        hero_position: int
+    ) -> SolveHandle:
+        """Start solve() in a background thread and return a handle on it.
+        
+        Act on handle.result() at the earliest of convergence, a deadline or a
+        state change, and cancel() the solve once its result is not needed.
+        """
+        return start_anytime_solve(
+            lambda handle: self.solve(root_state, hero_hand, villain_range, hero_position, progress=handle),
+            name="depth-limited-solve"
+        )
+    
+    def _warm_start(self, state: SubgameState, hero_hand: list, actions: List[AbstractAction]):
         """Warm-start regrets from blueprint strategy.
         
         Args:
             state: Root state
             hero_hand: Hero's cards
+            actions: Root actions
         """
         infoset = self._make_infoset(state, hero_hand)
         blueprint_strategy = self.blueprint.get_strategy(infoset)
@@ -190,10 +244,6 @@ class DepthLimitedCFR:
             return
         
         # Initialize regrets to favor blueprint actions
-        actions = self.subgame_builder.get_actions(
-            state, stack=100.0, in_position=True
-        )
-        
         for action in actions:
             prob = blueprint_strategy.get(action, 0.0)
             initial_regret = prob * 10.0  # Warm-start strength
@@ -201,39 +251,118 @@ class DepthLimitedCFR:
         
         logger.debug(f"Warm-started from blueprint: {len(blueprint_strategy)} actions")
     
-    def _cfr_iteration(
+    def _evaluate_leaves(
         self,
-        state: SubgameState,
+        tree: BettingTree,
+        root_state: SubgameState,
         hero_hand: list,
         villain_range: Dict[str, float],
-        hero_position: int,
+        hero_position: int
+    ) -> Optional[np.ndarray]:
+        """Evaluate all leaves of the subgame with one evaluate_batch call.
+        
+        Returns:
+            (num_leaves,) values of the leaves in tree.leaves() order (None if
+            evaluation failed, in which case iterations fall back to sampled
+            utilities)
+        """
+        start_time = time.perf_counter()
+        leaf_nodes = tree.leaves()
+        leaves = [tree.state(node, root_state) for node in leaf_nodes]
+        
+        try:
+            values = np.asarray(
+                self.leaf_evaluator.evaluate_batch(leaves, hero_hand, villain_range, hero_position),
+                dtype=np.float64
+            ).reshape(-1)
+            if len(values) != len(leaves):
+                raise ValueError(f"got {len(values)} values for {len(leaves)} leaves")
+        except Exception as e:
+            logger.warning(f"Batch leaf evaluation failed ({e}), using sampled utilities")
+            values = None
+        
+        self.last_leaf_eval_ms = (time.perf_counter() - start_time) * 1000
+        if values is None:
+            self.last_leaf_count = 0
+            return None
+        
+        self.last_leaf_count = len(leaves)
+        logger.debug(f"Evaluated {len(leaves)} leaves in {self.last_leaf_eval_ms:.2f}ms")
+        return values
+    
+    def _tree_infosets(self, tree: BettingTree, root_state: SubgameState, hero_hand: list) -> List[Optional[str]]:
+        """Infoset of every inner node of the tree (None for leaves), built once per solve."""
+        return [
+            self._make_infoset(root_state if node == 0 else tree.state(node, root_state), hero_hand)
+            if tree.terminal[node] == NOT_TERMINAL else None
+            for node in range(tree.num_nodes)
+        ]
+    
+    def _cfr_iteration(
+        self,
+        tree: BettingTree,
+        root_state: SubgameState,
+        infosets: List[Optional[str]],
+        leaf_values: Optional[np.ndarray],
         iteration: int
-    ):
-        """Run one CFR iteration.
+    ) -> float:
+        """Run one CFR iteration over the whole tree.
+        
+        Every inner node is a hero decision: the tree follows the hero's
+        stack through its own bets, and the opponent's responses are part of
+        the leaf values. A preorder pass takes each node's current strategy
+        and the hero's reach; a reverse pass backs the leaf values up with
+        those strategies and updates each node's regrets with its actions'
+        KL-regularized values against the node value.
         
         Args:
-            state: Current state
-            hero_hand: Hero's cards
-            villain_range: Villain's range
-            hero_position: Hero's position
+            tree: Betting tree of the subgame
+            root_state: Root state of the tree
+            infosets: Infoset of each inner node (see _tree_infosets)
+            leaf_values: Values of the leaves in tree.leaves() order (None:
+                sampled utilities at the root)
             iteration: Iteration number
+            
+        Returns:
+            Value of the root for the hero under the current strategies
         """
-        # Check if terminal
-        if self.subgame_builder.is_terminal(state):
-            # Evaluate leaf
-            return self.leaf_evaluator.evaluate(
-                state, hero_hand, villain_range, hero_position
+        if leaf_values is None:
+            return self._sampled_iteration(root_state, infosets[0], tree.actions(0))
+        
+        inner_nodes = np.flatnonzero(tree.terminal == NOT_TERMINAL)
+        reach = np.zeros(tree.num_nodes)
+        reach[0] = 1.0
+        strategies = {}
+        for node in inner_nodes:
+            actions = tree.actions(node)
+            strategy = self.regret_tracker.get_strategy(infosets[node], actions)
+            probs = np.array([strategy.get(a, 0.0) for a in actions])
+            strategies[node] = (strategy, probs)
+            reach[tree.child_nodes(node)] = reach[node] * probs
+        
+        values = np.empty(tree.num_nodes)
+        values[tree.leaves()] = leaf_values
+        for node in inner_nodes[::-1]:
+            actions = tree.actions(node)
+            strategy, probs = strategies[node]
+            blueprint_strategy = self.blueprint.get_strategy(infosets[node])
+            # KL regularization toward blueprint: penalize each action by its KL term
+            blueprint_probs = np.array([max(blueprint_strategy.get(a, 1e-6), 1e-6) for a in actions])
+            utilities = values[tree.child_nodes(node)] - self.kl_weight * np.log(
+                np.maximum(probs, 1e-10) / blueprint_probs
             )
-        
-        # Get actions
-        actions = self.subgame_builder.get_actions(
-            state, stack=100.0, in_position=True
-        )
-        
-        infoset = self._make_infoset(state, hero_hand)
-        
-        # Get current strategy
+            
+            expected = float(np.dot(probs, utilities))
+            for action, utility in zip(actions, utilities):
+                self.regret_tracker.update_regret(infosets[node], action, float(utility) - expected, 1.0)
+            self.regret_tracker.add_strategy(infosets[node], strategy, reach[node])
+            values[node] = expected
+        return float(values[0])
+    
+    def _sampled_iteration(self, state: SubgameState, infoset: str, actions: List[AbstractAction]) -> float:
+        """Root-only update with a sampled utility, when leaf values are unavailable."""
         strategy = self.regret_tracker.get_strategy(infoset, actions)
+        blueprint_strategy = self.blueprint.get_strategy(infoset)
         
         # Sample action
         action_probs = [strategy.get(a, 0.0) for a in actions]
@@ -246,7 +375,6 @@ class DepthLimitedCFR:
         utility = self.rng.uniform(-state.pot, state.pot)
         
         # Apply KL penalty toward blueprint
-        blueprint_strategy = self.blueprint.get_strategy(infoset)
         kl_div = self._kl_divergence(strategy, blueprint_strategy)
         utility -= self.kl_weight * kl_div
         
@@ -259,6 +387,7 @@ class DepthLimitedCFR:
         
         # Add to strategy sum
         self.regret_tracker.add_strategy(infoset, strategy, 1.0)
+        return utility
     
     def _make_infoset(self, state: SubgameState, hero_hand: list) -> str:
         """Create infoset identifier.
@@ -342,9 +471,14 @@ class DepthLimitedCFR:
             'rt/ev_delta_bbs': self.ev_delta_vs_blueprint,
             'rt/time_per_iteration_ms': self.last_solve_time_ms / max(self.last_iterations, 1),
             'rt/total_solves': float(self.total_solves),
-            'rt/total_fallbacks': float(self.failsafe_fallbacks)
+            'rt/total_fallbacks': float(self.failsafe_fallbacks),
+            'rt/leaves_evaluated': float(self.last_leaf_count),
+            'rt/leaf_eval_ms': self.last_leaf_eval_ms,
+            'rt/leaves_per_sec': (
+                self.last_leaf_count / (self.last_leaf_eval_ms / 1000.0) if self.last_leaf_eval_ms > 0 else 0.0
+            ),
+            'rt/decision_time_p99_ms': (
+                float(np.percentile(self._latencies_ms, 99)) if self._latencies_ms else 0.0
+            )
         }
 
-
-# Fix missing import
-import numpy as np
@@ -0,0 +1,290 @@
+"""Leaf-value cache for depth-limited resolving.
+
+Keys are 16-byte BLAKE2b digests of a canonical encoding of the leaf's
+public state (street, board, action history, pot) and its range digest
+(public / range buckets, action set), so they are compact, stable across
+processes and collision-free in practice. Values live in a least-recently
+used map bounded by entry count, with an optional time-to-live.
+
+A SharedLeafValueStore (fixed-size hash table in shared memory) can back
+the cache so resolver processes share each other's values: a local miss
+falls through to the shared table, and every put is written to both. The
+table is lock-free; each slot carries a checksum, so a read racing a
+write sees a miss instead of a torn value.
+"""
+
+import hashlib
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from holdem.types import Card, Street
+from holdem.utils.logging import get_logger
+
+logger = get_logger("rt_resolver.leaf_cache")
+
+KEY_BYTES = 16
+
+# Approximate bytes per local entry: key, (value, stamp) tuple, and ordered dict node
+_ENTRY_BYTES = sys.getsizeof(bytes(KEY_BYTES)) + sys.getsizeof((0.0, 0.0)) + 2 * sys.getsizeof(0.0) + 104
+
+
+def leaf_cache_key(
+    street: Street,
+    board: Sequence[Card],
+    history: Iterable[str],
+    pot: float,
+    bucket_public: Optional[int],
+    bucket_ranges: Optional[Tuple[int, ...]],
+    action_set_id: Optional[int]
+) -> bytes:
+    """Collision-safe key of a leaf value.
+
+    The board is order-independent (sorted cards) and the pot is rounded to
+    cents, so equal public states always map to the same key.
+    """
+    ranges = ",".join(str(int(b)) for b in bucket_ranges) if bucket_ranges is not None else "-"
+    canonical = "|".join([
+        street.name,
+        "".join(sorted(str(c) for c in board)),
+        "-".join(history),
+        f"{pot:.2f}",
+        str(bucket_public),
+        ranges,
+        str(action_set_id),
+    ])
+    return hashlib.blake2b(canonical.encode(), digest_size=KEY_BYTES).digest()
+
+
+class SharedLeafValueStore:
+    """Fixed-size open-addressing hash table of leaf values in shared memory.
+
+    Create it once in the parent process and attach to it by name from the
+    workers. Each key probes a short window of slots; when the window is
+    full the least recently used slot is replaced.
+    """
+
+    MAGIC = b"LEAFVAL1"
+    HEADER_BYTES = 64
+    PROBE = 8
+    SLOT_DTYPE = np.dtype([
+        ('key', f'V{KEY_BYTES}'),
+        ('value', '<f8'),
+        ('stamp', '<f8'),   # Write time (TTL)
+        ('used', '<f8'),    # Last access time (eviction)
+        ('check', '<u8'),   # Checksum of key, value and stamp
+    ])
+    _CHECK_SALT = 0x9E3779B97F4A7C15  # Makes all-zero (empty) slots invalid
+
+    def __init__(self, name: Optional[str] = None, num_slots: int = 65536, create: bool = True):
+        """Create (or attach to) a shared table.
+
+        Args:
+            name: Shared memory block name (generated when creating without one)
+            num_slots: Table size when creating
+            create: Create a new block; False attaches to an existing one
+        """
+        if create:
+            size = self.HEADER_BYTES + num_slots * self.SLOT_DTYPE.itemsize
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self._shm.buf[:self.HEADER_BYTES] = bytes(self.HEADER_BYTES)
+            self._shm.buf[:8] = self.MAGIC
+            struct.pack_into('<Q', self._shm.buf, 8, num_slots)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            # Only the creator owns the block: keep this process's resource
+            # tracker from unlinking it at exit
+            try:
+                resource_tracker.unregister(self._shm._name, 'shared_memory')
+            except Exception:
+                pass
+            if bytes(self._shm.buf[:8]) != self.MAGIC:
+                self._shm.close()
+                raise ValueError(f"Shared memory block {name} is not a leaf value store")
+            num_slots = struct.unpack_from('<Q', self._shm.buf, 8)[0]
+        self.num_slots = num_slots
+        self.owner = create
+        self._slots = np.ndarray(
+            (num_slots,), dtype=self.SLOT_DTYPE, buffer=self._shm.buf, offset=self.HEADER_BYTES
+        )
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedLeafValueStore":
+        """Attach to a table created by another process."""
+        return cls(name=name, create=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._shm.size
+
+    def _checksum(self, key: bytes, value: float, stamp: float) -> int:
+        words = struct.unpack('<QQQQ', key + struct.pack('<dd', value, stamp))
+        return (words[0] ^ words[1] ^ (words[2] * 31) ^ (words[3] * 17) ^ self._CHECK_SALT) & 0xFFFFFFFFFFFFFFFF
+
+    def _window(self, key: bytes) -> np.ndarray:
+        start = int.from_bytes(key[:8], 'little') % self.num_slots
+        return (start + np.arange(min(self.PROBE, self.num_slots))) % self.num_slots
+
+    def _valid(self, slot) -> bool:
+        key = bytes(slot['key'])
+        return int(slot['check']) == self._checksum(key, float(slot['value']), float(slot['stamp']))
+
+    def get(self, key: bytes, ttl_seconds: Optional[float] = None) -> Optional[float]:
+        """Value for key, or None if absent, expired or being written."""
+        now = time.time()
+        for index in self._window(key):
+            slot = self._slots[index]
+            if bytes(slot['key']) != key or not self._valid(slot):
+                continue
+            if ttl_seconds is not None and now - float(slot['stamp']) > ttl_seconds:
+                return None
+            self._slots['used'][index] = now
+            return float(slot['value'])
+        return None
+
+    def put(self, key: bytes, value: float):
+        """Store a value, replacing the key's slot, an empty slot or the least recently used one."""
+        window = self._window(key)
+        target = None
+        for index in window:
+            slot = self._slots[index]
+            if bytes(slot['key']) == key or not self._valid(slot):
+                target = index
+                break
+        if target is None:
+            target = window[np.argmin(self._slots['used'][window])]
+
+        now = time.time()
+        # Invalidate first so concurrent readers miss while the slot is rewritten
+        self._slots['check'][target] = 0
+        self._slots['key'][target] = np.void(key)
+        self._slots['value'][target] = value
+        self._slots['stamp'][target] = now
+        self._slots['used'][target] = now
+        self._slots['check'][target] = self._checksum(key, float(value), now)
+
+    def clear(self):
+        """Empty the table."""
+        self._slots[:] = np.zeros(1, dtype=self.SLOT_DTYPE)
+
+    def close(self):
+        """Detach from the block (and free it if this process created it)."""
+        self._slots = None
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+
+class LeafValueCache:
+    """LRU cache of leaf values with optional TTL and shared-memory backing.
+
+    Thread-safe, so evaluators used from background solves can share it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: Optional[float] = None,
+        shared: Optional[SharedLeafValueStore] = None
+    ):
+        """Create an empty cache.
+
+        Args:
+            max_entries: Maximum local entries (least recently used evicted)
+            ttl_seconds: Entries older than this are ignored (None = no expiry)
+            shared: Shared table backing local misses (optional)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.shared = shared
+        self._entries: "OrderedDict[bytes, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[float]:
+        """Cached value for key (marks it recently used), counting hits and misses."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stamp = entry
+                if self.ttl_seconds is not None and time.time() - stamp > self.ttl_seconds:
+                    del self._entries[key]
+                    self.expired += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+            if self.shared is not None:
+                value = self.shared.get(key, self.ttl_seconds)
+                if value is not None:
+                    self.hits += 1
+                    self.shared_hits += 1
+                    self._store(key, value)
+                    return value
+
+            self.misses += 1
+            return None
+
+    def record_hit(self):
+        """Count a lookup served without get() (e.g. a duplicate leaf in one batch)."""
+        with self._lock:
+            self.hits += 1
+
+    def put(self, key: bytes, value: float):
+        """Store a value locally (and in the shared table), evicting least recently used entries."""
+        with self._lock:
+            self._store(key, value)
+        if self.shared is not None:
+            self.shared.put(key, value)
+
+    def _store(self, key: bytes, value: float):
+        self._entries.pop(key, None)
+        self._entries[key] = (value, time.time())
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop local entries and reset statistics (the shared table is left alone)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.shared_hits = self.evictions = self.expired = 0
+
+    def memory_bytes(self) -> int:
+        """Approximate memory of the local entries."""
+        return sys.getsizeof(self._entries) + len(self._entries) * _ENTRY_BYTES
+
+    def stats(self) -> Dict[str, float]:
+        """Hit rate, evictions and memory use."""
+        lookups = self.hits + self.misses
+        stats = {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expired': self.expired,
+            'memory_mb': self.memory_bytes() / (1024 * 1024),
+        }
+        if self.shared is not None:
+            stats['shared_hits'] = self.shared_hits
+            stats['shared_memory_mb'] = self.shared.memory_bytes / (1024 * 1024)
+        return stats
@@ -2,24 +2,42 @@
 
 Evaluates terminal states (leaves) using:
 - Blueprint counterfactual values (CFV)
-- Rollouts using blueprint strategy
+- Vectorized rollouts (showdowns, optionally blueprint continuation play)
 - CFV Net: Neural network-based leaf evaluation
 - Reduced action set for speed
-- Caching of CFV/rollouts by (bucket_public, bucket_ranges, action_set_id, street)
+- LRU caching of CFV/rollouts by public state and range buckets (see leaf_cache)
 """
 
 import numpy as np
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
-from holdem.types import Card, Street, Position
+from holdem.types import Card, Position
 from holdem.abstraction.actions import AbstractAction
 from holdem.mccfr.policy_store import PolicyStore
+from holdem.realtime.leaf_continuations import LeafPolicy
+from holdem.rt_resolver.leaf_cache import LeafValueCache, SharedLeafValueStore, leaf_cache_key
+from holdem.rt_resolver.rollout_engine import RolloutEngine
 from holdem.rt_resolver.subgame_builder import SubgameState
+from holdem.utils.card_removal import (
+    NUM_COMBOS, card_index, combo_cards, combo_index, combo_indices, combos_avoiding, remove_cards
+)
+from holdem.utils.deck import RANKS
+from holdem.utils.metrics_registry import get_metrics_registry
+from holdem.utils.quantile_sketch import QuantileSketch
 from holdem.utils.rng import get_rng
 from holdem.utils.logging import get_logger
 
 logger = get_logger("rt_resolver.leaf_evaluator")
 
+_CFV_NET_LATENCY = get_metrics_registry().histogram(
+    "holdem_cfv_net_latency_ms", "CFV net inference latency per call (ms)", ["mode"]
+)
+_CFV_NET_SINGLE_LATENCY = _CFV_NET_LATENCY.labels(mode="single")
+_CFV_NET_BATCH_LATENCY = _CFV_NET_LATENCY.labels(mode="batch")
+_CFV_NET_LEAVES = get_metrics_registry().counter("holdem_cfv_net_leaves", "Leaves sent to the CFV net", ["result"])
+_CFV_NET_ACCEPTED = _CFV_NET_LEAVES.labels(result="accept")
+_CFV_NET_REJECTED = _CFV_NET_LEAVES.labels(result="reject")
+
 
 class LeafEvaluator:
     """Evaluates leaf nodes in depth-limited subgames.
@@ -28,7 +46,7 @@ class LeafEvaluator:
     1. Blueprint CFV: Use blueprint's counterfactual values directly
     2. Rollout: Sample game continuations using blueprint strategy
     3. CFV Net: Neural network-based fast evaluation with gating
-    4. Caching: Cache CFV/rollouts by (bucket_public, bucket_ranges, action_set_id, street)
+    4. Caching: LRU cache of CFV/rollouts keyed by public state and range buckets
     """
     
     def __init__(
@@ -39,7 +57,11 @@ class LeafEvaluator:
         enable_cache: bool = True,
         cache_max_size: int = 10000,
         mode: str = "rollout",
-        cfv_net_config: Optional[Dict] = None
+        cfv_net_config: Optional[Dict] = None,
+        cache_ttl_seconds: Optional[float] = None,
+        shared_cache_name: Optional[str] = None,
+        continuation_policy: Optional[LeafPolicy] = None,
+        rollout_target_stderr: Optional[float] = None
     ):
         """Initialize leaf evaluator.
         
@@ -51,6 +73,13 @@ class LeafEvaluator:
             cache_max_size: Maximum cache entries (LRU eviction)
             mode: Evaluation mode: "rollout", "blueprint", or "cfv_net"
             cfv_net_config: Configuration for CFV Net mode (if mode="cfv_net")
+            cache_ttl_seconds: Cached leaf values expire after this long (None = never)
+            shared_cache_name: Name of a SharedLeafValueStore to share cached
+                values with other processes (optional)
+            continuation_policy: Leaf policy rollouts play for one betting
+                round before showdown (None = straight to showdown)
+            rollout_target_stderr: Draw further batches of rollouts until the
+                standard error is at most this (None = one batch)
         """
         self.blueprint = blueprint
         self.num_rollout_samples = num_rollout_samples
@@ -59,11 +88,12 @@ class LeafEvaluator:
         self.cache_max_size = cache_max_size
         self.mode = mode
         self.rng = get_rng()
+        self.rollout_target_stderr = rollout_target_stderr
+        self.rollout_engine = RolloutEngine(blueprint, continuation_policy, rng=self.rng.rng)
         
-        # Cache: (bucket_public, bucket_ranges_hash, action_set_id, street) -> value
-        self._cache: Dict[Tuple, float] = {}
-        self._cache_hits = 0
-        self._cache_misses = 0
+        # Cache: leaf_cache_key(public state, range digest) -> value
+        shared = SharedLeafValueStore.attach(shared_cache_name) if shared_cache_name else None
+        self._cache = LeafValueCache(cache_max_size, ttl_seconds=cache_ttl_seconds, shared=shared)
         
         # CFV Net inference (lazy initialization)
         self.cfv_net_inference = None
@@ -73,7 +103,8 @@ class LeafEvaluator:
         # CFV Net metrics
         self._cfv_net_accepts = 0
         self._cfv_net_rejects = 0
-        self._cfv_net_latency_samples = []
+        self._cfv_net_latency_samples = QuantileSketch()  # Per-leaf inference latency (ms)
+        self._feature_buffer: Optional[np.ndarray] = None  # Reused [leaves, feature_dim] batch matrix
         
         # Initialize CFV Net if needed
         if self.mode == "cfv_net":
@@ -94,6 +125,7 @@ class LeafEvaluator:
             stats_path = self.cfv_net_config.get('stats', str(Path(model_path).parent / 'stats.json'))
             cache_size = self.cfv_net_config.get('cache_max_size', 10000)
             gating_config = self.cfv_net_config.get('gating', None)
+            session_config = self.cfv_net_config.get('session', None)
             
             # Initialize inference
             self.cfv_net_inference = CFVInference(
@@ -101,7 +133,8 @@ class LeafEvaluator:
                 stats_path=stats_path,
                 cache_max_size=cache_size,
                 gating_config=gating_config,
-                use_torch_fallback=True
+                use_torch_fallback=True,
+                session_config=session_config
             )
             
             # Initialize feature builder
@@ -148,56 +181,133 @@ class LeafEvaluator:
             Expected value for hero
         """
         # Try cache first
-        if self.enable_cache and bucket_public is not None and bucket_ranges is not None:
-            cache_key = self._make_cache_key(
-                bucket_public, bucket_ranges, action_set_id, state.street
-            )
-            
-            if cache_key in self._cache:
-                self._cache_hits += 1
-                value = self._cache[cache_key]
-                logger.debug(f"Cache HIT for key {cache_key[:3]}... -> {value:.2f}")
+        use_cache = self.enable_cache and bucket_public is not None and bucket_ranges is not None
+        if use_cache:
+            cache_key = self._make_cache_key(state, bucket_public, bucket_ranges, action_set_id)
+            value = self._cache.get(cache_key)
+            if value is not None:
+                logger.debug(f"Cache HIT for key {cache_key.hex()[:8]}... -> {value:.2f}")
                 return value
-            else:
-                self._cache_misses += 1
         
-        # Compute value based on mode
+        value = self._compute_value(
+            state, hero_hand, villain_range, hero_position,
+            bucket_public, bucket_ranges, action_set_id
+        )
+        
+        # Cache the result
+        if use_cache:
+            self._cache.put(cache_key, value)
+        
+        return value
+    
+    def evaluate_batch(
+        self,
+        states: List[SubgameState],
+        hero_hand: List[Card],
+        villain_range: Dict[str, float],
+        hero_position: int,
+        bucket_public: Optional[int] = None,
+        bucket_ranges: Optional[Tuple[int, ...]] = None,
+        action_set_id: Optional[int] = None
+    ) -> np.ndarray:
+        """Evaluate many leaves of one subgame at once.
+        
+        Same values as calling evaluate() per leaf. Cache hits are served
+        first; in CFV Net mode the features of all misses are built into one
+        matrix and evaluated with a single predict_batch call, and only the
+        leaves the gating rejects fall back to blueprint CFV / rollouts.
+        
+        Args:
+            states: Leaf states to evaluate
+            hero_hand, villain_range, hero_position, bucket_public,
+            bucket_ranges, action_set_id: As in evaluate()
+            
+        Returns:
+            Expected value for hero per leaf
+        """
+        values = np.zeros(len(states), dtype=np.float64)
+        use_cache = self.enable_cache and bucket_public is not None and bucket_ranges is not None
+        
+        pending = []
+        duplicates = []  # (leaf, pending leaf with the same cache key)
+        pending_keys: Dict[bytes, int] = {}
+        for i, state in enumerate(states):
+            if use_cache:
+                cache_key = self._make_cache_key(state, bucket_public, bucket_ranges, action_set_id)
+                if cache_key in pending_keys:
+                    # Would have been cached by the earlier leaf in a per-leaf loop
+                    self._cache.record_hit()
+                    duplicates.append((i, pending_keys[cache_key]))
+                    continue
+                value = self._cache.get(cache_key)
+                if value is not None:
+                    values[i] = value
+                    continue
+                pending_keys[cache_key] = i
+            pending.append(i)
+        
+        if pending and self.mode == "cfv_net" and self.cfv_net_inference is not None:
+            net_values = self._cfv_net_values(
+                [states[i] for i in pending], hero_position, bucket_public, bucket_ranges
+            )
+            rejected = []
+            for i, value in zip(pending, net_values):
+                if value is None:
+                    rejected.append(i)
+                else:
+                    values[i] = value
+            fallback = rejected
+        else:
+            fallback = pending
+        
+        # Leaves on the same board share the blocker-adjusted villain range
+        range_cdfs: Dict[Tuple, np.ndarray] = {}
+        for i in fallback:
+            values[i] = self._fallback_value(states[i], hero_hand, villain_range, hero_position, range_cdfs)
+        
+        if use_cache:
+            for cache_key, i in pending_keys.items():
+                self._cache.put(cache_key, float(values[i]))
+            for i, source in duplicates:
+                values[i] = values[source]
+        
+        return values
+    
+    def _compute_value(
+        self,
+        state: SubgameState,
+        hero_hand: List[Card],
+        villain_range: Dict[str, float],
+        hero_position: int,
+        bucket_public: Optional[int],
+        bucket_ranges: Optional[Tuple[int, ...]],
+        action_set_id: Optional[int]
+    ) -> float:
+        """Value of one leaf according to the evaluation mode (no caching)."""
         if self.mode == "cfv_net" and self.cfv_net_inference is not None:
-            # Try CFV Net first
+            # Try CFV Net first, fallback to blueprint/rollout if it rejects
             value = self._cfv_net_value(
                 state, hero_hand, villain_range, hero_position,
                 bucket_public, bucket_ranges, action_set_id
             )
-            
-            # If CFV Net rejects, fallback to rollout/blueprint
-            if value is None:
-                if self.use_cfv:
-                    cfv = self._get_blueprint_cfv(state, hero_hand, hero_position)
-                    value = cfv if cfv is not None else self._rollout_value(
-                        state, hero_hand, villain_range, hero_position
-                    )
-                else:
-                    value = self._rollout_value(state, hero_hand, villain_range, hero_position)
-        
-        elif self.use_cfv:
-            # Try blueprint CFV first
+            if value is not None:
+                return value
+        return self._fallback_value(state, hero_hand, villain_range, hero_position)
+    
+    def _fallback_value(
+        self,
+        state: SubgameState,
+        hero_hand: List[Card],
+        villain_range: Dict[str, float],
+        hero_position: int,
+        range_cdfs: Optional[Dict[Tuple, np.ndarray]] = None
+    ) -> float:
+        """Blueprint CFV if enabled and available, else rollout."""
+        if self.use_cfv:
             cfv = self._get_blueprint_cfv(state, hero_hand, hero_position)
             if cfv is not None:
-                value = cfv
-            else:
-                # Fall back to rollout
-                value = self._rollout_value(state, hero_hand, villain_range, hero_position)
-        else:
-            value = self._rollout_value(state, hero_hand, villain_range, hero_position)
-        
-        # Cache the result
-        if self.enable_cache and bucket_public is not None and bucket_ranges is not None:
-            cache_key = self._make_cache_key(
-                bucket_public, bucket_ranges, action_set_id, state.street
-            )
-            self._add_to_cache(cache_key, value)
-        
-        return value
+                return cfv
+        return self._rollout_value(state, hero_hand, villain_range, hero_position, range_cdfs)
     
     def _cfv_net_value(
         self,
@@ -222,39 +332,7 @@ class LeafEvaluator:
         try:
             start_time = time.perf_counter()
             
-            # Build features
-            # Convert hero_position to Position enum
-            num_players = state.active_players if hasattr(state, 'active_players') else 6
-            hero_pos_enum = Position.from_player_count_and_seat(num_players, hero_position)
-            
-            # Build range dict (placeholder - should use actual ranges)
-            ranges = {}
-            if bucket_ranges:
-                # Convert bucket_ranges to position-specific ranges
-                # Placeholder: distribute buckets across positions
-                positions = [Position.BTN, Position.SB, Position.BB, Position.UTG, Position.MP, Position.CO]
-                for i, pos in enumerate(positions[:num_players]):
-                    if i < len(bucket_ranges):
-                        ranges[pos] = [(bucket_ranges[i], 1.0)]
-            
-            # Build features
-            features_obj = self.cfv_feature_builder.build_features(
-                street=state.street,
-                num_players=num_players,
-                hero_position=hero_pos_enum,
-                spr=state.spr if hasattr(state, 'spr') else 10.0,
-                pot_size=state.pot / 100.0 if hasattr(state, 'pot') else 1.0,  # Convert to bb
-                to_call=0.0,  # Placeholder
-                last_bet=state.pot * 0.5 / 100.0 if hasattr(state, 'pot') else 0.5,
-                action_set="balanced",  # Placeholder
-                public_bucket=bucket_public if bucket_public is not None else 0,
-                ranges=ranges
-            )
-            
-            feature_vector = features_obj.to_vector()
-            
-            # Check if hero is in position
-            is_ip = hero_pos_enum.is_in_position_postflop(num_players)
+            feature_vector, is_ip = self._cfv_features(state, hero_position, bucket_public, bucket_ranges)
             
             # Predict
             mean_cfv, q10, q90, accept = self.cfv_net_inference.predict(
@@ -265,18 +343,17 @@ class LeafEvaluator:
             
             # Record latency
             latency_ms = (time.perf_counter() - start_time) * 1000.0
-            self._cfv_net_latency_samples.append(latency_ms)
-            
-            # Keep only recent samples (for p95 calculation)
-            if len(self._cfv_net_latency_samples) > 1000:
-                self._cfv_net_latency_samples = self._cfv_net_latency_samples[-1000:]
+            self._cfv_net_latency_samples.add(latency_ms)
+            _CFV_NET_SINGLE_LATENCY.observe(latency_ms)
             
             if accept:
                 self._cfv_net_accepts += 1
+                _CFV_NET_ACCEPTED.inc()
                 logger.debug(f"CFV Net ACCEPT: mean={mean_cfv:.2f} bb, PI=[{q10:.2f}, {q90:.2f}], latency={latency_ms:.2f}ms")
                 return mean_cfv
             else:
                 self._cfv_net_rejects += 1
+                _CFV_NET_REJECTED.inc()
                 logger.debug(f"CFV Net REJECT: mean={mean_cfv:.2f} bb, PI=[{q10:.2f}, {q90:.2f}], latency={latency_ms:.2f}ms")
                 return None
         
@@ -284,6 +361,105 @@ class LeafEvaluator:
             logger.error(f"CFV Net error: {e}")
             return None
     
+    def _cfv_features(
+        self,
+        state: SubgameState,
+        hero_position: int,
+        bucket_public: Optional[int],
+        bucket_ranges: Optional[Tuple[int, ...]]
+    ) -> Tuple[np.ndarray, bool]:
+        """CFV Net feature vector of a leaf and whether hero is in position."""
+        # Convert hero_position to Position enum
+        num_players = state.active_players if hasattr(state, 'active_players') else 6
+        hero_pos_enum = Position.from_player_count_and_seat(num_players, hero_position)
+        
+        # Build range dict (placeholder - should use actual ranges)
+        ranges = {}
+        if bucket_ranges:
+            # Convert bucket_ranges to position-specific ranges
+            # Placeholder: distribute buckets across positions
+            positions = [Position.BTN, Position.SB, Position.BB, Position.UTG, Position.MP, Position.CO]
+            for i, pos in enumerate(positions[:num_players]):
+                if i < len(bucket_ranges):
+                    ranges[pos] = [(bucket_ranges[i], 1.0)]
+        
+        # Build features
+        features_obj = self.cfv_feature_builder.build_features(
+            street=state.street,
+            num_players=num_players,
+            hero_position=hero_pos_enum,
+            spr=state.spr if hasattr(state, 'spr') else 10.0,
+            pot_size=state.pot / 100.0 if hasattr(state, 'pot') else 1.0,  # Convert to bb
+            to_call=0.0,  # Placeholder
+            last_bet=state.pot * 0.5 / 100.0 if hasattr(state, 'pot') else 0.5,
+            action_set="balanced",  # Placeholder
+            public_bucket=bucket_public if bucket_public is not None else 0,
+            ranges=ranges
+        )
+        
+        return features_obj.to_vector(), hero_pos_enum.is_in_position_postflop(num_players)
+    
+    def _cfv_net_values(
+        self,
+        states: List[SubgameState],
+        hero_position: int,
+        bucket_public: Optional[int],
+        bucket_ranges: Optional[Tuple[int, ...]]
+    ) -> List[Optional[float]]:
+        """CFV Net values of many leaves with one predict_batch call.
+        
+        Features are written into a reused preallocated matrix.
+        
+        Returns:
+            Value per leaf if accepted by gating, None if rejected
+        """
+        import time
+        
+        if self.cfv_net_inference is None or self.cfv_feature_builder is None:
+            return [None] * len(states)
+        
+        try:
+            start_time = time.perf_counter()
+            
+            is_ip = np.zeros(len(states), dtype=bool)
+            for i, state in enumerate(states):
+                vector, is_ip[i] = self._cfv_features(state, hero_position, bucket_public, bucket_ranges)
+                if i == 0:
+                    features = self._batch_buffer(len(states), vector)
+                features[i] = vector
+            
+            mean_cfv, q10, q90, accept = self.cfv_net_inference.predict_batch(
+                features,
+                [state.street for state in states],
+                is_ip
+            )
+            
+            # Record latency (amortized per leaf)
+            latency_ms = (time.perf_counter() - start_time) * 1000.0 / len(states)
+            self._cfv_net_latency_samples.add(latency_ms, weight=len(states))
+            _CFV_NET_BATCH_LATENCY.observe(latency_ms * len(states))
+            
+            accepted = int(np.count_nonzero(accept))
+            self._cfv_net_accepts += accepted
+            self._cfv_net_rejects += len(states) - accepted
+            _CFV_NET_ACCEPTED.inc(accepted)
+            _CFV_NET_REJECTED.inc(len(states) - accepted)
+            logger.debug(f"CFV Net batch: {len(states)} leaves, {accepted} accepted, "
+                         f"{latency_ms:.3f}ms per leaf")
+            return [float(m) if a else None for m, a in zip(mean_cfv, accept)]
+        
+        except Exception as e:
+            logger.error(f"CFV Net batch error: {e}")
+            return [None] * len(states)
+    
+    def _batch_buffer(self, rows: int, vector: np.ndarray) -> np.ndarray:
+        """First rows of the preallocated feature matrix (grown when too small)."""
+        buffer = self._feature_buffer
+        if buffer is None or buffer.shape[0] < rows or buffer.shape[1] != len(vector) \
+                or buffer.dtype != vector.dtype:
+            buffer = self._feature_buffer = np.empty((max(rows, 64), len(vector)), dtype=vector.dtype)
+        return buffer[:rows]
+    
     def get_cfv_net_stats(self) -> Dict[str, float]:
         """Get CFV Net statistics.
         
@@ -299,11 +475,11 @@ class LeafEvaluator:
             'cfv_net_accept_rate': accept_rate
         }
         
-        if self._cfv_net_latency_samples:
-            latencies = np.array(self._cfv_net_latency_samples)
-            stats['cfv_net_latency_p50'] = np.percentile(latencies, 50)
-            stats['cfv_net_latency_p95'] = np.percentile(latencies, 95)
-            stats['cfv_net_latency_mean'] = latencies.mean()
+        if self._cfv_net_latency_samples.count:
+            stats['cfv_net_latency_p50'] = self._cfv_net_latency_samples.quantile(0.50)
+            stats['cfv_net_latency_p95'] = self._cfv_net_latency_samples.quantile(0.95)
+            stats['cfv_net_latency_p99'] = self._cfv_net_latency_samples.quantile(0.99)
+            stats['cfv_net_latency_mean'] = self._cfv_net_latency_samples.mean
         
         if self.cfv_net_inference is not None:
             cache_stats = self.cfv_net_inference.get_cache_stats()
@@ -316,63 +492,59 @@ class LeafEvaluator:
     
     def _make_cache_key(
         self,
+        state: SubgameState,
         bucket_public: int,
         bucket_ranges: Tuple[int, ...],
-        action_set_id: Optional[int],
-        street: Street
-    ) -> Tuple:
-        """Create cache key from bucket information.
+        action_set_id: Optional[int]
+    ) -> bytes:
+        """Create cache key from the leaf's public state and bucket information.
         
         Args:
+            state: Leaf state (street, board, history, pot)
             bucket_public: Public card bucket
             bucket_ranges: Range buckets (tuple of ints)
             action_set_id: Action set identifier
-            street: Current street
             
         Returns:
-            Cache key tuple
+            16-byte digest, stable across processes
         """
-        # Hash the range buckets to keep key compact
-        ranges_hash = hash(bucket_ranges)
-        return (bucket_public, ranges_hash, action_set_id, street.value)
+        return leaf_cache_key(
+            state.street, state.board, state.history, state.pot,
+            bucket_public, bucket_ranges, action_set_id
+        )
     
-    def _add_to_cache(self, key: Tuple, value: float):
-        """Add entry to cache with LRU eviction.
-        
-        Args:
-            key: Cache key
-            value: Value to cache
-        """
-        # Simple LRU: if cache is full, remove oldest entry
-        if len(self._cache) >= self.cache_max_size:
-            # Remove first entry (FIFO approximation of LRU)
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-            logger.debug(f"Cache evicted key {oldest_key[:3]}... (size={len(self._cache)})")
-        
-        self._cache[key] = value
+    @property
+    def _cache_hits(self) -> int:
+        return self._cache.hits
+    
+    @property
+    def _cache_misses(self) -> int:
+        return self._cache.misses
     
     def get_cache_stats(self) -> Dict[str, float]:
         """Get cache statistics.
         
         Returns:
-            Dictionary with cache metrics
+            Dictionary with cache metrics (hit rate, evictions, memory)
         """
-        total_accesses = self._cache_hits + self._cache_misses
-        hit_rate = self._cache_hits / total_accesses if total_accesses > 0 else 0.0
-        
-        return {
-            'cache_size': len(self._cache),
-            'cache_hits': self._cache_hits,
-            'cache_misses': self._cache_misses,
-            'cache_hit_rate': hit_rate
+        stats = self._cache.stats()
+        result = {
+            'cache_size': stats['entries'],
+            'cache_hits': stats['hits'],
+            'cache_misses': stats['misses'],
+            'cache_hit_rate': stats['hit_rate'],
+            'cache_evictions': stats['evictions'],
+            'cache_expired': stats['expired'],
+            'cache_memory_mb': stats['memory_mb']
         }
+        if 'shared_hits' in stats:
+            result['cache_shared_hits'] = stats['shared_hits']
+            result['cache_shared_memory_mb'] = stats['shared_memory_mb']
+        return result
     
     def clear_cache(self):
         """Clear the cache and reset statistics."""
         self._cache.clear()
-        self._cache_hits = 0
-        self._cache_misses = 0
         logger.info("Cache cleared")
     
     def _get_blueprint_cfv(
@@ -426,7 +598,8 @@ class LeafEvaluator:
         state: SubgameState,
         hero_hand: List[Card],
         villain_range: Dict[str, float],
-        hero_position: int
+        hero_position: int,
+        range_cdfs: Optional[Dict[Tuple, np.ndarray]] = None
     ) -> float:
         """Rollout to estimate leaf value.
         
@@ -435,136 +608,95 @@ class LeafEvaluator:
             hero_hand: Hero's cards
             villain_range: Villain's hand distribution
             hero_position: Hero's position
+            range_cdfs: Villain range CDFs by dead cards, shared across the
+                leaves of one batch
             
         Returns:
             Average value over rollouts
         """
-        total_value = 0.0
-        
-        for _ in range(self.num_rollout_samples):
-            # Sample villain hand from range
-            villain_hand = self._sample_from_range(villain_range)
-            
-            # Simulate continuation using blueprint
-            value = self._simulate_continuation(
-                state, hero_hand, villain_hand, hero_position
-            )
-            total_value += value
-        
-        avg_value = total_value / self.num_rollout_samples
-        logger.debug(
-            f"Rollout value ({self.num_rollout_samples} samples): {avg_value:.2f}"
+        # Villain combos holding hero or board cards are impossible
+        dead_cards = tuple(card_index(c) for c in list(hero_hand) + list(state.board))
+        cdf = range_cdfs.get(dead_cards) if range_cdfs is not None else None
+        if cdf is None:
+            cdf = self._range_cdf(villain_range, list(dead_cards))
+            if range_cdfs is not None:
+                range_cdfs[dead_cards] = cdf
+        
+        result = self.rollout_engine.estimate(
+            state, hero_hand, cdf, self.num_rollout_samples, target_stderr=self.rollout_target_stderr
         )
-        return avg_value
+        return result.mean
     
-    def _sample_from_range(self, hand_range: Dict[str, float]) -> List[Card]:
+    def _sample_from_range(
+        self,
+        hand_range: Dict[str, float],
+        dead_cards: Optional[List[Card]] = None
+    ) -> List[Card]:
         """Sample a hand from probability distribution.
         
         Args:
             hand_range: hand_str -> probability
+            dead_cards: Cards the hand cannot contain (hero cards, board)
             
         Returns:
             Sampled hand as list of Cards
         """
-        if not hand_range:
-            # Empty range, return random hand
-            return self._random_hand()
-        
-        hands = list(hand_range.keys())
-        probs = list(hand_range.values())
-        
-        # Normalize probabilities
-        total = sum(probs)
-        if total > 0:
-            probs = [p / total for p in probs]
-        else:
-            probs = [1.0 / len(hands)] * len(hands)
-        
-        sampled_hand_str = self.rng.choice(hands, p=probs)
-        return self._parse_hand(sampled_hand_str)
+        dead = [card_index(c) for c in dead_cards or []]
+        return self._sample_combo(self._range_cdf(hand_range, dead))
     
-    def _random_hand(self) -> List[Card]:
-        """Generate random hand."""
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
-        suits = ['h', 'd', 'c', 's']
-        
-        deck = [Card(rank, suit) for rank in ranks for suit in suits]
-        self.rng.shuffle(deck)
-        return [deck[0], deck[1]]
-    
-    def _parse_hand(self, hand_str: str) -> List[Card]:
-        """Parse hand string to Card objects.
+    def _range_cdf(self, hand_range, dead_cards: List[int]) -> np.ndarray:
+        """Cumulative weights over the 1326 combos with blocked combos removed.
         
-        Args:
-            hand_str: e.g., "AhKs" or "AA"
-            
-        Returns:
-            List of Card objects
+        Falls back to uniform over the live combos when nothing in the range
+        survives (empty range, or every hand blocked).
         """
-        # Simplified parsing - in production, handle all formats
-        if len(hand_str) == 4:
-            # "AhKs"
-            return [
-                Card(hand_str[0], hand_str[1]),
-                Card(hand_str[2], hand_str[3])
-            ]
-        elif len(hand_str) == 2:
-            # "AA" - assign random suits
-            rank = hand_str[0]
-            suits = ['h', 'd']
-            return [Card(rank, suits[0]), Card(rank, suits[1])]
-        else:
-            # Fallback to random
-            return self._random_hand()
+        weights = remove_cards(self._range_vector(hand_range), dead_cards)
+        if weights.sum() <= 0:
+            weights = combos_avoiding(dead_cards).astype(np.float64)
+        return np.cumsum(weights)
     
-    def _simulate_continuation(
-        self,
-        state: SubgameState,
-        hero_hand: List[Card],
-        villain_hand: List[Card],
-        hero_position: int
-    ) -> float:
-        """Simulate game continuation using blueprint strategy.
+    def _sample_combo(self, cdf: np.ndarray) -> List[Card]:
+        """Sample a combo with one uniform draw against cumulative weights."""
+        combo = int(np.searchsorted(cdf, self.rng.random() * cdf[-1], side='right'))
+        return combo_cards(min(combo, NUM_COMBOS - 1))
+    
+    def _range_vector(self, hand_range) -> np.ndarray:
+        """Dense 1326-combo weights of a range.
         
         Args:
-            state: Current state
-            hero_hand: Hero's cards
-            villain_hand: Villain's cards
-            hero_position: Hero's position
-            
-        Returns:
-            Simulated payoff for hero
+            hand_range: Dense vector (e.g. BeliefState.range_vector()) or
+                dict of hand strings: "AhKs" for one combo, "AA" / "AK" for
+                every combo of that rank pair (weight split evenly)
         """
-        # Simplified simulation - in production, run full game tree
-        # For now, estimate based on hand strength
-        
-        # Estimate hand strengths (placeholder)
-        hero_strength = self._estimate_strength(hero_hand, state.board)
-        villain_strength = self._estimate_strength(villain_hand, state.board)
-        
-        # Simplified payoff
-        if hero_strength > villain_strength:
-            return state.pot * 0.7  # Win most of pot (rake adjustment)
-        elif hero_strength < villain_strength:
-            return -state.pot * 0.3  # Lose
-        else:
-            return 0.0  # Chop
+        if isinstance(hand_range, np.ndarray):
+            return hand_range.astype(np.float64)
+        weights = np.zeros(NUM_COMBOS, dtype=np.float64)
+        for hand_str, prob in (hand_range or {}).items():
+            combos = self._parse_hand(hand_str)
+            if len(combos):
+                weights[combos] += prob / len(combos)
+        return weights
     
-    def _estimate_strength(self, hand: List[Card], board: List[Card]) -> float:
-        """Rough hand strength estimate.
+    def _parse_hand(self, hand_str: str) -> np.ndarray:
+        """Parse a hand string to combo indices.
         
         Args:
-            hand: Player's cards
-            board: Community cards
+            hand_str: e.g., "AhKs" (one combo) or "AA" (all combos of the ranks)
             
         Returns:
-            Strength value (0-1)
+            Combo indices (empty if the string cannot be parsed)
         """
-        # Very simplified - just use high card
-        rank_values = {
-            '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8,
-            '9': 9, 'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14
-        }
-        
-        max_rank = max(rank_values.get(c.rank, 0) for c in hand)
-        return max_rank / 14.0
+        try:
+            if len(hand_str) == 4:
+                # "AhKs"
+                combo = combo_index([Card(hand_str[0], hand_str[1]), Card(hand_str[2], hand_str[3])])
+                return np.array([combo] if combo >= 0 else [], dtype=np.int64)
+            if len(hand_str) == 2:
+                # "AA" / "AK"
+                first = RANKS.index(hand_str[0]) * 4 + np.arange(4)
+                second = RANKS.index(hand_str[1]) * 4 + np.arange(4)
+                combos = combo_indices(first[:, None], second[None, :]).ravel()
+                return np.unique(combos[combos >= 0])
+        except ValueError:
+            pass
+        return np.zeros(0, dtype=np.int64)
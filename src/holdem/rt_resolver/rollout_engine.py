@@ -0,0 +1,224 @@
+"""Vectorized rollouts for leaf evaluation.
+
+A rollout batch samples K villain combos from the (blocker-free) range CDF
+and K board runouts as index arrays, then scores all 2K seven-card hands
+with one evaluate_hands() call. Optionally each sample first plays one
+betting round with the blueprint continuation strategies of
+realtime.leaf_continuations, in lock-step: every decision is a comparison
+of K uniform draws against per-sample action probabilities.
+
+Payoffs are hero's net share of the pot (+/- pot / 2 at showdown, plus the
+called half-pot bet when there is one), so estimates are zero-sum and stay
+within [-pot, pot]. Results carry the standard error, and estimate() keeps
+drawing batches until it falls below a target.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.realtime.leaf_continuations import LeafContinuationStrategy, LeafPolicy
+from holdem.rt_resolver.subgame_builder import SubgameState
+from holdem.types import Card
+from holdem.utils.card_removal import COMBO_CARDS, NUM_CARDS, NUM_COMBOS, card_index, index_card
+from holdem.utils.hand_eval import evaluate_hands
+from holdem.utils.logging import get_logger
+
+logger = get_logger("rt_resolver.rollout_engine")
+
+# Continuation bet size as a fraction of the pot
+BET_FRACTION = 0.5
+
+
+@dataclass
+class RolloutResult:
+    """Monte Carlo leaf value estimate."""
+    mean: float
+    stderr: float
+    num_samples: int
+
+
+class _Moments:
+    """Running sum and sum of squares of payoffs."""
+
+    def __init__(self):
+        self.n = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def add(self, payoffs: np.ndarray):
+        self.n += len(payoffs)
+        self.total += float(payoffs.sum())
+        self.total_sq += float(np.square(payoffs).sum())
+
+    def result(self) -> RolloutResult:
+        mean = self.total / self.n
+        variance = max(self.total_sq / self.n - mean * mean, 0.0)
+        stderr = float(np.sqrt(variance / (self.n - 1))) if self.n > 1 else float('inf')
+        return RolloutResult(mean=mean, stderr=stderr, num_samples=self.n)
+
+
+class RolloutEngine:
+    """Samples and scores many leaf rollouts per numpy call."""
+
+    def __init__(
+        self,
+        blueprint: Optional[PolicyStore] = None,
+        continuation_policy: Optional[LeafPolicy] = None,
+        rng: Optional[np.random.Generator] = None
+    ):
+        """Initialize rollout engine.
+
+        Args:
+            blueprint: Blueprint policy for continuation play
+            continuation_policy: Leaf policy played for one betting round
+                before showdown (None = straight to showdown)
+            rng: numpy Generator
+        """
+        self.blueprint = blueprint
+        self.continuation_policy = continuation_policy
+        self.continuation = LeafContinuationStrategy() if continuation_policy is not None else None
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def estimate(
+        self,
+        state: SubgameState,
+        hero_hand: List[Card],
+        villain_cdf: np.ndarray,
+        num_samples: int,
+        target_stderr: Optional[float] = None,
+        max_samples: Optional[int] = None
+    ) -> RolloutResult:
+        """Estimate hero's value at a leaf.
+
+        Args:
+            state: Leaf state
+            hero_hand: Hero's cards
+            villain_cdf: Cumulative villain weights over the 1326 combos, with
+                combos blocked by hero / board cards removed
+            num_samples: Rollouts per batch
+            target_stderr: Keep drawing batches until the standard error is
+                at most this (None = one batch)
+            max_samples: Cap on total rollouts when target_stderr is set
+                (default 10 batches)
+
+        Returns:
+            Mean payoff, its standard error and the number of rollouts
+        """
+        max_samples = max_samples if max_samples is not None else 10 * num_samples
+        moments = _Moments()
+        while True:
+            moments.add(self.run(state, hero_hand, villain_cdf, num_samples))
+            result = moments.result()
+            if target_stderr is None or result.stderr <= target_stderr or moments.n >= max_samples:
+                logger.debug(f"Rollouts: {result.num_samples} samples, {result.mean:.2f} +/- {result.stderr:.2f}")
+                return result
+
+    def run(
+        self,
+        state: SubgameState,
+        hero_hand: List[Card],
+        villain_cdf: np.ndarray,
+        num_samples: int
+    ) -> np.ndarray:
+        """Payoffs of num_samples rollouts from a leaf.
+
+        Returns:
+            (num_samples,) hero payoffs
+        """
+        hero_cards = np.array([card_index(c) for c in hero_hand], dtype=np.int64)
+        board_cards = np.array([card_index(c) for c in state.board], dtype=np.int64)
+
+        villain_combos = self.sample_combos(villain_cdf, num_samples)
+        villain_cards = COMBO_CARDS[villain_combos].astype(np.int64)
+        runouts = self.sample_runouts(
+            np.concatenate([hero_cards, board_cards]), villain_cards, 5 - len(board_cards)
+        )
+
+        boards = np.concatenate([np.broadcast_to(board_cards, (num_samples, len(board_cards))), runouts], axis=1)
+        hero_score = evaluate_hands(np.concatenate([np.broadcast_to(hero_cards, (num_samples, 2)), boards], axis=1))
+        villain_score = evaluate_hands(np.concatenate([villain_cards, boards], axis=1))
+        showdown = np.sign(hero_score - villain_score).astype(np.float64)
+
+        half_pot = state.pot / 2.0
+        if self.continuation is None:
+            return showdown * half_pot
+        return self._play_continuation(state, hero_hand, villain_combos, showdown, half_pot)
+
+    def sample_combos(self, cdf: np.ndarray, num_samples: int) -> np.ndarray:
+        """Combo indices drawn from cumulative weights."""
+        combos = np.searchsorted(cdf, self.rng.random(num_samples) * cdf[-1], side='right')
+        return np.minimum(combos, NUM_COMBOS - 1)
+
+    def sample_runouts(self, dead_cards: np.ndarray, villain_cards: np.ndarray, missing: int) -> np.ndarray:
+        """Board completions, one per sample, avoiding dead cards and that sample's villain cards.
+
+        Each row ranks the live deck by random keys (villain cards pushed
+        last) and takes the first `missing` cards.
+        """
+        num_samples = len(villain_cards)
+        if missing <= 0:
+            return np.zeros((num_samples, 0), dtype=np.int64)
+        live = np.ones(NUM_CARDS, dtype=bool)
+        live[dead_cards] = False
+        deck = np.flatnonzero(live)
+
+        keys = self.rng.random((num_samples, len(deck)))
+        position = np.full(NUM_CARDS, -1)
+        position[deck] = np.arange(len(deck))
+        rows = np.arange(num_samples)[:, None]
+        keys[rows, position[villain_cards]] = 2.0
+        order = np.argpartition(keys, missing - 1, axis=1)[:, :missing]
+        return deck[order]
+
+    def _play_continuation(
+        self,
+        state: SubgameState,
+        hero_hand: List[Card],
+        villain_combos: np.ndarray,
+        showdown: np.ndarray,
+        half_pot: float
+    ) -> np.ndarray:
+        """One betting round (hero first, one half-pot bet at most) before showdown.
+
+        Unopened, a player bets with the strategy's raise mass and checks
+        otherwise; facing a bet, they fold with the fold mass and call
+        otherwise (raises are capped to calls).
+        """
+        hero_fold, hero_bet = self._action_probs([hero_hand], state)[0]
+        unique, inverse = np.unique(villain_combos, return_inverse=True)
+        villain_probs = self._action_probs([[index_card(c) for c in COMBO_CARDS[u]] for u in unique], state)
+        villain_fold, villain_bet = villain_probs[inverse].T
+
+        draws = self.rng.random((3, len(villain_combos)))
+        hero_bets = draws[0] < hero_bet
+        villain_folds = hero_bets & (draws[1] < villain_fold)
+        villain_bets = ~hero_bets & (draws[1] < villain_bet)
+        hero_folds = villain_bets & (draws[2] < hero_fold)
+
+        bet = BET_FRACTION * state.pot
+        stake = half_pot + np.where(hero_bets | villain_bets, bet, 0.0)
+        payoffs = showdown * stake
+        payoffs[villain_folds] = half_pot
+        payoffs[hero_folds] = -half_pot
+        return payoffs
+
+    def _action_probs(self, hands: Sequence[List[Card]], state: SubgameState) -> np.ndarray:
+        """(fold-when-facing-a-bet, bet-when-unopened) probabilities per hand."""
+        board_str = ''.join(str(c) for c in state.board)
+        history_str = '-'.join(state.history)
+        probs = np.zeros((len(hands), 2))
+        for i, hand in enumerate(hands):
+            infoset = f"{''.join(str(c) for c in hand)}|{board_str}|{history_str}"
+            strategy = self.blueprint.get_strategy(infoset) if self.blueprint is not None else {}
+            strategy = self.continuation.get_biased_strategy(strategy, self.continuation_policy) if strategy else {}
+            mass: Dict[str, float] = {'fold': 0.0, 'call': 0.0, 'raise': 0.0}
+            for action, prob in strategy.items():
+                mass[self.continuation._categorize_action(action)] += prob
+            total = sum(mass.values())
+            if total <= 0:
+                continue  # No strategy: check / call down
+            probs[i] = (mass['fold'] / total, mass['raise'] / total)
+        return probs
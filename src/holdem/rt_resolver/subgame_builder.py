@@ -4,17 +4,56 @@ Constructs bounded subgames from the current game state by:
 - Freezing the action history
 - Restricting the action set based on mode
 - Limiting depth to current street + max_depth
+
+build_tree() lays the subgame's betting tree out once as flat arrays (action
+slots, child indices, pot / stack after each action, terminal types), so
+solvers traverse node indices instead of re-deriving actions per visit. Trees
+are relative to the root pot and cached by (street, stack-to-pot bucket,
+action set mode, depth), so one tree serves every spot in its bucket.
 """
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
 from holdem.types import Card, Street, TableState
 from holdem.abstraction.actions import AbstractAction, ActionAbstraction
 from holdem.abstraction.action_translator import ActionSetMode
+from holdem.realtime.range_solver import bet_fraction
 from holdem.utils.logging import get_logger
 
 logger = get_logger("rt_resolver.subgame_builder")
 
+# Terminal types of betting tree nodes
+NOT_TERMINAL, FOLD_TERMINAL, SHOWDOWN_TERMINAL, DEPTH_LIMIT_TERMINAL, NO_PLAYERS_TERMINAL = range(5)
+
+# Stack-to-pot ratios are bucketed to this precision (legal bet sizes change at 0.25 pot steps)
+SPR_PRECISION = 2
+# Deeper stacks than this many pots allow every size of the tree alike
+SPR_CAP = 100.0
+
+TIGHT_ACTIONS = frozenset([
+    AbstractAction.FOLD,
+    AbstractAction.CHECK_CALL,
+    AbstractAction.BET_POT,
+    AbstractAction.BET_THREE_QUARTERS_POT,
+    AbstractAction.ALL_IN
+])
+BALANCED_ACTIONS = frozenset([
+    AbstractAction.FOLD,
+    AbstractAction.CHECK_CALL,
+    AbstractAction.BET_TWO_THIRDS_POT,
+    AbstractAction.BET_POT,
+    AbstractAction.BET_OVERBET_150,
+    AbstractAction.ALL_IN
+])
+
+# (street, stack-to-pot bucket, action set mode, root depth, max depth, in position, root terminal type)
+TreeKey = Tuple[str, float, str, int, int, bool, int]
+
 
 @dataclass
 class SubgameState:
@@ -25,6 +64,52 @@ class SubgameState:
     history: List[str]
     active_players: int
     depth: int  # Depth from root (0 = current state)
+    effective_stack: float = 0.0  # Acting player's stack behind (0 = unknown)
+
+
+@dataclass
+class BettingTree:
+    """Flat betting tree of a subgame, in preorder (children after their parent).
+    
+    Node i's actions occupy slots action_offset[i]:action_offset[i + 1] of
+    slot_actions / children. Pots and stacks are in units of the root pot.
+    """
+    slot_actions: List[AbstractAction]  # (num_slots,) action of each slot
+    action_offset: np.ndarray  # (num_nodes + 1,) first slot of each node
+    children: np.ndarray  # (num_slots,) node reached by each slot
+    pot: np.ndarray  # (num_nodes,) pot at the node, after the action leading to it
+    stack: np.ndarray  # (num_nodes,) acting stack behind at the node
+    terminal: np.ndarray  # (num_nodes,) terminal type (NOT_TERMINAL for inner nodes)
+    depth: np.ndarray  # (num_nodes,) depth below the root
+    history: List[Tuple[str, ...]]  # Actions from the root to each node
+    
+    @property
+    def num_nodes(self) -> int:
+        return len(self.pot)
+    
+    def actions(self, node: int) -> List[AbstractAction]:
+        """Actions at a node, in their stable tree order."""
+        return self.slot_actions[self.action_offset[node]:self.action_offset[node + 1]]
+    
+    def child_nodes(self, node: int) -> np.ndarray:
+        return self.children[self.action_offset[node]:self.action_offset[node + 1]]
+    
+    def leaves(self) -> np.ndarray:
+        """Indices of the terminal nodes, in preorder."""
+        return np.flatnonzero(self.terminal != NOT_TERMINAL)
+    
+    def state(self, node: int, root: SubgameState) -> SubgameState:
+        """Subgame state at a node of the tree rooted at root."""
+        history = self.history[node]
+        return SubgameState(
+            street=root.street,
+            board=root.board.copy(),
+            pot=float(self.pot[node] * root.pot),
+            history=root.history + list(history),
+            active_players=root.active_players - (1 if history and history[-1] == AbstractAction.FOLD.value else 0),
+            depth=root.depth + int(self.depth[node]),
+            effective_stack=float(self.stack[node] * root.pot)
+        )
     
 
 class SubgameBuilder:
@@ -43,7 +128,8 @@ class SubgameBuilder:
         max_depth: int = 1,
         action_set_mode: ActionSetMode = ActionSetMode.BALANCED,
         begin_at_street_start: bool = True,
-        sentinel_probability: float = 0.02
+        sentinel_probability: float = 0.02,
+        tree_cache_size: int = 256
     ):
         """Initialize subgame builder.
         
@@ -52,11 +138,17 @@ class SubgameBuilder:
             action_set_mode: Action set restriction (tight/balanced/loose)
             begin_at_street_start: If True, ensure subgame starts at street beginning (no partial sequences)
             sentinel_probability: Minimum probability for sentinel actions (default 0.02 = 2%)
+            tree_cache_size: Betting trees kept by build_tree (LRU)
         """
         self.max_depth = max_depth
         self.action_set_mode = action_set_mode
         self.begin_at_street_start = begin_at_street_start
         self.sentinel_probability = sentinel_probability
+        self.tree_cache_size = tree_cache_size
+        self._trees: "OrderedDict[TreeKey, BettingTree]" = OrderedDict()
+        self._trees_lock = threading.Lock()
+        self.tree_cache_hits = 0
+        self.tree_cache_misses = 0
         logger.info(
             f"SubgameBuilder initialized: max_depth={max_depth}, mode={action_set_mode.name}, "
             f"begin_at_street_start={begin_at_street_start}, sentinel_prob={sentinel_probability}"
@@ -93,7 +185,8 @@ class SubgameBuilder:
             pot=table_state.pot,
             history=history.copy(),
             active_players=table_state.num_players,
-            depth=0
+            depth=0,
+            effective_stack=table_state.effective_stack
         )
         
         logger.debug(
@@ -182,39 +275,128 @@ class SubgameBuilder:
             in_position=in_position
         )
         
-        # Apply action set restriction based on mode
+        # Apply action set restriction based on mode (kept in the full set's order)
         if self.action_set_mode == ActionSetMode.TIGHT:
             # Keep only: fold, call, and 2-3 bet sizes
-            restricted = [a for a in actions if a in [
-                AbstractAction.FOLD,
-                AbstractAction.CHECK_CALL,
-                AbstractAction.BET_POT,
-                AbstractAction.BET_THREE_QUARTERS_POT,
-                AbstractAction.ALL_IN
-            ]]
+            restricted = [a for a in actions if a in TIGHT_ACTIONS]
             
             # Add sentinel actions (one per family: small, overbet, all-in)
             # Sentinel actions are included even in tight mode to prevent exploitation
             sentinels = self._get_sentinel_actions(actions, restricted)
             
             if restricted or sentinels:
-                actions = list(set(restricted + sentinels))
+                keep = set(restricted) | set(sentinels)
+                actions = [a for a in actions if a in keep]
         elif self.action_set_mode == ActionSetMode.BALANCED:
             # Keep: fold, call, and 3-4 bet sizes
-            restricted = [a for a in actions if a in [
-                AbstractAction.FOLD,
-                AbstractAction.CHECK_CALL,
-                AbstractAction.BET_TWO_THIRDS_POT,
-                AbstractAction.BET_POT,
-                AbstractAction.BET_OVERBET_150,
-                AbstractAction.ALL_IN
-            ]]
+            restricted = [a for a in actions if a in BALANCED_ACTIONS]
             if restricted:
                 actions = restricted
         # LOOSE mode: keep all actions
         
         return actions
     
+    def build_tree(self, root: SubgameState, stack: float, in_position: bool = True) -> BettingTree:
+        """Betting tree of the subgame below root, built once per bucket.
+        
+        The tree has the actions get_actions() and the terminals is_terminal()
+        give for the same states, with pots and stacks tracked through the
+        bets (a bet of f pot adds f x pot, all-in adds the stack).
+        
+        Args:
+            root: Subgame root
+            stack: Acting player's stack behind at the root
+            in_position: Whether the player is in position
+            
+        Returns:
+            Flat tree, relative to root (see BettingTree.state)
+        """
+        spr = stack / root.pot if root.pot > 0 else SPR_CAP
+        spr_bucket = round(min(spr, SPR_CAP), SPR_PRECISION)
+        key = (
+            root.street.name, spr_bucket, self.action_set_mode.name, root.depth,
+            self.max_depth, in_position, self._terminal_type(root)
+        )
+        with self._trees_lock:
+            tree = self._trees.get(key)
+            if tree is not None:
+                self._trees.move_to_end(key)
+                self.tree_cache_hits += 1
+                return tree
+            self.tree_cache_misses += 1
+        
+        tree = self._layout_tree(root, spr_bucket, in_position)
+        with self._trees_lock:
+            self._trees[key] = tree
+            while len(self._trees) > self.tree_cache_size:
+                self._trees.popitem(last=False)
+        logger.debug(f"Built betting tree: {tree.num_nodes} nodes, {len(tree.slot_actions)} action slots")
+        return tree
+    
+    def tree_cache_stats(self) -> Dict[str, float]:
+        """Betting tree cache hit rate."""
+        with self._trees_lock:
+            lookups = self.tree_cache_hits + self.tree_cache_misses
+            return {
+                'trees': len(self._trees),
+                'hits': self.tree_cache_hits,
+                'misses': self.tree_cache_misses,
+                'hit_rate': self.tree_cache_hits / lookups if lookups > 0 else 0.0,
+            }
+    
+    def _layout_tree(self, root: SubgameState, spr: float, in_position: bool) -> BettingTree:
+        """Preorder layout of the tree below root (root pot = 1, stack = spr)."""
+        pots: List[float] = []
+        stacks: List[float] = []
+        terminals: List[int] = []
+        depths: List[int] = []
+        histories: List[Tuple[str, ...]] = []
+        node_actions: List[List[AbstractAction]] = []
+        node_children: List[List[int]] = []
+        
+        def visit(state: SubgameState, stack: float, history: Tuple[str, ...]) -> int:
+            node = len(pots)
+            pots.append(state.pot)
+            stacks.append(stack)
+            terminals.append(self._terminal_type(state))
+            depths.append(state.depth - root.depth)
+            histories.append(history)
+            node_actions.append([])
+            node_children.append([])
+            if terminals[node] != NOT_TERMINAL:
+                return node
+            
+            for action in self.get_actions(state, stack=stack, in_position=in_position):
+                fraction = bet_fraction(action)
+                if action == AbstractAction.ALL_IN:
+                    bet = stack
+                elif fraction is not None:
+                    bet = min(fraction * state.pot, stack)
+                else:
+                    bet = 0.0
+                child = visit(self.advance_state(state, action, pot_increment=bet), stack - bet,
+                              history + (action.value,))
+                node_actions[node].append(action)
+                node_children[node].append(child)
+            return node
+        
+        visit(SubgameState(
+            street=root.street, board=[], pot=1.0, history=list(root.history),
+            active_players=root.active_players, depth=root.depth
+        ), spr, ())
+        
+        counts = [len(actions) for actions in node_actions]
+        return BettingTree(
+            slot_actions=[action for actions in node_actions for action in actions],
+            action_offset=np.concatenate([[0], np.cumsum(counts)]).astype(np.int64),
+            children=np.array([child for children in node_children for child in children], dtype=np.int64),
+            pot=np.array(pots),
+            stack=np.array(stacks),
+            terminal=np.array(terminals, dtype=np.int8),
+            depth=np.array(depths, dtype=np.int64),
+            history=histories
+        )
+    
     def _get_sentinel_actions(
         self,
         all_actions: List[AbstractAction],
@@ -275,25 +457,29 @@ class SubgameBuilder:
         Returns:
             True if state is terminal
         """
+        return self._terminal_type(state) != NOT_TERMINAL
+    
+    def _terminal_type(self, state: SubgameState) -> int:
+        """Why a state is terminal (NOT_TERMINAL if it is not)."""
         # Terminal if:
         # 1. Depth limit reached
         if state.depth >= self.max_depth:
-            return True
+            return DEPTH_LIMIT_TERMINAL
         
         # 2. History indicates fold or showdown
         if state.history:
             last_action = state.history[-1]
             if last_action == "fold":
-                return True
+                return FOLD_TERMINAL
             # Showdown detection (simplified)
             if state.street == Street.RIVER and last_action in ["check_call", "call"]:
-                return True
+                return SHOWDOWN_TERMINAL
         
         # 3. Only one active player (others folded)
         if state.active_players <= 1:
-            return True
+            return NO_PLAYERS_TERMINAL
         
-        return False
+        return NOT_TERMINAL
     
     def advance_state(
         self,
@@ -321,7 +507,8 @@ class SubgameBuilder:
             pot=state.pot + pot_increment,
             history=state.history + [action.value],
             active_players=state.active_players,
-            depth=state.depth + 1
+            depth=state.depth + 1,
+            effective_stack=max(state.effective_stack - pot_increment, 0.0)
         )
         
         # Update active players if fold
@@ -461,6 +461,24 @@ class MCCFRConfig:
     # Multiprocessing parameters
     num_workers: int = 1  # Number of parallel worker processes (1 = single process, 0 = use all CPU cores)
     batch_size: int = 100  # Number of iterations per worker batch
+    # Worker start method for ParallelMCCFRSolver:
+    # - "spawn": fresh interpreter per worker, bucketing pickled to each worker (default, cross-platform)
+    # - "fork": Linux only; workers inherit the parent's loaded bucketing copy-on-write (fast start, shared pages)
+    # - "forkserver": Linux only; workers fork from a server with the solver stack preloaded (bucketing still pickled)
+    mp_start_method: str = "spawn"
+    
+    # CPU placement (Linux): pin each worker/instance to its own core set and keep the main
+    # process (merge/IPC, or the multi-instance coordinator) on a dedicated core
+    cpu_affinity: bool = False
+    numa_spread: bool = True  # Spread pinned workers/instances round-robin across NUMA nodes (False = pack)
+    worker_blas_threads: Optional[int] = None  # Cap BLAS/OpenMP threads per worker/instance (1 avoids oversubscription)
+    
+    # Adaptive batch sizing for ParallelMCCFRSolver (batch_size is the starting size)
+    adaptive_batch_enabled: bool = False  # Resize batches to hold merge/IPC overhead near the target ratio
+    adaptive_batch_target_overhead: float = 0.1  # Target overhead / (overhead + worker compute) per batch
+    adaptive_batch_min_size: Optional[int] = None  # Smallest batch (default: num_workers)
+    adaptive_batch_max_size: int = 10000  # Largest batch (also capped at discount_interval when discounting)
+    adaptive_batch_smoothing: float = 0.3  # EMA weight of the newest batch timings
     
     # Adaptive epsilon schedule parameters
     adaptive_epsilon_enabled: bool = False  # Enable adaptive epsilon scheduling based on performance
@@ -485,6 +503,17 @@ class MCCFRConfig:
     # - "compact": Numpy-based compact storage (40-50% memory savings)
     storage_mode: str = "dense"  # Storage backend: "dense" or "compact"
     
+    # Training metrics aggregation (policy entropy / regret norm logged every tensorboard_log_interval)
+    # - "exact": cache per-infoset values, recompute only infosets touched since the last log
+    # - "sampled": estimate from a fixed-size reservoir sample of infosets (constant cost)
+    training_metrics_mode: str = "exact"
+    training_metrics_sample_size: int = 4096  # Reservoir size for "sampled" mode
+    training_metrics_background: bool = False  # Reduce metrics on a background thread (results lag one interval)
+    
+    # Per-phase profiling (deal/encode/strategy/regret_update/discount, plus dispatch/wait/merge in parallel mode)
+    # Exported to TensorBoard (Profile/*) and written to logdir/profile_report.json at the end of training
+    enable_phase_profiling: bool = False
+    
 
 @dataclass
 class SearchConfig:
@@ -495,6 +524,27 @@ class SearchConfig:
     depth_limit: int = 1  # Number of streets to look ahead
     fallback_to_blueprint: bool = True
     num_workers: int = 1  # Number of parallel worker processes for real-time solving (1 = single process)
+    cpu_affinity: bool = False  # Pin parallel resolver workers to dedicated cores, NUMA-spread (Linux)
+    worker_blas_threads: Optional[int] = None  # Cap BLAS/OpenMP threads per resolver worker
+    persistent_worker_pool: bool = True  # Keep resolver workers alive across decisions (started by SearchController)
+    
+    # Adaptive per-decision time budgets (realtime.time_budget); time_budget_ms is the base budget
+    adaptive_time_budget: bool = False  # Budget from street, pot/stack, subgame size and observed it/s; solves stop at it
+    time_budget_min_ms: float = 10.0
+    time_budget_max_ms: float = 1000.0
+    time_budget_street_factors: Dict[str, float] = field(
+        default_factory=lambda: {'preflop': 0.5, 'flop': 1.0, 'turn': 1.25, 'river': 1.5}
+    )
+    time_budget_pot_weight: float = 1.0  # Budget x (1 + weight * pot / (pot + effective stack))
+    time_bank_ms: float = 0.0  # Session time bank: unused budget is saved, slow decisions draw on it (0 = off)
+    time_bank_max_draw: float = 0.5  # Fraction of the bank one decision may draw
+    hard_time_limit_factor: float = 0.0  # Preempt a solve mid-iteration at budget x this (0 = off, e.g. 1.25)
+    time_budget_log_path: Optional[str] = None  # Append per-decision timing records (JSONL) for offline tuning
+    
+    # Anytime solves (realtime.anytime): the solve runs in the background and publishes its strategy
+    anytime_solve: bool = False  # SearchController acts at the earliest of convergence, budget or should_stop
+    anytime_publish_interval: int = 10  # Iterations between published strategy snapshots
+    anytime_convergence_tol: float = 0.0  # Act once a snapshot moves the strategy less than this (TV distance, 0 = off)
     
     # Street-based kl_weight configuration (flop/turn/river)
     kl_weight_flop: float = 0.30
@@ -522,6 +572,9 @@ class SearchConfig:
     samples_per_solve: int = 1  # DEPRECATED: Use num_future_boards_samples instead (kept for backward compatibility)
     sampling_mode: str = "uniform"  # Sampling mode: "uniform" (uniform sampling, current implementation) or "weighted" (future: equity-weighted)
     max_samples_warning_threshold: int = 100  # Warn if num_future_boards_samples exceeds this (performance concern)
+    sampling_num_workers: int = 1  # Processes solving sampled boards concurrently (1 = in-process, one after another)
+    sampling_early_stop_tol: float = 0.0  # Stop once a board moves the averaged strategy less than this (L2, 0 = off)
+    sampling_min_boards: int = 4  # Boards merged before the early stop can trigger
     
     # Leaf continuation strategies (k=4 policies at leaves)
     use_leaf_policies: bool = False  # Enable multiple leaf policies (blueprint/fold-biased/call-biased/raise-biased)
@@ -529,7 +582,36 @@ class SearchConfig:
     
     # Unsafe search from round start
     resolve_from_round_start: bool = False  # Start re-solve at beginning of current round, freeze only our actions
-    
+
+    # Range-vs-range vectorized subgame CFR (used when the subgame has a table state and hero cards)
+    # Opt-in: an iteration costs ~5 ms, so the default 80 ms budget only fits 3-12 of them;
+    # give it time_budget_ms >= 500 (~90-100 iterations) when enabling it
+    use_range_solver: bool = False  # Solve for all 1326 hands of both players at once
+    range_solver_max_raises: int = 2  # Bets/raises per street in the subgame betting tree
+    range_solver_leaf_runouts: int = 8  # Sampled runouts for depth-limit leaf showdown equity (before the river)
+
+    # Public-state keyed cache of range solver solutions (warm start across hands; needs use_range_solver)
+    solution_cache_enabled: bool = True
+    solution_cache_max_entries: int = 256
+    solution_cache_max_mb: float = 256.0
+    solution_cache_path: Optional[str] = None  # Persist across sessions (loaded at start, saved by SearchController.close)
+    solution_cache_target_exploitability: float = 0.005  # Warm-started solves stop once below this (fraction of pot)
+    solution_cache_min_improvement: float = 0.001  # ... or once exploitability improves less than this between checks
+    solution_cache_check_interval: int = 10  # Iterations between convergence checks of warm-started solves
+
+    # Within-hand carry-over: re-root the previous decision's range solve at the node reached (needs use_range_solver)
+    carry_over_solution: bool = True
+    carry_over_match_tolerance: float = 0.15  # Max relative pot / to-call mismatch to identify the opponent action
+
+    # Speculative pre-solving of the hero's next decisions while opponents act
+    speculative_presolve: bool = False  # Pre-solve likely next hero spots in a background thread
+    speculative_branches: int = 2  # Most probable opponent actions (per the blueprint) to pre-solve
+    speculative_min_prob: float = 0.05  # Skip opponent actions less likely than this
+    speculative_opponent_samples: int = 16  # Sampled opponent hands for blueprint action probabilities
+    speculative_refine_fraction: float = 0.25  # Share of min_iterations run to refine a pre-solved spot
+    speculative_match_tolerance: float = 0.15  # Max relative pot / to_call-to-pot difference for a cache hit
+    speculative_cache_size: int = 64  # Pre-solved spots kept
+
     def get_kl_weight(self, street: Street, is_oop: bool = False) -> float:
         """Get kl_weight for a specific street and position.
         
@@ -0,0 +1,246 @@
+"""CPU affinity, NUMA placement and per-core utilization helpers.
+
+Pinning relies on os.sched_setaffinity and NUMA topology is read from
+/sys/devices/system/node, so placement is only effective on Linux. Every
+helper degrades to a no-op (or a single pseudo-node) elsewhere.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from holdem.utils.logging import get_logger
+
+logger = get_logger("utils.affinity")
+
+NUMA_SYSFS_DIR = Path("/sys/devices/system/node")
+PROC_STAT_PATH = Path("/proc/stat")
+
+# Environment variables read by BLAS/OpenMP runtimes when their thread pools start
+BLAS_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def affinity_supported() -> bool:
+    """Whether the platform supports per-process CPU affinity."""
+    return hasattr(os, "sched_setaffinity") and hasattr(os, "sched_getaffinity")
+
+
+def available_cpus() -> List[int]:
+    """CPUs the current process may run on."""
+    if affinity_supported():
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def parse_cpulist(cpulist: str) -> List[int]:
+    """Parse a Linux cpulist string (e.g. "0-3,8,10-11") into CPU IDs."""
+    cpus = []
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-")
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def numa_nodes(cpus: Optional[Sequence[int]] = None) -> Dict[int, List[int]]:
+    """Map NUMA node ID to its CPUs, restricted to the given (or available) CPUs.
+
+    Args:
+        cpus: CPUs to consider (default: available_cpus())
+
+    Returns:
+        {node_id: [cpu, ...]}; a single node 0 when topology is unavailable
+    """
+    allowed = set(cpus if cpus is not None else available_cpus())
+    nodes = {}
+    try:
+        for node_dir in sorted(NUMA_SYSFS_DIR.glob("node[0-9]*")):
+            node_cpus = [cpu for cpu in parse_cpulist((node_dir / "cpulist").read_text()) if cpu in allowed]
+            if node_cpus:
+                nodes[int(node_dir.name[len("node"):])] = node_cpus
+    except (OSError, ValueError):
+        nodes = {}
+    if not nodes:
+        nodes = {0: sorted(allowed)}
+    return nodes
+
+
+def plan_cpu_sets(
+    num_workers: int,
+    reserve_main: bool = True,
+    spread_numa: bool = True,
+    cpus: Optional[Sequence[int]] = None
+) -> Tuple[List[int], List[List[int]]]:
+    """Assign CPU sets to a main (coordinator) process and its workers.
+
+    One CPU is reserved for the main process (merge/IPC work) when there
+    are more CPUs than workers. Workers are placed round-robin across NUMA
+    nodes when spread_numa is set (filling node by node otherwise), and
+    each node's CPUs are split into contiguous, non-overlapping slices
+    among the workers placed on it. With more workers than CPUs, workers
+    share CPUs.
+
+    Args:
+        num_workers: Number of worker processes
+        reserve_main: Keep a dedicated CPU for the main process
+        spread_numa: Spread workers across NUMA nodes
+        cpus: CPUs to distribute (default: available_cpus())
+
+    Returns:
+        (main_cpus, worker_cpu_sets) with one CPU list per worker
+    """
+    nodes = numa_nodes(cpus)
+    all_cpus = [cpu for node_cpus in nodes.values() for cpu in node_cpus]
+
+    main_cpus = list(all_cpus)
+    if reserve_main and len(all_cpus) > num_workers:
+        main_cpu = all_cpus[0]
+        main_cpus = [main_cpu]
+        nodes = {node: [cpu for cpu in node_cpus if cpu != main_cpu] for node, node_cpus in nodes.items()}
+        nodes = {node: node_cpus for node, node_cpus in nodes.items() if node_cpus}
+
+    node_ids = sorted(nodes)
+    if spread_numa:
+        worker_nodes = [node_ids[i % len(node_ids)] for i in range(num_workers)]
+    else:
+        # Pack workers onto as few nodes as possible (one CPU slot each)
+        slots = [node for node in node_ids for _ in nodes[node]]
+        worker_nodes = [slots[i % len(slots)] for i in range(num_workers)]
+
+    worker_cpu_sets: List[List[int]] = [[] for _ in range(num_workers)]
+    for node in node_ids:
+        placed = [i for i, worker_node in enumerate(worker_nodes) if worker_node == node]
+        node_cpus = nodes[node]
+        for slot, worker_id in enumerate(placed):
+            if len(placed) <= len(node_cpus):
+                start = slot * len(node_cpus) // len(placed)
+                end = (slot + 1) * len(node_cpus) // len(placed)
+                worker_cpu_sets[worker_id] = node_cpus[start:end]
+            else:
+                worker_cpu_sets[worker_id] = [node_cpus[slot % len(node_cpus)]]
+
+    return main_cpus, worker_cpu_sets
+
+
+def pin_current_process(cpus: Optional[Sequence[int]]) -> bool:
+    """Restrict the current process to the given CPUs.
+
+    Returns:
+        True if the affinity was applied
+    """
+    if not cpus or not affinity_supported():
+        return False
+    try:
+        os.sched_setaffinity(0, set(cpus))
+        return True
+    except OSError as e:
+        logger.warning(f"Could not set CPU affinity to {list(cpus)}: {e}")
+        return False
+
+
+def limit_blas_threads(num_threads: Optional[int]):
+    """Cap BLAS/OpenMP thread pools of the current process.
+
+    Sets the usual environment variables (effective for libraries loaded
+    afterwards) and, when threadpoolctl is installed, resizes pools of
+    libraries that are already loaded (e.g. numpy imported before a fork).
+
+    Args:
+        num_threads: Maximum threads per pool (None = leave unchanged)
+    """
+    if num_threads is None:
+        return
+    for var in BLAS_THREAD_ENV_VARS:
+        os.environ[var] = str(num_threads)
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=num_threads)
+    except ImportError:
+        pass
+
+
+@contextmanager
+def blas_thread_env(num_threads: Optional[int]):
+    """Temporarily set BLAS/OpenMP thread env vars (inherited by spawned children).
+
+    Spawned workers import numpy before any worker code runs, so the cap
+    must already be in the environment they inherit.
+    """
+    if num_threads is None:
+        yield
+        return
+    saved = {var: os.environ.get(var) for var in BLAS_THREAD_ENV_VARS}
+    try:
+        for var in BLAS_THREAD_ENV_VARS:
+            os.environ[var] = str(num_threads)
+        yield
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+class CpuUtilizationMonitor:
+    """Per-core CPU utilization from /proc/stat deltas (Linux only).
+
+    Each sample() returns the busy fraction of every core since the
+    previous call (or since construction).
+    """
+
+    def __init__(self, cpus: Optional[Sequence[int]] = None):
+        self.cpus = sorted(cpus) if cpus is not None else None
+        self._last = self._read()
+
+    @property
+    def available(self) -> bool:
+        return bool(self._last)
+
+    def _read(self) -> Dict[int, Tuple[int, int]]:
+        """Read (busy, total) jiffies per CPU."""
+        counters = {}
+        try:
+            with open(PROC_STAT_PATH) as f:
+                for line in f:
+                    if not line.startswith("cpu") or line.startswith("cpu "):
+                        continue
+                    fields = line.split()
+                    cpu = int(fields[0][3:])
+                    if self.cpus is not None and cpu not in self.cpus:
+                        continue
+                    values = [int(v) for v in fields[1:]]
+                    # idle + iowait count as not busy
+                    idle = values[3] + (values[4] if len(values) > 4 else 0)
+                    total = sum(values[:8])
+                    counters[cpu] = (total - idle, total)
+        except (OSError, ValueError, IndexError):
+            return {}
+        return counters
+
+    def sample(self) -> Dict[int, float]:
+        """Busy fraction (0-1) per core since the previous sample."""
+        current = self._read()
+        utilization = {}
+        for cpu, (busy, total) in current.items():
+            last_busy, last_total = self._last.get(cpu, (0, 0))
+            elapsed = total - last_total
+            utilization[cpu] = (busy - last_busy) / elapsed if elapsed > 0 else 0.0
+        self._last = current
+        return utilization
+
+    @staticmethod
+    def format(utilization: Dict[int, float]) -> str:
+        """Compact "cpu:pct" summary, e.g. "0:12% 1:98% 2:97%"."""
+        return " ".join(f"{cpu}:{100 * value:.0f}%" for cpu, value in sorted(utilization.items()))
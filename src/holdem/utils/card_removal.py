@@ -0,0 +1,155 @@
+"""Card-removal (blocker) structures for range arithmetic.
+
+Ranges are vectors over the 1326 two-card combos, with combo index order
+given by COMBO_CARDS and card index = rank_index * 4 + suit_index. Two
+combos can face each other only if they share no card, and a combo is only
+possible if it holds no board card. Everything here is precomputed once or
+done with per-card sums (inclusion-exclusion), never with loops over combo
+pairs:
+
+- CARD_COMBOS: per-card combo masks; combos_avoiding() for board/dead cards
+- live_cards(): cards left to deal
+- compatibility_bits(): bit-packed 1326x1326 compatibility matrix
+- compatible_reach(): opponent reach excluding the hands my cards block
+"""
+
+import itertools
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from holdem.types import Card
+from holdem.utils.deck import RANKS, SUITS
+
+NUM_CARDS = 52
+NUM_COMBOS = 1326
+
+# Combo index -> (card, card) with card = rank_index * 4 + suit_index
+COMBO_CARDS = np.array(list(itertools.combinations(range(NUM_CARDS), 2)), dtype=np.int16)
+
+# CARD_COMBOS[card] = mask of the combos holding that card
+CARD_COMBOS = np.zeros((NUM_CARDS, NUM_COMBOS), dtype=bool)
+CARD_COMBOS[COMBO_CARDS[:, 0], np.arange(NUM_COMBOS)] = True
+CARD_COMBOS[COMBO_CARDS[:, 1], np.arange(NUM_COMBOS)] = True
+
+
+def card_index(card: Card) -> int:
+    """Index (0-51) of a card."""
+    return RANKS.index(card.rank) * 4 + SUITS.index(card.suit)
+
+
+@lru_cache(maxsize=None)
+def _combo_lookup() -> np.ndarray:
+    lookup = np.full((NUM_CARDS, NUM_CARDS), -1, dtype=np.int32)
+    lookup[COMBO_CARDS[:, 0], COMBO_CARDS[:, 1]] = np.arange(NUM_COMBOS)
+    lookup[COMBO_CARDS[:, 1], COMBO_CARDS[:, 0]] = np.arange(NUM_COMBOS)
+    return lookup
+
+
+def index_card(card: int) -> Card:
+    """Card with the given index (inverse of card_index)."""
+    return Card(RANKS[card // 4], SUITS[card % 4])
+
+
+def live_cards(dead_cards: Sequence[int] = (), ranks: Optional[Sequence[str]] = None) -> np.ndarray:
+    """Indices of the cards not dead (optionally restricted to some ranks), for dealing."""
+    live = np.ones(NUM_CARDS, dtype=bool)
+    live[list(dead_cards)] = False
+    if ranks is not None:
+        allowed = np.zeros(NUM_CARDS, dtype=bool)
+        for rank in ranks:
+            allowed[RANKS.index(rank) * 4:RANKS.index(rank) * 4 + 4] = True
+        live &= allowed
+    return np.flatnonzero(live)
+
+
+def combo_index(cards: Sequence[Card]) -> int:
+    """Index (0-1325) of a two-card hand."""
+    return int(_combo_lookup()[card_index(cards[0]), card_index(cards[1])])
+
+
+def combo_indices(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Combo indices of card index pairs (vectorized; -1 where the cards are equal)."""
+    return _combo_lookup()[first, second]
+
+
+def combo_cards(combo: int) -> List[Card]:
+    """The two cards of a combo."""
+    return [index_card(c) for c in COMBO_CARDS[combo]]
+
+
+def combos_avoiding(dead_cards: Sequence[int]) -> np.ndarray:
+    """Boolean mask of combos that contain none of the given card indices."""
+    dead_cards = list(dead_cards)
+    if not dead_cards:
+        return np.ones(NUM_COMBOS, dtype=bool)
+    return ~CARD_COMBOS[dead_cards].any(axis=0)
+
+
+def remove_cards(reach: np.ndarray, dead_cards: Sequence[int]) -> np.ndarray:
+    """Reach (1326 combos, optionally x columns) with combos holding dead cards zeroed."""
+    mask = combos_avoiding(dead_cards)
+    return reach * (mask[:, None] if reach.ndim == 2 else mask)
+
+
+def card_onehot(combos: Optional[np.ndarray] = None, dtype=np.float32) -> np.ndarray:
+    """Combo x card incidence matrix (rows: the given combos, default all 1326)."""
+    cards = COMBO_CARDS if combos is None else COMBO_CARDS[combos]
+    onehot = np.zeros((len(cards), NUM_CARDS), dtype=dtype)
+    rows = np.arange(len(cards))
+    onehot[rows, cards[:, 0]] = 1
+    onehot[rows, cards[:, 1]] = 1
+    return onehot
+
+
+@lru_cache(maxsize=None)
+def compatibility_bits() -> np.ndarray:
+    """Bit-packed 1326x1326 matrix: bit (i, j) set if combos i and j share no card."""
+    onehot = _full_onehot()
+    bits = np.packbits((onehot @ onehot.T) == 0, axis=1)
+    bits.flags.writeable = False
+    return bits
+
+
+@lru_cache(maxsize=None)
+def _dense_compatibility() -> np.ndarray:
+    dense = np.unpackbits(compatibility_bits(), axis=1, count=NUM_COMBOS).astype(bool)
+    dense.flags.writeable = False
+    return dense
+
+
+def compatible_matrix(combos: Optional[np.ndarray] = None) -> np.ndarray:
+    """Dense boolean compatibility matrix between the given combos (default all 1326)."""
+    dense = _dense_compatibility()
+    return dense.copy() if combos is None else dense[combos][:, combos]
+
+
+def compatible_reach(reach: np.ndarray, onehot: Optional[np.ndarray] = None) -> np.ndarray:
+    """Opponent reach excluding the combos each of my combos blocks.
+
+    out[i] = sum of reach[j] over combos j sharing no card with combo i,
+    by inclusion-exclusion over per-card sums (O(combos x 52)).
+
+    Args:
+        reach: Opponent reach per combo, shape (n,) or (n, columns)
+        onehot: card_onehot() of the n combos (default: all 1326)
+    """
+    onehot = _onehot_for(reach, onehot)
+    card_sums = onehot.T @ reach
+    return reach.sum(axis=0) - onehot @ card_sums + reach
+
+
+def _onehot_for(reach: np.ndarray, onehot: Optional[np.ndarray]) -> np.ndarray:
+    if onehot is not None:
+        return onehot
+    if reach.shape[0] != NUM_COMBOS:
+        raise ValueError(f"Reach over {reach.shape[0]} combos needs their card_onehot()")
+    return _full_onehot()
+
+
+@lru_cache(maxsize=None)
+def _full_onehot() -> np.ndarray:
+    onehot = card_onehot()
+    onehot.flags.writeable = False
+    return onehot
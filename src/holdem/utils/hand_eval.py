@@ -0,0 +1,125 @@
+"""Vectorized poker hand evaluation on card index arrays.
+
+Hands are rows of card indices (card = rank_index * 4 + suit_index, as in
+card_removal), 5 to 7 cards each. evaluate_hands() scores all rows at once
+with numpy: rank and suit counts, a 13-bit rank mask for straights, and a
+(count, rank) sort for pairs / trips / quads. Scores compare like eval7's
+(higher is better, equal scores chop), but the values themselves differ.
+
+Score = category * 13**5 + five base-13 tiebreak digits.
+"""
+
+import numpy as np
+
+NUM_RANKS = 13
+
+HIGH_CARD, PAIR, TWO_PAIR, TRIPS, STRAIGHT, FLUSH, FULL_HOUSE, QUADS, STRAIGHT_FLUSH = range(9)
+
+_DIGITS = NUM_RANKS ** np.arange(4, -1, -1, dtype=np.int64)
+_CATEGORY = NUM_RANKS ** 5
+
+# Five-rank windows over a 14-bit mask whose bit 0 is the ace played low;
+# window w has its high card at rank index w + 3 (w = 0 is the wheel)
+_STRAIGHT_MASKS = np.array([0b11111 << w for w in range(10)], dtype=np.int64)
+_RANK_BITS = 1 << np.arange(NUM_RANKS, dtype=np.int64)
+
+# Tiebreak digits that count per category (the rest are cards outside the best five)
+_NUM_DIGITS = np.array([5, 4, 3, 3, 1, 5, 2, 2, 1])
+
+
+def _straight_high(present: np.ndarray) -> np.ndarray:
+    """Rank index of the highest straight per row (-1 if none), from a (N, 13) rank mask."""
+    bits = present.astype(np.int64) @ _RANK_BITS
+    bits = (bits << 1) | (bits >> (NUM_RANKS - 1) & 1)
+    hits = (bits[:, None] & _STRAIGHT_MASKS) == _STRAIGHT_MASKS
+    window = NUM_RANKS - 4 - np.argmax(hits[:, ::-1], axis=1)
+    return np.where(hits.any(axis=1), window + 3, -1)
+
+
+def _top_ranks(present: np.ndarray, count: int) -> np.ndarray:
+    """The `count` highest present ranks per row, descending (-1 padding)."""
+    ordered = np.where(present, np.arange(NUM_RANKS), -1)
+    return -np.sort(-ordered, axis=1)[:, :count]
+
+
+def evaluate_hands(cards: np.ndarray) -> np.ndarray:
+    """Strength of each hand.
+
+    Args:
+        cards: (N, k) card indices with 5 <= k <= 7, no repeated card in a row
+
+    Returns:
+        (N,) int64 scores; higher wins, equal scores tie
+    """
+    cards = np.asarray(cards, dtype=np.int64)
+    if cards.ndim == 1:
+        cards = cards[None, :]
+    n = cards.shape[0]
+    ranks = cards // 4
+    suits = cards % 4
+
+    rank_onehot = ranks[:, :, None] == np.arange(NUM_RANKS)
+    counts = rank_onehot.sum(axis=1)
+    present = counts > 0
+
+    # Rank groups ordered by (count, rank), largest first
+    groups = -np.sort(-(counts * 16 + np.arange(NUM_RANKS)), axis=1)
+    group_count = groups // 16
+    group_rank = np.where(group_count > 0, groups % 16, 0)
+    first, second = group_count[:, 0], group_count[:, 1]
+
+    category = np.full(n, HIGH_CARD, dtype=np.int64)
+    digits = np.zeros((n, 5), dtype=np.int64)
+
+    # High card, pair, trips: groups in order are exactly the tiebreaks
+    digits[:] = group_rank[:, :5]
+    category[first == 2] = PAIR
+    category[first == 3] = TRIPS
+
+    # Two pair / quads: best remaining card is the kicker, whatever its group
+    for cat, mask, used in (
+        (TWO_PAIR, (first == 2) & (second == 2), 2),
+        (QUADS, first == 4, 1),
+    ):
+        if mask.any():
+            rest = present[mask].copy()
+            rows = np.arange(mask.sum())
+            for g in range(used):
+                rest[rows, group_rank[mask, g]] = False
+            kicker = _top_ranks(rest, 1)[:, 0]
+            digits[mask] = 0
+            digits[mask, :used] = group_rank[mask, :used]
+            digits[mask, used] = np.maximum(kicker, 0)
+            category[mask] = cat
+
+    full_house = (first == 3) & (second >= 2)
+    digits[full_house] = 0
+    digits[full_house, :2] = group_rank[full_house, :2]
+    category[full_house] = FULL_HOUSE
+
+    straight = _straight_high(present)
+    is_straight = (straight >= 0) & (category < STRAIGHT)
+    digits[is_straight] = 0
+    digits[is_straight, 0] = straight[is_straight]
+    category[is_straight] = STRAIGHT
+
+    suit_counts = (suits[:, :, None] == np.arange(4)).sum(axis=1)
+    flush_suit = np.argmax(suit_counts, axis=1)
+    is_flush = suit_counts[np.arange(n), flush_suit] >= 5
+    if is_flush.any():
+        in_suit = suits[is_flush] == flush_suit[is_flush, None]
+        flush_present = (rank_onehot[is_flush] & in_suit[:, :, None]).any(axis=1)
+        flush_straight = _straight_high(flush_present)
+        flush_digits = _top_ranks(flush_present, 5)
+        flush_category = np.full(len(flush_digits), FLUSH, dtype=np.int64)
+        flush_category[flush_straight >= 0] = STRAIGHT_FLUSH
+        flush_digits[flush_straight >= 0] = 0
+        flush_digits[flush_straight >= 0, 0] = flush_straight[flush_straight >= 0]
+
+        rows = np.flatnonzero(is_flush)
+        better = flush_category > category[rows]
+        category[rows[better]] = flush_category[better]
+        digits[rows[better]] = flush_digits[better]
+
+    digits[np.arange(5) >= _NUM_DIGITS[category][:, None]] = 0
+    return category * _CATEGORY + np.maximum(digits, 0) @ _DIGITS
@@ -13,6 +13,7 @@ from typing import Dict, List, Optional
 import numpy as np
 from collections import defaultdict
 from holdem.utils.logging import get_logger
+from holdem.utils.metrics_registry import get_metrics_registry
 
 logger = get_logger("metrics")
 
@@ -260,6 +261,8 @@ def get_metrics_tracker() -> MetricsTracker:
     global _global_tracker
     if _global_tracker is None:
         _global_tracker = MetricsTracker()
+        # Exported as holdem_rt_decision_time_ms, holdem_translator_illegal_after_roundtrip, ...
+        get_metrics_registry().register_collector("holdem", _global_tracker.get_metrics)
     return _global_tracker
 
 
@@ -0,0 +1,492 @@
+"""Process-wide metrics registry with Prometheus text export.
+
+One registry (get_metrics_registry()) holds counters, gauges and histograms
+for every subsystem and renders them in the Prometheus text exposition
+format, for a textfile collector (write_textfile) or a local HTTP endpoint
+(start_metrics_server).
+
+Recording is meant for hot paths: counters and histograms write to a
+per-thread cell (no lock after a thread's first update; the cells are summed
+at scrape time) and histograms use fixed buckets, so an update is a bisect
+and two list increments. Resolve labelled children once with labels() and
+keep them; labels() itself costs a dict lookup.
+
+Subsystems that already keep their own stats dicts register a collector
+instead, called only at scrape time: a dict (nested dicts flattened, numeric
+values exported as gauges) or pre-rendered exposition text. Bound methods are
+held weakly, so registering an object's stats does not keep it alive.
+"""
+
+import bisect
+import http.server
+import math
+import os
+import re
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from holdem.utils.logging import get_logger
+
+logger = get_logger("utils.metrics_registry")
+
+# Upper bounds (ms) of the default latency histogram buckets
+DEFAULT_LATENCY_BUCKETS_MS = (
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0
+)
+
+# Port of the local scrape endpoint
+DEFAULT_METRICS_PORT = 9108
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+
+Collector = Callable[[], Union[Dict[str, Any], str]]
+
+
+def sanitize_metric_name(name: str) -> str:
+    """Map an arbitrary key (e.g. 'rt/decision_time_ms') to a valid metric name."""
+    name = _INVALID_NAME_CHARS.sub("_", name)
+    if name and name[0].isdigit():
+        name = "_" + name
+    return name
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (k, str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')) for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+class _CellOwner:
+    """Kept in one thread's thread-local storage: collected when the thread exits."""
+    __slots__ = ('__weakref__',)
+
+
+class _ThreadCells:
+    """Per-thread accumulator vectors, summed on read.
+
+    A thread's cell is folded into a base total when the thread exits, so
+    short-lived threads do not accumulate cells.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._base = [0.0] * size
+        self._cells: List[List[float]] = []
+        self._lock = threading.Lock()
+
+    def cell(self) -> List[float]:
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = [0.0] * self._size
+            owner = _CellOwner()
+            with self._lock:
+                self._cells.append(cell)
+            weakref.finalize(owner, self._retire, cell)
+            self._local.owner = owner
+            self._local.cell = cell
+            return cell
+
+    def _retire(self, cell: List[float]):
+        """Fold an exited thread's cell into the base total."""
+        with self._lock:
+            for i, value in enumerate(cell):
+                self._base[i] += value
+            self._cells = [c for c in self._cells if c is not cell]
+
+    def totals(self) -> List[float]:
+        with self._lock:
+            cells = list(self._cells)
+            totals = list(self._base)
+        for cell in cells:
+            for i, value in enumerate(cell):
+                totals[i] += value
+        return totals
+
+    def reset(self):
+        with self._lock:
+            self._base = [0.0] * self._size
+            for cell in self._cells:
+                for i in range(self._size):
+                    cell[i] = 0.0
+
+
+class CounterChild:
+    """Monotonic counter (one label combination)."""
+
+    def __init__(self):
+        self._cells = _ThreadCells(1)
+
+    def inc(self, amount: float = 1.0):
+        self._cells.cell()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._cells.totals()[0]
+
+    def _samples(self, name: str, labels):
+        yield name + "_total", labels, self.value
+
+    def _reset(self):
+        self._cells.reset()
+
+
+class GaugeChild:
+    """Value that goes up and down (one label combination)."""
+
+    def __init__(self):
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]):
+        """Read the value from function() at scrape time instead."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._value
+
+    def _samples(self, name: str, labels):
+        yield name, labels, self.value
+
+    def _reset(self):
+        self._value = 0.0
+
+
+class HistogramChild:
+    """Fixed-bucket histogram (one label combination)."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self._bounds = list(buckets)
+        # One count per bucket, then +Inf, then the sum
+        self._cells = _ThreadCells(len(self._bounds) + 2)
+
+    def observe(self, value: float):
+        cell = self._cells.cell()
+        cell[bisect.bisect_left(self._bounds, value)] += 1
+        cell[-1] += value
+
+    @property
+    def count(self) -> float:
+        return sum(self._cells.totals()[:-1])
+
+    @property
+    def sum(self) -> float:
+        return self._cells.totals()[-1]
+
+    def bucket_counts(self) -> List[Tuple[float, float]]:
+        """Cumulative (upper bound, count) pairs, ending with +Inf."""
+        totals = self._cells.totals()
+        cumulative = 0.0
+        counts = []
+        for bound, count in zip(self._bounds + [math.inf], totals[:-1]):
+            cumulative += count
+            counts.append((bound, cumulative))
+        return counts
+
+    def _samples(self, name: str, labels):
+        totals = self._cells.totals()
+        cumulative = 0.0
+        for bound, count in zip(self._bounds + [math.inf], totals[:-1]):
+            cumulative += count
+            yield name + "_bucket", labels + (("le", _format_value(bound)),), cumulative
+        yield name + "_count", labels, cumulative
+        yield name + "_sum", labels, totals[-1]
+
+    def _reset(self):
+        self._cells.reset()
+
+
+class Metric:
+    """A named metric family; its children are its label combinations."""
+
+    def __init__(self, kind: str, name: str, documentation: str, labelnames: Sequence[str], factory):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self._children[()] = factory()
+
+    def labels(self, *values, **kwargs):
+        """Child for one label combination (created on first use)."""
+        if kwargs:
+            values = tuple(str(kwargs[label]) for label in self.labelnames)
+        else:
+            values = tuple(str(v) for v in values)
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._factory())
+        return child
+
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}: use labels() first")
+        return self._default
+
+    # Shortcuts for metrics without labels
+
+    def inc(self, amount: float = 1.0):
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._unlabelled().dec(amount)
+
+    def set(self, value: float):
+        self._unlabelled().set(value)
+
+    def set_function(self, function: Callable[[], float]):
+        self._unlabelled().set_function(function)
+
+    def observe(self, value: float):
+        self._unlabelled().observe(value)
+
+    @property
+    def value(self) -> float:
+        return self._unlabelled().value
+
+    def samples(self) -> Iterable[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        with self._lock:
+            children = list(self._children.items())
+        for values, child in children:
+            yield from child._samples(self.name, tuple(zip(self.labelnames, values)))
+
+    def reset(self):
+        with self._lock:
+            for child in self._children.values():
+                child._reset()
+
+
+class MetricsRegistry:
+    """Named metrics and scrape-time collectors, rendered as Prometheus text."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: Dict[str, Callable[[], Optional[Collector]]] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, kind: str, name: str, documentation: str, labelnames: Sequence[str], factory) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Metric(kind, name, documentation, labelnames, factory)
+                self._metrics[name] = metric
+            elif metric.kind != kind or metric.labelnames != tuple(labelnames):
+                raise ValueError(
+                    f"Metric {name} already registered as {metric.kind} with labels {metric.labelnames}"
+                )
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Metric:
+        """Get or create a counter (exported as <name>_total)."""
+        return self._get_or_create("counter", name, documentation, labelnames, CounterChild)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Metric:
+        """Get or create a gauge."""
+        return self._get_or_create("gauge", name, documentation, labelnames, GaugeChild)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS
+    ) -> Metric:
+        """Get or create a histogram with fixed bucket upper bounds."""
+        bounds = sorted(float(b) for b in buckets if not math.isinf(b))
+        return self._get_or_create("histogram", name, documentation, labelnames, lambda: HistogramChild(bounds))
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def register_collector(self, name: str, collect: Collector):
+        """Export a stats source at scrape time (replaces any collector with the same name).
+
+        Args:
+            name: Collector name; prefix of the gauges exported from a dict
+            collect: Returns a stats dict or pre-rendered exposition text;
+                held weakly if it is a bound method
+        """
+        if hasattr(collect, "__self__") and hasattr(collect, "__func__"):
+            ref = weakref.WeakMethod(collect)
+        else:
+            ref = lambda: collect  # noqa: E731
+        with self._lock:
+            self._collectors[name] = ref
+
+    def unregister_collector(self, name: str):
+        with self._lock:
+            self._collectors.pop(name, None)
+
+    def reset(self):
+        """Zero every metric (registrations and collectors are kept)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def render(self) -> str:
+        """All metrics and collectors in Prometheus text format."""
+        lines = []
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+            collectors = sorted(self._collectors.items())
+
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+
+        dead = []
+        for name, ref in collectors:
+            collect = ref()
+            if collect is None:
+                dead.append((name, ref))
+                continue
+            try:
+                stats = collect()
+            except Exception as e:
+                logger.warning(f"Metrics collector {name} failed: {e}")
+                continue
+            if isinstance(stats, str):
+                lines.extend(line for line in stats.splitlines() if line)
+            else:
+                for key, value in sorted(self._flatten(stats, sanitize_metric_name(name)).items()):
+                    lines.append(f"# TYPE {key} gauge")
+                    lines.append(f"{key} {_format_value(value)}")
+
+        if dead:
+            with self._lock:
+                for name, ref in dead:
+                    if self._collectors.get(name) is ref:
+                        del self._collectors[name]
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _flatten(stats: Dict[str, Any], prefix: str) -> Dict[str, float]:
+        flat = {}
+        for key, value in stats.items():
+            name = sanitize_metric_name(f"{prefix}_{key}")
+            if isinstance(value, dict):
+                flat.update(MetricsRegistry._flatten(value, name))
+            elif isinstance(value, (int, float)):
+                flat[name] = float(value)
+            elif hasattr(value, "item") and getattr(value, "ndim", 1) == 0:  # numpy scalar
+                flat[name] = float(value.item())
+        return flat
+
+    def write_textfile(self, path: str):
+        """Atomically write the rendered metrics (e.g. for node_exporter's textfile collector)."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    registry: MetricsRegistry = _registry
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood the log
+
+
+_server: Optional[http.server.ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(
+    port: int = DEFAULT_METRICS_PORT,
+    host: str = "127.0.0.1",
+    registry: Optional[MetricsRegistry] = None
+) -> int:
+    """Serve the registry at http://host:port/metrics from a daemon thread (no-op if running).
+
+    Args:
+        port: Port to listen on (0 = any free port)
+        host: Interface to bind (local only by default)
+        registry: Registry to serve (default: the process-wide one)
+
+    Returns:
+        The port actually bound
+    """
+    global _server
+    with _server_lock:
+        if _server is not None:
+            return _server.server_address[1]
+        handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry or _registry})
+        _server = http.server.ThreadingHTTPServer((host, port), handler)
+        _server.daemon_threads = True
+        thread = threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True)
+        thread.start()
+        bound = _server.server_address[1]
+    logger.info(f"Serving metrics on http://{host}:{bound}/metrics")
+    return bound
+
+
+def stop_metrics_server():
+    """Stop the metrics endpoint (no-op if not running)."""
+    global _server
+    with _server_lock:
+        server, _server = _server, None
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+
+def metrics_server_running() -> bool:
+    return _server is not None
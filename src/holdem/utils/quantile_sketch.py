@@ -0,0 +1,178 @@
+"""Streaming quantile sketch with relative accuracy (DDSketch-style).
+
+Values are counted in logarithmic buckets: bucket k holds values in
+(gamma**(k-1), gamma**k] with gamma = (1 + alpha) / (1 - alpha), so any
+quantile is returned within a relative error alpha of the exact one. Adding a
+value is one log and one dict update; memory is bounded by max_bins per sign
+(when exceeded, the lowest buckets are folded together, which only costs
+accuracy at the low quantiles). Sketches with the same accuracy merge by
+adding bucket counts, e.g. per-worker sketches into a session total.
+
+Count, sum, min and max are exact; quantiles are clamped to [min, max].
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+# Values closer to zero than this are counted as zero
+MIN_INDEXABLE = 1e-9
+
+
+class QuantileSketch:
+    """Constant-memory, mergeable quantile estimates of a stream of values."""
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        """Create an empty sketch.
+
+        Args:
+            relative_accuracy: Relative error bound of quantile estimates (0 < alpha < 1)
+            max_bins: Buckets kept per sign
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}  # Keyed by the bucket of -value
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        """Representative value of a bucket (relative error <= alpha for its whole range)."""
+        return 2.0 * self._gamma ** key / (self._gamma + 1.0)
+
+    def add(self, value: float, weight: int = 1):
+        """Add a value (weight times)."""
+        value = float(value)
+        if value > MIN_INDEXABLE:
+            self._add_to(self._positive, self._key(value), weight)
+        elif value < -MIN_INDEXABLE:
+            self._add_to(self._negative, self._key(-value), weight)
+        else:
+            self.zero_count += weight
+        self.count += weight
+        self.sum += value * weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def extend(self, values: Iterable[float]):
+        """Add every value of an iterable."""
+        for value in values:
+            self.add(value)
+
+    def _add_to(self, bins: Dict[int, int], key: int, weight: int):
+        if key in bins:
+            bins[key] += weight
+            return
+        bins[key] = weight
+        if len(bins) > self.max_bins:
+            # Fold the lowest bucket into the next one
+            lowest = min(bins)
+            count = bins.pop(lowest)
+            next_lowest = min(bins)
+            bins[next_lowest] += count
+
+    def merge(self, other: "QuantileSketch"):
+        """Add another sketch's values to this one.
+
+        Raises:
+            ValueError: If the sketches have different accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracies")
+        for key, count in other._positive.items():
+            self._add_to(self._positive, key, count)
+        for key, count in other._negative.items():
+            self._add_to(self._negative, key, count)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def reset(self):
+        """Forget all values."""
+        self._positive.clear()
+        self._negative.clear()
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated q-quantile (0 <= q <= 1), None if empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        estimate = None
+        for key in sorted(self._negative, reverse=True):  # Most negative first
+            seen += self._negative[key]
+            if seen > rank:
+                estimate = -self._value(key)
+                break
+        if estimate is None:
+            seen += self.zero_count
+            if seen > rank:
+                estimate = 0.0
+        if estimate is None:
+            for key in sorted(self._positive):
+                seen += self._positive[key]
+                if seen > rank:
+                    estimate = self._value(key)
+                    break
+        if estimate is None:
+            estimate = self.max
+        return min(max(estimate, self.min), self.max)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Estimated p-th percentile (0 <= p <= 100), None if empty."""
+        return self.quantile(p / 100.0)
+
+    def fraction_above(self, threshold: float) -> float:
+        """Estimated fraction of values above a threshold (0.0 if empty)."""
+        if self.count == 0:
+            return 0.0
+        if threshold >= self.max:
+            return 0.0
+        if threshold < self.min:
+            return 1.0
+        above = 0
+        if threshold > MIN_INDEXABLE:
+            key = self._key(threshold)
+            above = sum(count for k, count in self._positive.items() if k > key)
+        elif threshold < -MIN_INDEXABLE:
+            key = self._key(-threshold)
+            above = sum(self._positive.values()) + self.zero_count
+            above += sum(count for k, count in self._negative.items() if k < key)
+        else:
+            above = sum(self._positive.values())
+        return above / self.count
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Count, mean and p50 / p90 / p99."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'p50': self.quantile(0.50),
+            'p90': self.quantile(0.90),
+            'p99': self.quantile(0.99),
+        }
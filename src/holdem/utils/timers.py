@@ -1,7 +1,7 @@
 """Timing utilities."""
 
 import time
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from contextlib import contextmanager
 
 
@@ -87,3 +87,112 @@ _timer_registry = TimerRegistry()
 def get_timer_registry() -> TimerRegistry:
     """Get global timer registry."""
     return _timer_registry
+
+
+class _NullPhase:
+    """No-op context manager returned by a disabled PhaseProfiler."""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """Reusable context manager accumulating into a PhaseProfiler slot."""
+    
+    __slots__ = ('profiler', 'name', 'start_time')
+    
+    def __init__(self, profiler: 'PhaseProfiler', name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start_time = 0.0
+    
+    def __enter__(self):
+        self.start_time = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.add(self.name, time.perf_counter() - self.start_time)
+        return False
+
+
+class PhaseProfiler:
+    """Low-overhead accumulating timers for named phases of a hot loop.
+    
+    Unlike Timer, which keeps only the last elapsed time, PhaseProfiler
+    accumulates total seconds and call counts per phase. When disabled,
+    phase() returns a shared no-op context manager so instrumented code
+    pays only an attribute lookup and a with-statement.
+    
+    Phases of the same name must not be nested.
+    """
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.totals: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self._phases: Dict[str, _Phase] = {}
+    
+    def phase(self, name: str):
+        """Context manager timing one occurrence of a phase."""
+        if not self.enabled:
+            return _NULL_PHASE
+        ctx = self._phases.get(name)
+        if ctx is None:
+            ctx = _Phase(self, name)
+            self._phases[name] = ctx
+        return ctx
+    
+    def add(self, name: str, seconds: float, count: int = 1):
+        """Record elapsed seconds for a phase."""
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + count
+    
+    def snapshot(self) -> Dict[str, Tuple[float, int]]:
+        """Get {phase: (total_seconds, count)} (picklable, for IPC)."""
+        return {name: (total, self.counts[name]) for name, total in self.totals.items()}
+    
+    def merge(self, snapshot: Dict[str, Tuple[float, int]], prefix: str = ""):
+        """Accumulate a snapshot from another profiler (e.g. a worker process)."""
+        for name, (total, count) in snapshot.items():
+            self.add(prefix + name, total, count)
+    
+    def reset(self):
+        """Clear all accumulated phase times."""
+        self.totals.clear()
+        self.counts.clear()
+    
+    def report(self, iterations: int = 0, wall_seconds: float = 0.0) -> Dict:
+        """Build a JSON-serializable per-phase breakdown.
+        
+        Args:
+            iterations: Iterations covered by the accumulated times (for per-iteration cost)
+            wall_seconds: Wall-clock duration (for the fraction of time spent per phase)
+        
+        Returns:
+            Dictionary with iterations, wall_seconds and a 'phases' mapping of
+            total_seconds, count, mean_us, us_per_iteration and fraction per phase
+        """
+        phases = {}
+        for name in sorted(self.totals):
+            total = self.totals[name]
+            count = self.counts[name]
+            phases[name] = {
+                'total_seconds': total,
+                'count': count,
+                'mean_us': total / count * 1e6 if count else 0.0,
+                'us_per_iteration': total / iterations * 1e6 if iterations else 0.0,
+                'fraction': total / wall_seconds if wall_seconds > 0 else 0.0,
+            }
+        return {
+            'iterations': iterations,
+            'wall_seconds': wall_seconds,
+            'phases': phases,
+        }
@@ -5,9 +5,10 @@ replacing rollouts while maintaining EV and fitting within 80-110ms budget.
 
 Main components:
 - features.py: Feature construction and normalization
-- dataset.py: Dataset reader/writer with .jsonl.zst sharding
+- dataset.py: Dataset reader/writer with .jsonl.zst sharding, memory-mapped columnar format
 - cfv_net.py: PyTorch model definition and training utilities
 - infer.py: ONNX inference with gating and caching
+- quantize.py: INT8 quantization and FP32/INT8 comparison (needs onnx)
 """
 
 from holdem.value_net.features import (
@@ -20,6 +21,10 @@ from holdem.value_net.features import (
 from holdem.value_net.dataset import (
     CFVDatasetWriter,
     CFVDatasetReader,
+    CFVColumnarWriter,
+    CFVColumnarDataset,
+    convert_to_columnar,
+    is_columnar_dataset,
     split_dataset
 )
 from holdem.value_net.cfv_net import (
@@ -45,6 +50,10 @@ __all__ = [
     # Dataset
     'CFVDatasetWriter',
     'CFVDatasetReader',
+    'CFVColumnarWriter',
+    'CFVColumnarDataset',
+    'convert_to_columnar',
+    'is_columnar_dataset',
     'split_dataset',
     # Model
     'CFVNet',
@@ -2,17 +2,25 @@
 
 Handles .jsonl.zst sharded format with 100k examples per shard.
 Supports atomic writes and efficient streaming reads.
+
+For training, shards can be converted once (convert_to_columnar) to a
+columnar binary format: per shard, one .npy file per fixed-width column
+plus the precomputed float32 feature matrix and targets, listed in a small
+index.json. CFVColumnarDataset memory-maps these files, so epochs skip zstd
+decompression, JSON parsing and feature construction.
 """
 
 import json
 import os
 import zstandard as zstd
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 import tempfile
 import shutil
 import numpy as np
 
+from holdem.types import Position, Street
+
 
 class CFVDatasetWriter:
     """Write CFV training examples to sharded .jsonl.zst files."""
@@ -199,6 +207,17 @@ class CFVDatasetReader:
         
         yield from examples
     
+    def read_shard(self, index: int = 0) -> Iterator[Dict]:
+        """Iterate over the examples of a single shard (e.g. for calibration).
+        
+        Args:
+            index: Shard index in sorted order
+            
+        Yields:
+            Example dictionaries
+        """
+        yield from self._read_shard(self.shard_files[index])
+    
     def get_num_examples(self) -> Optional[int]:
         """Get total number of examples if known."""
         return self.metadata.get('total_examples')
@@ -251,3 +270,293 @@ def split_dataset(
         'val': [shard_files[i] for i in val_indices],
         'test': [shard_files[i] for i in test_indices]
     }
+
+
+# Columnar format identifier and version (index.json)
+COLUMNAR_FORMAT = 'cfv-columnar'
+COLUMNAR_VERSION = 1
+
+# Fixed-width columns of the columnar format besides 'features' [n, feature_dim]
+# (street, hero_pos: enum values; aset: action set id as in CFVFeatures)
+COLUMNAR_COLUMNS = {
+    'street': 'int8',
+    'num_players': 'int8',
+    'hero_pos': 'int8',
+    'spr': 'float32',
+    'public_bucket': 'int32',
+    'pot_norm': 'float32',
+    'to_call_over_pot': 'float32',
+    'last_bet_over_pot': 'float32',
+    'aset': 'int8',
+    'target_cfv_bb': 'float32',
+}
+
+
+class CFVColumnarWriter:
+    """Write CFV examples as memory-mappable columnar shards.
+    
+    Layout of output_dir:
+        index.json                    format, feature_dim, feature config, shard sizes
+        shard_000000/features.npy     float32 [n, feature_dim] (unnormalized)
+        shard_000000/<column>.npy     one file per COLUMNAR_COLUMNS entry
+    
+    Ranges are only stored through the features they produce.
+    """
+    
+    def __init__(self, output_dir: str, feature_builder, feature_config: Optional[Dict] = None):
+        """Initialize writer.
+        
+        Args:
+            output_dir: Output directory
+            feature_builder: CFVFeatureBuilder the features are built with
+            feature_config: Feature settings recorded in the index (embed_dim,
+                topk_range, num_buckets, seed), checked by the training tool
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.feature_builder = feature_builder
+        self.feature_config = feature_config or {}
+        self.feature_dim: Optional[int] = None
+        self.shards: List[Dict] = []
+        self.total_examples = 0
+    
+    def add_shard(self, examples: List[Dict], source: Optional[str] = None):
+        """Build features for a list of examples and write them as one shard.
+        
+        Args:
+            examples: Example dictionaries (see CFVDatasetWriter.add_example)
+            source: Name of the .jsonl.zst shard they come from
+        """
+        if not examples:
+            return
+        
+        n = len(examples)
+        columns = {name: np.empty(n, dtype=dtype) for name, dtype in COLUMNAR_COLUMNS.items()}
+        features = None
+        for i, example in enumerate(examples):
+            features_obj = self.feature_builder.build_features_from_example(example)
+            vector = features_obj.to_vector()
+            if features is None:
+                features = np.empty((n, len(vector)), dtype=np.float32)
+            features[i] = vector
+            
+            scalars = example['scalars']
+            columns['street'][i] = Street[example['street']].value
+            columns['num_players'][i] = example['num_players']
+            columns['hero_pos'][i] = Position[example['hero_pos']].value
+            columns['spr'][i] = example['spr']
+            columns['public_bucket'][i] = example['public_bucket']
+            columns['pot_norm'][i] = scalars['pot_norm']
+            columns['to_call_over_pot'][i] = scalars['to_call_over_pot']
+            columns['last_bet_over_pot'][i] = scalars['last_bet_over_pot']
+            columns['aset'][i] = features_obj.action_set_id
+            columns['target_cfv_bb'][i] = example['target_cfv_bb']
+        
+        if self.feature_dim is None:
+            self.feature_dim = features.shape[1]
+        elif features.shape[1] != self.feature_dim:
+            raise ValueError(f"Feature dimension changed: {features.shape[1]} != {self.feature_dim}")
+        
+        shard_name = f"shard_{len(self.shards):06d}"
+        shard_dir = self.output_dir / shard_name
+        temp_dir = self.output_dir / f".{shard_name}.tmp"
+        
+        try:
+            # Write to temporary directory
+            temp_dir.mkdir(exist_ok=True)
+            np.save(temp_dir / "features.npy", features)
+            for name, values in columns.items():
+                np.save(temp_dir / f"{name}.npy", values)
+            
+            # Atomic rename
+            if shard_dir.exists():
+                shutil.rmtree(shard_dir)
+            shutil.move(str(temp_dir), str(shard_dir))
+        except Exception as e:
+            # Clean up temp directory on error
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir)
+            raise e
+        
+        self.shards.append({'name': shard_name, 'num_examples': n, 'source': source})
+        self.total_examples += n
+        print(f"Wrote columnar shard {shard_name}: {n} examples -> {shard_dir}")
+    
+    def finalize(self) -> Dict:
+        """Write index.json (last, so a partial conversion has no index).
+        
+        Returns:
+            Index dictionary
+        """
+        index = {
+            'format': COLUMNAR_FORMAT,
+            'version': COLUMNAR_VERSION,
+            'feature_dim': self.feature_dim,
+            'feature_config': self.feature_config,
+            'total_examples': self.total_examples,
+            'columns': dict(COLUMNAR_COLUMNS, features='float32'),
+            'shards': self.shards,
+        }
+        
+        index_path = self.output_dir / "index.json"
+        temp_path = self.output_dir / ".index.json.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(index, f, indent=2)
+        shutil.move(str(temp_path), str(index_path))
+        
+        print(f"Columnar dataset finalized: {self.total_examples} examples in {len(self.shards)} shards")
+        return index
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.finalize()
+
+
+def is_columnar_dataset(data_dir: str) -> bool:
+    """Whether data_dir holds a columnar CFV dataset (index.json)."""
+    index_path = Path(data_dir) / "index.json"
+    if not index_path.exists():
+        return False
+    with open(index_path, 'r') as f:
+        return json.load(f).get('format') == COLUMNAR_FORMAT
+
+
+class CFVColumnarDataset:
+    """Memory-mapped columnar CFV dataset (see CFVColumnarWriter).
+    
+    Shard files are opened with np.load(mmap_mode='r') on first access, so
+    rows are paged in from the OS cache as they are read. The mappings are
+    not pickled: DataLoader workers reopen them.
+    """
+    
+    def __init__(self, data_dir: str, shards: Optional[Sequence[int]] = None):
+        """Initialize dataset.
+        
+        Args:
+            data_dir: Directory containing index.json and the shard directories
+            shards: Indices of the shards to use (default: all)
+        """
+        self.data_dir = Path(data_dir)
+        index_path = self.data_dir / "index.json"
+        if not index_path.exists():
+            raise ValueError(f"No columnar index found in {self.data_dir}")
+        with open(index_path, 'r') as f:
+            self.index = json.load(f)
+        if self.index.get('format') != COLUMNAR_FORMAT:
+            raise ValueError(f"Not a columnar CFV dataset: {index_path}")
+        if self.index.get('version') != COLUMNAR_VERSION:
+            raise ValueError(
+                f"Unsupported columnar dataset version {self.index.get('version')} (expected {COLUMNAR_VERSION})"
+            )
+        
+        all_shards = self.index['shards']
+        selected = range(len(all_shards)) if shards is None else shards
+        self.shards = [all_shards[i] for i in selected]
+        if not self.shards:
+            raise ValueError(f"No shards selected in {self.data_dir}")
+        
+        self.feature_dim = self.index['feature_dim']
+        self.feature_config = self.index.get('feature_config', {})
+        # Row offset of each shard; offsets[-1] = number of rows
+        self.offsets = np.concatenate([[0], np.cumsum([shard['num_examples'] for shard in self.shards])])
+        self._arrays: Dict[Tuple[int, str], np.ndarray] = {}
+        
+        print(f"Columnar dataset loaded: {len(self.shards)} shards, {len(self)} examples")
+    
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+    
+    def get_num_shards(self) -> int:
+        """Get number of shards."""
+        return len(self.shards)
+    
+    def column(self, name: str, shard: int) -> np.ndarray:
+        """Memory-mapped column of one shard.
+        
+        Args:
+            name: Column name ('features' or a COLUMNAR_COLUMNS key)
+            shard: Shard index within this dataset
+            
+        Returns:
+            Read-only array
+        """
+        key = (shard, name)
+        array = self._arrays.get(key)
+        if array is None:
+            if name != 'features' and name not in COLUMNAR_COLUMNS:
+                raise KeyError(f"Unknown column: {name}")
+            path = self.data_dir / self.shards[shard]['name'] / f"{name}.npy"
+            array = self._arrays[key] = np.load(path, mmap_mode='r')
+        return array
+    
+    def read_column(self, name: str) -> np.ndarray:
+        """A column over all shards, copied into memory."""
+        return np.concatenate([self.column(name, shard) for shard in range(len(self.shards))])
+    
+    def get_batch(self, indices: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Features and targets of a batch of rows.
+        
+        Args:
+            indices: Row indices in [0, len(self))
+            
+        Returns:
+            Tuple of (features float32 [n, feature_dim], targets float32 [n])
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        features = np.empty((len(indices), self.feature_dim), dtype=np.float32)
+        targets = np.empty(len(indices), dtype=np.float32)
+        shard_ids = np.searchsorted(self.offsets, indices, side='right') - 1
+        for shard in np.unique(shard_ids):
+            rows = np.flatnonzero(shard_ids == shard)
+            local = indices[rows] - self.offsets[shard]
+            # Read each shard in file order
+            order = np.argsort(local, kind='stable')
+            rows, local = rows[order], local[order]
+            features[rows] = self.column('features', shard)[local]
+            targets[rows] = self.column('target_cfv_bb', shard)[local]
+        return features, targets
+    
+    def __getitem__(self, idx: int) -> Tuple[np.ndarray, float]:
+        """Features and target of one row."""
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        shard = int(np.searchsorted(self.offsets, idx, side='right') - 1)
+        local = idx - int(self.offsets[shard])
+        return (
+            np.array(self.column('features', shard)[local]),
+            float(self.column('target_cfv_bb', shard)[local])
+        )
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_arrays'] = {}
+        return state
+
+
+def convert_to_columnar(
+    data_dir: str,
+    output_dir: str,
+    feature_builder,
+    feature_config: Optional[Dict] = None
+) -> Dict:
+    """Convert a .jsonl.zst dataset to the columnar format, one shard at a time.
+    
+    Args:
+        data_dir: Directory with shard_*.jsonl.zst files
+        output_dir: Output directory for the columnar dataset
+        feature_builder: CFVFeatureBuilder used for training
+        feature_config: Feature settings recorded in the index
+        
+    Returns:
+        Index dictionary
+    """
+    reader = CFVDatasetReader(data_dir, shuffle=False)
+    writer = CFVColumnarWriter(output_dir, feature_builder, feature_config)
+    for i, shard_file in enumerate(reader.shard_files):
+        writer.add_shard(list(reader.read_shard(i)), source=shard_file.name)
+    return writer.finalize()
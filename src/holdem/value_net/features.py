@@ -169,6 +169,36 @@ class CFVFeatureBuilder:
             range_embeddings=range_embeddings
         )
     
+    def build_features_from_example(self, example: Dict) -> CFVFeatures:
+        """Build features from a dataset example (see CFVDatasetWriter).
+        
+        Args:
+            example: Example dictionary with street, hero_pos, num_players,
+                spr, public_bucket, scalars and ranges
+            
+        Returns:
+            CFVFeatures object
+        """
+        scalars = example['scalars']
+        pot_size = scalars['pot_norm'] * 100.0  # Denormalize
+        
+        ranges = {}
+        for pos_str, topk in example['ranges'].items():
+            ranges[Position[pos_str]] = [(int(bid), float(w)) for bid, w in topk]
+        
+        return self.build_features(
+            street=Street[example['street']],
+            num_players=example['num_players'],
+            hero_position=Position[example['hero_pos']],
+            spr=example['spr'],
+            pot_size=pot_size,
+            to_call=scalars['to_call_over_pot'] * pot_size,
+            last_bet=scalars['last_bet_over_pot'] * pot_size,
+            action_set=scalars['aset'],
+            public_bucket=example['public_bucket'],
+            ranges=ranges
+        )
+    
     def _bin_spr(self, spr: float) -> np.ndarray:
         """Bin SPR into 6 categories.
         
@@ -0,0 +1,289 @@
+"""INT8 quantization of exported CFV Net ONNX models.
+
+Two modes (onnxruntime.quantization, which needs the onnx package):
+- dynamic: MatMul weights stored as INT8, activation ranges computed on
+  every run. No data needed.
+- static: activation ranges fixed from calibration features (normally one
+  shard of the CFV dataset), so runs skip the range computation.
+
+The quantized model keeps the float32 'features' input and mean/q10/q90
+outputs, and uses the same stats.json: point CFVInference (or
+rt.leaf.cfv_net.checkpoint) at either file.
+
+compare_models() runs FP32 and INT8 on the same features and reports what
+decides whether INT8 may replace FP32: p50/p99 latency per batch size, MAE
+of each output against FP32, and the gating accept rate per street. An INT8
+model whose quantile heads drift moves PI widths across the tau thresholds
+and changes how many leaves fall back to rollouts, even with a small MAE.
+"""
+
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from onnxruntime.quantization import (
+        CalibrationDataReader, QuantFormat, QuantType, quantize_dynamic, quantize_static
+    )
+    HAS_QUANTIZATION = True
+except ImportError:
+    HAS_QUANTIZATION = False
+    CalibrationDataReader = object
+
+from holdem.types import Position, Street
+from holdem.value_net.features import CFVFeatureBuilder, FeatureStats
+from holdem.value_net.infer import CFVInference
+from holdem.utils.logging import get_logger
+
+logger = get_logger("value_net.quantize")
+
+QUANTIZATION_MODES = ('dynamic', 'static')
+
+# Batch sizes of the latency comparison
+DEFAULT_COMPARE_BATCH_SIZES = (1, 16, 64, 256)
+
+
+class FeatureCalibrationReader(CalibrationDataReader):
+    """Feeds normalized feature batches to quantize_static."""
+
+    def __init__(self, input_name: str, features_norm: np.ndarray, batch_size: int = 64):
+        """Initialize reader.
+
+        Args:
+            input_name: Model input name
+            features_norm: Normalized features [num_samples, feature_dim]
+            batch_size: Rows per calibration batch
+        """
+        self.input_name = input_name
+        self.features_norm = np.ascontiguousarray(features_norm, dtype=np.float32)
+        self.batch_size = batch_size
+        self.position = 0
+
+    def get_next(self) -> Optional[Dict[str, np.ndarray]]:
+        """Next calibration batch, None when exhausted."""
+        if self.position >= len(self.features_norm):
+            return None
+        batch = self.features_norm[self.position:self.position + self.batch_size]
+        self.position += self.batch_size
+        return {self.input_name: batch}
+
+    def rewind(self):
+        """Restart from the first batch."""
+        self.position = 0
+
+
+def examples_to_features(
+    examples: Iterable[Dict],
+    feature_builder: CFVFeatureBuilder
+) -> Tuple[np.ndarray, List[Street], np.ndarray]:
+    """Feature matrix, streets and in-position flags of dataset examples.
+
+    Args:
+        examples: Example dictionaries (see CFVDatasetWriter)
+        feature_builder: Feature builder the model was trained with
+
+    Returns:
+        Tuple of (features [n, feature_dim], streets, is_ip [n])
+    """
+    rows, streets, is_ip = [], [], []
+    for example in examples:
+        rows.append(feature_builder.build_features_from_example(example).to_vector())
+        streets.append(Street[example['street']])
+        is_ip.append(Position[example['hero_pos']].is_in_position_postflop(example['num_players']))
+    return np.array(rows, dtype=np.float32), streets, np.array(is_ip, dtype=bool)
+
+
+def quantize_onnx_model(
+    model_path: str,
+    output_path: str,
+    mode: str = 'dynamic',
+    calibration_features: Optional[np.ndarray] = None,
+    feature_stats: Optional[FeatureStats] = None,
+    per_channel: bool = False,
+    calibration_batch_size: int = 64
+) -> str:
+    """Quantize an FP32 CFV Net ONNX model to INT8.
+
+    Args:
+        model_path: FP32 ONNX model
+        output_path: Output INT8 ONNX model
+        mode: 'dynamic' or 'static'
+        calibration_features: Raw (unnormalized) features, required for static
+        feature_stats: Normalization applied to calibration_features, as
+            CFVInference does before running the model
+        per_channel: Per output channel weight scales (more accurate, larger)
+        calibration_batch_size: Rows per calibration batch
+
+    Returns:
+        output_path
+    """
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown quantization mode: {mode}. Must be one of {QUANTIZATION_MODES}.")
+    if not HAS_QUANTIZATION:
+        raise ImportError("INT8 quantization requires onnxruntime with the onnx package (pip install onnx)")
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    if mode == 'dynamic':
+        quantize_dynamic(str(model_path), str(output_path), per_channel=per_channel, weight_type=QuantType.QInt8)
+    else:
+        if calibration_features is None or len(calibration_features) == 0:
+            raise ValueError("Static quantization requires calibration_features")
+        import onnxruntime as ort
+
+        features_norm = np.asarray(calibration_features, dtype=np.float32)
+        if feature_stats is not None:
+            features_norm = feature_stats.normalize(features_norm)
+        input_name = ort.InferenceSession(
+            str(model_path), providers=['CPUExecutionProvider']
+        ).get_inputs()[0].name
+        reader = FeatureCalibrationReader(input_name, features_norm, calibration_batch_size)
+        quantize_static(
+            str(model_path),
+            str(output_path),
+            reader,
+            quant_format=QuantFormat.QDQ,
+            per_channel=per_channel,
+            activation_type=QuantType.QInt8,
+            weight_type=QuantType.QInt8
+        )
+
+    logger.info(
+        f"Quantized {model_path} -> {output_path} ({mode}): "
+        f"{Path(model_path).stat().st_size / 1024:.0f} KB -> {Path(output_path).stat().st_size / 1024:.0f} KB"
+    )
+    return str(output_path)
+
+
+def _batch_latencies_ms(inference: CFVInference, features: np.ndarray, streets: Sequence[Street],
+                        is_ip: np.ndarray, batch_size: int, rounds: int) -> np.ndarray:
+    """Milliseconds of cold-cache predict_batch calls, cycling through the features."""
+    times = np.empty(rounds)
+    for i in range(rounds):
+        rows = np.arange(i * batch_size, (i + 1) * batch_size) % len(features)
+        batch_streets = [streets[r] for r in rows]
+        inference.clear_cache()
+        start = time.perf_counter()
+        inference.predict_batch(features[rows], batch_streets, is_ip[rows])
+        times[i] = time.perf_counter() - start
+    return times * 1000
+
+
+def compare_models(
+    fp32_path: str,
+    quantized_path: str,
+    stats_path: str,
+    features: np.ndarray,
+    streets: Sequence[Street],
+    is_ip: Sequence[bool],
+    batch_sizes: Sequence[int] = DEFAULT_COMPARE_BATCH_SIZES,
+    rounds: int = 200,
+    gating_config: Optional[Dict] = None,
+    session_config: Optional[Dict] = None
+) -> Dict:
+    """Side-by-side latency, accuracy and gating of an FP32 and a quantized model.
+
+    Args:
+        fp32_path: FP32 ONNX model
+        quantized_path: Quantized ONNX model
+        stats_path: Feature stats JSON (shared by both models)
+        features: Raw feature matrix [n, feature_dim], n >= max(batch_sizes)
+        streets: Street per row
+        is_ip: In-position flag per row
+        batch_sizes: Batch sizes of the latency comparison
+        rounds: predict_batch calls per batch size and model
+        gating_config: Gating configuration (default: CFVInference defaults)
+        session_config: ONNX Runtime settings for both models
+
+    Returns:
+        Report dict with 'models', 'latency', 'mae', 'max_abs_error' and 'gating'
+    """
+    features = np.asarray(features, dtype=np.float32)
+    is_ip = np.asarray(is_ip, dtype=bool)
+    models = {
+        'fp32': CFVInference(fp32_path, stats_path, cache_max_size=max(batch_sizes),
+                             gating_config=gating_config, session_config=session_config),
+        'int8': CFVInference(quantized_path, stats_path, cache_max_size=max(batch_sizes),
+                             gating_config=gating_config, session_config=session_config),
+    }
+
+    # Raw outputs for accuracy, and the runtime decision (OOD check + gating) per row
+    outputs = {}
+    accepts = {}
+    for name, inference in models.items():
+        outputs[name] = inference._infer_batch(inference.feature_stats.normalize(features))
+        inference.clear_cache()
+        accepts[name] = inference.predict_batch(features, list(streets), is_ip)[3]
+        inference.clear_cache()
+
+    output_names = ('mean', 'q10', 'q90')
+    errors = {
+        output: np.abs(outputs['int8'][i] - outputs['fp32'][i]) for i, output in enumerate(output_names)
+    }
+
+    gating = {}
+    street_array = np.array([street.name for street in streets])
+    for street in Street:
+        rows = street_array == street.name
+        if not rows.any():
+            continue
+        fp32_rate = float(accepts['fp32'][rows].mean())
+        int8_rate = float(accepts['int8'][rows].mean())
+        gating[street.name] = {
+            'count': int(rows.sum()),
+            'fp32_accept_rate': fp32_rate,
+            'int8_accept_rate': int8_rate,
+            'delta': int8_rate - fp32_rate,
+            'agreement': float((accepts['fp32'][rows] == accepts['int8'][rows]).mean()),
+        }
+
+    latency = []
+    for batch_size in batch_sizes:
+        row = {'batch_size': int(batch_size)}
+        for name, inference in models.items():
+            # Warm up the session (and its IO binding for this size)
+            _batch_latencies_ms(inference, features, streets, is_ip, batch_size, 2)
+            times = _batch_latencies_ms(inference, features, streets, is_ip, batch_size, rounds)
+            row[f'{name}_p50_ms'] = float(np.percentile(times, 50))
+            row[f'{name}_p99_ms'] = float(np.percentile(times, 99))
+        row['speedup_p50'] = row['fp32_p50_ms'] / row['int8_p50_ms']
+        latency.append(row)
+
+    return {
+        'models': {
+            'fp32': {'path': str(fp32_path), 'size_bytes': Path(fp32_path).stat().st_size},
+            'int8': {'path': str(quantized_path), 'size_bytes': Path(quantized_path).stat().st_size},
+        },
+        'num_examples': len(features),
+        'latency': latency,
+        'mae': {output: float(error.mean()) for output, error in errors.items()},
+        'max_abs_error': {output: float(error.max()) for output, error in errors.items()},
+        'gating': gating,
+    }
+
+
+def format_comparison(report: Dict) -> List[str]:
+    """Human-readable lines of a compare_models() report."""
+    models = report['models']
+    lines = [
+        f"Model size: FP32 {models['fp32']['size_bytes'] / 1024:.0f} KB, "
+        f"INT8 {models['int8']['size_bytes'] / 1024:.0f} KB",
+        "",
+        f"{'batch':>6} {'fp32 p50':>9} {'fp32 p99':>9} {'int8 p50':>9} {'int8 p99':>9} {'speedup':>8}",
+    ]
+    for r in report['latency']:
+        lines.append(
+            f"{r['batch_size']:>6} {r['fp32_p50_ms']:>9.3f} {r['fp32_p99_ms']:>9.3f} "
+            f"{r['int8_p50_ms']:>9.3f} {r['int8_p99_ms']:>9.3f} {r['speedup_p50']:>7.2f}x"
+        )
+    lines += ["", f"Accuracy vs FP32 ({report['num_examples']} examples, bb):"]
+    for output, mae in report['mae'].items():
+        lines.append(f"  {output:<5} MAE={mae:.4f} max={report['max_abs_error'][output]:.4f}")
+    lines += ["", f"{'street':>8} {'count':>7} {'fp32 acc':>9} {'int8 acc':>9} {'delta':>8} {'agree':>7}"]
+    for street, g in report['gating'].items():
+        lines.append(
+            f"{street:>8} {g['count']:>7} {g['fp32_accept_rate']:>9.1%} {g['int8_accept_rate']:>9.1%} "
+            f"{g['delta'] * 100:>+7.1f}pp {g['agreement']:>7.1%}"
+        )
+    return lines
@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict
 from holdem.types import Card, Street
 from holdem.utils.logging import get_logger
+from holdem.utils.metrics_registry import get_metrics_registry
 
 logger = get_logger("vision.cache")
 
@@ -529,6 +530,12 @@ class PlayerNameCache:
         self.last_name_candidate.clear()
 
 
+_OCR_CALLS = get_metrics_registry().counter("holdem_ocr_calls", "OCR calls by region type", ["type"])
+_OCR_CACHE_HITS = get_metrics_registry().counter(
+    "holdem_ocr_cache_hits", "OCR calls skipped by the region cache", ["type"]
+)
+
+
 class OcrCacheManager:
     """Manager for multiple OCR region caches."""
     
@@ -596,6 +603,7 @@ class OcrCacheManager:
         self._total_ocr_calls += 1
         if cache_type in self._ocr_calls_by_type:
             self._ocr_calls_by_type[cache_type] += 1
+        _OCR_CALLS.labels(cache_type).inc()
     
     def record_cache_hit(self, cache_type: str):
         """Record a cache hit.
@@ -606,6 +614,7 @@ class OcrCacheManager:
         self._cache_hits += 1
         if cache_type in self._cache_hits_by_type:
             self._cache_hits_by_type[cache_type] += 1
+        _OCR_CACHE_HITS.labels(cache_type).inc()
     
     def get_metrics(self) -> dict:
         """Get cache metrics.
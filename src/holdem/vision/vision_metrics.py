@@ -13,9 +13,15 @@ import hashlib
 import json
 import numpy as np
 from holdem.utils.logging import get_logger
+from holdem.utils.metrics_registry import get_metrics_registry
+from holdem.utils.quantile_sketch import QuantileSketch
 
 logger = get_logger("vision.metrics")
 
+_VISION_LATENCY = get_metrics_registry().histogram(
+    "holdem_vision_latency_ms", "Vision stage latency (ms)", ["type"]
+)
+
 
 class AlertLevel(Enum):
     """Alert severity levels."""
@@ -58,6 +64,7 @@ class VisionMetricsConfig:
     # Latency thresholds (milliseconds)
     latency_p95_threshold: float = 50.0  # 50ms
     latency_p99_threshold: float = 80.0  # 80ms
+    latency_window_size: int = 1000  # Raw samples kept per latency type (percentiles use sketches)
     
     # Flicker detection
     flicker_window_seconds: float = 10.0  # Time window for flicker detection
@@ -163,14 +170,21 @@ class VisionMetrics:
         self.vision_board_confidences: List[float] = []
         self.chat_board_confidences: List[float] = []
         
-        # Board detection timing
-        self.board_vision_latencies: List[float] = []
-        self.board_chat_latencies: List[float] = []
+        # Board detection timing (recent samples)
+        window = self.config.latency_window_size
+        self.board_vision_latencies: deque = deque(maxlen=window)
+        self.board_chat_latencies: deque = deque(maxlen=window)
+        
+        # Performance tracking (recent samples)
+        self.ocr_latencies: deque = deque(maxlen=window)
+        self.card_recognition_latencies: deque = deque(maxlen=window)
+        self.parse_latencies: deque = deque(maxlen=window)
         
-        # Performance tracking
-        self.ocr_latencies: List[float] = []
-        self.card_recognition_latencies: List[float] = []
-        self.parse_latencies: List[float] = []
+        # Session-wide latency distributions (constant memory)
+        self.latency_sketches: Dict[str, QuantileSketch] = {
+            name: QuantileSketch() for name in ("ocr", "card", "parse", "board_vision", "board_chat")
+        }
+        self._latency_histograms = {name: _VISION_LATENCY.labels(type=name) for name in self.latency_sketches}
         
         # Parse mode tracking (full vs light)
         self.full_parse_count: int = 0
@@ -197,6 +211,9 @@ class VisionMetrics:
         
         # Ground truth data
         self.ground_truth_data: List[Dict[str, Any]] = []
+        
+        # Accuracy / alert gauges in the process-wide scrape (latest instance wins)
+        get_metrics_registry().register_collector("vision", self.export_prometheus_metrics)
     
     def record_ocr(
         self,
@@ -224,6 +241,8 @@ class VisionMetrics:
         
         if latency_ms is not None:
             self.ocr_latencies.append(latency_ms)
+            self.latency_sketches["ocr"].add(latency_ms)
+            self._latency_histograms["ocr"].observe(latency_ms)
         
         # Check for alerts
         self._check_ocr_alerts()
@@ -310,6 +329,8 @@ class VisionMetrics:
         
         if latency_ms is not None:
             self.card_recognition_latencies.append(latency_ms)
+            self.latency_sketches["card"].add(latency_ms)
+            self._latency_histograms["card"].observe(latency_ms)
         
         # Check for alerts
         self._check_card_alerts()
@@ -338,6 +359,8 @@ class VisionMetrics:
                 self.vision_board_confidences.append(confidence)
             if latency_ms is not None:
                 self.board_vision_latencies.append(latency_ms)
+                self.latency_sketches["board_vision"].add(latency_ms)
+                self._latency_histograms["board_vision"].observe(latency_ms)
         
         elif source == "chat":
             self.board_from_chat_count += 1
@@ -345,6 +368,8 @@ class VisionMetrics:
                 self.chat_board_confidences.append(confidence)
             if latency_ms is not None:
                 self.board_chat_latencies.append(latency_ms)
+                self.latency_sketches["board_chat"].add(latency_ms)
+                self._latency_histograms["board_chat"].observe(latency_ms)
         
         elif source == "fusion_agree":
             self.board_from_fusion_agree_count += 1
@@ -364,6 +389,8 @@ class VisionMetrics:
             is_full_parse: Whether this was a full parse or light parse
         """
         self.parse_latencies.append(latency_ms)
+        self.latency_sketches["parse"].add(latency_ms)
+        self._latency_histograms["parse"].observe(latency_ms)
         
         # Track parse mode
         if is_full_parse:
@@ -380,7 +407,7 @@ class VisionMetrics:
             return
         
         # Calculate recent metrics (last N samples)
-        recent_latencies = self.parse_latencies[-self.config.min_samples_for_alert:]
+        recent_latencies = list(self.parse_latencies)[-self.config.min_samples_for_alert:]
         mean_latency = float(np.mean(recent_latencies))
         p95_latency = float(np.percentile(recent_latencies, 95))
         p99_latency = float(np.percentile(recent_latencies, 99))
@@ -790,6 +817,9 @@ class VisionMetrics:
     def get_latency_percentile(self, latency_type: str, percentile: int) -> Optional[float]:
         """Get latency percentile.
         
+        Exact while the recent-sample window still holds every sample, then
+        estimated from the session-wide sketch (1% relative error).
+        
         Args:
             latency_type: Type of latency ("ocr", "card", "parse")
             percentile: Percentile to calculate (0-100)
@@ -809,6 +839,9 @@ class VisionMetrics:
         if not latencies:
             return None
         
+        sketch = self.latency_sketches[latency_type]
+        if sketch.count > len(latencies):
+            return sketch.percentile(percentile)
         return float(np.percentile(latencies, percentile))
     
     def get_summary(self) -> Dict[str, Any]:
@@ -830,7 +863,7 @@ class VisionMetrics:
                 "total_readings": len(self.ocr_results),
                 "with_ground_truth": len([r for r in self.ocr_results if r.is_correct is not None]),
                 "accuracy": self.get_ocr_accuracy(),
-                "mean_latency_ms": float(np.mean(self.ocr_latencies)) if self.ocr_latencies else None,
+                "mean_latency_ms": self.latency_sketches["ocr"].mean,
                 "p50_latency_ms": self.get_latency_percentile("ocr", 50),
                 "p95_latency_ms": self.get_latency_percentile("ocr", 95),
                 "p99_latency_ms": self.get_latency_percentile("ocr", 99),
@@ -856,7 +889,7 @@ class VisionMetrics:
                 "accuracy_turn": self.get_card_accuracy("turn"),
                 "accuracy_river": self.get_card_accuracy("river"),
                 "mean_confidence": float(np.mean([r.confidence for r in self.card_results])) if self.card_results else None,
-                "mean_latency_ms": float(np.mean(self.card_recognition_latencies)) if self.card_recognition_latencies else None,
+                "mean_latency_ms": self.latency_sketches["card"].mean,
                 "confusion_matrix": self.get_card_confusion_matrix(),
             },
             "board": {
@@ -867,12 +900,12 @@ class VisionMetrics:
                 "conflicts": self.board_source_conflict_count,
                 "vision_mean_confidence": float(np.mean(self.vision_board_confidences)) if self.vision_board_confidences else None,
                 "chat_mean_confidence": float(np.mean(self.chat_board_confidences)) if self.chat_board_confidences else None,
-                "vision_mean_latency_ms": float(np.mean(self.board_vision_latencies)) if self.board_vision_latencies else None,
-                "chat_mean_latency_ms": float(np.mean(self.board_chat_latencies)) if self.board_chat_latencies else None,
+                "vision_mean_latency_ms": self.latency_sketches["board_vision"].mean,
+                "chat_mean_latency_ms": self.latency_sketches["board_chat"].mean,
                 "updates_per_hand_mean": float(np.mean(self.board_updates_per_hand)) if self.board_updates_per_hand else None,
             },
             "performance": {
-                "mean_parse_latency_ms": float(np.mean(self.parse_latencies)) if self.parse_latencies else None,
+                "mean_parse_latency_ms": self.latency_sketches["parse"].mean,
                 "p50_parse_latency_ms": self.get_latency_percentile("parse", 50),
                 "p95_parse_latency_ms": self.get_latency_percentile("parse", 95),
                 "p99_parse_latency_ms": self.get_latency_percentile("parse", 99),
@@ -1155,8 +1188,8 @@ class VisionMetrics:
             lines.append(f"vision_parse_latency_ms{{quantile=\"0.5\"}} {summary['performance']['p50_parse_latency_ms']}")
             lines.append(f"vision_parse_latency_ms{{quantile=\"0.95\"}} {summary['performance']['p95_parse_latency_ms']}")
             lines.append(f"vision_parse_latency_ms{{quantile=\"0.99\"}} {summary['performance']['p99_parse_latency_ms']}")
-            lines.append(f"vision_parse_latency_ms_count {len(self.parse_latencies)}")
-            lines.append(f"vision_parse_latency_ms_sum {sum(self.parse_latencies)}")
+            lines.append(f"vision_parse_latency_ms_count {self.latency_sketches['parse'].count}")
+            lines.append(f"vision_parse_latency_ms_sum {self.latency_sketches['parse'].sum}")
         
         # Alert counters
         lines.append('# HELP vision_alerts_total Total number of alerts')
@@ -1180,6 +1213,10 @@ class VisionMetrics:
         self.ocr_latencies.clear()
         self.card_recognition_latencies.clear()
         self.parse_latencies.clear()
+        self.board_vision_latencies.clear()
+        self.board_chat_latencies.clear()
+        for sketch in self.latency_sketches.values():
+            sketch.reset()
         self.alerts.clear()
         self.flicker_events.clear()
         self.value_history.clear()
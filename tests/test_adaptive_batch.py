@@ -0,0 +1,110 @@
+"""Tests for adaptive batch sizing in the parallel MCCFR solver."""
+
+import sys
+
+import pytest
+
+from holdem.types import MCCFRConfig, BucketConfig
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.mccfr.adaptive_batch import AdaptiveBatchSizer
+from holdem.mccfr.parallel_solver import ParallelMCCFRSolver, _crossed_interval
+
+
+def _config(**kwargs):
+    defaults = dict(num_workers=2, batch_size=100, adaptive_batch_enabled=True, adaptive_batch_smoothing=1.0)
+    defaults.update(kwargs)
+    return MCCFRConfig(**defaults)
+
+
+def _stats(*worker_timings):
+    return {
+        worker_id: {'num_iterations': n, 'compute_seconds': seconds}
+        for worker_id, (n, seconds) in enumerate(worker_timings)
+    }
+
+
+def test_even_shares_before_measurements():
+    sizer = AdaptiveBatchSizer(_config(batch_size=101), num_workers=2)
+    assert sizer.get_shares() == [51, 50]
+    assert sizer.get_shares(7) == [4, 3]
+
+
+def test_batch_grows_when_overhead_dominates():
+    sizer = AdaptiveBatchSizer(_config(), num_workers=2)
+    # 50 iterations/worker in 0.1s compute, 0.1s overhead -> 50% overhead, target 10%
+    sizer.record_batch(0.2, _stats((50, 0.1), (50, 0.1)))
+    # Growth is limited to 2x per batch
+    assert sizer.batch_size == 200
+    assert sizer.get_metrics()['batch/overhead_ratio'] == pytest.approx(0.5)
+
+
+def test_batch_shrinks_when_overhead_is_negligible():
+    sizer = AdaptiveBatchSizer(_config(batch_size=1000), num_workers=2)
+    # 500 iterations/worker in 1s, 10ms overhead (1%) -> compute can shrink to 90ms (90 iterations
+    # at 1000 iterations/s over both workers), halving at most per batch
+    sizer.record_batch(1.01, _stats((500, 1.0), (500, 1.0)))
+    assert sizer.batch_size == 500
+    sizer.record_batch(0.51, _stats((250, 0.5), (250, 0.5)))
+    assert sizer.batch_size == 250
+    sizer.record_batch(0.26, _stats((125, 0.25), (125, 0.25)))
+    assert sizer.batch_size == 125
+    sizer.record_batch(0.135, _stats((62, 0.125), (63, 0.125)))
+    assert sizer.batch_size == 90
+
+
+def test_batch_size_bounds():
+    sizer = AdaptiveBatchSizer(
+        _config(batch_size=5000, adaptive_batch_max_size=4000, discount_interval=1000, regret_discount_alpha=0.9),
+        num_workers=2
+    )
+    # Capped at the discount interval when discounting is enabled
+    assert sizer.batch_size == 1000
+    sizer.record_batch(10.0, _stats((500, 0.1), (500, 0.1)))
+    assert sizer.batch_size == 1000
+
+    sizer = AdaptiveBatchSizer(_config(batch_size=10, adaptive_batch_min_size=8), num_workers=2)
+    sizer.record_batch(1.0, _stats((5, 0.999), (5, 0.999)))
+    assert sizer.batch_size == 8
+
+    with pytest.raises(ValueError):
+        AdaptiveBatchSizer(_config(adaptive_batch_target_overhead=1.5), num_workers=2)
+
+
+def test_shares_follow_worker_throughput():
+    sizer = AdaptiveBatchSizer(_config(batch_size=90), num_workers=2)
+    # Worker 1 is twice as fast as worker 0
+    sizer.record_batch(1.0, _stats((45, 0.9), (45, 0.45)))
+    shares = sizer.get_shares()
+    assert sum(shares) == sizer.batch_size
+    assert shares[1] == pytest.approx(2 * shares[0], abs=1)
+
+
+def test_crossed_interval():
+    assert _crossed_interval(900, 1000, 1000)
+    assert _crossed_interval(950, 1050, 1000)
+    assert not _crossed_interval(1000, 1050, 1000)
+    assert not _crossed_interval(0, 100, 0)
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="fork start method requires Linux")
+def test_parallel_training_with_adaptive_batches(tmp_path):
+    """Adaptive training runs exactly num_iterations and logs batch metrics."""
+    bucketing = HandBucketing(BucketConfig(k_preflop=2, k_flop=2, k_turn=2, k_river=2, num_samples=20, seed=42))
+    bucketing.build()
+
+    config = MCCFRConfig(
+        num_iterations=30,
+        num_workers=2,
+        batch_size=4,
+        checkpoint_interval=1000,
+        mp_start_method="fork",
+        adaptive_batch_enabled=True,
+        adaptive_batch_max_size=16
+    )
+    solver = ParallelMCCFRSolver(config=config, bucketing=bucketing, num_players=2)
+    solver.train(logdir=tmp_path, use_tensorboard=False)
+
+    assert solver.iteration == 30
+    metrics = solver._batch_sizer.get_metrics()
+    assert 2 <= metrics['batch/size'] <= 16
+    assert 'batch/overhead_ratio' in metrics
@@ -0,0 +1,205 @@
+"""Tests for anytime, interruptible solves (realtime.anytime)."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from holdem.types import SearchConfig, BucketConfig, TableState, PlayerState, Street, Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.realtime.anytime import SolveHandle, start_anytime_solve
+from holdem.realtime.resolver import SubgameResolver
+from holdem.realtime.search_controller import SearchController
+from holdem.realtime.subgame import SubgameBuilder
+from holdem.rt_resolver.depth_limited_cfr import DepthLimitedCFR
+from holdem.rt_resolver.leaf_evaluator import LeafEvaluator
+from holdem.rt_resolver.subgame_builder import SubgameBuilder as RTSubgameBuilder, SubgameState
+
+RIVER_BOARD = [Card('A', 'h'), Card('K', 'd'), Card('7', 'c'), Card('2', 's'), Card('9', 'h')]
+HERO_CARDS = [Card('Q', 's'), Card('Q', 'h')]
+INFOSET = "v2:RIVER:0:"
+
+
+def _state():
+    return TableState(
+        street=Street.RIVER,
+        pot=10.0,
+        board=list(RIVER_BOARD),
+        players=[PlayerState("Hero", 100.0, position=0), PlayerState("Villain", 100.0, position=1)],
+        effective_stack=100.0
+    )
+
+
+def _wait_for_iterations(handle: SolveHandle, iterations: int, timeout: float = 30.0):
+    end = time.perf_counter() + timeout
+    while time.perf_counter() < end:
+        snapshot = handle.snapshot()
+        if snapshot is not None and snapshot.iterations >= iterations:
+            return snapshot
+        time.sleep(0.001)
+    pytest.fail("solve published no snapshot in time")
+
+
+def test_result_returns_on_convergence():
+    release = threading.Event()
+
+    def solve(handle):
+        for i in range(1, 6):
+            bet = 0.5 + 0.5 ** i  # Moves less and less
+            handle.publish({AbstractAction.CHECK_CALL: 1 - bet, AbstractAction.BET_POT: bet}, i)
+        release.wait(30)
+        return {AbstractAction.CHECK_CALL: 0.5, AbstractAction.BET_POT: 0.5}
+
+    handle = start_anytime_solve(solve)
+    strategy = handle.result(tolerance=0.05, deadline=time.perf_counter() + 30)
+
+    assert not handle.done()
+    snapshot = handle.snapshot()
+    assert snapshot.convergence <= 0.05
+    assert strategy == snapshot.strategy
+    release.set()
+    assert handle.wait(30) == {AbstractAction.CHECK_CALL: 0.5, AbstractAction.BET_POT: 0.5}
+
+
+def test_result_stops_at_deadline_or_should_stop():
+    release = threading.Event()
+
+    def solve(handle):
+        handle.publish({AbstractAction.CHECK_CALL: 1.0}, 0)
+        release.wait(30)
+        return {AbstractAction.CHECK_CALL: 1.0}
+
+    handle = start_anytime_solve(solve)
+    start = time.perf_counter()
+    assert handle.result(deadline=start + 0.05) == {AbstractAction.CHECK_CALL: 1.0}
+    assert 0.04 <= time.perf_counter() - start < 5.0
+
+    calls = []
+    assert handle.result(should_stop=lambda: calls.append(1) or len(calls) >= 3) == {AbstractAction.CHECK_CALL: 1.0}
+    assert len(calls) == 3 and not handle.done()
+    release.set()
+
+
+def test_errors_reach_the_caller():
+    def solve(handle):
+        raise ValueError("bad subgame")
+
+    handle = start_anytime_solve(solve)
+    with pytest.raises(ValueError):
+        handle.result()
+
+
+@pytest.fixture(scope="module")
+def bucketing():
+    bucketing = HandBucketing(BucketConfig(k_preflop=2, k_flop=2, k_turn=2, k_river=2, num_samples=20, seed=42))
+    bucketing.build()
+    return bucketing
+
+
+def test_resolver_solve_can_be_cancelled():
+    resolver = SubgameResolver(SearchConfig(min_iterations=10 ** 7, anytime_publish_interval=5), PolicyStore())
+    subgame = SubgameBuilder().build_subgame(_state(), HERO_CARDS, [])
+
+    handle = resolver.solve_anytime(subgame, INFOSET, time_budget_ms=10 ** 7)
+    snapshot = _wait_for_iterations(handle, 10)
+    assert snapshot.iterations % 5 == 0
+    assert sum(snapshot.strategy.values()) == pytest.approx(1.0)
+    handle.cancel()
+    strategy = handle.wait(30)
+
+    assert handle.done()
+    assert sum(strategy.values()) == pytest.approx(1.0)
+    stats = resolver.last_solve_stats
+    assert stats['cancelled'] and 10 <= stats['iterations'] < 10 ** 7
+
+
+def test_depth_limited_solve_can_be_cancelled():
+    blueprint = Mock(spec=PolicyStore)
+    blueprint.get_strategy.return_value = {AbstractAction.CHECK_CALL: 0.8, AbstractAction.BET_POT: 0.2}
+    evaluator = Mock(spec=LeafEvaluator)
+    evaluator.evaluate_batch.side_effect = lambda states, *args, **kwargs: np.zeros(len(states))
+    solver = DepthLimitedCFR(
+        blueprint=blueprint,
+        subgame_builder=RTSubgameBuilder(max_depth=1),
+        leaf_evaluator=evaluator,
+        min_iterations=10 ** 7,
+        max_iterations=10 ** 7,
+        time_limit_ms=10 ** 7,
+        publish_interval=5
+    )
+    root = SubgameState(street=Street.RIVER, board=list(RIVER_BOARD), pot=10.0, history=[], active_players=2, depth=0)
+
+    handle = solver.solve_anytime(root, HERO_CARDS, {}, hero_position=0)
+    _wait_for_iterations(handle, 10)
+    handle.cancel()
+    strategy = handle.wait(30)
+
+    # Cancelled before min_iterations: the solved strategy, not the blueprint fallback
+    assert solver.failsafe_fallbacks == 0
+    assert 10 <= solver.last_iterations < 10 ** 7
+    assert sum(strategy.values()) == pytest.approx(1.0)
+
+
+def test_controller_acts_when_should_stop_fires(bucketing):
+    config = SearchConfig(time_budget_ms=60000, min_iterations=10 ** 7, anytime_solve=True)
+    controller = SearchController(config, bucketing, PolicyStore())
+    polls = []
+
+    start = time.perf_counter()
+    action = controller.get_action(_state(), HERO_CARDS, [], should_stop=lambda: polls.append(1) or len(polls) > 2)
+
+    assert isinstance(action, AbstractAction)
+    assert time.perf_counter() - start < 30.0
+    assert controller.resolver.last_solve_stats['cancelled']
+
+
+def test_controller_acts_at_budget(bucketing):
+    config = SearchConfig(time_budget_ms=50, min_iterations=10 ** 7, anytime_solve=True)
+    controller = SearchController(config, bucketing, PolicyStore())
+
+    start = time.perf_counter()
+    controller.get_action(_state(), HERO_CARDS, [])
+
+    assert time.perf_counter() - start < 30.0
+    stats = controller.resolver.last_solve_stats
+    # Stopped at the budget: cancelled by the controller, or by the solve's own binding budget
+    assert 0 < stats['iterations'] < config.min_iterations
+    assert stats['cancelled'] or stats['elapsed_ms'] >= config.time_budget_ms
+
+
+def test_parallel_resolver_solve_can_be_cancelled():
+    from holdem.realtime.parallel_resolver import ParallelSubgameResolver
+
+    config = SearchConfig(min_iterations=10 ** 7, anytime_publish_interval=5, num_workers=1)
+    resolver = ParallelSubgameResolver(config, PolicyStore())
+    subgame = SubgameBuilder().build_subgame(_state(), HERO_CARDS, [])
+
+    handle = resolver.solve_anytime(subgame, INFOSET, time_budget_ms=10 ** 7)
+    snapshot = _wait_for_iterations(handle, 10)
+    assert snapshot.iterations % 5 == 0
+    handle.cancel()
+    strategy = handle.wait(30)
+
+    assert handle.done()
+    assert sum(strategy.values()) == pytest.approx(1.0)
+
+
+def test_controller_anytime_with_worker_pool(bucketing):
+    config = SearchConfig(time_budget_ms=3000, min_iterations=10 ** 7, anytime_solve=True, num_workers=2)
+    controller = SearchController(config, bucketing, PolicyStore())
+    polls = []
+    try:
+        start = time.perf_counter()
+        action = controller.get_action(_state(), HERO_CARDS, [], should_stop=lambda: polls.append(1) or len(polls) > 2)
+        elapsed = time.perf_counter() - start
+    finally:
+        controller.close()
+
+    # The pool solve is interrupted instead of running to the budget
+    assert isinstance(action, AbstractAction)
+    assert len(polls) == 3
+    assert elapsed < 1.5
@@ -0,0 +1,133 @@
+"""Tests for the dense 1326-combo belief state."""
+
+import numpy as np
+import pytest
+
+from holdem.types import BucketConfig, Street, Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.abstraction.preflop_lossless import get_bucket_169
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.mccfr.regrets import RegretTracker
+from holdem.realtime.belief import BeliefState
+from holdem.utils.card_removal import NUM_COMBOS, combo_index
+from holdem.utils.rng import RNG
+
+BOARD = [Card('A', 'h'), Card('K', 'd'), Card('7', 'c')]
+HERO_CARDS = [Card('Q', 's'), Card('Q', 'h')]
+
+
+class PairBucketing:
+    """Pocket pairs in bucket 1, everything else in bucket 0."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_buckets(self, hands, board, street, pot=100.0, stack=200.0, is_in_position=True):
+        self.calls += 1
+        return np.array([int(hand[0].rank == hand[1].rank) for hand in hands], dtype=np.int32)
+
+
+def _blueprint():
+    tracker = RegretTracker()
+    tracker.add_strategy("v2:FLOP:0:", {AbstractAction.CHECK_CALL: 0.9, AbstractAction.BET_POT: 0.1}, 1.0)
+    tracker.add_strategy("v2:FLOP:1:", {AbstractAction.CHECK_CALL: 0.1, AbstractAction.BET_POT: 0.9}, 1.0)
+    return PolicyStore(tracker)
+
+
+def test_uniform_with_dead_cards():
+    belief = BeliefState()
+    assert belief.ranges.shape == (1, NUM_COMBOS)
+    assert belief.ranges.dtype == np.float32
+    assert belief.ranges[0] == pytest.approx(np.full(NUM_COMBOS, 1.0 / NUM_COMBOS))
+
+    belief.initialize_uniform(dead_cards=HERO_CARDS)
+    assert belief.ranges[0][combo_index([Card('Q', 's'), Card('2', 'c')])] == 0.0
+    # 50 choose 2 combos left
+    assert np.count_nonzero(belief.ranges[0]) == 1225
+    assert belief.ranges[0].sum() == pytest.approx(1.0)
+
+
+def test_update_multiplies_blueprint_likelihoods():
+    bucketing = PairBucketing()
+    belief = BeliefState(bucketing=bucketing, blueprint=_blueprint())
+    belief.initialize_uniform(dead_cards=HERO_CARDS)
+
+    belief.update(AbstractAction.BET_POT, 0, street=Street.FLOP, board=BOARD)
+    weights = belief.range_vector(0)
+    pair = weights[combo_index([Card('8', 's'), Card('8', 'h')])]
+    other = weights[combo_index([Card('8', 's'), Card('9', 'h')])]
+    assert pair / other == pytest.approx(9.0)
+    # Board cards are dead now
+    assert weights[combo_index([Card('A', 'h'), Card('8', 'h')])] == 0.0
+    assert weights.sum() == pytest.approx(1.0)
+
+    # String actions work too, and the board's bucket table is reused as the pot grows
+    belief.update("check_call", 0, street=Street.FLOP, board=BOARD, pot=37.5, stack=181.25)
+    assert bucketing.calls == 1
+    weights = belief.range_vector(0)
+    assert weights[combo_index([Card('8', 's'), Card('8', 'h')])] == pytest.approx(
+        weights[combo_index([Card('8', 's'), Card('9', 'h')])]
+    )
+    assert belief.get_range(0)["8h8s"] == pytest.approx(float(weights[combo_index([Card('8', 's'), Card('8', 'h')])]))
+
+
+def test_update_without_blueprint_keeps_range():
+    belief = BeliefState()
+    before = belief.ranges.copy()
+    belief.update("bet_pot", 0)
+    assert np.array_equal(belief.ranges, before)
+
+
+def test_sample_hand_follows_range():
+    belief = BeliefState()
+    belief.ranges[0] = 0.0
+    belief.ranges[0][combo_index([Card('A', 's'), Card('A', 'd')])] = 0.75
+    belief.ranges[0][combo_index([Card('7', 's'), Card('2', 'd')])] = 0.25
+    belief._cdf[0] = None
+
+    rng = RNG(seed=0)
+    samples = ["".join(sorted(str(c) for c in belief.sample_hand(0, rng))) for _ in range(2000)]
+    assert set(samples) == {"AdAs", "2d7s"}
+    assert samples.count("AdAs") / len(samples) == pytest.approx(0.75, abs=0.04)
+
+
+def test_batch_buckets_match_single_lookups():
+    bucketing = HandBucketing(BucketConfig(k_preflop=2, k_flop=2, k_turn=2, k_river=2, num_samples=20, seed=42),
+                              use_lossless_preflop=True)
+    hands = [[Card('A', 's'), Card('A', 'd')], [Card('7', 's'), Card('2', 'd')], [Card('K', 'h'), Card('Q', 'h')]]
+    buckets = bucketing.get_buckets(hands, [], Street.PREFLOP)
+    assert buckets.tolist() == [get_bucket_169(hand) for hand in hands]
+    assert bucketing.get_buckets([], [], Street.PREFLOP).shape == (0,)
+
+
+def test_controller_tracks_opponent_ranges_per_hand():
+    from holdem.realtime.search_controller import SearchController
+    from holdem.types import PlayerState, SearchConfig, TableState
+
+    controller = SearchController(SearchConfig(), PairBucketing(), _blueprint())
+    state = TableState(
+        street=Street.FLOP,
+        pot=10.0,
+        board=list(BOARD),
+        players=[PlayerState("Villain1", 100.0, position=0), PlayerState("Hero", 100.0, position=1),
+                 PlayerState("Villain2", 100.0, position=2)],
+        effective_stack=100.0,
+        hero_position=1
+    )
+    controller.start_hand(HERO_CARDS, num_opponents=2)
+    assert controller.belief.num_opponents == 2
+    assert controller.belief.range_vector(1)[combo_index([Card('Q', 'd'), Card('Q', 'h')])] == 0.0
+
+    controller.update_belief(AbstractAction.BET_POT, 1, state=state, history=[])
+    pair = combo_index([Card('8', 's'), Card('8', 'h')])
+    other = combo_index([Card('8', 's'), Card('9', 'h')])
+    # Villain2 raised pot: pairs 9x as likely; Villain1 did not act
+    assert controller.belief.range_vector(1)[pair] / controller.belief.range_vector(1)[other] == pytest.approx(9.0)
+    assert controller.belief.range_vector(0)[pair] == pytest.approx(controller.belief.range_vector(0)[other])
+
+    # A new hand starts from uniform ranges without the new hero cards
+    controller.start_hand([Card('8', 's'), Card('2', 'd')])
+    assert controller.belief.range_vector(1)[pair] == 0.0
+    assert controller.belief.range_vector(1)[other] == 0.0
+    assert controller.belief.range_vector(1)[combo_index([Card('Q', 's'), Card('Q', 'h')])] > 0.0
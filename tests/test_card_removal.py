@@ -0,0 +1,62 @@
+"""Tests for the card-removal (blocker) kernels."""
+
+import numpy as np
+import pytest
+
+from holdem.types import Card
+from holdem.utils.card_removal import (
+    COMBO_CARDS, NUM_COMBOS, card_index, combo_cards, combo_index, combo_indices,
+    combos_avoiding, compatibility_bits, compatible_matrix, compatible_reach, index_card, live_cards,
+    remove_cards
+)
+
+RIVER_BOARD = [Card('A', 'h'), Card('K', 'd'), Card('7', 'c'), Card('2', 's'), Card('9', 'h')]
+
+
+def _brute_compatible():
+    cards = COMBO_CARDS.astype(int)
+    return ((cards[:, None, 0] != cards[None, :, 0]) & (cards[:, None, 0] != cards[None, :, 1]) &
+            (cards[:, None, 1] != cards[None, :, 0]) & (cards[:, None, 1] != cards[None, :, 1]))
+
+
+def test_indexing_round_trip():
+    hand = [Card('Q', 's'), Card('Q', 'h')]
+    combo = combo_index(hand)
+    assert combo_index(hand[::-1]) == combo
+    assert sorted(map(str, combo_cards(combo))) == sorted(map(str, hand))
+    assert index_card(card_index(Card('T', 'c'))) == Card('T', 'c')
+    first = np.array([card_index(Card('Q', 's')), 5])
+    second = np.array([card_index(Card('Q', 'h')), 5])
+    assert combo_indices(first, second).tolist() == [combo, -1]
+
+
+def test_compatibility_matches_brute_force():
+    expected = _brute_compatible()
+    bits = compatibility_bits()
+    assert bits.nbytes < NUM_COMBOS * NUM_COMBOS // 7
+    assert np.array_equal(np.unpackbits(bits, axis=1, count=NUM_COMBOS).astype(bool), expected)
+
+    combos = np.flatnonzero(combos_avoiding([card_index(c) for c in RIVER_BOARD]))
+    assert np.array_equal(compatible_matrix(combos), expected[np.ix_(combos, combos)])
+
+
+def test_compatible_reach_and_removal():
+    rng = np.random.default_rng(0)
+    reach = rng.random((NUM_COMBOS, 3))
+    assert compatible_reach(reach) == pytest.approx(_brute_compatible() @ reach)
+
+    dead = [card_index(c) for c in RIVER_BOARD]
+    removed = remove_cards(reach[:, 0], dead)
+    assert np.count_nonzero(removed) == 47 * 46 // 2
+    assert removed[combo_index([Card('A', 'h'), Card('3', 'c')])] == 0.0
+
+    with pytest.raises(ValueError):
+        compatible_reach(reach[:10])
+
+
+def test_live_cards_for_dealing():
+    dead = [card_index(Card('A', 'h'))]
+    cards = live_cards(dead, ranks=['A', 'K'])
+    assert len(cards) == 7
+    assert card_index(Card('A', 'h')) not in cards
+    assert len(live_cards()) == 52
@@ -5,11 +5,18 @@ import tempfile
 import shutil
 from pathlib import Path
 import json
+import pickle
+import numpy as np
+from holdem.types import Position, Street
 from holdem.value_net.dataset import (
     CFVDatasetWriter,
     CFVDatasetReader,
+    CFVColumnarDataset,
+    convert_to_columnar,
+    is_columnar_dataset,
     split_dataset
 )
+from holdem.value_net.features import CFVFeatureBuilder, create_bucket_embeddings
 
 
 def test_dataset_writer_basic():
@@ -392,3 +399,102 @@ def test_hash_seed_edge_cases():
             for example in examples:
                 assert 'target_cfv_bb' in example
                 assert isinstance(example['target_cfv_bb'], float)
+
+
+def _write_varied_dataset(data_dir, num_examples=25, shard_size=10):
+    """Write examples that differ in every column; returns them in order."""
+    streets = ["FLOP", "TURN", "RIVER"]
+    positions = ["BTN", "SB", "BB", "UTG", "MP", "CO"]
+    examples = []
+    with CFVDatasetWriter(data_dir, shard_size=shard_size) as writer:
+        for i in range(num_examples):
+            example = {
+                "street": streets[i % 3],
+                "num_players": 2 + i % 5,
+                "hero_pos": positions[i % 6],
+                "spr": 1.0 + i * 0.5,
+                "public_bucket": i,
+                "ranges": {"BTN": [[i, 0.7], [i + 1, 0.3]], "BB": [[2 * i, 1.0]]},
+                "scalars": {
+                    "pot_norm": 0.1 * (i + 1),
+                    "to_call_over_pot": 0.02 * i,
+                    "last_bet_over_pot": 0.5,
+                    "aset": ["tight", "balanced", "loose"][i % 3]
+                },
+                "target_cfv_bb": float(i) - 10.0
+            }
+            writer.add_example(example)
+            examples.append(example)
+    return examples
+
+
+def test_columnar_conversion():
+    """Test that converted shards hold the features and columns of every example."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir) / "jsonl"
+        out_dir = Path(tmpdir) / "columnar"
+        examples = _write_varied_dataset(str(data_dir))
+        builder = CFVFeatureBuilder(create_bucket_embeddings(100, 8, seed=0), topk_range=16, embed_dim=8)
+        
+        index = convert_to_columnar(str(data_dir), str(out_dir), builder, {'embed_dim': 8})
+        
+        assert index['total_examples'] == 25
+        assert [shard['num_examples'] for shard in index['shards']] == [10, 10, 5]
+        assert is_columnar_dataset(str(out_dir))
+        assert not is_columnar_dataset(str(data_dir))
+        
+        dataset = CFVColumnarDataset(str(out_dir))
+        assert len(dataset) == 25 and dataset.get_num_shards() == 3
+        assert dataset.feature_config == {'embed_dim': 8}
+        assert isinstance(dataset.column('features', 0), np.memmap)
+        
+        for i in (0, 9, 10, 24):
+            features, target = dataset[i]
+            expected = builder.build_features_from_example(examples[i]).to_vector()
+            np.testing.assert_allclose(features, expected, rtol=1e-6)
+            assert target == examples[i]['target_cfv_bb']
+        
+        assert dataset.read_column('street').tolist() == [Street[e['street']].value for e in examples]
+        assert dataset.read_column('hero_pos').tolist() == [Position[e['hero_pos']].value for e in examples]
+        assert dataset.read_column('aset').tolist() == [i % 3 for i in range(25)]
+        np.testing.assert_allclose(dataset.read_column('spr'), [e['spr'] for e in examples])
+
+
+def test_columnar_batches_and_shard_selection():
+    """Test batch gathers across shards, shard subsets and pickling."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir) / "jsonl"
+        out_dir = Path(tmpdir) / "columnar"
+        _write_varied_dataset(str(data_dir))
+        builder = CFVFeatureBuilder(create_bucket_embeddings(100, 8, seed=0), topk_range=16, embed_dim=8)
+        convert_to_columnar(str(data_dir), str(out_dir), builder)
+        dataset = CFVColumnarDataset(str(out_dir))
+        
+        # Unsorted rows from every shard come back in request order
+        indices = [24, 3, 15, 3, 0, 11]
+        features, targets = dataset.get_batch(indices)
+        assert features.shape == (6, dataset.feature_dim) and features.dtype == np.float32
+        for row, i in enumerate(indices):
+            np.testing.assert_array_equal(features[row], dataset[i][0])
+            assert targets[row] == dataset[i][1]
+        
+        subset = CFVColumnarDataset(str(out_dir), shards=[2])
+        assert len(subset) == 5
+        assert subset[0][1] == dataset[20][1]
+        
+        # Memory maps are reopened after unpickling (DataLoader workers)
+        restored = pickle.loads(pickle.dumps(dataset))
+        assert not restored._arrays
+        np.testing.assert_array_equal(restored.get_batch(indices)[0], features)
+
+
+def test_columnar_invalid_directory():
+    """Test that directories without a columnar index are rejected."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with pytest.raises(ValueError):
+            CFVColumnarDataset(tmpdir)
+        
+        with open(Path(tmpdir) / "index.json", 'w') as f:
+            json.dump({'format': 'cfv-columnar', 'version': 99, 'shards': []}, f)
+        with pytest.raises(ValueError):
+            CFVColumnarDataset(tmpdir)
@@ -0,0 +1,117 @@
+"""Tests for tuned, process-shared ONNX Runtime sessions (value_net.infer)."""
+
+import json
+import threading
+
+import numpy as np
+import pytest
+
+ort = pytest.importorskip("onnxruntime")
+
+from holdem.types import Street
+from holdem.value_net import infer
+from holdem.value_net.features import FeatureStats
+
+DIM = 6
+
+
+@pytest.fixture
+def onnx_model(tmp_path):
+    """Tiny linear model with outputs mean, q10, q90 of shape [batch]."""
+    onnx = pytest.importorskip("onnx")
+    from onnx import TensorProto, helper, numpy_helper
+
+    rng = np.random.default_rng(0)
+    weights = {name: rng.normal(size=DIM).astype(np.float32) for name in ("mean", "q10", "q90")}
+    weights["q10"] = weights["mean"] - 0.01
+    weights["q90"] = weights["mean"] + 0.01
+    graph = helper.make_graph(
+        [helper.make_node("MatMul", ["features", f"w_{name}"], [name]) for name in weights],
+        "cfv",
+        [helper.make_tensor_value_info("features", TensorProto.FLOAT, ["batch_size", DIM])],
+        [helper.make_tensor_value_info(name, TensorProto.FLOAT, ["batch_size"]) for name in weights],
+        [numpy_helper.from_array(w, f"w_{name}") for name, w in weights.items()],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    model_path = tmp_path / "cfv.onnx"
+    onnx.save(model, str(model_path))
+    stats_path = tmp_path / "stats.json"
+    stats_path.write_text(json.dumps(FeatureStats(mean=np.zeros(DIM), std=np.ones(DIM)).to_dict()))
+
+    infer.clear_shared_sessions()
+    yield model_path, stats_path, weights
+    infer.clear_shared_sessions()
+
+
+def test_session_options_from_config():
+    config = dict(infer.DEFAULT_SESSION_CONFIG, intra_op_num_threads=3, graph_optimization_level='basic',
+                  execution_mode='parallel', enable_mem_pattern=False)
+    options = infer.make_session_options(config)
+
+    assert options.intra_op_num_threads == 3
+    assert options.graph_optimization_level == ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+    assert options.execution_mode == ort.ExecutionMode.ORT_PARALLEL
+    assert not options.enable_mem_pattern
+
+
+def test_session_is_shared_per_model_and_config(onnx_model):
+    model_path, stats_path, _ = onnx_model
+
+    first = infer.CFVInference(str(model_path), str(stats_path))
+    second = infer.CFVInference(str(model_path), str(stats_path))
+    other = infer.CFVInference(str(model_path), str(stats_path), session_config={'intra_op_num_threads': 2})
+
+    assert first.shared_session is second.shared_session
+    assert other.shared_session is not first.shared_session
+    assert other.shared_session.config['intra_op_num_threads'] == 2
+
+
+def test_io_binding_matches_plain_run(onnx_model):
+    model_path, stats_path, weights = onnx_model
+    session = infer.get_shared_session(str(model_path), {'io_binding_batch_sizes': (1, 8)})
+    rng = np.random.default_rng(1)
+
+    # Padded into the 8-row buffers, exact fit, and beyond the largest binding
+    for n in (1, 3, 8, 20):
+        features = rng.normal(size=(n, DIM)).astype(np.float32)
+        outputs = session.run(features)
+        for out, name in zip(outputs, ("mean", "q10", "q90")):
+            assert out.shape == (n,)
+            assert out == pytest.approx(features @ weights[name], abs=1e-5)
+
+
+def test_concurrent_calls(onnx_model):
+    model_path, stats_path, weights = onnx_model
+    session = infer.get_shared_session(str(model_path))
+    errors = []
+
+    def work(seed):
+        rng = np.random.default_rng(seed)
+        for _ in range(50):
+            features = rng.normal(size=(int(rng.integers(1, 40)), DIM)).astype(np.float32)
+            if not np.allclose(session.run(features)[0], features @ weights["mean"], atol=1e-5):
+                errors.append(seed)
+
+    threads = [threading.Thread(target=work, args=(seed,)) for seed in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+
+def test_optimized_model_is_cached(onnx_model, tmp_path):
+    model_path, stats_path, weights = onnx_model
+    optimized_path = tmp_path / "cache" / "cfv.opt.onnx"
+    config = {'optimized_model_path': str(optimized_path)}
+
+    infer.CFVInference(str(model_path), str(stats_path), session_config=config)
+    assert optimized_path.exists()
+
+    # A new process (no shared session yet) loads the optimized graph
+    infer.clear_shared_sessions()
+    inference = infer.CFVInference(str(model_path), str(stats_path), session_config=config)
+    features = np.full(DIM, 0.1)
+    mean, _, _, _ = inference.predict(features, Street.FLOP, True)
+    assert mean == pytest.approx(float(features @ weights["mean"]), abs=1e-5)
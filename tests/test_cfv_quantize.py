@@ -0,0 +1,147 @@
+"""Tests for INT8 quantization of the CFV Net and the FP32/INT8 comparison."""
+
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+onnx = pytest.importorskip("onnx")
+
+from holdem.types import Position, Street
+from holdem.value_net import infer
+from holdem.value_net.dataset import CFVDatasetReader, CFVDatasetWriter
+from holdem.value_net.features import (
+    CFVFeatureBuilder, FeatureStats, create_bucket_embeddings, get_feature_dimension
+)
+from holdem.value_net.quantize import (
+    compare_models, examples_to_features, format_comparison, quantize_onnx_model
+)
+
+EMBED_DIM = 8
+DIM = get_feature_dimension(EMBED_DIM)
+
+
+def make_example(rng, street, hero_pos):
+    return {
+        "street": street,
+        "num_players": 6,
+        "hero_pos": hero_pos,
+        "spr": float(rng.uniform(1, 20)),
+        "public_bucket": int(rng.integers(100)),
+        "ranges": {pos: [[int(rng.integers(100)), 0.5], [int(rng.integers(100)), 0.5]] for pos in ("BTN", "BB")},
+        "scalars": {
+            "pot_norm": float(rng.uniform(0.05, 1.0)),
+            "to_call_over_pot": float(rng.uniform(0, 1)),
+            "last_bet_over_pot": float(rng.uniform(0, 1)),
+            "aset": "balanced"
+        },
+        "target_cfv_bb": 0.0
+    }
+
+
+@pytest.fixture
+def fp32_model(tmp_path):
+    """Small MLP with outputs mean, q10, q90 of shape [batch], plus its stats and a dataset."""
+    from onnx import TensorProto, helper, numpy_helper
+
+    rng = np.random.default_rng(0)
+    hidden = 32
+    initializers = [
+        numpy_helper.from_array(rng.normal(scale=1 / np.sqrt(DIM), size=(DIM, hidden)).astype(np.float32), "W0"),
+        numpy_helper.from_array(rng.normal(scale=0.1, size=hidden).astype(np.float32), "b0"),
+    ]
+    nodes = [
+        helper.make_node("MatMul", ["features", "W0"], ["m0"]),
+        helper.make_node("Add", ["m0", "b0"], ["a0"]),
+        helper.make_node("Relu", ["a0"], ["h0"]),
+    ]
+    head = rng.normal(size=hidden).astype(np.float32)
+    for name, offset in (("mean", 0.0), ("q10", -0.1), ("q90", 0.1)):
+        initializers.append(numpy_helper.from_array(head + offset, f"w_{name}"))
+        nodes.append(helper.make_node("MatMul", ["h0", f"w_{name}"], [name]))
+    graph = helper.make_graph(
+        nodes,
+        "cfv",
+        [helper.make_tensor_value_info("features", TensorProto.FLOAT, ["batch_size", DIM])],
+        [helper.make_tensor_value_info(name, TensorProto.FLOAT, ["batch_size"]) for name in ("mean", "q10", "q90")],
+        initializers,
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    model_path = tmp_path / "cfv.onnx"
+    onnx.save(model, str(model_path))
+
+    data_dir = tmp_path / "data"
+    with CFVDatasetWriter(str(data_dir), shard_size=200) as writer:
+        for i in range(300):
+            writer.add_example(make_example(rng, ("FLOP", "TURN", "RIVER")[i % 3], ("BTN", "BB")[i % 2]))
+    builder = CFVFeatureBuilder(create_bucket_embeddings(100, EMBED_DIM, seed=0), topk_range=16, embed_dim=EMBED_DIM)
+    examples = list(CFVDatasetReader(str(data_dir), shuffle=False).read_shard(0))
+    features, streets, is_ip = examples_to_features(examples, builder)
+
+    stats = FeatureStats(mean=features.mean(axis=0), std=features.std(axis=0) + 1e-3)
+    stats_path = tmp_path / "stats.json"
+    stats_path.write_text(json.dumps(stats.to_dict()))
+
+    infer.clear_shared_sessions()
+    yield model_path, stats_path, stats, (features, streets, is_ip)
+    infer.clear_shared_sessions()
+
+
+def test_examples_to_features(fp32_model):
+    _, _, _, (features, streets, is_ip) = fp32_model
+
+    # One shard of the dataset
+    assert features.shape == (200, DIM) and features.dtype == np.float32
+    assert streets[:3] == [Street.FLOP, Street.TURN, Street.RIVER]
+    assert is_ip[:2].tolist() == [
+        Position.BTN.is_in_position_postflop(6), Position.BB.is_in_position_postflop(6)
+    ]
+
+
+@pytest.mark.parametrize("mode", ["dynamic", "static"])
+def test_quantized_model_loads_in_cfv_inference(fp32_model, tmp_path, mode):
+    model_path, stats_path, stats, (features, streets, is_ip) = fp32_model
+    quantized_path = quantize_onnx_model(
+        str(model_path), str(tmp_path / f"cfv.{mode}.onnx"), mode=mode,
+        calibration_features=features, feature_stats=stats
+    )
+
+    fp32 = infer.CFVInference(str(model_path), str(stats_path))
+    int8 = infer.CFVInference(quantized_path, str(stats_path))
+    expected = fp32.predict_batch(features, streets, is_ip)[0]
+    mean = int8.predict_batch(features, streets, is_ip)[0]
+    mean_single, _, _, _ = int8.predict(features[0], streets[0], bool(is_ip[0]))
+
+    assert np.abs(mean - expected).mean() < 0.05 * np.abs(expected).mean()
+    assert mean_single == pytest.approx(mean[0])
+
+
+def test_invalid_quantization_arguments(fp32_model, tmp_path):
+    model_path = fp32_model[0]
+    with pytest.raises(ValueError):
+        quantize_onnx_model(str(model_path), str(tmp_path / "out.onnx"), mode="fp16")
+    with pytest.raises(ValueError):
+        quantize_onnx_model(str(model_path), str(tmp_path / "out.onnx"), mode="static")
+
+
+def test_compare_models_report(fp32_model, tmp_path):
+    model_path, stats_path, stats, (features, streets, is_ip) = fp32_model
+    quantized_path = quantize_onnx_model(str(model_path), str(tmp_path / "cfv.int8.onnx"))
+
+    report = compare_models(
+        str(model_path), quantized_path, str(stats_path), features, streets, is_ip,
+        batch_sizes=(1, 16), rounds=5
+    )
+
+    assert [r['batch_size'] for r in report['latency']] == [1, 16]
+    assert all(r['fp32_p50_ms'] > 0 and r['int8_p99_ms'] > 0 for r in report['latency'])
+    assert set(report['mae']) == {'mean', 'q10', 'q90'}
+    assert report['mae']['mean'] <= report['max_abs_error']['mean']
+    assert set(report['gating']) == {'FLOP', 'TURN', 'RIVER'}
+    flop = report['gating']['FLOP']
+    assert flop['count'] == sum(street == Street.FLOP for street in streets)
+    assert flop['delta'] == pytest.approx(flop['int8_accept_rate'] - flop['fp32_accept_rate'])
+    assert 0.0 <= flop['agreement'] <= 1.0
+    assert any(line.strip().startswith("RIVER") for line in format_comparison(report))
@@ -0,0 +1,125 @@
+"""Tests for CPU affinity / NUMA placement helpers and pinned parallel training."""
+
+import os
+
+import pytest
+
+from holdem.types import MCCFRConfig, BucketConfig
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.mccfr.parallel_solver import ParallelMCCFRSolver
+from holdem.utils import affinity
+from holdem.utils.affinity import (
+    parse_cpulist, plan_cpu_sets, blas_thread_env,
+    CpuUtilizationMonitor, BLAS_THREAD_ENV_VARS
+)
+
+
+def test_parse_cpulist():
+    assert parse_cpulist("0-3,8,10-11\n") == [0, 1, 2, 3, 8, 10, 11]
+    assert parse_cpulist("5") == [5]
+    assert parse_cpulist("") == []
+
+
+def test_numa_nodes_from_sysfs(tmp_path, monkeypatch):
+    for node, cpulist in ((0, "0-3"), (1, "4-7")):
+        (tmp_path / f"node{node}").mkdir()
+        (tmp_path / f"node{node}" / "cpulist").write_text(cpulist + "\n")
+    monkeypatch.setattr(affinity, "NUMA_SYSFS_DIR", tmp_path)
+
+    assert affinity.numa_nodes(cpus=range(8)) == {0: [0, 1, 2, 3], 1: [4, 5, 6, 7]}
+    # Restricted to allowed CPUs; empty nodes dropped
+    assert affinity.numa_nodes(cpus=[1, 2]) == {0: [1, 2]}
+
+
+def test_numa_nodes_without_topology(tmp_path, monkeypatch):
+    monkeypatch.setattr(affinity, "NUMA_SYSFS_DIR", tmp_path / "missing")
+    assert affinity.numa_nodes(cpus=[0, 1]) == {0: [0, 1]}
+
+
+def test_plan_cpu_sets_spreads_across_numa_nodes(monkeypatch):
+    monkeypatch.setattr(affinity, "numa_nodes", lambda cpus=None: {0: [0, 1, 2, 3], 1: [4, 5, 6, 7]})
+
+    main_cpus, worker_sets = plan_cpu_sets(3, spread_numa=True)
+    assert main_cpus == [0]
+    # Workers 0 and 2 share node 0 (minus the main CPU), worker 1 owns node 1
+    assert worker_sets == [[1], [4, 5, 6, 7], [2, 3]]
+
+    # Disjoint and never on the main CPU
+    flat = [cpu for cpus in worker_sets for cpu in cpus]
+    assert len(flat) == len(set(flat))
+    assert 0 not in flat
+
+
+def test_plan_cpu_sets_packed_and_oversubscribed(monkeypatch):
+    monkeypatch.setattr(affinity, "numa_nodes", lambda cpus=None: {0: [0, 1, 2, 3], 1: [4, 5, 6, 7]})
+
+    _, packed = plan_cpu_sets(2, spread_numa=False)
+    # Both workers on node 0, which is split between them
+    assert packed == [[1], [2, 3]]
+
+    # More workers than CPUs: no CPU reserved for main, workers share CPUs
+    main_cpus, shared = plan_cpu_sets(10, spread_numa=True)
+    assert main_cpus == list(range(8))
+    assert all(len(cpus) == 1 for cpus in shared)
+
+
+def test_blas_thread_env_restores_environment(monkeypatch):
+    for var in BLAS_THREAD_ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("OMP_NUM_THREADS", "8")
+
+    with blas_thread_env(1):
+        assert all(os.environ[var] == "1" for var in BLAS_THREAD_ENV_VARS)
+    assert os.environ["OMP_NUM_THREADS"] == "8"
+    assert "MKL_NUM_THREADS" not in os.environ
+
+    with blas_thread_env(None):
+        assert os.environ["OMP_NUM_THREADS"] == "8"
+
+
+def test_cpu_utilization_monitor(tmp_path, monkeypatch):
+    stat = tmp_path / "stat"
+    stat.write_text(
+        "cpu  10 0 10 80 0 0 0 0 0 0\n"
+        "cpu0 5 0 5 40 0 0 0 0 0 0\n"
+        "cpu1 5 0 5 40 0 0 0 0 0 0\n"
+    )
+    monkeypatch.setattr(affinity, "PROC_STAT_PATH", stat)
+    monitor = CpuUtilizationMonitor()
+    assert monitor.available
+
+    # cpu0 fully busy for 100 jiffies, cpu1 idle
+    stat.write_text(
+        "cpu  110 0 10 180 0 0 0 0 0 0\n"
+        "cpu0 105 0 5 40 0 0 0 0 0 0\n"
+        "cpu1 5 0 5 140 0 0 0 0 0 0\n"
+    )
+    utilization = monitor.sample()
+    assert utilization == {0: pytest.approx(1.0), 1: pytest.approx(0.0)}
+    assert CpuUtilizationMonitor.format(utilization) == "0:100% 1:0%"
+
+    monkeypatch.setattr(affinity, "PROC_STAT_PATH", tmp_path / "missing")
+    assert not CpuUtilizationMonitor().available
+
+
+@pytest.mark.skipif(not affinity.affinity_supported(), reason="CPU affinity requires Linux")
+def test_pinned_parallel_training_restores_affinity(tmp_path):
+    """Workers and the main process are pinned during training; main affinity is restored afterwards."""
+    bucketing = HandBucketing(BucketConfig(k_preflop=2, k_flop=2, k_turn=2, k_river=2, num_samples=20, seed=42))
+    bucketing.build()
+    original = os.sched_getaffinity(0)
+
+    config = MCCFRConfig(
+        num_iterations=4,
+        num_workers=2,
+        batch_size=4,
+        checkpoint_interval=1000,
+        mp_start_method="fork",
+        cpu_affinity=True,
+        worker_blas_threads=1
+    )
+    solver = ParallelMCCFRSolver(config=config, bucketing=bucketing, num_players=2)
+    solver.train(logdir=tmp_path, use_tensorboard=False)
+
+    assert all(cpus for cpus in solver._worker_cpu_sets)
+    assert os.sched_getaffinity(0) == original
@@ -0,0 +1,268 @@
+"""Tests for batched leaf evaluation (LeafEvaluator.evaluate_batch, CFVInference.predict_batch)."""
+
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from holdem.types import Street, Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.rt_resolver.depth_limited_cfr import DepthLimitedCFR
+from holdem.rt_resolver.leaf_evaluator import LeafEvaluator
+from holdem.rt_resolver.subgame_builder import SubgameBuilder, SubgameState
+from holdem.value_net import CFVFeatureBuilder, create_bucket_embeddings
+from holdem.value_net.features import FeatureStats
+
+BOARD = [Card('A', 'h'), Card('K', 's'), Card('Q', 'd')]
+HERO_HAND = [Card('J', 's'), Card('T', 'h')]
+
+
+def _leaf(street, pot, history):
+    return SubgameState(street=street, board=list(BOARD), pot=pot, history=history, active_players=2, depth=1)
+
+
+def _leaves():
+    return [
+        _leaf(Street.FLOP, 100.0, ["check_call"]),
+        _leaf(Street.FLOP, 200.0, ["bet_1.0p"]),
+        _leaf(Street.TURN, 150.0, ["bet_0.66p"]),
+    ]
+
+
+def test_batch_matches_single_leaf_evaluation():
+    blueprint = Mock(spec=PolicyStore)
+    blueprint.get_strategy.return_value = {AbstractAction.BET_POT: 0.5, AbstractAction.CHECK_CALL: 0.5}
+    single = LeafEvaluator(blueprint=blueprint, use_cfv=True)
+    batch = LeafEvaluator(blueprint=blueprint, use_cfv=True)
+
+    leaves = _leaves() + [_leaves()[0]]
+    expected = [single.evaluate(leaf, HERO_HAND, {}, 0, bucket_public=1, bucket_ranges=(2, 3)) for leaf in leaves]
+    values = batch.evaluate_batch(leaves, HERO_HAND, {}, 0, bucket_public=1, bucket_ranges=(2, 3))
+
+    assert values.tolist() == pytest.approx(expected)
+    # The repeated leaf is a hit, as in the per-leaf loop
+    assert batch.get_cache_stats() == single.get_cache_stats()
+
+
+def test_cfv_net_leaves_use_one_batch_call():
+    evaluator = LeafEvaluator(blueprint=PolicyStore(), use_cfv=False, num_rollout_samples=3)
+    evaluator.mode = "cfv_net"
+    evaluator.cfv_feature_builder = CFVFeatureBuilder(create_bucket_embeddings(100, 64, seed=0), embed_dim=64)
+    evaluator.cfv_net_inference = MagicMock()
+    # Second leaf rejected by gating -> rollout fallback
+    evaluator.cfv_net_inference.predict_batch.return_value = (
+        np.array([1.5, 9.0, -2.0]), np.zeros(3), np.zeros(3), np.array([True, False, True])
+    )
+
+    values = evaluator.evaluate_batch(_leaves(), HERO_HAND, {'AsKh': 1.0}, 0)
+
+    assert evaluator.cfv_net_inference.predict_batch.call_count == 1
+    features, streets, _ = evaluator.cfv_net_inference.predict_batch.call_args[0]
+    assert features.shape[0] == 3
+    assert streets == [Street.FLOP, Street.FLOP, Street.TURN]
+    assert values[0] == 1.5 and values[2] == -2.0
+    assert values[1] != 9.0
+    assert evaluator._cfv_net_accepts == 2
+    assert evaluator._cfv_net_rejects == 1
+
+
+@pytest.fixture
+def torch_inference(tmp_path):
+    """CFVInference on a small TorchScript model (ONNX export is not needed)."""
+    torch = pytest.importorskip("torch")
+    from holdem.value_net import infer
+
+    dim = 8
+
+    class TinyNet(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.linear = torch.nn.Linear(dim, 2)
+
+        def forward(self, x):
+            out = self.linear(x)
+            return out[:, 0], out[:, 0] - out[:, 1].abs() * 0.01, out[:, 0] + out[:, 1].abs() * 0.01
+
+    torch.manual_seed(0)
+    model_path = tmp_path / "tiny.pt"
+    torch.jit.script(TinyNet()).save(str(model_path))
+    stats_path = tmp_path / "stats.json"
+    stats_path.write_text(json.dumps(FeatureStats(mean=np.zeros(dim), std=np.ones(dim)).to_dict()))
+
+    def make():
+        with patch.object(infer, "HAS_ONNX", False):
+            return infer.CFVInference(str(model_path), str(stats_path))
+
+    return make, dim
+
+
+def test_predict_batch_matches_predict(torch_inference):
+    make, dim = torch_inference
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(6, dim))
+    features[4, 0] = 10.0  # Out of distribution
+    streets = [Street.FLOP, Street.TURN, Street.RIVER, Street.PREFLOP, Street.FLOP, Street.FLOP]
+    is_ip = [True, False, True, True, False, True]
+
+    single = make()
+    expected = [single.predict(row, street, ip) for row, street, ip in zip(features, streets, is_ip)]
+    batch = make()
+    mean, q10, q90, accept = batch.predict_batch(features, streets, is_ip)
+
+    assert mean == pytest.approx([e[0] for e in expected], abs=1e-6)
+    assert q10 == pytest.approx([e[1] for e in expected], abs=1e-6)
+    assert q90 == pytest.approx([e[2] for e in expected], abs=1e-6)
+    assert accept.tolist() == [e[3] for e in expected]
+    assert accept[4] == False and accept[3] == False
+
+    # Second call is served from the cache
+    batch.predict_batch(features, streets, is_ip)
+    assert batch.get_cache_stats()['cache_hits'] == 6
+
+
+def test_predict_batch_repeats_and_gating(torch_inference):
+    make, dim = torch_inference
+    inference = make()
+    rng = np.random.default_rng(1)
+    row = rng.normal(size=dim)
+    features = np.stack([row, rng.normal(size=dim), row])
+
+    mean, _, _, accept = inference.predict_batch(features, [Street.TURN] * 3, [True, True, True])
+
+    # A row repeated within the batch is inferred once and counted as a hit, like predict()
+    stats = inference.get_cache_stats()
+    assert stats['cache_misses'] == 2 and stats['cache_hits'] == 1
+    assert mean[2] == mean[0] and accept[2] == accept[0]
+    assert inference._hash_features_batch(features)[1] == inference._hash_features(features[1])
+
+    # Vectorized gating matches the per-row gate, including preflop and boundary widths
+    n = 200
+    centers = rng.normal(scale=20.0, size=n)
+    widths = rng.choice([0.05, 0.12, 0.132, 0.2, 0.3], size=n)
+    streets = list(rng.choice([Street.PREFLOP, Street.FLOP, Street.TURN, Street.RIVER], size=n))
+    is_ip = rng.random(n) < 0.5
+    q10, q90 = centers - widths / 2, centers + widths / 2
+    expected = [inference._gate_prediction(m, lo, hi, st, ip)
+                for m, lo, hi, st, ip in zip(centers, q10, q90, streets, is_ip)]
+    assert inference._gate_batch(centers, q10, q90, streets, is_ip).tolist() == expected
+
+
+def test_depth_limited_cfr_evaluates_leaves_once():
+    evaluator = Mock(spec=LeafEvaluator)
+    evaluator.evaluate_batch.side_effect = lambda states, *args, **kwargs: np.array(
+        [10.0 if state.history[-1] == AbstractAction.BET_POT.value else 0.0 for state in states]
+    )
+    solver = DepthLimitedCFR(
+        blueprint=PolicyStore(),
+        subgame_builder=SubgameBuilder(max_depth=1),
+        leaf_evaluator=evaluator,
+        min_iterations=50,
+        max_iterations=50,
+        time_limit_ms=1000
+    )
+    root = SubgameState(street=Street.FLOP, board=list(BOARD), pot=100.0, history=[], active_players=2, depth=0)
+
+    strategy = solver.solve(root, HERO_HAND, {}, hero_position=0)
+
+    assert evaluator.evaluate_batch.call_count == 1
+    evaluator.evaluate.assert_not_called()
+    assert max(strategy, key=strategy.get) == AbstractAction.BET_POT
+    metrics = solver.get_metrics()
+    assert metrics['rt/leaves_evaluated'] == len(evaluator.evaluate_batch.call_args[0][0])
+    assert metrics['rt/leaves_per_sec'] > 0
+    assert metrics['rt/decision_time_p99_ms'] > 0
+
+
+def test_depth_limited_cfr_sizes_bets_from_the_effective_stack():
+    evaluator = Mock(spec=LeafEvaluator)
+    evaluator.evaluate_batch.side_effect = lambda states, *args, **kwargs: np.zeros(len(states))
+    solver = DepthLimitedCFR(
+        blueprint=PolicyStore(),
+        subgame_builder=SubgameBuilder(max_depth=1),
+        leaf_evaluator=evaluator,
+        min_iterations=5,
+        max_iterations=5,
+        time_limit_ms=1000
+    )
+    # Half a pot behind: a pot-sized bet is capped at the stack, like the all-in
+    root = SubgameState(street=Street.FLOP, board=list(BOARD), pot=10.0, history=[], active_players=2, depth=0,
+                        effective_stack=5.0)
+
+    solver.solve(root, HERO_HAND, {}, hero_position=0)
+
+    leaves = evaluator.evaluate_batch.call_args[0][0]
+    assert max(leaf.pot for leaf in leaves) == pytest.approx(15.0)
+    all_in = next(leaf for leaf in leaves if leaf.history[-1] == AbstractAction.ALL_IN.value)
+    assert all_in.pot == pytest.approx(15.0)
+    assert all_in.effective_stack == pytest.approx(0.0)
+
+
+def test_depth_limited_cfr_backs_up_current_strategies():
+    """A bet whose follow-ups average badly but contain the best line must win (not the mean of children)."""
+    def leaf_value(state):
+        first, last = state.history[0], state.history[-1]
+        if first == AbstractAction.BET_POT.value and len(state.history) == 2:
+            return 10.0 if last == AbstractAction.BET_POT.value else -10.0
+        return 1.0 if first == AbstractAction.CHECK_CALL.value else 0.0
+
+    evaluator = Mock(spec=LeafEvaluator)
+    evaluator.evaluate_batch.side_effect = lambda states, *args, **kwargs: np.array([leaf_value(s) for s in states])
+    solver = DepthLimitedCFR(
+        blueprint=PolicyStore(),
+        subgame_builder=SubgameBuilder(max_depth=2),
+        leaf_evaluator=evaluator,
+        min_iterations=200,
+        max_iterations=200,
+        time_limit_ms=10000,
+        kl_weight=0.0  # No pull toward the (empty) blueprint
+    )
+    root = SubgameState(street=Street.FLOP, board=list(BOARD), pot=10.0, history=[], active_players=2, depth=0,
+                        effective_stack=100.0)
+
+    strategy = solver.solve(root, HERO_HAND, {}, hero_position=0)
+
+    assert max(strategy, key=strategy.get) == AbstractAction.BET_POT
+    # Regrets are updated below the root too: the follow-up node learned its best action
+    after_bet = SubgameState(street=Street.FLOP, board=list(BOARD), pot=20.0,
+                             history=[AbstractAction.BET_POT.value], active_players=2, depth=1)
+    tree = solver.subgame_builder.build_tree(root, stack=100.0)
+    follow_up = solver.regret_tracker.get_average_strategy(
+        solver._make_infoset(after_bet, HERO_HAND), tree.actions(tree.children[tree.action_offset[0] + 1])
+    )
+    assert max(follow_up, key=follow_up.get) == AbstractAction.BET_POT
+
+
+def test_depth_limited_cfr_backs_up_batched_leaf_values():
+    evaluator = Mock(spec=LeafEvaluator)
+    evaluator.evaluate_batch.side_effect = lambda states, *args, **kwargs: np.array(
+        [float(len(state.history)) + state.pot for state in states]
+    )
+    solver = DepthLimitedCFR(
+        blueprint=PolicyStore(),
+        subgame_builder=SubgameBuilder(max_depth=2),
+        leaf_evaluator=evaluator,
+        min_iterations=20,
+        max_iterations=20,
+        time_limit_ms=10000
+    )
+    root = SubgameState(street=Street.FLOP, board=list(BOARD), pot=10.0, history=[], active_players=2, depth=0,
+                        effective_stack=100.0)
+    tree = solver.subgame_builder.build_tree(root, stack=100.0)
+
+    # One value per leaf, in tree.leaves() order
+    values = solver._evaluate_leaves(tree, root, HERO_HAND, {}, 0)
+    leaves = evaluator.evaluate_batch.call_args[0][0]
+    assert values.shape == (len(tree.leaves()),)
+    assert [tuple(leaf.history) for leaf in leaves] == [tree.history[node] for node in tree.leaves()]
+
+    # Every iteration backs the same batch up: leaves are evaluated once per solve, never one by one
+    evaluator.evaluate_batch.reset_mock()
+    solver.solve(root, HERO_HAND, {}, hero_position=0)
+    assert evaluator.evaluate_batch.call_count == 1
+    evaluator.evaluate.assert_not_called()
+    # Without the KL term the root value is a mix of leaf values
+    solver.kl_weight = 0.0
+    root_value = solver._cfr_iteration(tree, root, solver._tree_infosets(tree, root, HERO_HAND), values, 20)
+    assert values.min() <= root_value <= values.max()
@@ -0,0 +1,145 @@
+"""Tests for the leaf-value cache (LRU, TTL, keys, shared-memory backing)."""
+
+import multiprocessing
+from unittest.mock import patch
+
+import pytest
+
+from holdem.rt_resolver import leaf_cache
+from holdem.rt_resolver.leaf_cache import LeafValueCache, SharedLeafValueStore, leaf_cache_key
+from holdem.types import Card, Street
+
+BOARD = [Card('A', 'h'), Card('K', 's'), Card('Q', 'd')]
+
+
+def _key(**overrides):
+    fields = dict(
+        street=Street.FLOP, board=BOARD, history=["check_call"], pot=100.0,
+        bucket_public=1, bucket_ranges=(2, 3), action_set_id=0
+    )
+    fields.update(overrides)
+    return leaf_cache_key(**fields)
+
+
+def test_keys_are_compact_and_canonical():
+    key = _key()
+    assert isinstance(key, bytes) and len(key) == leaf_cache.KEY_BYTES
+    assert _key(board=list(reversed(BOARD))) == key
+    assert _key(pot=100.0000001) == key
+
+    others = [
+        _key(street=Street.TURN),
+        _key(board=BOARD + [Card('2', 'c')]),
+        _key(history=["bet_1.0p"]),
+        _key(history=[]),
+        _key(pot=101.0),
+        _key(bucket_public=2),
+        _key(bucket_ranges=(3, 2)),
+        _key(bucket_ranges=None),
+        _key(action_set_id=1),
+    ]
+    assert len({key, *others}) == len(others) + 1
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LeafValueCache(max_entries=2)
+    cache.put(b'a', 1.0)
+    cache.put(b'b', 2.0)
+    assert cache.get(b'a') == 1.0  # 'a' is now the most recently used
+
+    cache.put(b'c', 3.0)
+
+    assert cache.get(b'b') is None
+    assert cache.get(b'a') == 1.0 and cache.get(b'c') == 3.0
+    stats = cache.stats()
+    assert stats['evictions'] == 1
+    assert stats['entries'] == 2
+    assert stats['hits'] == 3 and stats['misses'] == 1
+    assert stats['hit_rate'] == pytest.approx(0.75)
+    assert stats['memory_mb'] > 0
+
+
+def test_ttl_expires_entries():
+    cache = LeafValueCache(ttl_seconds=10.0)
+    with patch.object(leaf_cache.time, 'time', return_value=1000.0):
+        cache.put(b'a', 1.0)
+    with patch.object(leaf_cache.time, 'time', return_value=1005.0):
+        assert cache.get(b'a') == 1.0
+    with patch.object(leaf_cache.time, 'time', return_value=1011.0):
+        assert cache.get(b'a') is None
+
+    assert len(cache) == 0
+    assert cache.stats()['expired'] == 1
+
+
+def _put_from_child(name, key, value):
+    store = SharedLeafValueStore.attach(name)
+    store.put(key, value)
+    store.close()
+
+
+def test_shared_store_is_visible_across_processes():
+    store = SharedLeafValueStore(num_slots=64)
+    try:
+        key = _key()
+        process = multiprocessing.Process(target=_put_from_child, args=(store.name, key, 4.25))
+        process.start()
+        process.join(timeout=30)
+        assert process.exitcode == 0
+
+        cache = LeafValueCache(shared=store)
+        assert cache.get(key) == 4.25
+        assert cache.get(_key(pot=200.0)) is None
+        stats = cache.stats()
+        assert stats['shared_hits'] == 1
+        assert stats['shared_memory_mb'] > 0
+        # Served locally from now on
+        assert cache.get(key) == 4.25
+        assert cache.stats()['shared_hits'] == 1
+    finally:
+        store.close()
+
+
+def test_shared_store_replaces_least_recently_used_slot():
+    store = SharedLeafValueStore(num_slots=SharedLeafValueStore.PROBE)
+    try:
+        keys = [_key(pot=float(p)) for p in range(SharedLeafValueStore.PROBE + 1)]
+        clock = iter(range(1000, 2000))
+        with patch.object(leaf_cache.time, 'time', side_effect=lambda: float(next(clock))):
+            for i, key in enumerate(keys[:-1]):
+                store.put(key, float(i))
+            for key in keys[1:-1]:
+                assert store.get(key) is not None
+
+            store.put(keys[-1], -1.0)
+
+        assert store.get(keys[0]) is None
+        assert store.get(keys[-1]) == -1.0
+        assert all(store.get(key) is not None for key in keys[1:-1])
+    finally:
+        store.close()
+
+
+def test_shared_store_ignores_torn_slots():
+    store = SharedLeafValueStore(num_slots=16)
+    try:
+        key = _key()
+        store.put(key, 1.5)
+        index = store._window(key)[0]
+        assert store.get(key) == 1.5
+        store._slots['value'][index] = 9.0  # Write in progress: checksum no longer matches
+        assert store.get(key) is None
+    finally:
+        store.close()
+
+
+def test_attach_rejects_foreign_blocks():
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(create=True, size=256)
+    try:
+        with pytest.raises(ValueError):
+            SharedLeafValueStore.attach(block.name)
+    finally:
+        block.close()
+        block.unlink()
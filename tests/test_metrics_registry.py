@@ -0,0 +1,146 @@
+"""Tests for the process-wide metrics registry and its Prometheus export."""
+
+import gc
+import threading
+import urllib.request
+
+import pytest
+
+from holdem.utils.metrics_registry import (
+    MetricsRegistry, get_metrics_registry, metrics_server_running, sanitize_metric_name,
+    start_metrics_server, stop_metrics_server
+)
+from holdem.vision.vision_cache import OcrCacheManager
+
+
+def test_counters_sum_across_threads():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_events", "Events", ["kind"])
+    child = counter.labels(kind="a")
+
+    def work():
+        for _ in range(10000):
+            child.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.labels("b").inc(2.5)
+
+    assert child.value == 40000
+    text = registry.render()
+    assert "# TYPE test_events counter" in text
+    assert 'test_events_total{kind="a"} 40000.0' in text
+    assert 'test_events_total{kind="b"} 2.5' in text
+
+
+def test_exited_threads_release_their_cells():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_short_lived", "Events").labels()
+    histogram = registry.histogram("test_short_lived_ms", "Latency", buckets=(1.0, 10.0)).labels()
+
+    def work():
+        counter.inc()
+        histogram.observe(5.0)
+
+    for _ in range(50):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    # Each exited thread's cell is folded into the base total
+    assert len(counter._cells._cells) == 0
+    assert len(histogram._cells._cells) == 0
+    assert counter.value == 50
+    assert histogram.count == 50 and histogram.sum == 250.0
+
+    counter.inc()
+    assert counter.value == 51
+    registry.reset()
+    assert counter.value == 0
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_latency_ms", "Latency", buckets=(1.0, 10.0))
+    for value in (0.5, 1.0, 5.0, 50.0):
+        histogram.observe(value)
+
+    child = histogram.labels()
+    assert child.bucket_counts() == [(1.0, 2), (10.0, 3), (float("inf"), 4)]
+    assert child.count == 4 and child.sum == pytest.approx(56.5)
+    text = registry.render()
+    assert 'test_latency_ms_bucket{le="+Inf"} 4.0' in text
+    assert "test_latency_ms_sum 56.5" in text
+
+    registry.reset()
+    assert child.count == 0
+
+
+def test_registration_is_idempotent_and_typed():
+    registry = MetricsRegistry()
+    gauge = registry.gauge("test_depth", "Queue depth")
+    assert registry.gauge("test_depth", "Queue depth") is gauge
+    with pytest.raises(ValueError):
+        registry.counter("test_depth", "Queue depth")
+    with pytest.raises(ValueError):
+        gauge.labels("x")
+
+    gauge.set(3)
+    gauge.dec()
+    assert gauge.value == 2.0
+    gauge.set_function(lambda: 7)
+    assert "test_depth 7.0" in registry.render()
+
+
+def test_collectors_export_stats_dicts():
+    class Cache:
+        def stats(self):
+            return {'hits': 3, 'hit_rate': 0.75, 'name': 'lru', 'by_type': {'stack': 1}}
+
+    registry = MetricsRegistry()
+    cache = Cache()
+    registry.register_collector("test_cache", cache.stats)
+    registry.register_collector("test_text", lambda: "# TYPE test_raw gauge\ntest_raw 1\n")
+
+    text = registry.render()
+    assert "test_cache_hits 3.0" in text and "test_cache_hit_rate 0.75" in text
+    assert "test_cache_by_type_stack 1.0" in text and "lru" not in text
+    assert "test_raw 1" in text
+    assert sanitize_metric_name("rt/decision_time_ms") == "rt_decision_time_ms"
+
+    # Bound methods are held weakly
+    del cache
+    gc.collect()
+    assert "test_cache_hits" not in registry.render()
+
+
+def test_ocr_cache_records_into_global_registry():
+    calls = get_metrics_registry().get("holdem_ocr_calls").labels("pot")
+    before = calls.value
+    manager = OcrCacheManager()
+    manager.record_ocr_call("pot")
+    manager.record_ocr_call("pot")
+    assert calls.value == before + 2
+
+
+def test_http_endpoint_and_textfile(tmp_path):
+    registry = get_metrics_registry()
+    registry.counter("test_scrapes", "Scrapes").inc()
+
+    port = start_metrics_server(port=0)
+    try:
+        assert metrics_server_running()
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=10) as response:
+            body = response.read().decode()
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "test_scrapes_total" in body
+    finally:
+        stop_metrics_server()
+    assert not metrics_server_running()
+
+    path = tmp_path / "holdem.prom"
+    registry.write_textfile(str(path))
+    assert "test_scrapes_total" in path.read_text()
@@ -0,0 +1,60 @@
+"""Tests for the ParallelMCCFRSolver worker start method option."""
+
+import platform
+
+import pytest
+
+from holdem.types import MCCFRConfig, BucketConfig
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.mccfr import parallel_solver
+from holdem.mccfr.parallel_solver import ParallelMCCFRSolver, _resolve_start_method, _process_memory_mb
+
+
+linux_only = pytest.mark.skipif(platform.system() != "Linux", reason="fork start method is Linux-only")
+
+
+def test_default_start_method_is_spawn():
+    bucketing = HandBucketing(BucketConfig(k_preflop=2, k_flop=2, k_turn=2, k_river=2))
+    solver = ParallelMCCFRSolver(MCCFRConfig(num_workers=2), bucketing)
+    assert solver.start_method == "spawn"
+    assert solver.mp_context.get_start_method() == "spawn"
+
+
+def test_invalid_start_method_rejected():
+    with pytest.raises(ValueError):
+        _resolve_start_method("threads")
+
+
+def test_fork_falls_back_to_spawn_off_linux(monkeypatch):
+    monkeypatch.setattr(parallel_solver.platform, "system", lambda: "Darwin")
+    assert _resolve_start_method("fork") == "spawn"
+    assert _resolve_start_method("forkserver") == "spawn"
+
+
+def test_process_memory_reports_rss():
+    memory = _process_memory_mb()
+    assert memory['rss_mb'] > 0
+    if platform.system() == "Linux":
+        assert 0 <= memory['private_mb'] <= memory['rss_mb']
+
+
+@linux_only
+def test_fork_pool_shares_bucketing():
+    """Fork workers inherit the built buckets and report startup memory."""
+    bucketing = HandBucketing(BucketConfig(k_preflop=2, k_flop=2, k_turn=2, k_river=2, num_samples=20, seed=42))
+    bucketing.build()
+
+    config = MCCFRConfig(num_iterations=4, num_workers=2, batch_size=2, mp_start_method="fork")
+    solver = ParallelMCCFRSolver(config, bucketing)
+    assert solver.mp_context.get_start_method() == "fork"
+
+    solver.train(logdir=None, use_tensorboard=False)
+
+    assert solver.iteration == 4
+    assert len(solver.regret_tracker.strategy_sum) > 0
+    stats = solver.pool_stats
+    assert stats['start_method'] == "fork"
+    assert stats['num_workers'] == 2
+    assert len(stats['worker_memory']) == 2
+    assert stats['start_seconds'] > 0
+    assert stats['worker_avg_private_mb'] <= stats['worker_avg_rss_mb']
@@ -0,0 +1,119 @@
+"""Tests for per-phase training profiling and the training benchmark tool."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from holdem.types import MCCFRConfig, BucketConfig
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.mccfr.solver import MCCFRSolver
+from holdem.utils.timers import PhaseProfiler
+
+# Add tools to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(scope="module")
+def bucketing():
+    """Tiny built bucketing so training iterations run quickly."""
+    bucketing = HandBucketing(BucketConfig(k_preflop=2, k_flop=2, k_turn=2, k_river=2, num_samples=20, seed=42))
+    bucketing.build()
+    return bucketing
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = PhaseProfiler(enabled=False)
+    with profiler.phase('encode'):
+        pass
+    assert profiler.snapshot() == {}
+    assert profiler.report()['phases'] == {}
+
+
+def test_profiler_accumulates_and_merges():
+    profiler = PhaseProfiler(enabled=True)
+    for _ in range(3):
+        with profiler.phase('encode'):
+            pass
+    profiler.add('merge', 0.5)
+
+    snapshot = profiler.snapshot()
+    assert snapshot['encode'][1] == 3
+    assert snapshot['merge'] == (0.5, 1)
+
+    # Worker snapshots are merged under a prefix
+    main = PhaseProfiler(enabled=True)
+    main.merge(snapshot, prefix='worker/')
+    main.merge(snapshot, prefix='worker/')
+    assert main.counts['worker/encode'] == 6
+    assert main.totals['worker/merge'] == pytest.approx(1.0)
+
+    report = main.report(iterations=10, wall_seconds=2.0)
+    merge_stats = report['phases']['worker/merge']
+    assert merge_stats['us_per_iteration'] == pytest.approx(1e5)
+    assert merge_stats['fraction'] == pytest.approx(0.5)
+
+    main.reset()
+    assert main.snapshot() == {}
+
+
+def test_solver_phase_profiling_report(bucketing, tmp_path):
+    """Profiled training records sampler/solver phases and writes a JSON report."""
+    config = MCCFRConfig(
+        num_iterations=10,
+        discount_interval=5,
+        checkpoint_interval=1000,
+        enable_phase_profiling=True
+    )
+    solver = MCCFRSolver(config=config, bucketing=bucketing, num_players=2)
+    assert solver.sampler.profiler is solver.profiler
+
+    solver.train(logdir=tmp_path, use_tensorboard=False)
+
+    report_path = tmp_path / "profile_report.json"
+    assert report_path.exists()
+    with open(report_path) as f:
+        report = json.load(f)
+
+    assert report['iterations'] == 10
+    assert report['solver'] == 'MCCFRSolver'
+    assert report['phases']['deal']['count'] == 10
+    assert report['phases']['discount']['count'] == 2
+    for phase in ('encode', 'strategy', 'regret_update'):
+        assert report['phases'][phase]['count'] > 0
+
+
+def test_solver_profiling_disabled_by_default(bucketing, tmp_path):
+    solver = MCCFRSolver(config=MCCFRConfig(num_iterations=3), bucketing=bucketing, num_players=2)
+    solver.train(logdir=tmp_path, use_tensorboard=False)
+
+    assert not solver.profiler.enabled
+    assert solver.profiler.snapshot() == {}
+    assert not (tmp_path / "profile_report.json").exists()
+
+
+def test_benchmark_configs_and_compare():
+    """Benchmark configs load into valid configs; comparison reports relative changes."""
+    from tools.benchmark_training import BENCHMARK_DIR, load_benchmark_config, compare_results
+
+    for name in ("training_small", "training_medium", "training_large"):
+        config = load_benchmark_config(BENCHMARK_DIR / f"{name}.yaml")
+        BucketConfig(**config['buckets'])
+        MCCFRConfig(**config['mccfr'])
+
+    def _result(iter_per_sec, encode_us):
+        return {
+            'name': 'small',
+            'iterations_per_second': iter_per_sec,
+            'infosets_per_second': 10 * iter_per_sec,
+            'peak_rss_mb': 100.0,
+            'profiled': True,
+            'phases': {'encode': {'us_per_iteration': encode_us}},
+            'environment': {'git_revision': None},
+        }
+
+    lines = compare_results(_result(10.0, 200.0), _result(12.0, 150.0))
+    text = "\n".join(lines)
+    assert "+20.0%" in text
+    assert "-25.0%" in text
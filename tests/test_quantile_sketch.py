@@ -0,0 +1,102 @@
+"""Tests for streaming quantile sketches and the statistics built on them."""
+
+import numpy as np
+import pytest
+
+from holdem.types import SearchConfig
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.realtime.resolver import SubgameResolver
+from holdem.utils.quantile_sketch import QuantileSketch
+from holdem.vision.vision_metrics import VisionMetrics, VisionMetricsConfig
+
+
+def test_quantiles_within_relative_accuracy():
+    values = np.random.default_rng(0).lognormal(mean=3.0, sigma=1.0, size=20000)
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    sketch.extend(values)
+
+    for q in (0.01, 0.25, 0.5, 0.9, 0.99):
+        # Compare to the nearest-rank quantile the sketch targets
+        exact = np.sort(values)[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.01)
+    assert sketch.count == len(values)
+    assert sketch.mean == pytest.approx(values.mean())
+    assert sketch.quantile(0.0) == values.min() and sketch.quantile(1.0) == values.max()
+
+
+def test_merge_matches_single_sketch():
+    values = np.random.default_rng(1).exponential(10.0, size=5000)
+    combined = QuantileSketch()
+    combined.extend(values)
+    left, right = QuantileSketch(), QuantileSketch()
+    left.extend(values[:1000])
+    right.extend(values[1000:])
+
+    left.merge(right)
+
+    assert left.count == combined.count
+    assert left.sum == pytest.approx(combined.sum)
+    for q in (0.1, 0.5, 0.99):
+        assert left.quantile(q) == combined.quantile(q)
+    with pytest.raises(ValueError):
+        left.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_memory_is_bounded():
+    sketch = QuantileSketch(max_bins=64)
+    sketch.extend(np.logspace(-6, 6, 10000))
+
+    assert len(sketch._positive) <= 64
+    # Folding only costs accuracy at the low end
+    assert sketch.quantile(0.99) == pytest.approx(np.logspace(-6, 6, 10000)[9899], rel=0.01)
+
+
+def test_signed_values_and_weights():
+    sketch = QuantileSketch()
+    for value in (-5.0, -1.0, 0.0, 0.0, 2.0, 8.0):
+        sketch.add(value)
+    sketch.add(100.0, weight=4)
+
+    assert len(sketch) == 10 and sketch.zero_count == 2
+    assert sketch.quantile(0.0) == -5.0
+    assert sketch.quantile(0.25) == 0.0
+    assert sketch.quantile(0.9) == pytest.approx(100.0, rel=0.01)
+    assert sketch.fraction_above(1.0) == pytest.approx(0.6)
+    assert sketch.fraction_above(-2.0) == pytest.approx(0.9)
+    assert sketch.fraction_above(100.0) == 0.0
+
+
+def test_empty_sketch():
+    sketch = QuantileSketch()
+    assert sketch.quantile(0.5) is None and sketch.mean is None
+    assert sketch.fraction_above(0.0) == 0.0
+    sketch.add(3.0)
+    sketch.reset()
+    assert sketch.summary() == {'count': 0, 'mean': None, 'p50': None, 'p90': None, 'p99': None}
+
+
+def test_kl_statistics_from_sketches():
+    resolver = SubgameResolver(SearchConfig(kl_high_threshold=0.3), PolicyStore())
+    for kl in np.linspace(0.0, 1.0, 101):
+        resolver.kl_history['flop']['IP'].add(kl)
+
+    stats = resolver.get_kl_statistics()['flop']['IP']
+
+    assert stats['count'] == 101
+    assert stats['avg'] == pytest.approx(0.5)
+    assert stats['p50'] == pytest.approx(0.5, rel=0.01)
+    assert stats['p90'] == pytest.approx(0.9, rel=0.01)
+    assert stats['pct_high'] == pytest.approx(70.0, abs=1.0)
+
+
+def test_vision_latency_window_is_bounded():
+    metrics = VisionMetrics(VisionMetricsConfig(latency_window_size=100))
+    for i in range(1, 1001):
+        metrics.record_parse_latency(float(i))
+
+    assert len(metrics.parse_latencies) == 100
+    # Percentiles and means still cover the whole session
+    assert metrics.get_latency_percentile("parse", 50) == pytest.approx(500.0, rel=0.01)
+    assert metrics.get_summary()['performance']['mean_parse_latency_ms'] == pytest.approx(500.5)
+    metrics.reset()
+    assert metrics.get_latency_percentile("parse", 50) is None
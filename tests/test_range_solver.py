@@ -0,0 +1,129 @@
+"""Tests for the range-vs-range vectorized subgame solver."""
+
+import numpy as np
+import pytest
+
+from holdem.types import SearchConfig, TableState, PlayerState, Street, Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.mccfr.regrets import RegretTracker
+from holdem.realtime.range_solver import (
+    COMBO_CARDS, NUM_COMBOS, FOLD, SHOWDOWN, RangeVsRangeCFR, build_betting_tree, card_index,
+    combo_index, combos_avoiding, showdown_matrix
+)
+from holdem.realtime.resolver import SubgameResolver
+from holdem.realtime.subgame import SubgameTree
+
+ACTIONS = [AbstractAction.FOLD, AbstractAction.CHECK_CALL, AbstractAction.BET_HALF_POT, AbstractAction.BET_POT]
+RIVER_BOARD = [Card('A', 'h'), Card('K', 'd'), Card('7', 'c'), Card('2', 's'), Card('9', 'h')]
+
+
+def test_combo_indexing():
+    assert len(COMBO_CARDS) == NUM_COMBOS
+    idx = combo_index([Card('A', 's'), Card('A', 'h')])
+    assert sorted(COMBO_CARDS[idx]) == sorted([card_index(Card('A', 's')), card_index(Card('A', 'h'))])
+    assert combo_index([Card('A', 'h'), Card('A', 's')]) == idx
+
+    # 52 - 5 board cards leave C(47, 2) combos
+    assert combos_avoiding([card_index(c) for c in RIVER_BOARD]).sum() == 1081
+
+
+def test_betting_tree_check_and_bet_lines():
+    nodes = build_betting_tree(ACTIONS, to_call=0.0, stack=10.0, pot=1.0, max_raises=1)
+    root = nodes[0]
+    # No fold without a bet to face
+    assert root.actions == [AbstractAction.CHECK_CALL, AbstractAction.BET_HALF_POT, AbstractAction.BET_POT]
+
+    bet_node = nodes[root.children[1]]
+    assert bet_node.player == 1
+    # Raise cap reached: opponent can only fold or call
+    assert bet_node.actions == [AbstractAction.FOLD, AbstractAction.CHECK_CALL]
+    assert nodes[bet_node.children[0]].kind == FOLD
+    call = nodes[bet_node.children[1]]
+    assert call.kind == SHOWDOWN
+    assert call.contrib == (0.5, 0.5)
+
+
+def test_showdown_matrix_river_is_exact_and_antisymmetric():
+    board = [card_index(c) for c in RIVER_BOARD]
+    combos = np.flatnonzero(combos_avoiding(board))
+    matrix = showdown_matrix(combos, board)
+
+    np.testing.assert_allclose(matrix, -matrix.T)
+    aces = list(combos).index(combo_index([Card('A', 's'), Card('A', 'd')]))
+    kings = list(combos).index(combo_index([Card('K', 's'), Card('K', 'c')]))
+    blocked = list(combos).index(combo_index([Card('A', 's'), Card('K', 's')]))
+    assert matrix[aces, kings] == 1.0
+    # Hands sharing a card never meet
+    assert matrix[aces, blocked] == 0.0
+
+
+def test_fold_values_use_card_removal():
+    solver = RangeVsRangeCFR(RIVER_BOARD, ACTIONS, pot=10.0)
+    reach = solver.ranges[1]
+    mass = solver.compatible_mass(reach[:, None])[:, 0]
+    # Uniform opponent: a hand blocks 2 * 46 - 1 = 91 of the 1081 combos
+    assert mass == pytest.approx(np.full(len(mass), (1081 - 91) / 1081))
+
+
+def test_exploitability_decreases_with_iterations():
+    solver = RangeVsRangeCFR(RIVER_BOARD, ACTIONS, pot=10.0, stack=100.0)
+    solver.iterate()
+    early = solver.exploitability()
+    for _ in range(99):
+        solver.iterate()
+    late = solver.exploitability()
+    assert late < early
+    assert late < 0.02
+
+
+def test_resolver_solves_range_vs_range():
+    tracker = RegretTracker()
+    tracker.add_strategy("RIVER:0", {AbstractAction.CHECK_CALL: 0.7, AbstractAction.BET_POT: 0.3}, 10.0)
+    resolver = SubgameResolver(SearchConfig(min_iterations=50, time_budget_ms=5000, use_range_solver=True), PolicyStore(tracker))
+
+    state = TableState(
+        street=Street.RIVER,
+        pot=10.0,
+        board=list(RIVER_BOARD),
+        players=[PlayerState("Hero", 100.0, position=0), PlayerState("Villain", 100.0, position=1)],
+        effective_stack=100.0
+    )
+    subgame = SubgameTree([Street.RIVER], state, [Card('A', 's'), Card('A', 'd')])
+    strategy = resolver.solve(subgame, "RIVER:0", street=Street.RIVER)
+
+    assert set(strategy) == set(ACTIONS)
+    assert sum(strategy.values()) == pytest.approx(1.0)
+    # Nothing to fold to at the root
+    assert strategy[AbstractAction.FOLD] == 0.0
+    # Top set bets for value
+    assert strategy[AbstractAction.BET_HALF_POT] + strategy[AbstractAction.BET_POT] > 0.5
+    assert resolver.last_solve_stats['solver'] == 'range'
+    assert resolver.last_solve_stats['iterations'] == 50
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_time_budget_binds_before_min_iterations(parallel, monkeypatch):
+    from holdem.realtime.parallel_resolver import ParallelSubgameResolver
+
+    calls = []
+    iterate = RangeVsRangeCFR.iterate
+    monkeypatch.setattr(RangeVsRangeCFR, "iterate", lambda self, **kw: calls.append(1) or iterate(self, **kw))
+
+    # A flop iteration costs milliseconds: min_iterations does not fit in the budget
+    config = SearchConfig(min_iterations=100, time_budget_ms=30, num_workers=1, use_range_solver=True)
+    resolver_cls = ParallelSubgameResolver if parallel else SubgameResolver
+    resolver = resolver_cls(config, PolicyStore(RegretTracker()))
+
+    state = TableState(
+        street=Street.FLOP,
+        pot=10.0,
+        board=list(RIVER_BOARD[:3]),
+        players=[PlayerState("Hero", 100.0, position=0), PlayerState("Villain", 100.0, position=1)],
+        effective_stack=100.0
+    )
+    subgame = SubgameTree([Street.FLOP], state, [Card('Q', 's'), Card('J', 's')])
+    strategy = resolver.solve(subgame, "FLOP:0")
+
+    assert sum(strategy.values()) == pytest.approx(1.0)
+    assert 1 <= len(calls) < config.min_iterations
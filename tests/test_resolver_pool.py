@@ -0,0 +1,139 @@
+"""Tests for the persistent worker pool of ParallelSubgameResolver."""
+
+import pytest
+
+from holdem.types import SearchConfig, BucketConfig, TableState, PlayerState, Street, Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.mccfr.regrets import RegretTracker
+from holdem.realtime.parallel_resolver import ParallelSubgameResolver, _range_solver_spec
+from holdem.realtime.subgame import SubgameTree
+from holdem.realtime.search_controller import SearchController
+
+ACTIONS = [AbstractAction.FOLD, AbstractAction.CHECK_CALL, AbstractAction.BET_POT]
+
+
+class MockSubgame:
+    def get_actions(self, infoset):
+        return list(ACTIONS)
+
+
+@pytest.fixture
+def blueprint():
+    tracker = RegretTracker()
+    tracker.add_strategy("TEST:0:initial", {
+        AbstractAction.FOLD: 0.1,
+        AbstractAction.CHECK_CALL: 0.4,
+        AbstractAction.BET_POT: 0.5
+    }, 10.0)
+    return PolicyStore(tracker)
+
+
+@pytest.fixture
+def pool_resolver(blueprint):
+    config = SearchConfig(num_workers=2, min_iterations=200, time_budget_ms=2000)
+    resolver = ParallelSubgameResolver(config, blueprint)
+    resolver.start_pool()
+    yield resolver
+    resolver.shutdown_pool()
+
+
+def test_pool_solves_repeated_decisions(pool_resolver):
+    assert pool_resolver.pool_running
+    workers = list(pool_resolver._pool_workers)
+
+    for _ in range(3):
+        strategy = pool_resolver.solve(MockSubgame(), "TEST:0:initial")
+        assert set(strategy) == set(ACTIONS)
+        assert sum(strategy.values()) == pytest.approx(1.0)
+
+    # Same processes serve every decision
+    assert pool_resolver._pool_workers == workers
+    assert all(p.is_alive() for p in workers)
+
+    stats = pool_resolver.latency_stats()
+    assert stats['count'] == 3
+    assert stats['p50_ms'] <= stats['p99_ms']
+
+
+def test_pool_returns_partial_results_at_deadline(pool_resolver):
+    """A tight deadline still yields a strategy from streamed partial results, not the blueprint fallback."""
+    pool_resolver.config.min_iterations = 10_000_000
+    strategy = pool_resolver.solve(MockSubgame(), "TEST:0:initial", time_budget_ms=300)
+    assert set(strategy) == set(ACTIONS)
+    assert sum(strategy.values()) == pytest.approx(1.0)
+
+    # Late final results of the previous solve are ignored by the next one
+    pool_resolver.config.min_iterations = 50
+    strategy = pool_resolver.solve(MockSubgame(), "TEST:0:initial", time_budget_ms=2000)
+    assert sum(strategy.values()) == pytest.approx(1.0)
+
+
+def test_pool_solves_range_vs_range_from_task_spec(pool_resolver):
+    """Pool tasks carry the table numbers and hero cards, not the SubgameTree or SearchConfig."""
+    state = TableState(
+        street=Street.RIVER,
+        pot=10.0,
+        board=[Card('A', 'h'), Card('K', 'd'), Card('7', 'c'), Card('2', 's'), Card('9', 'h')],
+        players=[PlayerState("Hero", 100.0, position=0), PlayerState("Villain", 100.0, position=1)],
+        effective_stack=100.0
+    )
+    subgame = SubgameTree([Street.RIVER], state, [Card('A', 's'), Card('A', 'd')])
+    pool_resolver.config.use_range_solver = True
+    spec = _range_solver_spec(subgame, pool_resolver.config)
+    assert not any(isinstance(value, (SubgameTree, SearchConfig, TableState)) for value in spec.values())
+
+    pool_resolver.config.min_iterations = 40
+    strategy = pool_resolver.solve(subgame, "RIVER:0")
+    assert sum(strategy.values()) == pytest.approx(1.0)
+    # Nothing to fold to at the root; top set bets for value
+    assert strategy[AbstractAction.FOLD] == 0.0
+    assert strategy[AbstractAction.BET_HALF_POT] + strategy[AbstractAction.BET_POT] > 0.5
+
+
+def test_shutdown_pool_stops_workers(blueprint):
+    resolver = ParallelSubgameResolver(SearchConfig(num_workers=2), blueprint)
+    resolver.start_pool()
+    workers = list(resolver._pool_workers)
+    resolver.shutdown_pool()
+
+    assert not resolver.pool_running
+    assert not any(p.is_alive() for p in workers)
+    # Shutdown is idempotent
+    resolver.shutdown_pool()
+
+
+def test_search_controller_starts_and_closes_pool(blueprint):
+    bucketing = HandBucketing(BucketConfig())
+    config = SearchConfig(num_workers=2)
+    controller = SearchController(config, bucketing, blueprint)
+    try:
+        assert controller.resolver.pool_running
+    finally:
+        controller.close()
+    assert not controller.resolver.pool_running
+
+    controller = SearchController(SearchConfig(num_workers=2, persistent_worker_pool=False), bucketing, blueprint)
+    assert not controller.resolver.pool_running
+
+
+def test_pool_pins_main_process_to_reserved_cpu(blueprint, monkeypatch):
+    """The CPU kept free of workers is where the caller runs while the pool is up."""
+    from holdem.realtime import parallel_resolver
+
+    pinned = []
+    monkeypatch.setattr(parallel_resolver, "affinity_supported", lambda: True)
+    monkeypatch.setattr(parallel_resolver, "plan_cpu_sets", lambda n, reserve_main=True: ([0], [[1], [2]]))
+    monkeypatch.setattr(parallel_resolver, "available_cpus", lambda: [0, 1, 2])
+    monkeypatch.setattr(parallel_resolver, "pin_current_process", lambda cpus: pinned.append(list(cpus)) or True)
+
+    resolver = ParallelSubgameResolver(SearchConfig(num_workers=2, cpu_affinity=True), blueprint)
+    resolver.start_pool()
+    try:
+        assert resolver.main_cpus == [0]
+        assert pinned == [[0]]
+    finally:
+        resolver.shutdown_pool()
+    # Original affinity restored
+    assert pinned == [[0], [0, 1, 2]]
@@ -6,6 +6,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 import numpy as np
+import pytest
 from holdem.types import Card, Street, SearchConfig, TableState
 from holdem.abstraction.actions import AbstractAction
 from holdem.mccfr.policy_store import PolicyStore
@@ -244,6 +245,94 @@ def test_config_samples_per_solve_default():
     print("✓ SearchConfig samples_per_solve defaults work")
 
 
+def _sampling_subgame():
+    state = TableState(
+        street=Street.FLOP,
+        pot=100.0,
+        board=[Card('A', 'h'), Card('K', 's'), Card('Q', 'd')]
+    )
+    our_cards = [Card('J', 'c'), Card('T', 'c')]
+    return SubgameTree([Street.FLOP], state, our_cards), our_cards
+
+
+def test_sampling_drops_boards_past_deadline():
+    """Boards that miss the shared deadline are dropped instead of stalling the decision."""
+    import time
+    from unittest.mock import patch
+    
+    config = SearchConfig(
+        time_budget_ms=100,
+        min_iterations=5,
+        enable_public_card_sampling=True,
+        num_future_boards_samples=20
+    )
+    resolver = SubgameResolver(config, PolicyStore())
+    subgame, our_cards = _sampling_subgame()
+    
+    def slow_solve(board_subgame, infoset, *args, **kwargs):
+        time.sleep(0.03)
+        return {AbstractAction.CHECK_CALL: 0.5, AbstractAction.BET_POT: 0.5}
+    
+    start = time.time()
+    with patch.object(resolver, 'solve', side_effect=slow_solve):
+        strategy = resolver.solve_with_sampling(subgame, "test_infoset", our_cards, street=Street.FLOP)
+    elapsed_ms = (time.time() - start) * 1000
+    
+    stats = resolver.last_sampling_stats
+    assert 1 <= stats['boards_solved'] < 20
+    assert stats['boards_dropped'] == 20 - stats['boards_solved']
+    assert elapsed_ms < 300  # Not 20 x 30ms
+    assert abs(sum(strategy.values()) - 1.0) < 0.01
+
+
+def test_sampling_stops_early_when_average_is_stable():
+    """Identical board strategies stop sampling after sampling_min_boards."""
+    from unittest.mock import patch
+    
+    config = SearchConfig(
+        time_budget_ms=10_000,
+        min_iterations=5,
+        enable_public_card_sampling=True,
+        num_future_boards_samples=20,
+        sampling_early_stop_tol=1e-3,
+        sampling_min_boards=3
+    )
+    resolver = SubgameResolver(config, PolicyStore())
+    subgame, our_cards = _sampling_subgame()
+    fixed = {AbstractAction.CHECK_CALL: 0.25, AbstractAction.BET_POT: 0.75}
+    
+    with patch.object(resolver, 'solve', return_value=fixed) as solve:
+        strategy = resolver.solve_with_sampling(subgame, "test_infoset", our_cards, street=Street.FLOP)
+    
+    assert solve.call_count == 3
+    assert resolver.last_sampling_stats['stopped_early']
+    assert strategy == pytest.approx(fixed)
+
+
+def test_sampling_worker_pool():
+    """Sampled boards solved by a persistent worker pool."""
+    config = SearchConfig(
+        time_budget_ms=30_000,
+        min_iterations=5,
+        enable_public_card_sampling=True,
+        num_future_boards_samples=4,
+        sampling_num_workers=2
+    )
+    resolver = SubgameResolver(config, PolicyStore())
+    subgame, our_cards = _sampling_subgame()
+    try:
+        resolver.start_pool()
+        assert resolver.pool_running
+        for _ in range(2):
+            strategy = resolver.solve_with_sampling(subgame, "test_infoset", our_cards, street=Street.FLOP)
+            assert abs(sum(strategy.values()) - 1.0) < 0.01
+            assert resolver.last_sampling_stats['boards_solved'] == 4
+            assert resolver.last_sampling_stats['workers'] == 2
+    finally:
+        resolver.shutdown_pool()
+    assert not resolver.pool_running
+
+
 if __name__ == "__main__":
     test_resolver_solve_without_sampling()
     test_resolver_solve_with_sampling()
@@ -0,0 +1,127 @@
+"""Tests for the vectorized rollout engine and hand evaluator."""
+
+from unittest.mock import Mock
+
+import eval7
+import numpy as np
+import pytest
+
+from holdem.abstraction.actions import AbstractAction
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.realtime.leaf_continuations import LeafPolicy
+from holdem.rt_resolver.leaf_evaluator import LeafEvaluator
+from holdem.rt_resolver.rollout_engine import RolloutEngine
+from holdem.rt_resolver.subgame_builder import SubgameState
+from holdem.types import Card, Street
+from holdem.utils.card_removal import COMBO_CARDS, card_index, combo_index, index_card
+from holdem.utils.hand_eval import evaluate_hands
+
+FLOP = [Card('A', 'h'), Card('K', 'd'), Card('7', 'c')]
+RIVER = FLOP + [Card('2', 's'), Card('9', 'h')]
+
+
+def _cdf(hands):
+    weights = np.zeros(len(COMBO_CARDS))
+    for hand in hands:
+        weights[combo_index(hand)] = 1.0
+    return np.cumsum(weights)
+
+
+def _state(board, pot=100.0):
+    street = {3: Street.FLOP, 4: Street.TURN, 5: Street.RIVER}[len(board)]
+    return SubgameState(street=street, board=list(board), pot=pot, history=[], active_players=2, depth=1)
+
+
+def test_evaluate_hands_orders_like_eval7():
+    rng = np.random.default_rng(0)
+    for size in (5, 6, 7):
+        cards = np.array([rng.choice(52, size, replace=False) for _ in range(3000)])
+        ours = evaluate_hands(cards)
+        theirs = np.array([eval7.evaluate([eval7.Card(str(index_card(c))) for c in row]) for row in cards])
+        first, second = slice(0, 1500), slice(1500, 3000)
+        assert np.array_equal(np.sign(ours[first] - ours[second]), np.sign(theirs[first] - theirs[second]))
+
+
+def test_evaluate_hands_edge_cases():
+    def score(hand):
+        return evaluate_hands(np.array([[card_index(Card(c[0], c[1])) for c in hand.split()]]))[0]
+
+    wheel = score("Ah 2d 3c 4s 5h Kd Kc")
+    six_high = score("2d 3c 4s 5h 6h Kd Kc")
+    assert six_high > wheel > score("Kh Kd Kc 9s 8h 2d 3c")
+    assert score("Ah 2h 3h 4h 5h Kd Kc") > score("Kh Kd Kc Ks 8h 2d 3c")
+    # Third pair does not play; the best remaining card is the kicker
+    assert score("Ah Ad Kc Ks 8h 8d 3c") == score("Ah Ad Kc Ks 8h 2d 3c")
+    assert score("Ah Ad Kc Ks Qh 8d 8c") > score("Ah Ad Kc Ks 8h 8d 3c")
+
+
+def test_runouts_avoid_dead_and_villain_cards():
+    engine = RolloutEngine(rng=np.random.default_rng(0))
+    dead = np.array([card_index(c) for c in [Card('Q', 's'), Card('J', 's')] + FLOP])
+    villain = COMBO_CARDS[engine.sample_combos(_cdf([[Card('T', 'h'), Card('T', 'd')],
+                                                     [Card('2', 'c'), Card('3', 'c')]]), 500)].astype(np.int64)
+
+    runouts = engine.sample_runouts(dead, villain, 2)
+
+    assert runouts.shape == (500, 2)
+    assert not np.isin(runouts, dead).any()
+    assert not (runouts[:, :, None] == villain[:, None, :]).any()
+    assert (runouts[:, 0] != runouts[:, 1]).all()
+    # Villain cards are only blocked in their own sample
+    assert len(np.unique(runouts)) == 52 - len(dead)
+
+
+def test_river_showdown_is_exact():
+    engine = RolloutEngine(rng=np.random.default_rng(0))
+    # Top two pair against a weaker pair and a dominated ace
+    cdf = _cdf([[Card('Q', 'c'), Card('Q', 'd')], [Card('A', 'd'), Card('3', 'c')]])
+
+    result = engine.estimate(_state(RIVER), [Card('A', 's'), Card('K', 'h')], cdf, num_samples=200)
+
+    assert result.mean == 50.0
+    assert result.stderr == 0.0
+    assert result.num_samples == 200
+
+
+def test_estimate_draws_until_target_stderr():
+    engine = RolloutEngine(rng=np.random.default_rng(0))
+    cdf = _cdf([[Card('Q', 'c'), Card('Q', 'd')], [Card('8', 'c'), Card('9', 'c')]])
+    hero = [Card('A', 's'), Card('Q', 'h')]
+
+    single = engine.estimate(_state(FLOP), hero, cdf, num_samples=100)
+    tight = engine.estimate(_state(FLOP), hero, cdf, num_samples=100, target_stderr=single.stderr / 2)
+    capped = engine.estimate(_state(FLOP), hero, cdf, num_samples=100, target_stderr=0.0, max_samples=300)
+
+    assert single.num_samples == 100
+    assert tight.num_samples > 100 and tight.stderr <= single.stderr / 2
+    assert capped.num_samples == 300
+    assert -50.0 <= tight.mean <= 50.0
+
+
+def test_continuation_play_follows_blueprint():
+    hero = [Card('2', 'c'), Card('3', 'd')]
+    hero_str = ''.join(str(c) for c in hero)
+    blueprint = Mock(spec=PolicyStore)
+    # Hero always bets, villain always folds to a bet
+    blueprint.get_strategy.side_effect = lambda infoset: (
+        {AbstractAction.BET_HALF_POT: 1.0} if infoset.startswith(hero_str)
+        else {AbstractAction.FOLD: 1.0}
+    )
+    engine = RolloutEngine(blueprint, LeafPolicy.BLUEPRINT, rng=np.random.default_rng(0))
+    cdf = _cdf([[Card('A', 'c'), Card('A', 'd')], [Card('K', 'c'), Card('K', 's')]])
+
+    result = engine.estimate(_state(RIVER), hero, cdf, num_samples=100)
+
+    # Hero would lose every showdown but wins the pot uncontested
+    assert result.mean == 50.0
+    assert RolloutEngine(rng=np.random.default_rng(0)).estimate(_state(RIVER), hero, cdf, 100).mean == -50.0
+
+
+def test_leaf_evaluator_uses_rollout_engine():
+    evaluator = LeafEvaluator(blueprint=PolicyStore(), num_rollout_samples=50, use_cfv=False,
+                              rollout_target_stderr=1e-9)
+    evaluator.rollout_engine.rng = np.random.default_rng(0)
+
+    value = evaluator.evaluate(_state(RIVER), [Card('A', 's'), Card('K', 'h')], {'QcQd': 1.0}, 0)
+
+    assert value == pytest.approx(50.0)
@@ -0,0 +1,145 @@
+"""Tests for adaptive per-decision time budgets and the hard wall-clock guard."""
+
+import json
+import time
+
+import numpy as np
+import pytest
+
+from holdem.types import SearchConfig, BucketConfig, TableState, PlayerState, Street, Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.realtime.range_solver import RangeVsRangeCFR
+from holdem.realtime.search_controller import SearchController
+from holdem.realtime.time_budget import TimeBudgetPolicy
+
+ACTIONS = [AbstractAction.FOLD, AbstractAction.CHECK_CALL, AbstractAction.BET_HALF_POT, AbstractAction.BET_POT]
+RIVER_BOARD = [Card('A', 'h'), Card('K', 'd'), Card('7', 'c'), Card('2', 's'), Card('9', 'h')]
+HERO_CARDS = [Card('Q', 's'), Card('Q', 'h')]
+
+
+def _config(**overrides):
+    fields = dict(time_budget_ms=100.0, min_iterations=100, adaptive_time_budget=True,
+                  time_budget_min_ms=10.0, time_budget_max_ms=1000.0)
+    fields.update(overrides)
+    return SearchConfig(**fields)
+
+
+def test_budget_scales_with_street_and_pot():
+    policy = TimeBudgetPolicy(_config())
+
+    preflop = policy.allocate(Street.PREFLOP, pot=10.0, stack=190.0, num_actions=4)
+    river = policy.allocate(Street.RIVER, pot=10.0, stack=190.0, num_actions=4)
+    big_river = policy.allocate(Street.RIVER, pot=200.0, stack=100.0, num_actions=4)
+
+    assert preflop.budget_ms < river.budget_ms < big_river.budget_ms
+    assert river.budget_ms == pytest.approx(100.0 * 1.5 * (1 + 10.0 / 200.0))
+
+
+def test_budget_is_clamped():
+    policy = TimeBudgetPolicy(_config(time_budget_ms=5000.0, time_budget_max_ms=300.0))
+    assert policy.allocate(Street.RIVER, 100.0, 100.0, 4).budget_ms == 300.0
+
+    policy = TimeBudgetPolicy(_config(time_budget_ms=1.0, time_budget_min_ms=20.0))
+    assert policy.allocate(Street.PREFLOP, 1.0, 100.0, 4).budget_ms == 20.0
+
+
+def test_fast_spots_bank_time_for_slow_ones():
+    policy = TimeBudgetPolicy(_config(time_bank_ms=500.0, time_bank_max_draw=0.5))
+    policy.bank_ms = 0.0
+
+    # Flop spots reach min_iterations in 20ms: budget shrinks to the observed need
+    timing = policy.allocate(Street.FLOP, 10.0, 190.0, 4)
+    policy.record(timing, 20.0, {'iterations': 100, 'iterations_per_second': 5000.0})
+    assert policy.bank_ms == pytest.approx(timing.target_ms - 20.0)
+    timing = policy.allocate(Street.FLOP, 10.0, 190.0, 4)
+    assert timing.budget_ms == pytest.approx(100 / 5000.0 * 1000 * 1.1)
+    policy.record(timing, 20.0, {'iterations': 100, 'iterations_per_second': 5000.0})
+    banked = policy.bank_ms
+
+    # A slow river spot may draw up to half the bank on top of its share
+    timing = policy.allocate(Street.RIVER, 10.0, 190.0, 8)
+    policy.record(timing, 1000.0, {'iterations': 10, 'iterations_per_second': 10.0})
+    assert policy.bank_ms == 0.0
+    timing = policy.allocate(Street.RIVER, 10.0, 190.0, 8)
+    assert timing.budget_ms == pytest.approx(timing.target_ms)
+    policy.bank_ms = banked
+    timing = policy.allocate(Street.RIVER, 10.0, 190.0, 8)
+    assert timing.budget_ms == pytest.approx(timing.target_ms + 0.5 * banked)
+
+
+def test_decisions_are_logged(tmp_path):
+    log_path = tmp_path / "budget.jsonl"
+    policy = TimeBudgetPolicy(_config(time_budget_log_path=str(log_path)))
+    for _ in range(2):
+        timing = policy.allocate(Street.TURN, 50.0, 100.0, 4)
+        policy.record(timing, 42.0, {'iterations': 80, 'iterations_per_second': 2000.0,
+                                     'preempted': True, 'final_kl': 0.01}, exploitability=0.5)
+
+    records = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert len(records) == 2
+    assert records[0]['street'] == 'turn'
+    assert records[0]['used_ms'] == 42.0 and records[0]['iterations'] == 80
+    assert records[0]['preempted'] is True and records[0]['exploitability'] == 0.5
+    stats = policy.stats()
+    assert stats['decisions'] == 2 and stats['preempted_rate'] == 1.0
+
+
+def test_expired_deadline_leaves_solver_untouched():
+    solver = RangeVsRangeCFR(RIVER_BOARD, ACTIONS, pot=10.0, stack=100.0)
+    solver.iterate()
+    regrets = {i: r.copy() for i, r in solver.regrets.items()}
+    strategy_sum = {i: s.copy() for i, s in solver.strategy_sum.items()}
+
+    assert solver.iterate(deadline=time.perf_counter() - 1.0) is None
+
+    assert solver.iterations == 1
+    assert all(np.array_equal(solver.regrets[i], regrets[i]) for i in regrets)
+    assert all(np.array_equal(solver.strategy_sum[i], strategy_sum[i]) for i in strategy_sum)
+    assert solver.iterate(deadline=time.perf_counter() + 60.0) is not None
+    assert solver.iterations == 2
+
+
+def _state():
+    return TableState(
+        street=Street.RIVER,
+        pot=10.0,
+        board=list(RIVER_BOARD),
+        players=[PlayerState("Hero", 100.0, position=0), PlayerState("Villain", 100.0, position=1)],
+        effective_stack=100.0
+    )
+
+
+@pytest.fixture(scope="module")
+def bucketing():
+    bucketing = HandBucketing(BucketConfig(k_preflop=2, k_flop=2, k_turn=2, k_river=2, num_samples=20, seed=42))
+    bucketing.build()
+    return bucketing
+
+
+def test_hard_limit_preempts_solve(bucketing):
+    config = SearchConfig(time_budget_ms=5.0, min_iterations=100000, hard_time_limit_factor=2.0)
+    controller = SearchController(config, bucketing, PolicyStore())
+
+    start = time.perf_counter()
+    action = controller.get_action(_state(), HERO_CARDS, [])
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    stats = controller.resolver.last_solve_stats
+    assert isinstance(action, AbstractAction)
+    assert stats['preempted']
+    assert stats['iterations'] < 100000
+    assert elapsed_ms < 5000.0
+
+
+def test_controller_records_adaptive_budgets(bucketing):
+    controller = SearchController(_config(min_iterations=20), bucketing, PolicyStore())
+    controller.get_action(_state(), HERO_CARDS, [])
+    controller.get_action(_state(), HERO_CARDS, [])
+
+    stats = controller.time_budget_stats()
+    assert stats['decisions'] == 2
+    record = controller.time_budget.records[-1]
+    assert record.street == 'river' and record.iterations > 0
+    assert controller.resolver.last_solve_stats['budget_ms'] == record.budget_ms
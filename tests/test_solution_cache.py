@@ -0,0 +1,115 @@
+"""Tests for the public-state keyed subgame solution cache."""
+
+import numpy as np
+import pytest
+
+from holdem.types import SearchConfig, TableState, PlayerState, Street, Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.realtime.range_solver import RangeVsRangeCFR
+from holdem.realtime.resolver import SubgameResolver
+from holdem.realtime.solution_cache import SubgameSolutionCache, public_state_key
+from holdem.realtime.subgame import SubgameTree
+
+ACTIONS = [AbstractAction.FOLD, AbstractAction.CHECK_CALL, AbstractAction.BET_HALF_POT, AbstractAction.BET_POT]
+RIVER_BOARD = [Card('A', 'h'), Card('K', 'd'), Card('7', 'c'), Card('2', 's'), Card('9', 'h')]
+# Same board with hearts and spades swapped
+ISOMORPHIC_BOARD = [Card('A', 's'), Card('K', 'd'), Card('7', 'c'), Card('2', 'h'), Card('9', 's')]
+INFOSET = "v2:RIVER:3:C"
+
+
+def _entry(size):
+    return {'regrets': {0: np.zeros(size, dtype=np.float32)}, 'strategy_sum': {0: np.zeros(size, dtype=np.float32)}}
+
+
+def test_isomorphic_boards_share_key_and_solution():
+    solver = RangeVsRangeCFR(RIVER_BOARD, ACTIONS, pot=10.0, stack=100.0)
+    for _ in range(50):
+        solver.iterate()
+    other = RangeVsRangeCFR(ISOMORPHIC_BOARD, ACTIONS, pot=10.0, stack=100.0)
+    assert public_state_key(solver, INFOSET) == public_state_key(other, INFOSET)
+    # Hand bucket is not part of the key, bet sizing is
+    assert public_state_key(solver, "v2:RIVER:5:C") == public_state_key(solver, INFOSET)
+    assert public_state_key(solver, INFOSET) != public_state_key(solver, "v2:RIVER:3:C-B75")
+
+    assert other.load_state(solver.export_state())
+    assert other.iterations == 50
+    assert other.exploitability() == pytest.approx(solver.exploitability(), abs=1e-4)
+    # Same hand up to the suit swap
+    mine = solver.root_strategy([Card('A', 's'), Card('9', 'd')])
+    theirs = other.root_strategy([Card('A', 'h'), Card('9', 'd')])
+    for action in mine:
+        assert theirs[action] == pytest.approx(mine[action], abs=1e-5)
+
+    # A different tree is rejected
+    assert not RangeVsRangeCFR(RIVER_BOARD, ACTIONS, pot=10.0, stack=100.0, max_raises=1).load_state(solver.export_state())
+
+
+def test_lru_and_memory_eviction():
+    cache = SubgameSolutionCache(max_entries=2, max_mb=1.0)
+    cache.put("a", _entry(10))
+    cache.put("b", _entry(10))
+    assert cache.get("a") is not None
+    cache.put("c", _entry(10))
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    # Two entries of ~0.4MB each fit in 1MB, a third does not
+    cache = SubgameSolutionCache(max_entries=10, max_mb=1.0)
+    for key in "xyz":
+        cache.put(key, _entry(50000))
+    assert len(cache) == 2
+    assert cache.get("x") is None
+    assert cache.stats()['memory_mb'] == pytest.approx(0.8 * 1000000 / (1024 * 1024))
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "solutions.pkl"
+    cache = SubgameSolutionCache(path=path)
+    cache.put("a", _entry(10))
+    cache.put("b", _entry(10))
+    cache.save()
+
+    loaded = SubgameSolutionCache(path=path)
+    assert len(loaded) == 2
+    assert loaded.memory_bytes == cache.memory_bytes
+    assert np.array_equal(loaded.get("b")['regrets'][0], cache.get("b")['regrets'][0])
+
+
+def test_resolver_reuses_converged_solution():
+    config = SearchConfig(min_iterations=300, time_budget_ms=60000, use_range_solver=True)
+    resolver = SubgameResolver(config, PolicyStore())
+
+    def solve(board, hero_cards):
+        state = TableState(
+            street=Street.RIVER,
+            pot=10.0,
+            board=list(board),
+            players=[PlayerState("Hero", 100.0, position=0), PlayerState("Villain", 100.0, position=1)],
+            effective_stack=100.0
+        )
+        return resolver.solve(SubgameTree([Street.RIVER], state, hero_cards), INFOSET, street=Street.RIVER)
+
+    solve(RIVER_BOARD, [Card('Q', 's'), Card('Q', 'h')])
+    assert not resolver.last_solve_stats['cache_hit']
+    assert resolver.last_solve_stats['iterations'] == 300
+
+    # Next hand: isomorphic board, different hero hand, already converged
+    strategy = solve(ISOMORPHIC_BOARD, [Card('J', 'c'), Card('J', 'd')])
+    assert resolver.last_solve_stats['cache_hit']
+    assert resolver.last_solve_stats['iterations'] < 300
+    assert sum(strategy.values()) == pytest.approx(1.0)
+
+    stats = resolver.solution_cache_stats()
+    assert stats['entries'] == 1
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == pytest.approx(0.5)
+    assert stats['avg_iterations_saved'] == 300 - resolver.last_solve_stats['iterations']
+    assert stats['memory_mb'] > 0.0
+
+
+def test_solution_cache_disabled():
+    resolver = SubgameResolver(SearchConfig(solution_cache_enabled=False), PolicyStore())
+    assert resolver.solution_cache is None
+    assert resolver.solution_cache_stats() == {}
@@ -0,0 +1,96 @@
+"""Tests for carrying a subgame solve over to the next decision of the hand."""
+
+import numpy as np
+import pytest
+
+from holdem.types import SearchConfig, BucketConfig, TableState, PlayerState, Street, Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.realtime.range_solver import RangeVsRangeCFR, ACTION
+from holdem.realtime.search_controller import SearchController
+
+ACTIONS = [AbstractAction.FOLD, AbstractAction.CHECK_CALL, AbstractAction.BET_HALF_POT, AbstractAction.BET_POT]
+RIVER_BOARD = [Card('A', 'h'), Card('K', 'd'), Card('7', 'c'), Card('2', 's'), Card('9', 'h')]
+HERO_CARDS = [Card('Q', 's'), Card('Q', 'h')]
+
+
+def _solved(iterations=200):
+    solver = RangeVsRangeCFR(RIVER_BOARD, ACTIONS, pot=10.0, stack=100.0)
+    for _ in range(iterations):
+        solver.iterate()
+    return solver
+
+
+def _state(pot, to_call):
+    return TableState(
+        street=Street.RIVER,
+        pot=pot,
+        board=list(RIVER_BOARD),
+        players=[PlayerState("Hero", 100.0, position=0), PlayerState("Villain", 100.0, position=1)],
+        to_call=to_call,
+        effective_stack=100.0
+    )
+
+
+def test_reached_node_and_ranges():
+    solver = _solved()
+    # Hero checks, villain bets half pot: 15 in the pot, 5 to call
+    node_id = solver.reached_hero_node(AbstractAction.CHECK_CALL, 15.0, 5.0)
+    assert node_id is not None
+    node = solver.nodes[node_id]
+    assert node.player == 0
+    assert node.contrib == pytest.approx((0.0, 0.5))
+    # Within tolerance of the half-pot bet, not of an overbet
+    assert solver.reached_hero_node(AbstractAction.CHECK_CALL, 14.6, 4.6) == node_id
+    assert solver.reached_hero_node(AbstractAction.CHECK_CALL, 40.0, 30.0) is None
+
+    hero_range, opponent_range = solver.reached_ranges(node_id)
+    assert hero_range.shape == opponent_range.shape == (1326,)
+    # Both ranges narrowed by the actions taken, board combos excluded
+    assert 0.0 < hero_range.sum() < 1.0
+    assert 0.0 < opponent_range.sum() < 1.0
+    assert hero_range[np.setdiff1d(np.arange(1326), solver.combos)].sum() == 0.0
+
+
+def test_carry_over_converges_faster():
+    previous = _solved()
+    node_id = previous.reached_hero_node(AbstractAction.CHECK_CALL, 15.0, 5.0)
+    hero_range, opponent_range = previous.reached_ranges(node_id)
+
+    def rerooted():
+        return RangeVsRangeCFR(RIVER_BOARD, ACTIONS, pot=15.0, to_call=5.0, stack=100.0,
+                               hero_range=hero_range, opponent_range=opponent_range)
+
+    carried, cold = rerooted(), rerooted()
+    assert carried.carry_over(previous, node_id) > 0
+    assert carried.iterations == previous.iterations
+    for _ in range(10):
+        carried.iterate()
+        cold.iterate()
+    assert carried.exploitability() < cold.exploitability()
+
+
+def test_controller_carries_over_within_street():
+    bucketing = HandBucketing(BucketConfig(k_preflop=2, k_flop=2, k_turn=2, k_river=2, num_samples=20, seed=42))
+    bucketing.build()
+    controller = SearchController(SearchConfig(min_iterations=30, use_range_solver=True), bucketing, PolicyStore())
+
+    controller.get_action(_state(10.0, 0.0), HERO_CARDS, [])
+    assert controller.resolver.last_solve_stats['carried_nodes'] == 0
+    _, hero_action, solver = controller._last_decision
+
+    # Villain replies with a bet or raise that gets back to the hero
+    root = solver.nodes[0]
+    reply = solver.nodes[root.children[root.actions.index(hero_action)]]
+    node = next(solver.nodes[c] for c in reply.children if solver.nodes[c].kind == ACTION)
+    pot = (solver.pot + sum(node.contrib)) * solver.scale
+    to_call = (node.contrib[1] - node.contrib[0]) * solver.scale
+
+    history = [hero_action.value, "villain_bet"]
+    controller.get_action(_state(pot, to_call), HERO_CARDS, history)
+    assert controller.resolver.last_solve_stats['carried_nodes'] > 0
+
+    # A new hand (history does not extend the previous one) starts cold
+    controller.get_action(_state(10.0, 0.0), HERO_CARDS, [])
+    assert controller.resolver.last_solve_stats['carried_nodes'] == 0
@@ -0,0 +1,112 @@
+"""Tests for speculative pre-solving of the hero's next decisions."""
+
+import time
+
+import pytest
+
+from holdem.types import SearchConfig, BucketConfig, TableState, PlayerState, Street, Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.realtime.search_controller import SearchController
+
+BOARD = [Card('A', 'h'), Card('K', 'd'), Card('7', 'c')]
+HERO_CARDS = [Card('Q', 's'), Card('Q', 'h')]
+
+
+@pytest.fixture(scope="module")
+def bucketing():
+    bucketing = HandBucketing(BucketConfig(k_preflop=2, k_flop=2, k_turn=2, k_river=2, num_samples=20, seed=42))
+    bucketing.build()
+    return bucketing
+
+
+def _state(pot=10.0, to_call=0.0):
+    return TableState(
+        street=Street.FLOP,
+        pot=pot,
+        board=list(BOARD),
+        players=[PlayerState("Hero", 100.0, position=0), PlayerState("Villain", 100.0, position=1)],
+        to_call=to_call,
+        effective_stack=100.0
+    )
+
+
+def _controller(bucketing, **kwargs):
+    # Empty blueprint: every opponent infoset is uniform over fold / check-call / half-pot bet
+    config = SearchConfig(speculative_presolve=True, min_iterations=20, **kwargs)
+    return SearchController(config, bucketing, PolicyStore())
+
+
+def test_predict_spots_follows_betting(bucketing):
+    speculative = _controller(bucketing).speculative
+
+    # Opponent acts first: check or half-pot bet lead to a hero decision, fold does not
+    spots = speculative.predict_spots(_state(), HERO_CARDS, [])
+    assert [(s.pot, s.to_call) for _, s in spots] == [(10.0, 0.0), (15.0, 5.0)]
+    assert spots[0][0] == pytest.approx(1 / 3)
+
+    # After a hero check only a bet gets back to the hero
+    spots = speculative.predict_spots(_state(), HERO_CARDS, ["CHECK_CALL"], hero_action=AbstractAction.CHECK_CALL)
+    assert [(s.pot, s.to_call) for _, s in spots] == [(15.0, 5.0)]
+
+    # After a pot bet (10 into 10) the opponent raises half pot: 15 on top of the call
+    spots = speculative.predict_spots(_state(), HERO_CARDS, ["BET_POT"], hero_action=AbstractAction.BET_POT)
+    assert [(s.pot, s.to_call) for _, s in spots] == [(45.0, 15.0)]
+
+    # A hero call closes the round
+    assert speculative.predict_spots(_state(to_call=5.0), HERO_CARDS, ["CHECK_CALL"],
+                                     hero_action=AbstractAction.CHECK_CALL) == []
+
+
+def test_presolved_spot_is_reused(bucketing):
+    controller = _controller(bucketing)
+    history = ["CHECK_CALL"]
+    controller.presolve(_state(), HERO_CARDS, history, hero_action=AbstractAction.CHECK_CALL)
+    controller.speculative.wait(timeout=60)
+    assert controller.speculative.presolved == 1
+
+    # Opponent bet a bit less than predicted: still within tolerance
+    action = controller.get_action(_state(pot=14.6, to_call=4.6), HERO_CARDS, history)
+    assert isinstance(action, AbstractAction)
+
+    # No pre-solved spot facing an overbet
+    controller.get_action(_state(pot=40.0, to_call=30.0), HERO_CARDS, history)
+
+    stats = controller.speculative_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == pytest.approx(0.5)
+    assert stats['latency_saved_ms_total'] >= 0.0
+
+
+def test_new_presolve_interrupts_and_joins_previous(bucketing):
+    # Budget and iterations far beyond the test: only cancellation ends the first run
+    controller = _controller(bucketing, time_budget_ms=60_000)
+    controller.config.min_iterations = 10_000_000
+    speculative = controller.speculative
+    history = ["CHECK_CALL"]
+
+    speculative.presolve(_state(), HERO_CARDS, history, hero_action=AbstractAction.CHECK_CALL)
+    first = speculative._thread
+    deadline = time.time() + 30
+    while speculative._current_solve is None and time.time() < deadline:
+        time.sleep(0.01)
+
+    start = time.time()
+    speculative.presolve(_state(pot=20.0), HERO_CARDS, history, hero_action=AbstractAction.CHECK_CALL)
+    assert not first.is_alive()
+    assert time.time() - start < 5.0
+    # The interrupted solve is not cached as a pre-solved spot
+    assert speculative.presolved == 0
+
+    controller.close()
+    speculative.wait(timeout=10)
+    assert speculative.presolved == 0
+
+
+def test_speculative_disabled_by_default(bucketing):
+    controller = SearchController(SearchConfig(), bucketing, PolicyStore())
+    assert controller.speculative is None
+    controller.presolve(_state(), HERO_CARDS, [])
+    assert controller.speculative_stats() == {}
@@ -0,0 +1,116 @@
+"""Tests for precomputed subgame betting trees (SubgameBuilder.build_tree)."""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from holdem.types import Street, Card
+from holdem.abstraction.actions import AbstractAction, ActionAbstraction
+from holdem.abstraction.action_translator import ActionSetMode
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.rt_resolver.depth_limited_cfr import DepthLimitedCFR
+from holdem.rt_resolver.leaf_evaluator import LeafEvaluator
+from holdem.rt_resolver.subgame_builder import (
+    DEPTH_LIMIT_TERMINAL, FOLD_TERMINAL, NOT_TERMINAL, SHOWDOWN_TERMINAL, SubgameBuilder, SubgameState
+)
+
+BOARD = [Card('A', 'h'), Card('K', 's'), Card('Q', 'd'), Card('7', 'c'), Card('2', 'h')]
+
+
+def _root(street=Street.FLOP, pot=100.0, history=None, effective_stack=0.0):
+    board = BOARD[:{Street.FLOP: 3, Street.TURN: 4, Street.RIVER: 5}[street]]
+    return SubgameState(street=street, board=board, pot=pot, history=history or [], active_players=2, depth=0,
+                        effective_stack=effective_stack)
+
+
+def test_tree_matches_get_actions():
+    builder = SubgameBuilder(max_depth=2, action_set_mode=ActionSetMode.LOOSE)
+    root = _root(Street.RIVER)
+    tree = builder.build_tree(root, stack=1000.0)
+
+    assert tree.actions(0) == builder.get_actions(root, stack=1000.0)
+    # Preorder: children come after their parent
+    for node in range(tree.num_nodes):
+        assert all(child > node for child in tree.child_nodes(node))
+        state = tree.state(node, root)
+        assert (tree.terminal[node] != NOT_TERMINAL) == builder.is_terminal(state)
+        if tree.terminal[node] == NOT_TERMINAL:
+            expected = builder.get_actions(state, stack=float(tree.stack[node] * root.pot))
+            assert tree.actions(node) == expected
+
+    children = dict(zip(tree.actions(0), tree.child_nodes(0)))
+    assert tree.terminal[children[AbstractAction.CHECK_CALL]] == SHOWDOWN_TERMINAL
+    bet = children[AbstractAction.BET_POT]
+    assert tree.terminal[bet] == NOT_TERMINAL
+    assert tree.history[bet] == (AbstractAction.BET_POT.value,)
+    assert tree.state(bet, root).pot == pytest.approx(200.0)
+    assert tree.stack[bet] * root.pot == pytest.approx(900.0)
+    shove = children[AbstractAction.ALL_IN]
+    assert tree.state(shove, root).pot == pytest.approx(1100.0) and tree.stack[shove] == 0.0
+
+    # Nothing to call in the subgame: folds only appear in the history of the root
+    assert AbstractAction.FOLD not in tree.slot_actions
+    assert builder.build_tree(_root(Street.RIVER, history=["fold"]), stack=1000.0).terminal[0] == FOLD_TERMINAL
+    assert set(tree.terminal[tree.leaves()]) <= {FOLD_TERMINAL, SHOWDOWN_TERMINAL, DEPTH_LIMIT_TERMINAL}
+
+
+def test_tight_mode_order_is_stable():
+    builder = SubgameBuilder(action_set_mode=ActionSetMode.TIGHT)
+    root = _root(Street.FLOP)
+    full = ActionAbstraction.get_available_actions(
+        pot=root.pot, stack=1000.0, current_bet=0.0, player_bet=0.0, can_check=True, street=Street.FLOP
+    )
+
+    actions = builder.get_actions(root, stack=1000.0)
+
+    # Sentinels included, in the full action set's order
+    assert AbstractAction.BET_THIRD_POT in actions
+    assert actions == [a for a in full if a in set(actions)]
+    assert builder.build_tree(root, stack=1000.0).actions(0) == actions
+
+
+def test_trees_are_cached_by_bucket():
+    builder = SubgameBuilder(max_depth=1)
+
+    tree = builder.build_tree(_root(pot=100.0), stack=1000.0)
+    # Same stack-to-pot ratio at another scale: same tree, scaled pots
+    assert builder.build_tree(_root(pot=10.0), stack=100.0) is tree
+    assert builder.build_tree(_root(pot=10.0, history=["check_call"]), stack=100.0) is tree
+    assert tree.state(tree.child_nodes(0)[-1], _root(pot=10.0)).pot == pytest.approx(110.0)
+
+    assert builder.build_tree(_root(pot=100.0), stack=50.0) is not tree
+    assert builder.build_tree(_root(Street.TURN), stack=1000.0) is not tree
+    stats = builder.tree_cache_stats()
+    assert stats['hits'] == 2 and stats['misses'] == 3 and stats['trees'] == 3
+
+
+def test_tree_cache_is_bounded():
+    builder = SubgameBuilder(tree_cache_size=2)
+    for stack in (100.0, 200.0, 300.0):
+        builder.build_tree(_root(), stack=stack)
+    assert builder.tree_cache_stats()['trees'] == 2
+    builder.build_tree(_root(), stack=100.0)
+    assert builder.tree_cache_stats()['misses'] == 4
+
+
+def test_depth_limited_leaves_carry_pot_after_action():
+    evaluator = Mock(spec=LeafEvaluator)
+    evaluator.evaluate_batch.side_effect = lambda states, *args, **kwargs: np.array([s.pot for s in states])
+    solver = DepthLimitedCFR(
+        blueprint=PolicyStore(),
+        subgame_builder=SubgameBuilder(max_depth=1),
+        leaf_evaluator=evaluator,
+        min_iterations=20,
+        max_iterations=20,
+        time_limit_ms=1000
+    )
+
+    strategy = solver.solve(_root(pot=100.0, effective_stack=100.0), [Card('J', 's'), Card('T', 'h')], {},
+                            hero_position=0)
+
+    leaves = evaluator.evaluate_batch.call_args[0][0]
+    pots = {leaf.history[-1]: leaf.pot for leaf in leaves}
+    assert pots[AbstractAction.CHECK_CALL.value] == pytest.approx(100.0)
+    assert pots[AbstractAction.BET_POT.value] == pytest.approx(200.0)
+    assert list(strategy) == solver.subgame_builder.get_actions(_root(pot=100.0), stack=100.0)
@@ -0,0 +1,181 @@
+"""Tests for incremental training metrics aggregation (exact and sampled modes)."""
+
+import pytest
+from holdem.types import MCCFRConfig, BucketConfig
+from holdem.abstraction.actions import AbstractAction
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.mccfr.solver import MCCFRSolver
+from holdem.mccfr.regrets import RegretTracker
+from holdem.mccfr.compact_storage import CompactRegretStorage
+from holdem.mccfr.training_metrics import TrainingMetricsAggregator
+
+
+STREETS = ["PREFLOP", "FLOP", "TURN", "RIVER"]
+ACTIONS = [AbstractAction.FOLD, AbstractAction.CHECK_CALL, AbstractAction.BET_POT]
+
+
+def _make_solver(**config_kwargs) -> MCCFRSolver:
+    config = MCCFRConfig(num_iterations=10, **config_kwargs)
+    bucketing = HandBucketing(BucketConfig(k_preflop=2, k_flop=2, k_turn=2, k_river=2))
+    return MCCFRSolver(config=config, bucketing=bucketing, num_players=2)
+
+
+def _touch(solver: MCCFRSolver, infoset: str, regrets, strategy):
+    """Simulate a sampler update at infoset (observer first, then tracker update)."""
+    tracker = solver.sampler.regret_tracker
+    solver.sampler.infoset_observer(infoset)
+    for action, regret in zip(ACTIONS, regrets):
+        tracker.update_regret(infoset, action, regret)
+    tracker.add_strategy(infoset, dict(zip(ACTIONS, strategy)))
+
+
+def _populate(solver: MCCFRSolver, count: int = 40, offset: float = 0.0):
+    for i in range(count):
+        street = STREETS[i % 4]
+        infoset = f"v2:{street}:{i % 7}:C-B{i}"
+        _touch(
+            solver, infoset,
+            regrets=[i - 20.0 + offset, 5.0 + i, -3.0],
+            strategy=[0.2, 0.5 + (i % 3) * 0.1, 0.3]
+        )
+
+
+def _full_scan(solver: MCCFRSolver):
+    metrics = dict(solver._calculate_policy_entropy_metrics())
+    for street, norm in _full_scan_norms(solver).items():
+        metrics[f'avg_regret_norm/{street}'] = norm
+    return metrics
+
+
+def _full_scan_norms(solver: MCCFRSolver):
+    saved_history = list(solver._regret_history)
+    metrics = solver._calculate_regret_norm_metrics()
+    solver._regret_history = saved_history
+    return {k.split('/')[1]: v for k, v in metrics.items() if k.startswith('avg_regret_norm/')}
+
+
+def _incremental(solver: MCCFRSolver):
+    return {k: v for k, v in solver._calculate_training_metrics().items()
+            if not k.startswith('regret_slope')}
+
+
+def test_exact_mode_matches_full_scan():
+    """Exact mode should agree with the full-scan reference computation."""
+    solver = _make_solver(training_metrics_mode="exact")
+    _populate(solver)
+
+    expected = _full_scan(solver)
+    actual = _incremental(solver)
+
+    assert set(actual) == set(expected)
+    for name, value in expected.items():
+        assert actual[name] == pytest.approx(value, rel=1e-9), name
+
+
+def test_exact_mode_tracks_discount_and_reset():
+    """Lazy discounts and CFR+ resets must be reflected without a full rescan."""
+    solver = _make_solver(training_metrics_mode="exact")
+    tracker = solver.sampler.regret_tracker
+    _populate(solver)
+    _incremental(solver)
+
+    # Discount everything (lazy) and touch only a few infosets afterwards
+    tracker.discount(regret_factor=0.5, strategy_factor=0.8)
+    _populate(solver, count=6, offset=3.0)
+    incremental = _incremental(solver)
+    # The full-scan reference reads raw regrets, so materialize pending discounts first
+    tracker.apply_pending_discounts()
+    assert incremental == pytest.approx(_full_scan(solver), rel=1e-9)
+
+    # CFR+ negative regret reset changes norms of previously touched infosets
+    tracker.reset_regrets()
+    solver._training_metrics.on_regrets_reset()
+    assert _incremental(solver) == pytest.approx(_full_scan(solver), rel=1e-9)
+
+
+def test_exact_mode_refreshes_only_touched_infosets():
+    """After a log, only newly touched infosets are pending a refresh."""
+    solver = _make_solver(training_metrics_mode="exact")
+    _populate(solver)
+    _incremental(solver)
+
+    stats = solver._training_metrics.get_stats()
+    assert stats['tracked_infosets'] == 40
+    assert stats['pending_touched'] == 0
+
+    _touch(solver, "v2:RIVER:1:C-B1", regrets=[1.0, 2.0, 3.0], strategy=[0.1, 0.1, 0.8])
+    assert solver._training_metrics.get_stats()['pending_touched'] == 1
+
+
+def test_exact_mode_compact_storage():
+    """Exact mode also works with the compact numpy storage backend."""
+    solver = _make_solver(training_metrics_mode="exact", storage_mode="compact")
+    assert isinstance(solver.sampler.regret_tracker, CompactRegretStorage)
+    _populate(solver)
+
+    # Full-scan reference only supports dict rows, so compare against a dense twin
+    dense = _make_solver(training_metrics_mode="exact")
+    _populate(dense)
+
+    compact_metrics = _incremental(solver)
+    dense_metrics = _incremental(dense)
+    assert set(compact_metrics) == set(dense_metrics)
+    for name, value in dense_metrics.items():
+        assert compact_metrics[name] == pytest.approx(value, rel=1e-5), name
+
+
+def test_sampled_mode_reservoir_bounded():
+    """Sampled mode keeps a fixed-size reservoir and estimates per-street metrics."""
+    solver = _make_solver(training_metrics_mode="sampled", training_metrics_sample_size=8)
+    _populate(solver, count=100)
+
+    stats = solver._training_metrics.get_stats()
+    assert stats['reservoir_size'] == 8
+    assert stats['infosets_seen'] == 100
+
+    metrics = _incremental(solver)
+    assert metrics
+    for name, value in metrics.items():
+        assert value >= 0, name
+
+
+def test_sampled_mode_full_reservoir_is_exact():
+    """With a reservoir larger than the table, sampled mode equals the full scan."""
+    solver = _make_solver(training_metrics_mode="sampled", training_metrics_sample_size=1000)
+    _populate(solver)
+
+    expected = _full_scan(solver)
+    assert _incremental(solver) == pytest.approx(expected, rel=1e-9)
+
+
+def test_background_mode_publishes_previous_result():
+    """Background reduction returns the last completed result."""
+    solver = _make_solver(training_metrics_mode="exact", training_metrics_background=True)
+    _populate(solver)
+
+    first = solver._training_metrics.compute()
+    assert first == ({}, {})
+
+    solver._training_metrics._pending.result(timeout=10)
+    entropy_metrics, avg_norms = solver._training_metrics.compute()
+    assert entropy_metrics
+    assert avg_norms
+    solver._training_metrics.close()
+
+
+def test_rebuild_after_state_restore():
+    """rebuild() re-seeds the aggregator from a restored tracker state."""
+    solver = _make_solver(training_metrics_mode="exact")
+    _populate(solver)
+    state = solver.sampler.regret_tracker.get_state()
+
+    restored = _make_solver(training_metrics_mode="exact")
+    restored.sampler.regret_tracker.set_state(state)
+    restored._training_metrics.rebuild()
+
+    assert _incremental(restored) == pytest.approx(_full_scan(restored), rel=1e-9)
+
+
+def test_invalid_mode_rejected():
+    with pytest.raises(ValueError):
+        TrainingMetricsAggregator(RegretTracker(), mode="approximate")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""CFV Net inference throughput benchmark.
+
+Feeds the same feature rows to CFVInference one row at a time (predict) and
+in batches (predict_batch) at batch sizes from 1 to 4096, and reports rows
+per second with a cold cache (every row is inferred) and a warm cache (every
+row is a hit), plus p50/p99 latency of a cold batch call.
+
+With an ONNX model, each combination of --intra-op-threads and IO binding
+on/off is measured with its own session (see DEFAULT_SESSION_CONFIG in
+holdem.value_net.infer).
+
+Without --model, a randomly initialized CFVNet is exported to ONNX in a
+temporary directory (TorchScript if the ONNX exporter is unavailable).
+
+Usage:
+    python tools/benchmark_cfv_infer.py
+    python tools/benchmark_cfv_infer.py --model assets/cfv_net/6max_best.onnx --stats assets/cfv_net/stats.json
+    python tools/benchmark_cfv_infer.py --model m.onnx --stats stats.json --intra-op-threads 1 2 4 --io-binding on off
+    python tools/benchmark_cfv_infer.py --batch-sizes 1 64 4096 --rows 8192 --output cfv_infer.json
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from holdem.types import Street
+from holdem.value_net import infer
+from holdem.value_net.features import FeatureStats, get_feature_dimension
+
+DEFAULT_BATCH_SIZES = [1, 4, 16, 64, 256, 1024, 4096]
+
+
+def build_random_model(workdir: Path, hidden_dims: List[int]):
+    """Random CFVNet saved to workdir; returns (model_path, stats_path, feature_dim)."""
+    import torch
+    from holdem.value_net import CFVNet
+
+    dim = get_feature_dimension(embed_dim=64)
+    torch.manual_seed(0)
+    model = CFVNet(input_dim=dim, hidden_dims=hidden_dims, dropout=0.0).eval()
+    stats_path = workdir / "stats.json"
+    stats_path.write_text(json.dumps(FeatureStats(mean=np.zeros(dim), std=np.ones(dim)).to_dict()))
+
+    model_path = workdir / "cfv_net.onnx"
+    try:
+        infer.export_to_onnx(model, str(model_path), dim)
+    except Exception as e:
+        print(f"ONNX export unavailable ({e.__class__.__name__}: {e}); benchmarking TorchScript")
+        model_path = workdir / "cfv_net.pt"
+        traced = torch.jit.trace(model, torch.zeros(1, dim), strict=False)
+        traced.save(str(model_path))
+        infer.HAS_ONNX = False
+    return model_path, stats_path, dim
+
+
+def time_rows(run, rounds: int) -> np.ndarray:
+    """Seconds of each round of run()."""
+    times = np.empty(rounds)
+    for i in range(rounds):
+        start = time.perf_counter()
+        run()
+        times[i] = time.perf_counter() - start
+    return times
+
+
+def bench_batch_size(inference, features: np.ndarray, batch_size: int, total_rows: int) -> Dict:
+    rows = features[:batch_size]
+    streets = [Street.FLOP, Street.TURN, Street.RIVER] * (batch_size // 3 + 1)
+    streets = streets[:batch_size]
+    is_ip = (np.arange(batch_size) % 2 == 0).tolist()
+    rounds = max(1, total_rows // batch_size)
+
+    def per_row_cold():
+        inference.clear_cache()
+        for row, street, ip in zip(rows, streets, is_ip):
+            inference.predict(row, street, ip)
+
+    def batch_cold():
+        inference.clear_cache()
+        inference.predict_batch(rows, streets, is_ip)
+
+    def batch_warm():
+        inference.predict_batch(rows, streets, is_ip)
+
+    per_row = time_rows(per_row_cold, rounds).mean()
+    batch_times = time_rows(batch_cold, rounds)
+    batch = batch_times.mean()
+    inference.clear_cache()
+    inference.predict_batch(rows, streets, is_ip)
+    warm = time_rows(batch_warm, rounds).mean()
+    return {
+        'batch_size': batch_size,
+        'per_row_rows_per_s': batch_size / per_row,
+        'batch_rows_per_s': batch_size / batch,
+        'batch_warm_rows_per_s': batch_size / warm,
+        'batch_p50_ms': float(np.percentile(batch_times, 50)) * 1000,
+        'batch_p99_ms': float(np.percentile(batch_times, 99)) * 1000,
+        'speedup': per_row / batch,
+    }
+
+
+def format_results(results: List[Dict]) -> List[str]:
+    """Human-readable table."""
+    lines = [
+        f"{'session':>12} {'batch':>6} {'per-row/s':>11} {'batch/s':>11} {'warm/s':>11} "
+        f"{'p50 (ms)':>9} {'p99 (ms)':>9} {'speedup':>8}"
+    ]
+    for r in results:
+        lines.append(
+            f"{r['session']:>12} {r['batch_size']:>6} {r['per_row_rows_per_s']:>11.0f} {r['batch_rows_per_s']:>11.0f} "
+            f"{r['batch_warm_rows_per_s']:>11.0f} {r['batch_p50_ms']:>9.3f} {r['batch_p99_ms']:>9.3f} "
+            f"{r['speedup']:>7.1f}x"
+        )
+    return lines
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="CFVInference predict vs predict_batch throughput")
+    parser.add_argument('--model', type=Path, help='CFV Net ONNX model (default: random CFVNet)')
+    parser.add_argument('--stats', type=Path, help='Feature stats JSON for --model')
+    parser.add_argument('--hidden-dims', type=int, nargs='+', default=[512, 512, 256],
+                        help='Hidden layers of the random model (default: 512 512 256)')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=DEFAULT_BATCH_SIZES,
+                        help='Batch sizes to measure (default: 1 4 16 ... 4096)')
+    parser.add_argument('--rows', type=int, default=4096, help='Rows per measurement (default: 4096)')
+    parser.add_argument('--intra-op-threads', type=int, nargs='+', default=[1],
+                        help='ONNX Runtime intra-op thread counts to compare (default: 1)')
+    parser.add_argument('--io-binding', choices=['on', 'off'], nargs='+', default=['on'],
+                        help='Pre-bound IO buffers on and/or off (default: on)')
+    parser.add_argument('--output', type=Path, help='Save results as JSON')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.model:
+            if not args.stats:
+                parser.error("--model requires --stats")
+            model_path, stats_path = args.model, args.stats
+            with open(stats_path) as f:
+                dim = len(json.load(f)['mean'])
+        else:
+            model_path, stats_path, dim = build_random_model(Path(workdir), args.hidden_dims)
+        # Scaled down so that rows stay within the OOD threshold and reach the model
+        features = np.random.default_rng(0).normal(scale=0.5, size=(max(args.batch_sizes), dim))
+
+        sessions = [(t, b) for t in args.intra_op_threads for b in args.io_binding] if infer.HAS_ONNX else [(0, 'off')]
+        results = []
+        for threads, binding in sessions:
+            session_config = {
+                'intra_op_num_threads': threads,
+                'io_binding_batch_sizes': infer.DEFAULT_SESSION_CONFIG['io_binding_batch_sizes'] if binding == 'on' else (),
+            }
+            inference = infer.CFVInference(
+                str(model_path), str(stats_path), cache_max_size=max(args.batch_sizes), session_config=session_config
+            )
+            name = f"t{threads}/io-{binding}" if infer.HAS_ONNX else "torch"
+            for b in args.batch_sizes:
+                results.append({'session': name, **bench_batch_size(inference, features, b, args.rows)})
+
+    print("\n".join(format_results(results)))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
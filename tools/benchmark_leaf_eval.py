@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Leaf evaluation benchmark for depth-limited resolving.
+
+Runs DepthLimitedCFR solves with the leaves of each subgame evaluated one at
+a time (LeafEvaluator.evaluate per leaf) and in one batch
+(LeafEvaluator.evaluate_batch), and reports leaves per second and solve
+latency percentiles for both.
+
+Usage:
+    python tools/benchmark_leaf_eval.py
+    python tools/benchmark_leaf_eval.py --max-depth 2 --solves 200
+    python tools/benchmark_leaf_eval.py --mode cfv_net --checkpoint assets/cfv_net/6max_best.onnx
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from holdem.types import Card, Street
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.rt_resolver.depth_limited_cfr import DepthLimitedCFR
+from holdem.rt_resolver.leaf_evaluator import LeafEvaluator
+from holdem.rt_resolver.subgame_builder import SubgameBuilder, SubgameState
+from holdem.utils.logging import get_logger
+
+logger = get_logger("benchmark_leaf_eval")
+
+BOARD = [Card('A', 'h'), Card('K', 'd'), Card('7', 'c')]
+HERO_HAND = [Card('Q', 's'), Card('J', 's')]
+VILLAIN_RANGE = {'AA': 0.2, 'KK': 0.2, 'AK': 0.3, 'QQ': 0.1, '77': 0.2}
+
+
+class PerLeafEvaluator(LeafEvaluator):
+    """Evaluates a batch one leaf at a time (the pre-batching behavior)."""
+
+    def evaluate_batch(self, states, hero_hand, villain_range, hero_position, *args, **kwargs):
+        return np.array([
+            self.evaluate(state, hero_hand, villain_range, hero_position, *args, **kwargs)
+            for state in states
+        ])
+
+
+def run_variant(name: str, evaluator_cls, args) -> Dict:
+    """Solve the same subgame repeatedly, timing leaf evaluation and solves."""
+    blueprint = PolicyStore()
+    cfv_net_config = {'checkpoint': str(args.checkpoint)} if args.checkpoint else None
+    evaluator = evaluator_cls(
+        blueprint=blueprint,
+        num_rollout_samples=args.rollout_samples,
+        use_cfv=False,
+        enable_cache=False,
+        mode=args.mode,
+        cfv_net_config=cfv_net_config
+    )
+    solver = DepthLimitedCFR(
+        blueprint=blueprint,
+        subgame_builder=SubgameBuilder(max_depth=args.max_depth),
+        leaf_evaluator=evaluator,
+        min_iterations=args.iterations,
+        max_iterations=args.iterations,
+        time_limit_ms=10_000
+    )
+    root = SubgameState(street=Street.FLOP, board=list(BOARD), pot=100.0, history=[], active_players=2, depth=0,
+                        effective_stack=100.0)
+
+    leaves = 0
+    leaf_seconds = 0.0
+    latencies = []
+    for _ in range(args.solves):
+        start = time.perf_counter()
+        solver.solve(root, HERO_HAND, VILLAIN_RANGE, hero_position=0)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+        leaves += solver.last_leaf_count
+        leaf_seconds += solver.last_leaf_eval_ms / 1000.0
+
+    latencies = np.array(latencies)
+    return {
+        'variant': name,
+        'leaves_per_solve': leaves / args.solves,
+        'leaves_per_second': leaves / leaf_seconds if leaf_seconds > 0 else 0.0,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'mean_ms': float(latencies.mean()),
+    }
+
+
+def format_results(results: List[Dict]) -> List[str]:
+    """Human-readable table."""
+    lines = [f"{'Variant':>10} {'leaves':>7} {'leaves/s':>10} {'p50 (ms)':>9} {'p99 (ms)':>9}"]
+    for r in results:
+        lines.append(
+            f"{r['variant']:>10} {r['leaves_per_solve']:>7.0f} {r['leaves_per_second']:>10.0f} "
+            f"{r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f}"
+        )
+    return lines
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Per-leaf vs batched leaf evaluation benchmark")
+    parser.add_argument('--mode', choices=['rollout', 'blueprint', 'cfv_net'], default='rollout',
+                        help='Leaf evaluation mode (default: rollout)')
+    parser.add_argument('--checkpoint', type=Path, help='CFV Net ONNX model (for --mode cfv_net)')
+    parser.add_argument('--max-depth', type=int, default=2, help='Subgame depth (default: 2)')
+    parser.add_argument('--solves', type=int, default=100, help='Solves per variant (default: 100)')
+    parser.add_argument('--iterations', type=int, default=100, help='CFR iterations per solve (default: 100)')
+    parser.add_argument('--rollout-samples', type=int, default=10, help='Rollouts per leaf (default: 10)')
+    parser.add_argument('--output', type=Path, help='Save results as JSON')
+    args = parser.parse_args()
+
+    results = [
+        run_variant('per-leaf', PerLeafEvaluator, args),
+        run_variant('batch', LeafEvaluator, args),
+    ]
+
+    print("\n".join(format_results(results)))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Decision latency benchmark for the parallel real-time resolver.
+
+Runs the same sequence of decisions through ParallelSubgameResolver with a
+persistent (warm) worker pool and with the per-solve spawn path, and reports
+p50/p99 decision latency for each.
+
+Usage:
+    python tools/benchmark_resolver.py --workers 2 --decisions 50 --time-budget-ms 200
+    python tools/benchmark_resolver.py --modes pool --output pool.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from holdem.types import SearchConfig, TableState, PlayerState, Street, Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.mccfr.policy_store import PolicyStore
+from holdem.mccfr.regrets import RegretTracker
+from holdem.realtime.parallel_resolver import ParallelSubgameResolver
+from holdem.realtime.subgame import SubgameTree
+from holdem.utils.logging import get_logger
+
+logger = get_logger("benchmark_resolver")
+
+NUM_INFOSETS = 64
+
+
+def _make_blueprint() -> PolicyStore:
+    """Synthetic blueprint with NUM_INFOSETS infosets."""
+    tracker = RegretTracker()
+    for i in range(NUM_INFOSETS):
+        tracker.add_strategy(f"BENCH:{i}", {
+            AbstractAction.FOLD: 0.1 + 0.005 * i,
+            AbstractAction.CHECK_CALL: 0.4,
+            AbstractAction.BET_HALF_POT: 0.3,
+            AbstractAction.BET_POT: 0.2
+        }, 10.0)
+    return PolicyStore(tracker)
+
+
+def _make_subgame() -> SubgameTree:
+    state = TableState(
+        street=Street.FLOP,
+        pot=10.0,
+        board=[Card('A', 'h'), Card('K', 'd'), Card('7', 'c')],
+        players=[PlayerState("Hero", 100.0, position=0), PlayerState("Villain", 100.0, position=1)]
+    )
+    return SubgameTree([Street.FLOP, Street.TURN], state, [Card('Q', 's'), Card('Q', 'h')])
+
+
+def run_mode(mode: str, config: SearchConfig, num_decisions: int) -> Dict:
+    """Run num_decisions solves with the given mode ('pool' or 'spawn')."""
+    blueprint = _make_blueprint()
+    subgame = _make_subgame()
+    resolver = ParallelSubgameResolver(config, blueprint)
+
+    startup_seconds = 0.0
+    if mode == "pool":
+        start = time.perf_counter()
+        resolver.start_pool()
+        startup_seconds = time.perf_counter() - start
+
+    try:
+        for i in range(num_decisions):
+            resolver.solve(subgame, f"BENCH:{i % NUM_INFOSETS}", time_budget_ms=config.time_budget_ms)
+    finally:
+        resolver.shutdown_pool()
+
+    stats = resolver.latency_stats()
+    return {
+        'mode': mode,
+        'num_workers': resolver.num_workers,
+        'decisions': num_decisions,
+        'time_budget_ms': config.time_budget_ms,
+        'min_iterations': config.min_iterations,
+        'pool_startup_seconds': startup_seconds,
+        'p50_ms': stats['p50_ms'],
+        'p99_ms': stats['p99_ms'],
+        'mean_ms': stats['mean_ms'],
+    }
+
+
+def format_results(results: List[Dict]) -> List[str]:
+    """Human-readable comparison table."""
+    lines = [f"  {'Mode':<8} {'p50 (ms)':>10} {'p99 (ms)':>10} {'mean (ms)':>10} {'startup (s)':>12}"]
+    for r in results:
+        lines.append(
+            f"  {r['mode']:<8} {r['p50_ms']:>10.1f} {r['p99_ms']:>10.1f} {r['mean_ms']:>10.1f} "
+            f"{r['pool_startup_seconds']:>12.2f}"
+        )
+    return lines
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Parallel resolver decision latency benchmark")
+    parser.add_argument('--workers', type=int, default=2, help='Resolver worker processes (default: 2)')
+    parser.add_argument('--decisions', type=int, default=50, help='Decisions per mode (default: 50)')
+    parser.add_argument('--time-budget-ms', type=int, default=200, help='Time budget per decision (default: 200)')
+    parser.add_argument('--min-iters', type=int, default=400, help='Iterations per decision (default: 400)')
+    parser.add_argument('--modes', nargs='+', choices=['pool', 'spawn'], default=['pool', 'spawn'],
+                        help='Resolver modes to benchmark (default: pool spawn)')
+    parser.add_argument('--output', type=Path, help='Save results as JSON')
+    args = parser.parse_args()
+
+    config = SearchConfig(
+        time_budget_ms=args.time_budget_ms,
+        min_iterations=args.min_iters,
+        num_workers=args.workers
+    )
+
+    results = []
+    for mode in args.modes:
+        logger.info(f"Running {args.decisions} decisions with mode '{mode}'...")
+        results.append(run_mode(mode, config, args.decisions))
+
+    print(f"Decision latency ({args.workers} workers, budget {args.time_budget_ms}ms, "
+          f"{args.min_iters} iterations, {args.decisions} decisions)")
+    print("\n".join(format_results(results)))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Convergence benchmark for the range-vs-range subgame solver.
+
+Solves fixed flop, turn and river spots with RangeVsRangeCFR and reports,
+for each iteration budget, the iterations per second and the exploitability
+of the average strategy (in fractions of the pot).
+
+Usage:
+    python tools/benchmark_subgame.py
+    python tools/benchmark_subgame.py --iterations 10 50 100 200 500 --output subgame.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from holdem.types import Card
+from holdem.abstraction.actions import AbstractAction
+from holdem.realtime.range_solver import RangeVsRangeCFR
+from holdem.utils.logging import get_logger
+
+logger = get_logger("benchmark_subgame")
+
+ACTIONS = [AbstractAction.FOLD, AbstractAction.CHECK_CALL, AbstractAction.BET_HALF_POT, AbstractAction.BET_POT]
+
+SPOTS = {
+    'flop': [Card('A', 'h'), Card('K', 'd'), Card('7', 'c')],
+    'turn': [Card('A', 'h'), Card('K', 'd'), Card('7', 'c'), Card('2', 's')],
+    'river': [Card('A', 'h'), Card('K', 'd'), Card('7', 'c'), Card('2', 's'), Card('9', 'h')],
+}
+
+
+def run_spot(name: str, iteration_budgets: List[int], args) -> Dict:
+    """Solve one spot, measuring exploitability at each iteration budget."""
+    start = time.perf_counter()
+    solver = RangeVsRangeCFR(
+        SPOTS[name], ACTIONS, pot=args.pot, to_call=args.to_call, stack=args.stack,
+        max_raises=args.max_raises, num_runouts=args.runouts, rng=np.random.default_rng(args.seed)
+    )
+    setup_seconds = time.perf_counter() - start
+
+    points = []
+    solve_seconds = 0.0
+    for budget in sorted(iteration_budgets):
+        start = time.perf_counter()
+        while solver.iterations < budget:
+            solver.iterate()
+        solve_seconds += time.perf_counter() - start
+        points.append({
+            'iterations': budget,
+            'seconds': solve_seconds,
+            'iterations_per_second': budget / solve_seconds if solve_seconds > 0 else 0.0,
+            'exploitability': solver.exploitability(),
+        })
+
+    return {
+        'spot': name,
+        'hands': len(solver.combos),
+        'tree_nodes': len(solver.nodes),
+        'setup_seconds': setup_seconds,
+        'points': points,
+    }
+
+
+def format_results(results: List[Dict]) -> List[str]:
+    """Human-readable table per spot."""
+    lines = []
+    for r in results:
+        lines.append(f"{r['spot']}: {r['hands']} hands, {r['tree_nodes']} tree nodes, setup {r['setup_seconds'] * 1000:.0f}ms")
+        lines.append(f"  {'Iters':>6} {'it/s':>8} {'time (ms)':>10} {'exploit (pot)':>14}")
+        for p in r['points']:
+            lines.append(
+                f"  {p['iterations']:>6} {p['iterations_per_second']:>8.0f} {p['seconds'] * 1000:>10.1f} "
+                f"{p['exploitability']:>14.5f}"
+            )
+    return lines
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Range-vs-range subgame solver convergence benchmark")
+    parser.add_argument('--spots', nargs='+', choices=list(SPOTS), default=list(SPOTS),
+                        help='Spots to solve (default: flop turn river)')
+    parser.add_argument('--iterations', type=int, nargs='+', default=[10, 50, 100, 200, 500],
+                        help='Iteration budgets (default: 10 50 100 200 500)')
+    parser.add_argument('--pot', type=float, default=10.0, help='Pot size (default: 10)')
+    parser.add_argument('--to-call', type=float, default=0.0, help='Amount to call at the root (default: 0)')
+    parser.add_argument('--stack', type=float, default=100.0, help='Effective stack (default: 100)')
+    parser.add_argument('--max-raises', type=int, default=2, help='Bets/raises per street (default: 2)')
+    parser.add_argument('--runouts', type=int, default=8, help='Leaf runouts before the river (default: 8)')
+    parser.add_argument('--seed', type=int, default=42, help='Runout sampling seed (default: 42)')
+    parser.add_argument('--output', type=Path, help='Save results as JSON')
+    args = parser.parse_args()
+
+    results = []
+    for spot in args.spots:
+        logger.info(f"Solving {spot} spot...")
+        results.append(run_spot(spot, args.iterations, args))
+
+    print("\n".join(format_results(results)))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
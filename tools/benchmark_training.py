@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""Reproducible MCCFR training throughput benchmark.
+
+Runs blueprint training on fixed-seed benchmark configs (configs/benchmarks/)
+and reports iterations per second, infosets per second, peak RSS and the
+per-phase time breakdown collected by the solver's PhaseProfiler. Results can
+be saved as JSON and two result files compared side by side.
+
+Usage:
+    python tools/benchmark_training.py configs/benchmarks/training_small.yaml
+    python tools/benchmark_training.py configs/benchmarks/training_medium.yaml --output before.json
+    python tools/benchmark_training.py --compare before.json after.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import yaml
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from holdem.types import BucketConfig, MCCFRConfig
+from holdem.abstraction.bucketing import HandBucketing
+from holdem.mccfr.solver import MCCFRSolver
+from holdem.mccfr.parallel_solver import ParallelMCCFRSolver
+from holdem.utils.rng import set_seed
+from holdem.utils.logging import get_logger
+
+logger = get_logger("benchmark_training")
+
+BENCHMARK_DIR = Path(__file__).parent.parent / "configs" / "benchmarks"
+
+
+def _peak_rss_mb(who: int) -> float:
+    """Peak resident set size in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(who).ru_maxrss
+    if platform.system() == "Darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _git_revision() -> Optional[str]:
+    """Current git revision of the repository, if available."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent.parent,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_benchmark_config(path: Path) -> Dict:
+    """Load a benchmark config (name, seed, buckets, mccfr sections)."""
+    with open(path) as f:
+        config = yaml.safe_load(f)
+    config.setdefault('name', path.stem)
+    config.setdefault('seed', 42)
+    config.setdefault('buckets', {})
+    config.setdefault('mccfr', {})
+    return config
+
+
+def _seed_everything(seed: int):
+    """Seed the global RNG, numpy and Python's random (used by eval7 equity sampling)."""
+    set_seed(seed)
+    random.seed(seed)
+
+
+def run_benchmark(config: Dict, profile: bool = True, start_method: Optional[str] = None) -> Dict:
+    """Run one benchmark config and collect throughput metrics.
+
+    Bucket building is excluded from the timed section.
+
+    Args:
+        config: Benchmark config as returned by load_benchmark_config
+        profile: Enable per-phase profiling (adds a small timing overhead)
+        start_method: Override mccfr.mp_start_method for parallel configs
+
+    Returns:
+        JSON-serializable benchmark result
+    """
+    seed = config['seed']
+
+    _seed_everything(seed)
+    bucket_config = BucketConfig(seed=seed, **config['buckets'])
+    bucketing = HandBucketing(bucket_config)
+    logger.info(f"[{config['name']}] Building buckets ({bucket_config.num_samples} samples per street)...")
+    bucketing.build()
+
+    mccfr_options = dict(config['mccfr'])
+    if start_method is not None:
+        mccfr_options['mp_start_method'] = start_method
+    mccfr_config = MCCFRConfig(enable_phase_profiling=profile, **mccfr_options)
+
+    # Re-seed so the sampler stream does not depend on how many draws the bucket build used
+    _seed_everything(seed)
+    if mccfr_config.num_workers == 1:
+        solver = MCCFRSolver(config=mccfr_config, bucketing=bucketing)
+    else:
+        solver = ParallelMCCFRSolver(config=mccfr_config, bucketing=bucketing)
+
+    logger.info(f"[{config['name']}] Training {mccfr_config.num_iterations} iterations "
+                f"with {type(solver).__name__}...")
+    start = time.perf_counter()
+    solver.train(logdir=None, use_tensorboard=False)
+    wall_seconds = time.perf_counter() - start
+
+    iterations = mccfr_config.num_iterations
+    report = solver.get_profile_report(iterations, wall_seconds)
+    num_infosets = report['num_infosets']
+
+    return {
+        'name': config['name'],
+        'seed': seed,
+        'solver': report['solver'],
+        'num_workers': mccfr_config.num_workers,
+        'iterations': iterations,
+        'wall_seconds': wall_seconds,
+        'iterations_per_second': iterations / wall_seconds if wall_seconds > 0 else 0.0,
+        'num_infosets': num_infosets,
+        'infosets_per_second': num_infosets / wall_seconds if wall_seconds > 0 else 0.0,
+        'peak_rss_mb': _peak_rss_mb(resource.RUSAGE_SELF),
+        'peak_rss_children_mb': _peak_rss_mb(resource.RUSAGE_CHILDREN),
+        'profiled': profile,
+        'phases': report['phases'],
+        'worker_pool': getattr(solver, 'pool_stats', {}),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'git_revision': _git_revision(),
+        },
+    }
+
+
+def format_result(result: Dict) -> List[str]:
+    """Human-readable summary lines for one benchmark result."""
+    lines = [
+        f"Benchmark: {result['name']} ({result['solver']}, {result['num_workers']} worker(s), seed {result['seed']})",
+        f"  Iterations:      {result['iterations']} in {result['wall_seconds']:.2f}s",
+        f"  Throughput:      {result['iterations_per_second']:.1f} iter/s, "
+        f"{result['infosets_per_second']:.1f} infosets/s ({result['num_infosets']} infosets)",
+        f"  Peak RSS:        {result['peak_rss_mb']:.1f} MB (children: {result['peak_rss_children_mb']:.1f} MB)",
+    ]
+    pool = result.get('worker_pool')
+    if pool:
+        memory = ", ".join(
+            f"{key[len('worker_avg_'):-len('_mb')]} {pool[key]:.1f} MB"
+            for key in ('worker_avg_rss_mb', 'worker_avg_pss_mb', 'worker_avg_private_mb')
+            if key in pool
+        )
+        lines.append(f"  Worker pool:     '{pool['start_method']}' start in {pool['start_seconds']:.2f}s, "
+                     f"per worker: {memory}")
+    if result['phases']:
+        lines.append(f"  {'Phase':<24} {'Total (s)':>10} {'µs/iter':>10} {'% wall':>7}")
+        phases = sorted(result['phases'].items(), key=lambda kv: -kv[1]['total_seconds'])
+        for phase, stats in phases:
+            lines.append(
+                f"  {phase:<24} {stats['total_seconds']:>10.3f} "
+                f"{stats['us_per_iteration']:>10.1f} {100 * stats['fraction']:>6.1f}%"
+            )
+    return lines
+
+
+def _pct_change(before: float, after: float) -> str:
+    if before == 0:
+        return "n/a"
+    return f"{100 * (after - before) / before:+.1f}%"
+
+
+def compare_results(before: Dict, after: Dict) -> List[str]:
+    """Side-by-side comparison lines for two benchmark results."""
+    lines = [
+        f"Comparing {before['name']} ({before['environment'].get('git_revision')}) "
+        f"-> {after['name']} ({after['environment'].get('git_revision')})",
+        f"  {'Metric':<24} {'Before':>12} {'After':>12} {'Change':>9}",
+    ]
+    for key, label in [('iterations_per_second', 'iter/s'),
+                       ('infosets_per_second', 'infosets/s'),
+                       ('peak_rss_mb', 'peak RSS (MB)')]:
+        lines.append(
+            f"  {label:<24} {before[key]:>12.1f} {after[key]:>12.1f} "
+            f"{_pct_change(before[key], after[key]):>9}"
+        )
+
+    before_pool = before.get('worker_pool') or {}
+    after_pool = after.get('worker_pool') or {}
+    for key, label in [('start_seconds', 'pool start (s)'),
+                       ('worker_avg_rss_mb', 'worker RSS (MB)'),
+                       ('worker_avg_private_mb', 'worker private (MB)')]:
+        if key in before_pool and key in after_pool:
+            lines.append(
+                f"  {label:<24} {before_pool[key]:>12.2f} {after_pool[key]:>12.2f} "
+                f"{_pct_change(before_pool[key], after_pool[key]):>9}"
+            )
+
+    # Phase breakdowns are only comparable when both runs were profiled
+    phases = sorted(set(before['phases']) | set(after['phases']))
+    if before['profiled'] and after['profiled'] and phases:
+        lines.append(f"  {'Phase (µs/iter)':<24} {'Before':>12} {'After':>12} {'Change':>9}")
+        for phase in phases:
+            b = before['phases'].get(phase, {}).get('us_per_iteration', 0.0)
+            a = after['phases'].get(phase, {}).get('us_per_iteration', 0.0)
+            lines.append(f"  {phase:<24} {b:>12.1f} {a:>12.1f} {_pct_change(b, a):>9}")
+    return lines
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Reproducible MCCFR training throughput benchmark",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Run the small benchmark (default) with per-phase profiling
+  python tools/benchmark_training.py
+
+  # Run small and medium, save results
+  python tools/benchmark_training.py configs/benchmarks/training_small.yaml \\
+      configs/benchmarks/training_medium.yaml --output results.json
+
+  # Raw throughput without profiling overhead
+  python tools/benchmark_training.py configs/benchmarks/training_large.yaml --no-profile
+
+  # Worker pool start time and per-worker memory: spawn vs fork (Linux)
+  python tools/benchmark_training.py configs/benchmarks/training_large.yaml --start-method spawn --output spawn.json
+  python tools/benchmark_training.py configs/benchmarks/training_large.yaml --start-method fork --output fork.json
+  python tools/benchmark_training.py --compare spawn.json fork.json
+
+  # Compare two saved runs
+  python tools/benchmark_training.py --compare before.json after.json
+        """
+    )
+    parser.add_argument(
+        'configs',
+        nargs='*',
+        type=Path,
+        help='Benchmark config YAML files (default: configs/benchmarks/training_small.yaml)'
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        help='Save results as JSON (list of results, one per config)'
+    )
+    parser.add_argument(
+        '--no-profile',
+        action='store_true',
+        help='Disable per-phase profiling (measures raw throughput)'
+    )
+    parser.add_argument(
+        '--start-method',
+        choices=['spawn', 'fork', 'forkserver'],
+        help='Override the worker start method of parallel configs (fork/forkserver: Linux only)'
+    )
+    parser.add_argument(
+        '--compare',
+        nargs=2,
+        type=Path,
+        metavar=('BEFORE', 'AFTER'),
+        help='Compare two saved result files instead of running benchmarks'
+    )
+
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            before_results = json.load(f)
+        with open(args.compare[1]) as f:
+            after_results = json.load(f)
+        after_by_name = {r['name']: r for r in after_results}
+        for before in before_results:
+            after = after_by_name.get(before['name'])
+            if after is None:
+                print(f"Benchmark '{before['name']}' missing from {args.compare[1]}")
+                continue
+            print("\n".join(compare_results(before, after)))
+            print()
+        return 0
+
+    config_paths = args.configs or [BENCHMARK_DIR / "training_small.yaml"]
+    results = []
+    for path in config_paths:
+        result = run_benchmark(
+            load_benchmark_config(path),
+            profile=not args.no_profile,
+            start_method=args.start_method
+        )
+        results.append(result)
+        print("\n".join(format_result(result)))
+        print()
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Convert a .jsonl.zst CFV dataset to the memory-mapped columnar format.
+
+Usage:
+    python tools/convert_cfv_dataset.py \\
+        --data data/cfv/6max_jsonlz \\
+        --out data/cfv/6max_columnar \\
+        --config configs/cfv_net_m2.yaml
+
+This tool:
+1. Reads each shard_*.jsonl.zst shard once
+2. Builds the feature vectors with the training config's feature settings
+   (features.embed_dim, features.topk_range, train.seed)
+3. Writes per shard the float32 feature matrix, targets and fixed-width
+   columns as .npy files, plus index.json
+
+Pass the output directory to train_cfv_net.py / eval_cfv_net.py --data.
+Features depend on the feature settings: convert again after changing them.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+import yaml
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from holdem.value_net import (
+    CFVFeatureBuilder,
+    convert_to_columnar,
+    create_bucket_embeddings
+)
+
+# Bucket embedding table size (as in train_cfv_net.py)
+NUM_BUCKETS = 1000
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Convert CFV dataset to columnar format")
+
+    parser.add_argument(
+        "--data",
+        type=str,
+        required=True,
+        help="Dataset directory (sharded .jsonl.zst)"
+    )
+    parser.add_argument(
+        "--out",
+        type=str,
+        required=True,
+        help="Output directory for the columnar dataset"
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="configs/cfv_net_m2.yaml",
+        help="Training config with the feature settings (default: configs/cfv_net_m2.yaml)"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    """Main conversion."""
+    args = parse_args()
+
+    with open(args.config, 'r') as f:
+        config = yaml.safe_load(f)
+
+    feature_config = {
+        'embed_dim': config['features']['embed_dim'],
+        'topk_range': config['features']['topk_range'],
+        'num_buckets': NUM_BUCKETS,
+        'seed': config['train']['seed'],
+    }
+    feature_builder = CFVFeatureBuilder(
+        bucket_embeddings=create_bucket_embeddings(
+            NUM_BUCKETS, feature_config['embed_dim'], feature_config['seed']
+        ),
+        topk_range=feature_config['topk_range'],
+        embed_dim=feature_config['embed_dim']
+    )
+
+    start = time.time()
+    index = convert_to_columnar(args.data, args.out, feature_builder, feature_config)
+    elapsed = time.time() - start
+
+    print(f"\n✓ Conversion complete in {elapsed:.1f}s")
+    print(f"  Examples: {index['total_examples']}")
+    print(f"  Feature dim: {index['feature_dim']}")
+    print(f"  Output: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,8 @@ Usage:
 
 This tool:
 1. Loads trained CFV Net checkpoint
-2. Evaluates on test set
+2. Evaluates on test set (columnar datasets: on their precomputed features,
+   also per street)
 3. Computes metrics: MAE, PI coverage, ECE
 4. Measures inference latency
 5. Generates calibration plots and reports
@@ -26,8 +27,11 @@ import torch
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from holdem.types import Street
 from holdem.value_net import (
     CFVNet,
+    CFVColumnarDataset,
+    is_columnar_dataset,
     compute_metrics,
     get_feature_dimension,
     FeatureStats
@@ -48,7 +52,7 @@ def parse_args():
         "--data",
         type=str,
         required=True,
-        help="Dataset directory for test set"
+        help="Dataset directory for test set (sharded .jsonl.zst or columnar)"
     )
     parser.add_argument(
         "--out",
@@ -149,10 +153,32 @@ def benchmark_latency(model: torch.nn.Module, input_dim: int, device: torch.devi
     }
 
 
+def load_columnar_test_data(data_dir: str, num_samples: int, feature_stats: FeatureStats = None):
+    """First num_samples rows of a columnar dataset.
+    
+    Args:
+        data_dir: Columnar dataset directory
+        num_samples: Maximum number of rows
+        feature_stats: Feature normalization stats (optional)
+        
+    Returns:
+        Tuple of (features tensor, targets tensor, street values array)
+    """
+    columnar = CFVColumnarDataset(data_dir)
+    rows = np.arange(min(num_samples, len(columnar)))
+    features, targets = columnar.get_batch(rows)
+    if feature_stats is not None:
+        features = feature_stats.normalize(features)
+    streets = columnar.read_column('street')[rows]
+    return torch.from_numpy(features).float(), torch.from_numpy(targets), streets
+
+
 def evaluate_model(
     model: torch.nn.Module,
     test_data: list,
-    device: torch.device
+    device: torch.device,
+    test_features: torch.Tensor = None,
+    test_targets: torch.Tensor = None
 ) -> dict:
     """Evaluate model on test set.
     
@@ -160,19 +186,24 @@ def evaluate_model(
         model: Trained model
         test_data: Test dataset
         device: Device
+        test_features: Normalized test features (default: random placeholder)
+        test_targets: Test targets (with test_features)
         
     Returns:
         Evaluation metrics
     """
     print(f"Evaluating on {len(test_data)} examples...")
     
-    # Placeholder: In production, use actual test dataloader
-    # For now, generate dummy data
-    input_dim = model.input_dim
-    
-    # Generate random test data
-    test_features = torch.randn(len(test_data), input_dim).to(device)
-    test_targets = torch.randn(len(test_data)).to(device) * 5.0  # Random CFV
+    if test_features is None:
+        # Placeholder: In production, use actual test dataloader
+        # For now, generate dummy data
+        input_dim = model.input_dim
+        
+        # Generate random test data
+        test_features = torch.randn(len(test_data), input_dim)
+        test_targets = torch.randn(len(test_data)) * 5.0  # Random CFV
+    test_features = test_features.to(device)
+    test_targets = test_targets.to(device)
     
     # Predict
     with torch.no_grad():
@@ -222,11 +253,31 @@ def main():
         print(f"Warning: Feature stats not found at {stats_path}")
         feature_stats = None
     
-    # Load test data (placeholder)
-    test_data = list(range(args.num_samples))
-    
-    # Evaluate
-    metrics = evaluate_model(model, test_data, device)
+    # Load test data
+    metrics_by_street = {}
+    if is_columnar_dataset(args.data):
+        test_features, test_targets, streets = load_columnar_test_data(args.data, args.num_samples, feature_stats)
+        test_data = list(range(len(test_targets)))
+        
+        # Evaluate
+        metrics = evaluate_model(model, test_data, device, test_features, test_targets)
+        
+        print(f"\nPer-street MAE:")
+        for street in Street:
+            rows = torch.from_numpy(np.flatnonzero(streets == street.value))
+            if len(rows) == 0:
+                continue
+            with torch.no_grad():
+                predictions = model(test_features[rows].to(device))
+            street_metrics = compute_metrics(predictions, test_targets[rows].to(device))
+            metrics_by_street[street.name] = {k: float(v) for k, v in street_metrics.items()}
+            print(f"  {street.name}: {street_metrics['mae']:.4f} bb ({len(rows)} examples)")
+    else:
+        # Placeholder test data
+        test_data = list(range(args.num_samples))
+        
+        # Evaluate
+        metrics = evaluate_model(model, test_data, device)
     
     # Benchmark latency
     input_dim = model.input_dim
@@ -273,8 +324,9 @@ def main():
     
     # Save results
     results = {
-        'metrics': metrics,
-        'latency': latency_stats,
+        'metrics': {k: float(v) for k, v in metrics.items()},
+        'metrics_by_street': metrics_by_street,
+        'latency': {k: float(v) for k, v in latency_stats.items()},
         'quality_pass': quality_pass
     }
     
@@ -50,11 +50,12 @@ import pickle
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 import numpy as np
-from holdem.types import Card, Street, SearchConfig, TableState
+from holdem.types import Street, SearchConfig, TableState
 from holdem.mccfr.policy_store import PolicyStore
 from holdem.realtime.resolver import SubgameResolver
 from holdem.realtime.subgame import SubgameTree
 from holdem.rl_eval.statistics import compute_confidence_interval
+from holdem.utils.card_removal import index_card, live_cards
 from holdem.utils.logging import get_logger
 
 logger = get_logger("eval_rt_vs_blueprint")
@@ -139,21 +140,11 @@ class SimplifiedPokerSim:
             HandResult with chip differences and latency
         """
         # Create a representative game state (flop)
-        board = [
-            Card(self.rng.choice(['A', 'K', 'Q', 'J', 'T', '9', '8', '7']), 
-                 self.rng.choice(['h', 's', 'd', 'c'])),
-            Card(self.rng.choice(['A', 'K', 'Q', 'J', 'T', '9', '8', '7']),
-                 self.rng.choice(['h', 's', 'd', 'c'])),
-            Card(self.rng.choice(['A', 'K', 'Q', 'J', 'T', '9', '8', '7']),
-                 self.rng.choice(['h', 's', 'd', 'c']))
-        ]
-        
-        our_cards = [
-            Card(self.rng.choice(['A', 'K', 'Q', 'J', 'T']),
-                 self.rng.choice(['h', 's', 'd', 'c'])),
-            Card(self.rng.choice(['A', 'K', 'Q', 'J', 'T']),
-                 self.rng.choice(['h', 's', 'd', 'c']))
-        ]
+        # Cards are dealt without replacement (no board / hole card collisions)
+        board_idx = self.rng.choice(live_cards(ranks=['A', 'K', 'Q', 'J', 'T', '9', '8', '7']), 3, replace=False)
+        hole_idx = self.rng.choice(live_cards(board_idx, ranks=['A', 'K', 'Q', 'J', 'T']), 2, replace=False)
+        board = [index_card(c) for c in board_idx]
+        our_cards = [index_card(c) for c in hole_idx]
         
         state = TableState(
             street=Street.FLOP,
@@ -60,6 +60,7 @@ from holdem.realtime.resolver import SubgameResolver
 from holdem.realtime.subgame import SubgameTree
 from holdem.rl_eval.statistics import compute_confidence_interval
 from holdem.rl_eval.aivat import AIVATEvaluator
+from holdem.utils.card_removal import index_card, live_cards
 from holdem.utils.logging import get_logger
 
 logger = get_logger("eval_rt_vs_blueprint_enhanced")
@@ -248,19 +249,14 @@ class EnhancedPokerSim:
         
         # Generate new deal
         ranks = ['A', 'K', 'Q', 'J', 'T', '9', '8', '7', '6', '5']
-        suits = ['h', 's', 'd', 'c']
         
         # Board cards based on street
         num_board_cards = {Street.PREFLOP: 0, Street.FLOP: 3, Street.TURN: 4, Street.RIVER: 5}[street]
-        board = [
-            Card(self.rng.choice(ranks), self.rng.choice(suits))
-            for _ in range(num_board_cards)
-        ]
-        
-        our_cards = [
-            Card(self.rng.choice(ranks), self.rng.choice(suits))
-            for _ in range(2)
-        ]
+        # Cards are dealt without replacement (no board / hole card collisions)
+        board_idx = self.rng.choice(live_cards(ranks=ranks), num_board_cards, replace=False)
+        hole_idx = self.rng.choice(live_cards(board_idx, ranks=ranks), 2, replace=False)
+        board = [index_card(c) for c in board_idx]
+        our_cards = [index_card(c) for c in hole_idx]
         
         if self.paired:
             self.deals[hand_id] = (board, our_cards, position, street)
@@ -6,17 +6,26 @@ Usage:
         --checkpoint runs/cfv_net_6max_m2/best.pt \\
         --out assets/cfv_net/6max_best.onnx
 
+    # Also write an INT8 model (activation ranges from one dataset shard)
+    # and a FP32 vs INT8 latency/accuracy/gating report
+    python tools/export_cfv_net.py \\
+        --checkpoint runs/cfv_net_6max_m2/best.pt \\
+        --out assets/cfv_net/6max_best.onnx \\
+        --quantize static --calib-data data/cfv/6max_jsonlz
+
 This tool:
 1. Loads trained CFV Net checkpoint
 2. Exports to ONNX format (opset≥17)
 3. Saves feature normalization stats (stats.json)
 4. Optionally saves calibration data (calib.json)
+5. Optionally quantizes to INT8 and compares it with the FP32 model
 """
 
 import argparse
 import json
 import sys
 from pathlib import Path
+import numpy as np
 import torch
 
 # Add src to path
@@ -24,6 +33,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from holdem.value_net import (
     CFVNet,
+    CFVDatasetReader,
+    CFVFeatureBuilder,
+    create_bucket_embeddings,
     get_feature_dimension,
     export_to_onnx,
     FeatureStats
@@ -58,6 +70,61 @@ def parse_args():
         default=17,
         help="ONNX opset version (default: 17)"
     )
+    parser.add_argument(
+        "--quantize",
+        choices=["none", "dynamic", "static"],
+        default="none",
+        help="Also write an INT8 model (default: none)"
+    )
+    parser.add_argument(
+        "--quantized-out",
+        type=str,
+        default=None,
+        help="INT8 model path (default: <out>.int8.onnx)"
+    )
+    parser.add_argument(
+        "--calib-data",
+        type=str,
+        default=None,
+        help="CFV dataset directory for static calibration and the comparison (required for static)"
+    )
+    parser.add_argument(
+        "--calib-shard",
+        type=int,
+        default=0,
+        help="Dataset shard index to read (default: 0)"
+    )
+    parser.add_argument(
+        "--calib-samples",
+        type=int,
+        default=2048,
+        help="Examples read from the shard (default: 2048)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Bucket embedding seed used in training (default: 42)"
+    )
+    parser.add_argument(
+        "--topk-range",
+        type=int,
+        default=16,
+        help="Top-K range buckets used in training (default: 16)"
+    )
+    parser.add_argument(
+        "--compare-batch-sizes",
+        type=int,
+        nargs="+",
+        default=[1, 16, 64, 256],
+        help="Batch sizes of the latency comparison (default: 1 16 64 256)"
+    )
+    parser.add_argument(
+        "--report",
+        type=str,
+        default=None,
+        help="Comparison report JSON (default: <out dir>/quantization_report.json)"
+    )
     
     return parser.parse_args()
 
@@ -95,6 +162,82 @@ def load_model(checkpoint_path: str):
     return model
 
 
+def load_comparison_features(args, stats_path: Path, input_dim: int):
+    """Features, streets and in-position flags for calibration and the comparison.
+    
+    Read from one shard of --calib-data, or sampled around the feature stats
+    mean when no dataset is given (dynamic quantization only).
+    
+    Returns:
+        Tuple of (features, streets, is_ip, source description)
+    """
+    from itertools import islice
+    from holdem.types import Street
+    from holdem.value_net.quantize import examples_to_features
+    
+    if args.calib_data:
+        reader = CFVDatasetReader(args.calib_data, shuffle=True, seed=args.seed)
+        examples = list(islice(reader.read_shard(args.calib_shard), args.calib_samples))
+        feature_builder = CFVFeatureBuilder(
+            bucket_embeddings=create_bucket_embeddings(1000, 64, args.seed),
+            topk_range=args.topk_range,
+            embed_dim=64
+        )
+        features, streets, is_ip = examples_to_features(examples, feature_builder)
+        return features, streets, is_ip, f"{len(examples)} examples from {reader.shard_files[args.calib_shard]}"
+    
+    with open(stats_path, 'r') as f:
+        stats = FeatureStats.from_dict(json.load(f))
+    rng = np.random.default_rng(args.seed)
+    # Half a standard deviation around the mean keeps rows within the OOD threshold
+    features = (stats.mean + 0.5 * stats.std * rng.standard_normal((args.calib_samples, input_dim))).astype(np.float32)
+    postflop = [Street.FLOP, Street.TURN, Street.RIVER]
+    streets = [postflop[i % 3] for i in range(args.calib_samples)]
+    is_ip = np.arange(args.calib_samples) % 2 == 0
+    return features, streets, is_ip, f"{args.calib_samples} synthetic rows around stats.json"
+
+
+def quantize_and_compare(args, out_path: Path, stats_path: Path, input_dim: int):
+    """Write the INT8 model and the FP32 vs INT8 comparison report."""
+    from holdem.value_net.quantize import compare_models, format_comparison, quantize_onnx_model
+    
+    if args.quantize == "static" and not args.calib_data:
+        raise SystemExit("--quantize static requires --calib-data")
+    if not stats_path.exists():
+        raise SystemExit(f"Quantization needs feature stats, not found at {stats_path}")
+    
+    features, streets, is_ip, source = load_comparison_features(args, stats_path, input_dim)
+    print(f"Comparison data: {source}")
+    
+    quantized_path = Path(args.quantized_out) if args.quantized_out else out_path.with_suffix(".int8.onnx")
+    with open(stats_path, 'r') as f:
+        feature_stats = FeatureStats.from_dict(json.load(f))
+    print(f"\nQuantizing to INT8 ({args.quantize})...")
+    quantize_onnx_model(
+        str(out_path),
+        str(quantized_path),
+        mode=args.quantize,
+        calibration_features=features,
+        feature_stats=feature_stats
+    )
+    print(f"✓ INT8 model saved to {quantized_path}")
+    
+    report = compare_models(
+        str(out_path), str(quantized_path), str(stats_path),
+        features, streets, is_ip, batch_sizes=args.compare_batch_sizes
+    )
+    report['mode'] = args.quantize
+    report['data'] = source
+    print()
+    print("\n".join(format_comparison(report)))
+    
+    report_path = Path(args.report) if args.report else out_path.parent / "quantization_report.json"
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"✓ Comparison report saved to {report_path}")
+    return quantized_path
+
+
 def main():
     """Main export."""
     args = parse_args()
@@ -174,10 +317,16 @@ def main():
     except Exception as e:
         print(f"\nError verifying ONNX model: {e}")
     
+    quantized_path = None
+    if args.quantize != "none":
+        quantized_path = quantize_and_compare(args, out_path, out_path.parent / "stats.json", input_dim)
+    
     print(f"\n✓ Export complete!")
     print(f"  Model: {out_path}")
     print(f"  Stats: {out_path.parent / 'stats.json'}")
     print(f"  Calib: {out_path.parent / 'calib.json'}")
+    if quantized_path is not None:
+        print(f"  INT8:  {quantized_path}")
 
 
 if __name__ == "__main__":
@@ -7,8 +7,15 @@ Usage:
         --config configs/cfv_net_m2.yaml \\
         --logdir runs/cfv_net_6max_m2
 
+    # Columnar dataset (tools/convert_cfv_dataset.py): memory-mapped
+    # precomputed features, no per-epoch decompression or feature building
+    python tools/train_cfv_net.py \\
+        --data data/cfv/6max_columnar \\
+        --config configs/cfv_net_m2.yaml \\
+        --logdir runs/cfv_net_6max_m2
+
 This tool:
-1. Loads CFV training dataset (sharded .jsonl.zst)
+1. Loads CFV training dataset (sharded .jsonl.zst or columnar)
 2. Trains CFVNet with AdamW, cosine decay, warmup
 3. Logs metrics to TensorBoard
 4. Saves checkpoints and best model
@@ -25,7 +32,7 @@ import yaml
 import numpy as np
 import torch
 import torch.nn as nn
-from torch.utils.data import Dataset, DataLoader
+from torch.utils.data import BatchSampler, Dataset, DataLoader, RandomSampler, SequentialSampler
 from torch.utils.tensorboard import SummaryWriter
 
 # Add src to path
@@ -33,6 +40,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from holdem.value_net import (
     CFVDatasetReader,
+    CFVColumnarDataset,
+    is_columnar_dataset,
     CFVNet,
     CFVLoss,
     compute_metrics,
@@ -45,7 +54,6 @@ from holdem.value_net import (
     create_bucket_embeddings,
     split_dataset
 )
-from holdem.types import Street, Position
 
 
 def parse_args():
@@ -56,7 +64,7 @@ def parse_args():
         "--data",
         type=str,
         required=True,
-        help="Dataset directory (sharded .jsonl.zst)"
+        help="Dataset directory (sharded .jsonl.zst or columnar)"
     )
     parser.add_argument(
         "--config",
@@ -120,50 +128,181 @@ class CFVDataset(Dataset):
     def __getitem__(self, idx):
         example = self.examples[idx]
         
-        # Parse example
-        street = Street[example['street']]
-        hero_pos = Position[example['hero_pos']]
-        num_players = example['num_players']
-        spr = example['spr']
-        public_bucket = example['public_bucket']
+        features = self.feature_builder.build_features_from_example(example).to_vector()
         
-        scalars = example['scalars']
-        pot_norm = scalars['pot_norm']
-        pot_size = pot_norm * 100.0  # Denormalize
-        to_call = scalars['to_call_over_pot'] * pot_size
-        last_bet = scalars['last_bet_over_pot'] * pot_size
-        aset = scalars['aset']
+        # Normalize if stats available
+        if self.feature_stats is not None:
+            features = self.feature_stats.normalize(features)
         
-        # Convert ranges
-        ranges = {}
-        for pos_str, topk in example['ranges'].items():
-            pos = Position[pos_str]
-            ranges[pos] = [(int(bid), float(w)) for bid, w in topk]
+        # Target
+        target = example['target_cfv_bb']
         
-        # Build features
-        features_obj = self.feature_builder.build_features(
-            street=street,
-            num_players=num_players,
-            hero_position=hero_pos,
-            spr=spr,
-            pot_size=pot_size,
-            to_call=to_call,
-            last_bet=last_bet,
-            action_set=aset,
-            public_bucket=public_bucket,
-            ranges=ranges
-        )
+        return torch.from_numpy(features).float(), torch.tensor(target).float()
+
+
+class ColumnarCFVDataset(Dataset):
+    """PyTorch view of rows of a columnar dataset, indexed by whole batches.
+    
+    Used with a BatchSampler and batch_size=None, so each batch is one
+    gather from the memory-mapped feature matrix.
+    """
+    
+    def __init__(
+        self,
+        columnar: CFVColumnarDataset,
+        rows: np.ndarray,
+        feature_stats: FeatureStats = None
+    ):
+        """Initialize dataset.
         
-        features = features_obj.to_vector()
+        Args:
+            columnar: Columnar dataset
+            rows: Row indices of this split
+            feature_stats: Feature normalization stats (optional)
+        """
+        self.columnar = columnar
+        self.rows = rows
+        self.feature_stats = feature_stats
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def __getitem__(self, batch):
+        features, targets = self.columnar.get_batch(self.rows[np.asarray(batch)])
         
         # Normalize if stats available
         if self.feature_stats is not None:
             features = self.feature_stats.normalize(features)
         
-        # Target
-        target = example['target_cfv_bb']
+        return torch.from_numpy(features).float(), torch.from_numpy(targets)
+
+
+def load_columnar_datasets(data_dir: str, config: Dict, seed: int):
+    """Train/val datasets from a columnar dataset.
+    
+    Args:
+        data_dir: Columnar dataset directory
+        config: Training config
+        seed: Random seed for the row split
         
-        return torch.from_numpy(features).float(), torch.tensor(target).float()
+    Returns:
+        Tuple of (train_dataset, val_dataset), normalized with stats of the
+        training rows
+    """
+    columnar = CFVColumnarDataset(data_dir)
+    
+    # Features were built at conversion time: they must match this config
+    embed_dim = config['features']['embed_dim']
+    stored = columnar.feature_config
+    if columnar.feature_dim != get_feature_dimension(embed_dim) or \
+            stored.get('topk_range', config['features']['topk_range']) != config['features']['topk_range'] or \
+            stored.get('seed', seed) != seed:
+        raise ValueError(
+            f"Columnar dataset features ({stored}, dim={columnar.feature_dim}) do not match "
+            f"config (features={config['features']}, seed={seed}); convert again with this config"
+        )
+    
+    rng = np.random.RandomState(seed)
+    rows = rng.permutation(len(columnar))
+    num_train = int(len(rows) * config['split']['train'])
+    train_rows = rows[:num_train]
+    val_rows = rows[num_train:]
+    
+    print(f"Train examples: {len(train_rows)}")
+    print(f"Val examples: {len(val_rows)}")
+    
+    # Compute feature stats on a sample of training rows
+    print("Computing feature statistics...")
+    sample_features, _ = columnar.get_batch(np.sort(train_rows[:10000]))
+    feature_stats = FeatureStats(mean=sample_features.mean(axis=0), std=sample_features.std(axis=0))
+    
+    return (
+        ColumnarCFVDataset(columnar, train_rows, feature_stats),
+        ColumnarCFVDataset(columnar, val_rows, feature_stats)
+    )
+
+
+def load_jsonl_datasets(data_dir: str, config: Dict, seed: int):
+    """Train/val datasets from a sharded .jsonl.zst dataset.
+    
+    Args:
+        data_dir: Dataset directory
+        config: Training config
+        seed: Random seed
+        
+    Returns:
+        Tuple of (train_dataset, val_dataset), normalized with stats of the
+        training examples
+    """
+    # Split dataset
+    print("Splitting dataset...")
+    split = split_dataset(
+        data_dir,
+        train_frac=config['split']['train'],
+        val_frac=config['split']['val'],
+        test_frac=config['split']['test'],
+        seed=seed
+    )
+    
+    print(f"Train shards: {len(split['train'])}")
+    print(f"Val shards: {len(split['val'])}")
+    print(f"Test shards: {len(split['test'])}")
+    
+    # Load examples (simplified - in production, use efficient streaming)
+    print("Loading training examples...")
+    reader = CFVDatasetReader(data_dir, shuffle=True, seed=seed)
+    all_examples = list(reader)[:100000]  # Limit for demo
+    
+    num_train = int(len(all_examples) * config['split']['train'])
+    train_examples = all_examples[:num_train]
+    val_examples = all_examples[num_train:]
+    
+    print(f"Train examples: {len(train_examples)}")
+    print(f"Val examples: {len(val_examples)}")
+    
+    # Create bucket embeddings
+    num_buckets = 1000  # Placeholder
+    embed_dim = config['features']['embed_dim']
+    bucket_embeddings = create_bucket_embeddings(num_buckets, embed_dim, seed)
+    
+    # Create feature builder
+    feature_builder = CFVFeatureBuilder(
+        bucket_embeddings=bucket_embeddings,
+        topk_range=config['features']['topk_range'],
+        embed_dim=embed_dim
+    )
+    
+    # Create datasets
+    train_dataset = CFVDataset(train_examples, feature_builder)
+    
+    # Compute feature stats
+    feature_stats = compute_feature_stats(train_dataset)
+    
+    # Apply stats to datasets
+    train_dataset.feature_stats = feature_stats
+    val_dataset = CFVDataset(val_examples, feature_builder, feature_stats)
+    
+    return train_dataset, val_dataset
+
+
+def make_dataloader(dataset: Dataset, config: Dict, shuffle: bool) -> DataLoader:
+    """DataLoader over a CFVDataset (per example) or ColumnarCFVDataset (per batch)."""
+    if isinstance(dataset, ColumnarCFVDataset):
+        sampler = RandomSampler(dataset) if shuffle else SequentialSampler(dataset)
+        return DataLoader(
+            dataset,
+            sampler=BatchSampler(sampler, batch_size=config['opt']['batch_size'], drop_last=False),
+            batch_size=None,
+            num_workers=config['train']['num_workers'],
+            pin_memory=config['train']['pin_memory']
+        )
+    return DataLoader(
+        dataset,
+        batch_size=config['opt']['batch_size'],
+        shuffle=shuffle,
+        num_workers=config['train']['num_workers'],
+        pin_memory=config['train']['pin_memory']
+    )
 
 
 def compute_feature_stats(dataset: CFVDataset) -> FeatureStats:
@@ -362,53 +501,13 @@ def main():
     os.environ['OPENBLAS_NUM_THREADS'] = '1'
     os.environ['NUMEXPR_NUM_THREADS'] = '1'
     
-    # Split dataset
-    print("Splitting dataset...")
-    split = split_dataset(
-        args.data,
-        train_frac=config['split']['train'],
-        val_frac=config['split']['val'],
-        test_frac=config['split']['test'],
-        seed=seed
-    )
-    
-    print(f"Train shards: {len(split['train'])}")
-    print(f"Val shards: {len(split['val'])}")
-    print(f"Test shards: {len(split['test'])}")
-    
-    # Load examples (simplified - in production, use efficient streaming)
-    print("Loading training examples...")
-    reader = CFVDatasetReader(args.data, shuffle=True, seed=seed)
-    all_examples = list(reader)[:100000]  # Limit for demo
-    
-    num_train = int(len(all_examples) * config['split']['train'])
-    train_examples = all_examples[:num_train]
-    val_examples = all_examples[num_train:]
-    
-    print(f"Train examples: {len(train_examples)}")
-    print(f"Val examples: {len(val_examples)}")
-    
-    # Create bucket embeddings
-    num_buckets = 1000  # Placeholder
+    # Load datasets
+    if is_columnar_dataset(args.data):
+        train_dataset, val_dataset = load_columnar_datasets(args.data, config, seed)
+    else:
+        train_dataset, val_dataset = load_jsonl_datasets(args.data, config, seed)
+    feature_stats = train_dataset.feature_stats
     embed_dim = config['features']['embed_dim']
-    bucket_embeddings = create_bucket_embeddings(num_buckets, embed_dim, seed)
-    
-    # Create feature builder
-    feature_builder = CFVFeatureBuilder(
-        bucket_embeddings=bucket_embeddings,
-        topk_range=config['features']['topk_range'],
-        embed_dim=embed_dim
-    )
-    
-    # Create datasets
-    train_dataset = CFVDataset(train_examples, feature_builder)
-    
-    # Compute feature stats
-    feature_stats = compute_feature_stats(train_dataset)
-    
-    # Apply stats to datasets
-    train_dataset.feature_stats = feature_stats
-    val_dataset = CFVDataset(val_examples, feature_builder, feature_stats)
     
     # Save feature stats
     stats_path = logdir / "stats.json"
@@ -417,21 +516,8 @@ def main():
     print(f"Saved feature stats to {stats_path}")
     
     # Create dataloaders
-    train_loader = DataLoader(
-        train_dataset,
-        batch_size=config['opt']['batch_size'],
-        shuffle=True,
-        num_workers=config['train']['num_workers'],
-        pin_memory=config['train']['pin_memory']
-    )
-    
-    val_loader = DataLoader(
-        val_dataset,
-        batch_size=config['opt']['batch_size'],
-        shuffle=False,
-        num_workers=config['train']['num_workers'],
-        pin_memory=config['train']['pin_memory']
-    )
+    train_loader = make_dataloader(train_dataset, config, shuffle=True)
+    val_loader = make_dataloader(val_dataset, config, shuffle=False)
     
     # Create model
     input_dim = get_feature_dimension(embed_dim)